@@ -836,14 +836,14 @@ ANALYST_REPORT_MAP = {
 }
 
 
-def update_analyst_statuses(message_buffer, chunk, wall_time_tracker=None):
+def update_analyst_statuses(message_buffer, chunk, wall_time_tracker=None, parallel=False):
     """Update analyst statuses based on accumulated report state.
 
     Logic:
     - Store new report content from the current chunk if present
     - Check accumulated report_sections (not just current chunk) for status
     - Analysts with reports = completed
-    - First analyst without report = in_progress
+    - First analyst without report = in_progress (every one when ``parallel``)
     - Remaining analysts without reports = pending
     - When all analysts done, set Bull Researcher to in_progress
     """
@@ -869,7 +869,7 @@ def update_analyst_statuses(message_buffer, chunk, wall_time_tracker=None):
 
         if has_report:
             message_buffer.update_agent_status(agent_name, "completed")
-        elif not found_active:
+        elif not found_active or parallel:
             message_buffer.update_agent_status(agent_name, "in_progress")
             found_active = True
         else:
@@ -1000,7 +1000,9 @@ def run_analysis(checkpoint: bool | None = None):
     # Normalize analyst selection to predefined order (selection is a 'set', order is fixed)
     selected_set = {analyst.value for analyst in selections["analysts"]}
     selected_analyst_keys = [a for a in ANALYST_ORDER if a in selected_set]
-    analyst_execution_plan = build_analyst_execution_plan(selected_analyst_keys)
+    analyst_execution_plan = build_analyst_execution_plan(
+        selected_analyst_keys, parallel=config.get("parallel_analysts", False)
+    )
     analyst_wall_time_tracker = AnalystWallTimeTracker(analyst_execution_plan)
 
     # Initialize the graph with callbacks bound to LLMs
@@ -1089,6 +1091,10 @@ def run_analysis(checkpoint: bool | None = None):
         first_analyst = get_initial_analyst_node(analyst_execution_plan)
         message_buffer.update_agent_status(first_analyst, "in_progress")
         analyst_wall_time_tracker.mark_started(selected_analyst_keys[0])
+        if analyst_execution_plan.parallel:
+            for spec in analyst_execution_plan.specs[1:]:
+                message_buffer.update_agent_status(spec.agent_node, "in_progress")
+                analyst_wall_time_tracker.mark_started(spec.key)
         update_display(layout, stats_handler=stats_handler, start_time=start_time)
 
         # Create spinner text
@@ -1141,6 +1147,7 @@ def run_analysis(checkpoint: bool | None = None):
                 message_buffer,
                 chunk,
                 wall_time_tracker=analyst_wall_time_tracker,
+                parallel=analyst_execution_plan.parallel,
             )
 
             # Research Team - Handle Investment Debate State
@@ -56,6 +56,53 @@ def _isolate_config():
     config_module._config = copy.deepcopy(default_config.DEFAULT_CONFIG)
 
 
+@pytest.fixture(autouse=True)
+def _reset_rate_limiters():
+    """Give every test fresh vendor token buckets.
+
+    Buckets are process-wide, so a test that drains one (or configures a tiny
+    quota) would otherwise make later tests wait for tokens.
+    """
+    from tradingagents.dataflows.rate_limiter import reset_rate_limiters
+
+    reset_rate_limiters()
+    yield
+    reset_rate_limiters()
+
+
+@pytest.fixture(autouse=True)
+def _reset_cache_backend():
+    """Start every test with an empty vendor cache backend.
+
+    Tests patch vendor clients (``yf.Ticker``, ``fred._request``) per test; a
+    record, OHLCV frame, identity, shared ``Ticker`` or prefetched tool result
+    cached by an earlier test would otherwise bypass those patches.
+    """
+    from tradingagents.dataflows.cache_backend import reset_cache_backend
+    from tradingagents.dataflows.interface import clear_prefetched
+    from tradingagents.dataflows.yfinance_registry import clear_ticker_registry
+
+    reset_cache_backend()
+    clear_ticker_registry()
+    clear_prefetched()
+    yield
+    reset_cache_backend()
+    clear_ticker_registry()
+    clear_prefetched()
+
+
+@pytest.fixture(autouse=True)
+def _isolate_data_cache_dir(_isolate_config, tmp_path):
+    """Point ``data_cache_dir`` at a per-test directory.
+
+    On-disk caches (OHLCV CSVs, yfinance ``.info`` JSON) would otherwise be
+    written to the user's real cache and leak between tests.
+    """
+    import tradingagents.dataflows.config as config_module
+
+    config_module._config["data_cache_dir"] = str(tmp_path / "cache")
+
+
 @pytest.fixture()
 def mock_llm_client():
     client = MagicMock()
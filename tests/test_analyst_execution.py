@@ -88,3 +88,40 @@ class AnalystWallTimeTrackerTests(unittest.TestCase):
             tracker.get_wall_times(),
             {"market": 3.0, "news": 5.0},
         )
+
+    def test_parallel_plan_starts_every_analyst_at_once(self):
+        plan = build_analyst_execution_plan(["market", "news"], parallel=True)
+        tracker = AnalystWallTimeTracker(plan)
+
+        sync_analyst_tracker_from_chunk(tracker, {}, now=10.0)
+        sync_analyst_tracker_from_chunk(
+            tracker,
+            {"news_report": "done"},
+            now=14.0,
+        )
+
+        self.assertTrue(plan.parallel)
+        self.assertEqual(tracker.get_wall_times(), {"news": 4.0})
+
+    def test_prefers_wall_times_measured_by_parallel_branches(self):
+        # Both reports reach the parent graph in the same chunk when the
+        # fan-out joins; the branch-measured durations tell them apart.
+        plan = build_analyst_execution_plan(["market", "news"], parallel=True)
+        tracker = AnalystWallTimeTracker(plan)
+
+        sync_analyst_tracker_from_chunk(tracker, {}, now=10.0)
+        sync_analyst_tracker_from_chunk(
+            tracker,
+            {
+                "market_report": "done",
+                "news_report": "done",
+                "analyst_wall_times": {"market": 2.5, "news": 6.0},
+            },
+            now=16.0,
+        )
+
+        self.assertEqual(tracker.get_wall_times(), {"market": 2.5, "news": 6.0})
+        self.assertEqual(
+            tracker.format_summary(),
+            "Analyst wall time: Market 2.50s | News 6.00s",
+        )
@@ -0,0 +1,166 @@
+"""Async execution path: step-generator nodes await ``ainvoke``, and
+``apropagate`` runs many analyses on one event loop with bounded concurrency.
+"""
+import asyncio
+import functools
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tradingagents.agents import create_trader
+from tradingagents.agents.utils.llm_node import AsyncNode, llm_node
+from tradingagents.agents.utils.memory import TradingMemoryLog
+from tradingagents.graph.debate_rounds import create_research_round
+from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+
+class _FakeLLM:
+    """Records which path answered; ``ainvoke`` can wait for company."""
+
+    def __init__(self, reply="ok", gate=None):
+        self.reply = reply
+        self.gate = gate
+        self.calls = []
+
+    def invoke(self, prompt):
+        self.calls.append("invoke")
+        return SimpleNamespace(content=self.reply)
+
+    async def ainvoke(self, prompt):
+        self.calls.append("ainvoke")
+        if self.gate is not None:
+            await self.gate()
+        return SimpleNamespace(content=self.reply)
+
+
+def _echo_node(llm):
+    def step(state):
+        response = yield llm, state["prompt"]
+        return {"answer": response.content}
+
+    return llm_node(step)
+
+
+@pytest.mark.unit
+def test_llm_node_uses_invoke_when_called_and_ainvoke_when_awaited():
+    llm = _FakeLLM("hi")
+    node = _echo_node(llm)
+
+    assert isinstance(node, AsyncNode)
+    assert node({"prompt": "p"}) == {"answer": "hi"}
+    assert asyncio.run(node.acall({"prompt": "p"})) == {"answer": "hi"}
+    assert node.invoke({"prompt": "p"}) == {"answer": "hi"}
+    assert asyncio.run(node.ainvoke({"prompt": "p"})) == {"answer": "hi"}
+    assert llm.calls == ["invoke", "ainvoke", "invoke", "ainvoke"]
+
+
+@pytest.mark.unit
+def test_structured_fallback_works_on_the_async_path():
+    llm = MagicMock()
+    llm.with_structured_output.return_value.ainvoke = AsyncMock(side_effect=ValueError("bad json"))
+    llm.ainvoke = AsyncMock(return_value=SimpleNamespace(content="free-text plan"))
+    node = create_trader(llm)
+
+    state = {"company_of_interest": "AAPL", "investment_plan": "plan"}
+    result = asyncio.run(node.acall(state))
+
+    assert result["trader_investment_plan"] == "free-text plan"
+    llm.with_structured_output.return_value.invoke.assert_not_called()
+    llm.invoke.assert_not_called()
+
+
+@pytest.mark.unit
+def test_async_debate_round_shares_the_event_loop():
+    async def run():
+        waiting = []
+        both_waiting = asyncio.Event()
+
+        async def gate():
+            # Each side only answers once the other is in flight too.
+            waiting.append(1)
+            if len(waiting) == 2:
+                both_waiting.set()
+            await asyncio.wait_for(both_waiting.wait(), timeout=5)
+
+        def side(name):
+            llm = _FakeLLM(f"{name} point", gate)
+
+            def step(state):
+                response = yield llm, "prompt"
+                argument = f"{name} Analyst: {response.content}"
+                return {"investment_debate_state": {
+                    "current_response": argument,
+                    f"{name.lower()}_history": "\n" + argument,
+                }}
+
+            return llm_node(step)
+
+        round_node = create_research_round(side("Bull"), side("Bear"))
+        return await round_node.acall({"investment_debate_state": {"history": "", "count": 0}})
+
+    debate = asyncio.run(run())["investment_debate_state"]
+    assert debate["history"] == "\nBull Analyst: Bull point\nBear Analyst: Bear point"
+    assert debate["count"] == 2
+
+
+def _final_state(ticker):
+    return {
+        "final_trade_decision": f"Rating: Buy\nBuy {ticker}.",
+        "company_of_interest": ticker,
+        "trade_date": "2026-01-10",
+        "market_report": "", "sentiment_report": "", "news_report": "", "fundamentals_report": "",
+        "investment_debate_state": {
+            "bull_history": "", "bear_history": "", "history": "",
+            "current_response": "", "judge_decision": "",
+        },
+        "investment_plan": "",
+        "trader_investment_plan": "",
+        "risk_debate_state": {
+            "aggressive_history": "", "conservative_history": "", "neutral_history": "",
+            "history": "", "judge_decision": "",
+        },
+    }
+
+
+@pytest.mark.unit
+def test_apropagate_bounds_concurrency_and_keeps_runs_apart(tmp_path):
+    in_flight = []
+    peak = []
+
+    async def fake_ainvoke(init_state, **kwargs):
+        in_flight.append(1)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.pop()
+        return _final_state(init_state["company_of_interest"])
+
+    graph = MagicMock()
+    graph.memory_log = TradingMemoryLog({"memory_log_path": str(tmp_path / "mem.md")})
+    graph.log_states_dict = {}
+    graph.debug = False
+    graph.config = {"results_dir": str(tmp_path), "max_concurrent_runs": 2}
+    graph._async_slots = {}
+    graph.graph.ainvoke = fake_ainvoke
+    graph.propagator.create_initial_state.side_effect = lambda ticker, *a, **k: {"company_of_interest": ticker}
+    graph.propagator.get_graph_args.return_value = {}
+    graph.process_signal.side_effect = lambda decision: decision.split()[-1]
+    for name in (
+        "apropagate", "_apropagate", "_run_slots", "_arun_graph", "_start_run", "_finish_run", "_log_state",
+    ):
+        setattr(graph, name, functools.partial(getattr(TradingAgentsGraph, name), graph))
+
+    tickers = ["AAA", "BBB", "CCC", "DDD", "EEE"]
+
+    async def run_all():
+        return await asyncio.gather(*(graph.apropagate(t, "2026-01-10") for t in tickers))
+
+    results = asyncio.run(run_all())
+
+    assert max(peak) == 2
+    assert [signal for _, signal in results] == [f"{t}." for t in tickers]
+    for ticker in tickers:
+        log = tmp_path / ticker / "TradingAgentsStrategy_logs" / "full_states_log_2026-01-10.json"
+        assert json.loads(log.read_text())["company_of_interest"] == ticker
+    assert {e["ticker"] for e in graph.memory_log.load_entries()} == set(tickers)
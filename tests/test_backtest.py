@@ -0,0 +1,170 @@
+"""Walk-forward backtest: calendar, realized returns from the local OHLCV store,
+rating-to-position P&L and the trades table.
+"""
+import asyncio
+import importlib.util
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from tradingagents.backtest import (
+    RATING_POSITIONS,
+    TRADE_COLUMNS,
+    WalkForwardBacktest,
+    forward_return,
+    load_closes,
+    period_return,
+    summarize,
+    trade_calendar,
+    write_trades,
+)
+
+# Ten sessions, Mon 2026-01-05 .. Fri 2026-01-16; closes 100, 101, ..., 109.
+SESSIONS = pd.bdate_range("2026-01-05", periods=10)
+
+
+def _closes(start=100.0, step=1.0):
+    return pd.Series([start + step * n for n in range(10)], index=SESSIONS)
+
+
+@pytest.mark.unit
+def test_trade_calendar_steps_through_sessions():
+    closes = _closes()
+    assert trade_calendar(closes, "2026-01-05", "2026-01-16", every=3) == [
+        "2026-01-05", "2026-01-08", "2026-01-13", "2026-01-16",
+    ]
+    assert trade_calendar(closes, "2026-01-10", "2026-01-12") == ["2026-01-12"]
+
+
+@pytest.mark.unit
+def test_forward_return_enters_at_last_close_seen():
+    closes = _closes()
+    # Saturday 2026-01-10 enters at Friday's close (104) and holds 2 sessions.
+    assert forward_return(closes, "2026-01-10", 2) == (pytest.approx(106 / 104 - 1), "2026-01-13", 2)
+    # Cut short at the end of the data; nothing to realize on the last session.
+    assert forward_return(closes, "2026-01-15", 5) == (pytest.approx(109 / 108 - 1), "2026-01-16", 1)
+    assert forward_return(closes, "2026-01-16", 5) == (None, None, None)
+    assert forward_return(closes, "2026-01-01", 5) == (None, None, None)
+    assert period_return(closes, "2026-01-05", "2026-01-07") == pytest.approx(0.02)
+    assert period_return(closes, "2026-01-07", "2026-01-07") is None
+
+
+@pytest.mark.unit
+def test_load_closes_reads_the_ohlcv_store():
+    frame = pd.DataFrame({
+        "Date": [pd.Timestamp("2026-01-06"), pd.Timestamp("2026-01-05 16:00"), pd.Timestamp("2026-01-06")],
+        "Close": [2.0, 1.0, 3.0],
+    })
+    with mock.patch("tradingagents.backtest.prices.load_ohlcv", return_value=frame) as store:
+        closes = load_closes("NVDA", "2026-02-01")
+
+    store.assert_called_once_with("NVDA", "2026-02-01")
+    assert list(closes.index.strftime("%Y-%m-%d")) == ["2026-01-05", "2026-01-06"]
+    assert list(closes) == [1.0, 3.0]
+
+
+class _FakeGraph:
+    """Answers ``apropagate`` with a scripted rating; tracks overlapping runs."""
+
+    def __init__(self, tmp_path, ratings):
+        self.config = {"results_dir": str(tmp_path)}
+        self.ratings = ratings
+        self.calls = []
+        self.running = set()
+        self.overlap = []
+        self.peak = 0
+
+    def _resolve_benchmark(self, ticker):
+        return "SPY"
+
+    async def apropagate(self, ticker, trade_date, asset_type="stock", point_in_time=False):
+        assert point_in_time
+        self.overlap.append(ticker in self.running)
+        self.running.add(ticker)
+        self.peak = max(self.peak, len(self.running))
+        self.calls.append((ticker, trade_date))
+        await asyncio.sleep(0.01)
+        self.running.discard(ticker)
+        rating = self.ratings[(ticker, trade_date)]
+        if rating is None:
+            raise RuntimeError("vendor down")
+        return {}, rating
+
+
+@pytest.mark.unit
+def test_walk_forward_backtest_scores_ratings(tmp_path):
+    ratings = {
+        ("AAA", "2026-01-05"): "Buy",
+        ("AAA", "2026-01-12"): "Sell",
+        ("BBB", "2026-01-05"): "Underweight",
+        ("BBB", "2026-01-12"): None,
+    }
+    graph = _FakeGraph(tmp_path, ratings)
+    prices = {"AAA": _closes(), "BBB": _closes(200.0, -2.0), "SPY": _closes(50.0, 0.5)}
+    backtest = WalkForwardBacktest(graph, ["AAA", "BBB"], "2026-01-05", "2026-01-16", every=5)
+
+    with mock.patch("tradingagents.backtest.engine.load_closes", side_effect=prices.__getitem__):
+        trades = backtest.run(tmp_path / "trades.csv")
+
+    # Dates of one ticker run in order, never overlapping; tickers run together.
+    assert [d for t, d in graph.calls if t == "AAA"] == ["2026-01-05", "2026-01-12"]
+    assert not any(graph.overlap)
+    assert graph.peak == 2
+
+    assert list(trades.columns) == list(TRADE_COLUMNS)
+    assert str(trades["rating"].dtype) == "category"
+    aaa = trades[trades["ticker"] == "AAA"].reset_index(drop=True)
+    assert aaa.loc[0, "position"] == RATING_POSITIONS["Buy"]
+    assert aaa.loc[0, "return"] == pytest.approx(105 / 100 - 1)
+    assert aaa.loc[0, "benchmark_return"] == pytest.approx(52.5 / 50 - 1)
+    assert aaa.loc[0, "pnl"] == pytest.approx(0.05)
+    assert aaa.loc[0, "exit_date"] == pd.Timestamp("2026-01-12")
+    # The last trade is cut short at the end of the data.
+    assert aaa.loc[1, "sessions_held"] == 4
+    assert aaa.loc[1, "pnl"] == pytest.approx(-(109 / 105 - 1), rel=1e-6)
+
+    bbb = trades[trades["ticker"] == "BBB"].reset_index(drop=True)
+    assert bbb.loc[0, "pnl"] == pytest.approx(-0.5 * (190 / 200 - 1))
+    assert bbb.loc[1, "error"] == "RuntimeError: vendor down"
+    assert pd.isna(bbb.loc[1, "pnl"])
+
+    written = pd.read_csv(tmp_path / "trades.csv")
+    assert len(written) == 4
+
+    summary = summarize(trades)
+    assert summary.loc["AAA", "trades"] == 2
+    assert summary.loc["AAA", "hit_rate"] == pytest.approx(0.5)
+    assert summary.loc["BBB", "errors"] == 1
+    assert summary.loc["BBB", "total_return"] == pytest.approx(0.025)
+
+
+@pytest.mark.unit
+def test_holding_past_the_next_trade_date_is_rejected(tmp_path):
+    graph = _FakeGraph(tmp_path, {})
+    with pytest.raises(ValueError, match="holding_days"):
+        WalkForwardBacktest(graph, ["AAA"], "2026-01-05", "2026-01-16", every=5, holding_days=10)
+    assert WalkForwardBacktest(graph, ["AAA"], "2026-01-05", "2026-01-16", holding_days=3).holding_days == 3
+
+
+@pytest.mark.unit
+def test_walk_forward_backtest_skips_tickers_without_prices(tmp_path):
+    graph = _FakeGraph(tmp_path, {})
+
+    def closes(symbol):
+        raise ValueError(f"no data for {symbol}")
+
+    backtest = WalkForwardBacktest(graph, ["GONE"], "2026-01-05", "2026-01-16")
+    with mock.patch("tradingagents.backtest.engine.load_closes", side_effect=closes):
+        trades = backtest.run()
+
+    assert trades.empty
+    assert graph.calls == []
+    assert backtest.default_output_path().exists()
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(importlib.util.find_spec("pyarrow") is not None, reason="pyarrow installed")
+def test_write_trades_parquet_needs_pyarrow(tmp_path):
+    with pytest.raises(ImportError, match=r"tradingagents\[backtest\]"):
+        write_trades(pd.DataFrame({"ticker": ["AAA"]}), tmp_path / "trades.parquet")
@@ -0,0 +1,166 @@
+"""Pluggable vendor cache: the in-memory default, the Redis backend (exercised
+against an in-memory stand-in for the client), and the data paths that read
+through it — OHLCV, vendor records and instrument identity.
+"""
+import fnmatch
+import tempfile
+import unittest
+import zlib
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+import tradingagents.dataflows.stockstats_utils as su
+from tradingagents.agents.utils.agent_utils import resolve_instrument_identity
+from tradingagents.dataflows.cache_backend import (
+    MISS,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    get_cache_backend,
+    set_cache_backend,
+)
+from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.records import cached_record
+
+
+class FakeRedis:
+    """The subset of ``redis.Redis`` the backend uses, kept in a dict."""
+
+    def __init__(self):
+        self.store = {}
+        self.expiry = {}
+
+    def get(self, name):
+        return self.store.get(name)
+
+    def set(self, name, value, ex=None):
+        self.store[name] = value
+        self.expiry[name] = ex
+
+    def delete(self, *names):
+        for name in names:
+            self.store.pop(name, None)
+
+    def scan_iter(self, match="*"):
+        return [k for k in list(self.store) if fnmatch.fnmatch(k, match)]
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.unit
+class MemoryBackendTests(unittest.TestCase):
+    def test_ttl_expiry_and_none_is_cacheable(self):
+        clock = _Clock()
+        cache = MemoryCacheBackend(clock=clock)
+        cache.set("ns", "k", None, ttl=10)
+        self.assertIsNone(cache.get("ns", "k"))
+        clock.now = 11
+        self.assertIs(cache.get("ns", "k"), MISS)
+
+    def test_oldest_entries_evicted_and_namespaces_cleared_separately(self):
+        cache = MemoryCacheBackend(max_entries=2)
+        cache.set("a", 1, "one")
+        cache.set("b", 2, "two")
+        cache.set("b", 3, "three")
+        self.assertIs(cache.get("a", 1), MISS)
+        cache.clear("b")
+        self.assertIs(cache.get("b", 3), MISS)
+
+
+@pytest.mark.unit
+class RedisBackendTests(unittest.TestCase):
+    def setUp(self):
+        self.client = FakeRedis()
+        self.cache = RedisCacheBackend(self.client, prefix="prod")
+
+    def test_values_are_namespaced_compressed_and_expire(self):
+        frame = pd.DataFrame({"Close": [1.0, 2.0]})
+        self.cache.set("ohlcv", ("AAPL", "2021-01-01", "2026-01-02"), frame, ttl=0.5)
+
+        name = "prod:ohlcv:AAPL:2021-01-01:2026-01-02"
+        self.assertIn(name, self.client.store)
+        zlib.decompress(self.client.store[name])  # stored compressed
+        self.assertEqual(self.client.expiry[name], 1)  # sub-second TTL rounds up
+        pd.testing.assert_frame_equal(self.cache.get("ohlcv", ("AAPL", "2021-01-01", "2026-01-02")), frame)
+
+    def test_clear_only_touches_its_namespace(self):
+        self.cache.set("records", "a", 1)
+        self.cache.set("identity", "b", 2)
+        self.cache.clear("records")
+        self.assertIs(self.cache.get("records", "a"), MISS)
+        self.assertEqual(self.cache.get("identity", "b"), 2)
+
+    def test_outage_is_a_miss_not_an_error(self):
+        broken = mock.Mock()
+        broken.get.side_effect = ConnectionError("redis down")
+        broken.set.side_effect = ConnectionError("redis down")
+        cache = RedisCacheBackend(broken)
+        cache.set("records", "k", 1)
+        self.assertIs(cache.get("records", "k"), MISS)
+
+    def test_config_selects_redis_with_namespace_prefix(self):
+        self.assertIsInstance(get_cache_backend(), MemoryCacheBackend)
+        set_config({"cache_backend": "redis", "cache_namespace": "staging"})
+        backend = get_cache_backend()
+        self.assertIsInstance(backend, RedisCacheBackend)
+        self.assertEqual(backend.prefix, "staging")
+
+    def test_unknown_backend_rejected(self):
+        set_config({"cache_backend": "memcached"})
+        with self.assertRaises(ValueError):
+            get_cache_backend()
+
+
+@pytest.mark.unit
+class SharedCacheIntegrationTests(unittest.TestCase):
+    """Two "nodes" share one Redis: the second never calls the vendor."""
+
+    def setUp(self):
+        self.client = FakeRedis()
+        set_cache_backend(RedisCacheBackend(self.client))
+        resolve_instrument_identity.cache_clear()
+
+    def tearDown(self):
+        resolve_instrument_identity.cache_clear()
+
+    def test_identity_reused_across_processes(self):
+        with mock.patch("tradingagents.dataflows.yfinance_registry.yf.Ticker") as ticker:
+            ticker.return_value.info = {"longName": "Apple Inc.", "sector": "Technology"}
+            first = resolve_instrument_identity("AAPL")
+            resolve_instrument_identity.cache_clear()  # a fresh process
+            second = resolve_instrument_identity("AAPL")
+        ticker.assert_called_once()
+        self.assertEqual(first, second)
+
+    def test_records_reused_across_processes(self):
+        fetch = mock.Mock(return_value="record")
+        cached_record(("yfinance", "news", "AAPL", 20), fetch)
+        cached_record(("yfinance", "news", "AAPL", 20), fetch)
+        fetch.assert_called_once()
+        self.assertTrue(any(k.startswith("tradingagents:records:") for k in self.client.store))
+
+    def test_ohlcv_reused_without_a_local_file(self):
+        today = pd.Timestamp.today().normalize()
+        frame = pd.DataFrame(
+            {"Open": [1.0], "High": [1.0], "Low": [1.0], "Close": [1.0], "Volume": [1]},
+            index=pd.DatetimeIndex([today], name="Date"),
+        )
+        curr = today.strftime("%Y-%m-%d")
+        with mock.patch.object(su.yf, "download", return_value=frame) as download:
+            for _ in range(2):  # each "node" has its own empty data_cache_dir
+                with tempfile.TemporaryDirectory() as tmp:
+                    set_config({"data_cache_dir": tmp})
+                    out = su.load_ohlcv("AAPL", curr)
+                    self.assertEqual(len(out), 1)
+        download.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,8 +5,14 @@ import unittest
 
 import pytest
 
+import tradingagents.dataflows.config as config_module
 import tradingagents.default_config as default_config
-from tradingagents.dataflows.config import get_config, set_config
+from tradingagents.dataflows.config import (
+    get_config,
+    get_config_snapshot,
+    get_config_version,
+    set_config,
+)
 
 
 @pytest.mark.unit
@@ -59,3 +65,32 @@ class DataflowsConfigIsolationTests(unittest.TestCase):
         fresh = get_config()
         self.assertEqual(fresh["tool_vendors"]["get_stock_data"], "alpha_vantage")
         self.assertEqual(fresh["tool_vendors"]["get_news"], "alpha_vantage")
+
+
+@pytest.mark.unit
+class ConfigSnapshotTests(unittest.TestCase):
+    def test_snapshot_is_reused_until_config_changes(self):
+        first = get_config_snapshot()
+        self.assertIs(get_config_snapshot(), first)
+        version = get_config_version()
+
+        set_config({"output_language": "German"})
+
+        second = get_config_snapshot()
+        self.assertIsNot(second, first)
+        self.assertEqual(second["output_language"], "German")
+        self.assertGreater(get_config_version(), version)
+
+    def test_snapshot_tracks_wholesale_config_replacement(self):
+        first = get_config_snapshot()
+        config_module._config = copy.deepcopy(default_config.DEFAULT_CONFIG)
+        self.assertIsNot(get_config_snapshot(), first)
+
+    def test_snapshot_is_deeply_immutable(self):
+        snap = get_config_snapshot()
+        with self.assertRaises(TypeError):
+            snap["output_language"] = "German"
+        with self.assertRaises(TypeError):
+            snap["data_vendors"]["core_stock_apis"] = "alpha_vantage"
+        self.assertIsInstance(snap["global_news_queries"], tuple)
+        self.assertEqual(get_config()["data_vendors"]["core_stock_apis"], "yfinance")
@@ -9,6 +9,7 @@ import pytest
 
 import tradingagents.dataflows.stockstats_utils as su
 import tradingagents.dataflows.y_finance as yfin
+import tradingagents.dataflows.yfinance_registry as yreg
 from tradingagents.dataflows.config import set_config
 
 
@@ -30,7 +31,7 @@ def test_get_yfin_requests_inclusive_end(monkeypatch):
                 index=idx,
             )
 
-    monkeypatch.setattr(yfin.yf, "Ticker", FakeTicker)
+    monkeypatch.setattr(yreg.yf, "Ticker", FakeTicker)
     out = yfin.get_YFin_data_online("AAPL", "2025-05-01", "2025-05-09")
 
     # end is requested one day past end_date so 2025-05-09 is included (#987).
@@ -0,0 +1,152 @@
+"""Round-based debate scheduling: speakers in a round answer the previous
+round concurrently and are merged in a fixed order.
+"""
+import threading
+from types import SimpleNamespace
+
+import pytest
+from langgraph.prebuilt import ToolNode
+
+from tradingagents.agents import (
+    create_aggressive_debator,
+    create_bear_researcher,
+    create_bull_researcher,
+    create_conservative_debator,
+    create_neutral_debator,
+)
+from tradingagents.graph.conditional_logic import ConditionalLogic
+from tradingagents.graph.debate_rounds import create_research_round, create_risk_round
+from tradingagents.graph.setup import GraphSetup
+
+
+class _BarrierLLM:
+    """Answers only once every speaker of the round is waiting on it."""
+
+    def __init__(self, name, barrier, prompts):
+        self.name = name
+        self.barrier = barrier
+        self.prompts = prompts
+
+    def invoke(self, prompt):
+        self.prompts[self.name] = prompt
+        self.barrier.wait()
+        return SimpleNamespace(content=f"{self.name} point")
+
+
+def _state(**debates):
+    return {
+        "company_of_interest": "AAPL",
+        "trade_date": "2025-01-10",
+        "market_report": "m",
+        "sentiment_report": "s",
+        "news_report": "n",
+        "fundamentals_report": "f",
+        "trader_investment_plan": "BUY",
+        **debates,
+    }
+
+
+def _invest(**overrides):
+    return {
+        "history": "", "bull_history": "", "bear_history": "", "current_response": "",
+        "current_bull_response": "", "current_bear_response": "", "judge_decision": "",
+        "count": 0, **overrides,
+    }
+
+
+def _research_round(prompts):
+    barrier = threading.Barrier(2, timeout=5)
+    return create_research_round(
+        create_bull_researcher(_BarrierLLM("bull", barrier, prompts)),
+        create_bear_researcher(_BarrierLLM("bear", barrier, prompts)),
+    )
+
+
+@pytest.mark.unit
+def test_research_round_runs_both_sides_and_merges_bull_first():
+    prompts = {}
+    result = _research_round(prompts)(_state(investment_debate_state=_invest()))
+    debate = result["investment_debate_state"]
+
+    assert debate["history"] == "\nBull Analyst: bull point\nBear Analyst: bear point"
+    assert debate["bull_history"] == "\nBull Analyst: bull point"
+    assert debate["bear_history"] == "\nBear Analyst: bear point"
+    assert debate["current_bull_response"] == "Bull Analyst: bull point"
+    assert debate["current_bear_response"] == "Bear Analyst: bear point"
+    assert debate["count"] == 2
+    # Opening statements: neither side saw the other.
+    assert "bear point" not in prompts["bull"]
+    assert "bull point" not in prompts["bear"]
+
+
+@pytest.mark.unit
+def test_later_round_answers_the_other_sides_previous_argument():
+    prompts = {}
+    previous = _invest(
+        history="\nBull Analyst: old bull\nBear Analyst: old bear",
+        bull_history="\nBull Analyst: old bull",
+        bear_history="\nBear Analyst: old bear",
+        current_response="Bear Analyst: old bear",
+        current_bull_response="Bull Analyst: old bull",
+        current_bear_response="Bear Analyst: old bear",
+        count=2,
+    )
+    result = _research_round(prompts)(_state(investment_debate_state=previous))
+    debate = result["investment_debate_state"]
+
+    assert "Last bear argument: Bear Analyst: old bear" in prompts["bull"]
+    assert "Bull Analyst: old bull" in prompts["bear"].split("Conversation history")[-1]
+    assert debate["bull_history"] == "\nBull Analyst: old bull\nBull Analyst: bull point"
+    assert debate["history"].endswith("\nBull Analyst: bull point\nBear Analyst: bear point")
+    assert debate["count"] == 4
+
+
+@pytest.mark.unit
+def test_risk_round_merges_in_speaker_order():
+    prompts = {}
+    barrier = threading.Barrier(3, timeout=5)
+    risk_round = create_risk_round(
+        create_aggressive_debator(_BarrierLLM("aggressive", barrier, prompts)),
+        create_conservative_debator(_BarrierLLM("conservative", barrier, prompts)),
+        create_neutral_debator(_BarrierLLM("neutral", barrier, prompts)),
+    )
+    risk = {
+        "history": "", "aggressive_history": "", "conservative_history": "",
+        "neutral_history": "", "latest_speaker": "", "current_aggressive_response": "",
+        "current_conservative_response": "", "current_neutral_response": "",
+        "judge_decision": "", "count": 0,
+    }
+
+    debate = risk_round(_state(risk_debate_state=risk))["risk_debate_state"]
+
+    assert debate["history"] == (
+        "\nAggressive Analyst: aggressive point"
+        "\nConservative Analyst: conservative point"
+        "\nNeutral Analyst: neutral point"
+    )
+    assert debate["current_conservative_response"] == "Conservative Analyst: conservative point"
+    assert debate["neutral_history"] == "\nNeutral Analyst: neutral point"
+    assert debate["count"] == 3
+
+
+@pytest.mark.unit
+def test_round_routing_stops_after_configured_rounds():
+    logic = ConditionalLogic(max_debate_rounds=2, max_risk_discuss_rounds=1)
+
+    assert logic.should_continue_debate_round({"investment_debate_state": {"count": 2}}) == "Research Debate"
+    assert logic.should_continue_debate_round({"investment_debate_state": {"count": 4}}) == "Research Manager"
+    assert logic.should_continue_risk_round({"risk_debate_state": {"count": 0}}) == "Risk Debate"
+    assert logic.should_continue_risk_round({"risk_debate_state": {"count": 3}}) == "Portfolio Manager"
+
+
+@pytest.mark.unit
+def test_parallel_debate_graph_replaces_turn_nodes_with_round_nodes():
+    setup = GraphSetup(None, None, {"market": ToolNode([])}, ConditionalLogic())
+    graph = setup.setup_graph(["market"], parallel_debate=True).compile().get_graph()
+
+    assert {"Research Debate", "Risk Debate"} <= set(graph.nodes)
+    assert not {"Bull Researcher", "Aggressive Analyst"} & set(graph.nodes)
+    edges = {(edge.source, edge.target) for edge in graph.edges}
+    assert ("Msg Clear Market", "Research Debate") in edges
+    assert ("Trader", "Risk Debate") in edges
+    assert ("Research Debate", "Research Debate") in edges
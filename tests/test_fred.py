@@ -5,6 +5,7 @@ All API access is mocked, so these run without a network connection or a key.
 """
 import copy
 import unittest
+from datetime import date, timedelta
 from unittest import mock
 
 import pytest
@@ -121,10 +122,12 @@ class FredFormattingTests(unittest.TestCase):
         self.assertIn("not found", out)
 
     def test_long_series_is_truncated_but_change_uses_full_range(self):
-        # Build > MAX_ROWS observations deterministically.
+        # Build > MAX_ROWS daily observations deterministically (FRED dates
+        # are unique per series, and the store keys observations by date).
+        start = date(2025, 1, 1)
         obs = {
             "observations": [
-                {"date": f"2025-01-{(i % 28) + 1:02d}", "value": str(i)}
+                {"date": (start + timedelta(days=i)).isoformat(), "value": str(i)}
                 for i in range(fred.MAX_ROWS + 10)
             ]
         }
@@ -0,0 +1,169 @@
+"""FRED store: metadata is cached for its TTL, observation history accumulates
+per series, and only observations outside the stored range are requested.
+"""
+import os
+import unittest
+from datetime import date, datetime, timedelta
+from unittest import mock
+
+import pytest
+
+from tradingagents.dataflows import fred
+from tradingagents.dataflows.config import get_config, set_config
+from tradingagents.dataflows.fred_store import FredStore
+
+
+def _ts(day):
+    return datetime.strptime(day, "%Y-%m-%d").timestamp()
+
+
+def _monthly(start, end):
+    """Month-start observations in ``[start, end]``, valued by month number."""
+    points, day = [], date.fromisoformat(start).replace(day=1)
+    while day.isoformat() <= end:
+        if day.isoformat() >= start:
+            points.append((day.isoformat(), str(day.month)))
+        day = (day + timedelta(days=32)).replace(day=1)
+    return tuple(points)
+
+
+class _Observations:
+    """Fake ``series/observations`` fetcher; ``published`` is the last released date."""
+
+    def __init__(self, published="2099-12-31"):
+        self.published = published
+        self.calls = []
+
+    def __call__(self, series_id, start, end):
+        self.calls.append((start, end))
+        return _monthly(start, min(end, self.published))
+
+
+@pytest.mark.unit
+class FredStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.now = _ts("2025-10-20")
+        path = os.path.join(get_config()["data_cache_dir"], "fred-test.sqlite")
+        self.store = FredStore(path, metadata_ttl=86400, refresh_interval=3600, clock=lambda: self.now)
+
+    def test_windows_inside_the_stored_range_are_local(self):
+        vendor = _Observations()
+        first = self.store.observations("UNRATE", "2024-01-01", "2025-06-30", vendor)
+        inner = self.store.observations("UNRATE", "2024-06-01", "2025-03-31", vendor)
+        self.assertEqual(vendor.calls, [("2024-01-01", "2025-06-30")])
+        self.assertEqual(inner[0], ("2024-06-01", "6"))
+        self.assertEqual(inner[-1], ("2025-03-01", "3"))
+        self.assertEqual(len(first), 18)
+
+    def test_later_window_fetches_only_newer_observations(self):
+        vendor = _Observations()
+        self.store.observations("UNRATE", "2024-01-01", "2025-03-31", vendor)
+        out = self.store.observations("UNRATE", "2024-06-01", "2025-06-30", vendor)
+        # Resumes after the last stored observation, up to the present.
+        self.assertEqual(vendor.calls[1], ("2025-03-02", "2025-10-20"))
+        self.assertEqual(out[-1], ("2025-06-01", "6"))
+        # The extended range answers the following backtest dates locally.
+        self.store.observations("UNRATE", "2024-07-01", "2025-09-30", vendor)
+        self.assertEqual(len(vendor.calls), 2)
+
+    def test_reads_never_include_observations_after_the_end_date(self):
+        vendor = _Observations()
+        self.store.observations("UNRATE", "2024-01-01", "2025-10-20", vendor)
+        out = self.store.observations("UNRATE", "2024-01-01", "2025-02-15", vendor)
+        self.assertEqual(out[-1], ("2025-02-01", "2"))
+
+    def test_earlier_start_fetches_the_gap_before_the_range(self):
+        vendor = _Observations()
+        self.store.observations("UNRATE", "2025-01-01", "2025-06-30", vendor)
+        out = self.store.observations("UNRATE", "2024-10-01", "2025-06-30", vendor)
+        self.assertEqual(vendor.calls[1], ("2024-10-01", "2024-12-31"))
+        self.assertEqual(out[0], ("2024-10-01", "10"))
+
+    def test_present_range_is_polled_at_most_every_refresh_interval(self):
+        vendor = _Observations(published="2025-09-01")
+        self.store.observations("CPIAUCSL", "2025-01-01", "2025-10-20", vendor)
+        self.now += 600
+        self.store.observations("CPIAUCSL", "2025-01-01", "2025-10-21", vendor)
+        self.assertEqual(len(vendor.calls), 1)
+        # A late release dated in the past is picked up on the next poll.
+        vendor.published = "2025-10-01"
+        self.now += 3600
+        out = self.store.observations("CPIAUCSL", "2025-01-01", "2025-10-21", vendor)
+        self.assertEqual(vendor.calls[1], ("2025-09-02", "2025-10-20"))
+        self.assertEqual(out[-1], ("2025-10-01", "10"))
+
+    def test_failed_sync_serves_stored_observations(self):
+        vendor = _Observations()
+        self.store.observations("UNRATE", "2025-01-01", "2025-03-31", vendor)
+        down = mock.Mock(side_effect=RuntimeError("down"))
+        out = self.store.observations("UNRATE", "2025-01-01", "2025-06-30", down)
+        self.assertEqual(out[-1], ("2025-03-01", "3"))
+        with self.assertRaises(RuntimeError):
+            self.store.observations("DGS10", "2025-01-01", "2025-03-31", down)
+
+    def test_metadata_is_cached_for_its_ttl(self):
+        fetch = mock.Mock(return_value={"title": "Unemployment Rate"})
+        self.store.metadata("UNRATE", fetch)
+        self.now += 3600
+        self.assertEqual(self.store.metadata("UNRATE", fetch)["title"], "Unemployment Rate")
+        self.assertEqual(fetch.call_count, 1)
+        self.now += 86400
+        self.store.metadata("UNRATE", fetch)
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_unknown_series_metadata_is_not_stored(self):
+        fetch = mock.Mock(return_value=None)
+        self.assertIsNone(self.store.metadata("NOPE", fetch))
+        self.assertIsNone(self.store.metadata("NOPE", fetch))
+        self.assertEqual(fetch.call_count, 2)
+
+
+def _request_counter():
+    calls = []
+
+    def _request(path, params):
+        calls.append(path)
+        if path == "series":
+            return {"seriess": [{"title": "Series", "units_short": "%", "frequency": "Monthly"}]}
+        return {
+            "observations": [
+                {"date": d, "value": v}
+                for d, v in _monthly(params["observation_start"], params["observation_end"])
+            ]
+        }
+
+    return calls, _request
+
+
+@pytest.mark.unit
+def test_repeated_macro_lookups_make_no_further_requests():
+    calls, request = _request_counter()
+    with mock.patch.object(fred, "_request", side_effect=request):
+        fred.get_macro_data("unemployment", "2025-06-30", 365)
+        out = fred.get_macro_data("unemployment", "2025-05-31", 180)
+    assert calls == ["series", "series/observations"]
+    assert "| 2025-05-01 | 5 |" in out
+    assert "2025-06-01" not in out
+
+
+@pytest.mark.unit
+def test_disabled_store_fetches_every_call():
+    set_config({"fred_store": False, "record_cache_ttl": 0})
+    calls, request = _request_counter()
+    with mock.patch.object(fred, "_request", side_effect=request):
+        fred.get_macro_data("unemployment", "2025-06-30", 365)
+        fred.get_macro_data("unemployment", "2025-05-31", 180)
+    assert calls == ["series", "series/observations"] * 2
+
+
+@pytest.mark.unit
+def test_warm_loads_each_macro_series_once():
+    calls, request = _request_counter()
+    with mock.patch.object(fred, "_request", side_effect=request):
+        warmed = fred.warm_macro_series("2025-06-30")
+        fred.get_macro_data("cpi", "2025-06-30", 90)
+    series_ids = set(fred.MACRO_SERIES.values())
+    assert set(warmed) == series_ids
+    assert all(count == 12 for count in warmed.values())
+    assert calls.count("series") == len(series_ids)
+    assert calls.count("series/observations") == len(series_ids)
@@ -0,0 +1,151 @@
+"""Fundamentals bundle prefetch: the overview and three statements are fetched
+concurrently at node start, handed to the analyst in one prompt, and the
+matching tool calls are answered without another vendor request.
+"""
+import threading
+import unittest
+from unittest import mock
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.runnables import RunnableLambda
+
+from tradingagents.agents.analysts.fundamentals_analyst import create_fundamentals_analyst
+from tradingagents.agents.utils.fundamental_data_tools import (
+    get_balance_sheet,
+    get_fundamentals,
+    prefetch_fundamentals,
+)
+from tradingagents.dataflows import interface
+from tradingagents.dataflows.config import set_config
+
+_METHODS = ("get_fundamentals", "get_balance_sheet", "get_cashflow", "get_income_statement")
+
+
+class _Vendor:
+    """Fake vendor recording calls; ``barrier`` proves the calls overlap."""
+
+    def __init__(self, barrier=None, fail=(), error_text=()):
+        self.calls = []
+        self.barrier = barrier
+        self.fail = set(fail)
+        self.error_text = set(error_text)
+        self._lock = threading.Lock()
+
+    def patch(self):
+        return mock.patch.dict(
+            interface.VENDOR_METHODS,
+            {m: {"yfinance": self._impl(m)} for m in _METHODS},
+        )
+
+    def _impl(self, method):
+        def impl(*args):
+            with self._lock:
+                self.calls.append((method, args))
+            if self.barrier is not None:
+                self.barrier.wait(5)
+            if method in self.fail:
+                raise RuntimeError("boom")
+            if method in self.error_text:
+                self.error_text.discard(method)  # transient: the next call succeeds
+                return f"Error retrieving {method} for {args[0]}: timed out"
+            return f"{method.upper()} {args[0]}"
+
+        return impl
+
+
+class _CapturingLLM:
+    """Stands in for a chat model: records the prompt, answers without tools."""
+
+    def __init__(self):
+        self.prompts = []
+
+    def bind_tools(self, tools):
+        def respond(prompt_value):
+            self.prompts.append(prompt_value.to_messages())
+            return AIMessage(content="Fundamentals report.")
+
+        return RunnableLambda(respond)
+
+
+@pytest.mark.unit
+class FundamentalsPrefetchTests(unittest.TestCase):
+    def test_bundle_fetches_all_four_reports_concurrently(self):
+        vendor = _Vendor(barrier=threading.Barrier(4))
+        with vendor.patch():
+            bundle = prefetch_fundamentals("AAPL", "2026-01-10")
+        self.assertEqual(list(bundle), list(_METHODS))
+        self.assertEqual(bundle["get_cashflow"], "GET_CASHFLOW AAPL")
+        self.assertIn(("get_balance_sheet", ("AAPL", "quarterly", "2026-01-10")), vendor.calls)
+
+    def test_tool_calls_are_served_from_the_prefetch(self):
+        vendor = _Vendor()
+        with vendor.patch():
+            prefetch_fundamentals("AAPL", "2026-01-10")
+            overview = get_fundamentals.invoke({"ticker": "AAPL", "curr_date": "2026-01-10"})
+            sheet = get_balance_sheet.invoke(
+                {"ticker": "AAPL", "freq": "quarterly", "curr_date": "2026-01-10"}
+            )
+        self.assertEqual(overview, "GET_FUNDAMENTALS AAPL")
+        self.assertEqual(sheet, "GET_BALANCE_SHEET AAPL")
+        self.assertEqual(len(vendor.calls), 4)
+
+    def test_different_arguments_still_reach_the_vendor(self):
+        vendor = _Vendor()
+        with vendor.patch():
+            prefetch_fundamentals("AAPL", "2026-01-10")
+            get_balance_sheet.invoke({"ticker": "AAPL", "freq": "annual", "curr_date": "2026-01-10"})
+        self.assertEqual(len(vendor.calls), 5)
+
+    def test_failed_report_is_left_to_the_tool_call(self):
+        vendor = _Vendor(fail={"get_cashflow"})
+        with vendor.patch():
+            bundle = prefetch_fundamentals("AAPL", "2026-01-10")
+            self.assertNotIn("get_cashflow", bundle)
+            with self.assertRaises(RuntimeError):
+                interface.route_to_vendor("get_cashflow", "AAPL", "quarterly", "2026-01-10")
+        self.assertEqual(len(vendor.calls), 5)
+
+    def test_error_text_is_neither_cached_nor_shown_to_the_analyst(self):
+        vendor = _Vendor(error_text={"get_balance_sheet"})
+        with vendor.patch():
+            bundle = prefetch_fundamentals("AAPL", "2026-01-10")
+            self.assertNotIn("get_balance_sheet", bundle)
+            sheet = get_balance_sheet.invoke(
+                {"ticker": "AAPL", "freq": "quarterly", "curr_date": "2026-01-10"}
+            )
+        self.assertEqual(sheet, "GET_BALANCE_SHEET AAPL")
+        self.assertEqual(len(vendor.calls), 5)
+
+    def _run_node(self):
+        llm = _CapturingLLM()
+        node = create_fundamentals_analyst(llm)
+        state = {
+            "trade_date": "2026-01-10",
+            "company_of_interest": "AAPL",
+            "messages": [HumanMessage(content="Analyze AAPL")],
+        }
+        result = node(state)
+        return llm.prompts[0][0].content, result
+
+    def test_analyst_receives_the_bundle_in_its_prompt(self):
+        vendor = _Vendor()
+        with vendor.patch():
+            system, result = self._run_node()
+        self.assertIn("GET_INCOME_STATEMENT AAPL", system)
+        self.assertIn("already been retrieved", system)
+        self.assertIn("as of 2026-01-10", system)
+        self.assertNotIn("as of today", system)
+        self.assertEqual(result["fundamentals_report"], "Fundamentals report.")
+
+    def test_prefetch_can_be_disabled(self):
+        set_config({"prefetch_fundamentals": False})
+        vendor = _Vendor()
+        with vendor.patch():
+            system, _ = self._run_node()
+        self.assertEqual(vendor.calls, [])
+        self.assertNotIn("already been retrieved", system)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+"""Point-in-time fundamentals store: as-of queries are answered locally and the
+vendor is asked again only when a newer fiscal period could have been reported.
+"""
+import os
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from tradingagents.dataflows import y_finance, yfinance_registry
+from tradingagents.dataflows.config import get_config, set_config
+from tradingagents.dataflows.fundamentals_store import FundamentalsStore
+from tradingagents.dataflows.records import FinancialStatement, clear_record_cache
+
+
+def _frame(*periods, revenue=100.0):
+    return pd.DataFrame(
+        {pd.Timestamp(p): [revenue + i, 50.0 + i] for i, p in enumerate(periods)},
+        index=["Total Revenue", "Net Income"],
+    )
+
+
+def _ts(date):
+    return datetime.strptime(date, "%Y-%m-%d").timestamp()
+
+
+class _Vendor:
+    def __init__(self, *frames):
+        self.frames = list(frames)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        frame = self.frames[min(self.calls, len(self.frames)) - 1]
+        if isinstance(frame, Exception):
+            raise frame
+        return FinancialStatement("AAPL", "AAPL", "income_statement", "quarterly", frame, currency="USD")
+
+
+@pytest.mark.unit
+class FundamentalsStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.now = _ts("2025-08-01")
+        self.path = os.path.join(get_config()["data_cache_dir"], "store.sqlite")
+        self.store = FundamentalsStore(self.path, refresh_interval=86400, clock=lambda: self.now)
+
+    def _query(self, vendor, as_of):
+        return self.store.statement("yfinance", "AAPL", "income_statement", "quarterly", as_of, vendor)
+
+    def test_backtest_dates_before_the_download_are_served_locally(self):
+        vendor = _Vendor(_frame("2025-06-30", "2025-03-31", "2024-12-31"))
+        for as_of in pd.date_range("2025-01-01", "2025-07-31", freq="7D"):
+            self._query(vendor, as_of.strftime("%Y-%m-%d"))
+        self.assertEqual(vendor.calls, 1)
+
+    def test_as_of_excludes_later_periods(self):
+        vendor = _Vendor(_frame("2025-06-30", "2025-03-31", "2024-12-31"))
+        statement = self._query(vendor, "2025-04-15")
+        self.assertEqual(
+            list(statement.frame.columns), [pd.Timestamp("2025-03-31"), pd.Timestamp("2024-12-31")]
+        )
+        self.assertEqual(statement.frame.loc["Total Revenue", pd.Timestamp("2025-03-31")], 101.0)
+        self.assertEqual(statement.currency, "USD")
+
+    def test_refreshes_once_a_newer_period_has_ended(self):
+        vendor = _Vendor(_frame("2025-06-30"), _frame("2025-09-30", "2025-06-30"))
+        self._query(vendor, "2025-08-01")
+        self.now = _ts("2025-09-15")
+        self._query(vendor, "2025-09-15")  # Q3 hasn't ended yet
+        self.assertEqual(vendor.calls, 1)
+        self.now = _ts("2025-10-20")
+        statement = self._query(vendor, "2025-10-20")
+        self.assertEqual(vendor.calls, 2)
+        self.assertIn(pd.Timestamp("2025-09-30"), statement.frame.columns)
+
+    def test_pending_filing_is_rechecked_at_most_once_per_interval(self):
+        vendor = _Vendor(_frame("2025-06-30"))
+        self._query(vendor, "2025-08-01")
+        self.now = _ts("2025-10-20")
+        self._query(vendor, "2025-10-20")
+        self.now += 3600
+        self._query(vendor, "2025-10-20")
+        self.assertEqual(vendor.calls, 2)
+
+    def test_restated_period_bumps_its_version(self):
+        vendor = _Vendor(_frame("2025-06-30"), _frame("2025-09-30", "2025-06-30", revenue=90.0))
+        self._query(vendor, "2025-08-01")
+        self.now = _ts("2025-10-20")
+        self._query(vendor, "2025-10-20")
+        versions = self.store.versions("yfinance", "AAPL", "income_statement", "quarterly")
+        self.assertEqual(versions, {"2025-06-30": 2, "2025-09-30": 1})
+
+    def test_failed_refresh_serves_stored_periods(self):
+        vendor = _Vendor(_frame("2025-06-30"), RuntimeError("429"))
+        self._query(vendor, "2025-08-01")
+        self.now = _ts("2025-10-20")
+        statement = self._query(vendor, "2025-10-20")
+        self.assertEqual(list(statement.frame.columns), [pd.Timestamp("2025-06-30")])
+
+    def test_store_persists_across_instances(self):
+        self._query(_Vendor(_frame("2025-06-30")), "2025-08-01")
+        reopened = FundamentalsStore(self.path, clock=lambda: self.now)
+        vendor = _Vendor(_frame("2025-06-30"))
+        statement = reopened.statement(
+            "yfinance", "AAPL", "income_statement", "quarterly", "2025-07-15", vendor
+        )
+        self.assertEqual(vendor.calls, 0)
+        self.assertEqual(len(statement.frame.columns), 1)
+
+
+@pytest.mark.unit
+class StatementToolStoreTests(unittest.TestCase):
+    def _fake_ticker(self):
+        frame = _frame("2025-06-30", "2025-03-31")
+
+        class FakeTicker:
+            calls = 0
+
+            def __init__(self, symbol):
+                pass
+
+            @property
+            def quarterly_income_stmt(self):
+                FakeTicker.calls += 1
+                return frame
+
+        return FakeTicker
+
+    def test_repeated_backtest_survives_a_cold_record_cache(self):
+        FakeTicker = self._fake_ticker()
+        with mock.patch.object(yfinance_registry.yf, "Ticker", FakeTicker):
+            for as_of in ("2025-04-15", "2025-07-15", "2025-05-01"):
+                clear_record_cache()
+                y_finance.get_income_statement("AAPL", "quarterly", as_of)
+        self.assertEqual(FakeTicker.calls, 1)
+
+    def test_disabled_store_downloads_again(self):
+        set_config({"fundamentals_store": False})
+        FakeTicker = self._fake_ticker()
+        with mock.patch.object(yfinance_registry.yf, "Ticker", FakeTicker):
+            for as_of in ("2025-04-15", "2025-07-15"):
+                clear_record_cache()
+                report = y_finance.get_income_statement("AAPL", "quarterly", as_of)
+        self.assertEqual(FakeTicker.calls, 2)
+        self.assertIn("2025-06-30", report)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+"""Global news searches run concurrently, are cached per (query, date) so every
+ticker analysed on a date shares them, and dedup runs after the window filter.
+"""
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+import tradingagents.dataflows.yfinance_news as ynews
+from tradingagents.dataflows.config import set_config
+
+_QUERIES = ["fed", "earnings", "oil"]
+
+
+def _epoch(date_str):
+    return int(time.mktime(datetime.strptime(date_str, "%Y-%m-%d").timetuple()))
+
+
+def _article(title, date):
+    return {"title": title, "publisher": "P", "link": "l", "providerPublishTime": _epoch(date)}
+
+
+def _install(monkeypatch, by_query, barrier=None):
+    calls = []
+
+    class FakeSearch:
+        def __init__(self, query, **kwargs):
+            calls.append(query)
+            if barrier is not None:
+                barrier.wait(5)
+            result = by_query.get(query, [])
+            if isinstance(result, Exception):
+                raise result
+            self.news = result
+
+    monkeypatch.setattr(ynews.yf, "Search", FakeSearch)
+    set_config({"global_news_queries": list(by_query) or _QUERIES})
+    return calls
+
+
+@pytest.mark.unit
+def test_queries_run_concurrently(monkeypatch):
+    by_query = {q: [_article(f"{q} story", "2025-05-05")] for q in _QUERIES}
+    calls = _install(monkeypatch, by_query, barrier=threading.Barrier(len(_QUERIES)))
+    out = ynews.get_global_news_yfinance("2025-05-09", look_back_days=7, limit=10)
+    assert sorted(calls) == sorted(_QUERIES)
+    # Output keeps query order regardless of completion order.
+    assert out.index("fed story") < out.index("earnings story") < out.index("oil story")
+
+
+@pytest.mark.unit
+def test_results_are_cached_per_query_and_date(monkeypatch):
+    by_query = {q: [_article(f"{q} story", "2025-05-05")] for q in _QUERIES}
+    calls = _install(monkeypatch, by_query)
+    ynews.get_global_news_yfinance("2025-05-09", look_back_days=7, limit=10)
+    ynews.get_global_news_yfinance("2025-05-09", look_back_days=7, limit=10)
+    assert len(calls) == len(_QUERIES)
+    ynews.get_global_news_yfinance("2025-05-10", look_back_days=7, limit=10)
+    assert len(calls) == 2 * len(_QUERIES)
+
+
+@pytest.mark.unit
+def test_dedup_runs_after_the_window_filter(monkeypatch):
+    # The first query's copy of the headline is out of window; the second's
+    # is in window and must survive rather than be shadowed by the first.
+    by_query = {
+        "fed": [_article("Fed holds rates", "2025-03-01")],
+        "earnings": [_article("fed  HOLDS rates", "2025-05-06"), _article("Fed holds rates", "2025-05-07")],
+    }
+    _install(monkeypatch, by_query)
+    out = ynews.get_global_news_yfinance("2025-05-09", look_back_days=7, limit=10)
+    assert out.count("### ") == 1
+    assert "fed  HOLDS rates" in out
+
+
+@pytest.mark.unit
+def test_limit_applies_to_in_window_articles(monkeypatch):
+    stale = [_article(f"old {i}", "2025-01-01") for i in range(3)]
+    by_query = {"fed": stale, "earnings": [_article("fresh", "2025-05-08")]}
+    _install(monkeypatch, by_query)
+    out = ynews.get_global_news_yfinance("2025-05-09", look_back_days=7, limit=3)
+    assert "fresh" in out
+
+
+@pytest.mark.unit
+def test_one_failed_query_does_not_drop_the_rest(monkeypatch):
+    by_query = {"fed": RuntimeError("boom"), "earnings": [_article("fresh", "2025-05-08")]}
+    monkeypatch.setattr(ynews, "yf_retry", lambda fn: fn())
+    _install(monkeypatch, by_query)
+    out = ynews.get_global_news_yfinance("2025-05-09", look_back_days=7, limit=3)
+    assert "fresh" in out
@@ -1,5 +1,6 @@
 """Tests for TradingMemoryLog — storage, deferred reflection, PM injection, legacy removal."""
 
+from functools import partial
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
@@ -266,6 +267,26 @@ class TestTradingMemoryLogCore:
         assert "Recent cross-ticker lessons" in ctx
         assert "Past analyses of NVDA" not in ctx
 
+    def test_get_past_context_before_keeps_only_outcomes_known_by_then(self, tmp_path):
+        log = make_log(tmp_path)
+        # Decided 01-02, realized 5 sessions later on 01-09.
+        _seed_completed(tmp_path, "NVDA", "2026-01-02", "Buy NVDA early.", "Realized in time.")
+        # Decided before 01-12 but realized after it (recorded exit date).
+        log.store_decision("AAPL", "2026-01-08", DECISION_SELL)
+        log.batch_update_with_outcomes([{
+            "ticker": "AAPL", "trade_date": "2026-01-08", "raw_return": -0.03,
+            "alpha_return": -0.01, "holding_days": 5, "reflection": "Sold too late.",
+            "exit_date": "2026-01-15",
+        }])
+        # Decided after 01-12 (a later date of an earlier rerun).
+        _seed_completed(tmp_path, "NVDA", "2026-01-14", "Buy NVDA later.", "From the future.")
+
+        ctx = log.get_past_context("NVDA", before="2026-01-12")
+        assert "Buy NVDA early." in ctx
+        assert "Sold too late." not in ctx
+        assert "From the future." not in ctx
+        assert "Sold too late." in log.get_past_context("NVDA", before="2026-01-15")
+
     def test_n_same_limit_respected(self, tmp_path):
         """Only the n_same most recent same-ticker entries are included."""
         log = make_log(tmp_path)
@@ -665,6 +686,58 @@ class TestDeferredReflection:
         assert "+5.0%" in entries[0]["raw"]
         assert "+2.0%" in entries[0]["alpha"]
 
+    def test_resolve_as_of_reads_closes_up_to_the_trade_date(self, tmp_path):
+        """A point-in-time run resolves only outcomes realized by its trade date."""
+        log = make_log(tmp_path)
+        log.store_decision("NVDA", "2026-01-05", DECISION_BUY)
+        log.store_decision("NVDA", "2026-01-12", DECISION_BUY)
+        mock_reflector = MagicMock()
+        mock_reflector.reflect_on_final_decision.return_value = "Momentum confirmed."
+        mock_graph = MagicMock(spec=TradingAgentsGraph)
+        mock_graph.memory_log = log
+        mock_graph.reflector = mock_reflector
+        mock_graph._resolve_benchmark = MagicMock(return_value="SPY")
+        mock_graph._fetch_returns_as_of = partial(TradingAgentsGraph._fetch_returns_as_of, mock_graph)
+        sessions = pd.bdate_range("2026-01-05", periods=15)
+        prices = {
+            "NVDA": pd.Series([100.0 + n for n in range(15)], index=sessions),
+            "SPY": pd.Series([400.0] * 15, index=sessions),
+        }
+        seen = []
+
+        def closes(symbol, as_of):
+            seen.append(as_of)
+            return prices[symbol][prices[symbol].index <= pd.Timestamp(as_of)]
+
+        with patch("tradingagents.backtest.prices.load_closes", side_effect=closes):
+            # On 01-09 the 01-05 decision's five sessions have not closed yet.
+            TradingAgentsGraph._resolve_pending_entries(mock_graph, "NVDA", as_of="2026-01-09")
+            assert len(log.get_pending_entries()) == 2
+            TradingAgentsGraph._resolve_pending_entries(mock_graph, "NVDA", as_of="2026-01-12")
+
+        mock_graph._fetch_returns.assert_not_called()
+        assert set(seen) == {"2026-01-09", "2026-01-12"}
+        resolved, pending = log.load_entries()
+        assert resolved["exit"] == "2026-01-12"
+        assert resolved["raw"] == "+5.0%" and resolved["alpha"] == "+5.0%"
+        assert pending["pending"] and pending["date"] == "2026-01-12"
+
+    def test_start_run_context_has_no_outcome_after_the_trade_date(self, tmp_path):
+        log = make_log(tmp_path)
+        _seed_completed(tmp_path, "NVDA", "2026-01-02", "Buy NVDA early.", "Known on 01-12.")
+        _seed_completed(tmp_path, "AAPL", "2026-01-08", "Buy AAPL.", "Realized 01-15.")
+        _seed_completed(tmp_path, "NVDA", "2026-01-20", "Buy NVDA later.", "From the future.")
+        mock_graph = MagicMock(spec=TradingAgentsGraph)
+        mock_graph.memory_log = log
+        mock_graph.propagator = Propagator()
+        mock_graph.config = {}
+        state, _ = TradingAgentsGraph._start_run(
+            mock_graph, "NVDA", "2026-01-12", instrument_context="NVDA"
+        )
+        assert "Known on 01-12." in state["past_context"]
+        assert "Realized 01-15." not in state["past_context"]
+        assert "From the future." not in state["past_context"]
+
 
 # ---------------------------------------------------------------------------
 # Portfolio Manager injection: past_context in state and prompt
@@ -864,6 +937,12 @@ class TestLegacyRemoval:
         mock_graph._run_graph = functools.partial(
             TradingAgentsGraph._run_graph, mock_graph
         )
+        mock_graph._start_run = functools.partial(
+            TradingAgentsGraph._start_run, mock_graph
+        )
+        mock_graph._finish_run = functools.partial(
+            TradingAgentsGraph._finish_run, mock_graph
+        )
         TradingAgentsGraph.propagate(mock_graph, "NVDA", "2026-01-10")
         entries = mock_graph.memory_log.load_entries()
         assert len(entries) == 1
@@ -0,0 +1,212 @@
+"""News store: articles persist across runs, duplicates collapse on canonical
+URL, content hash and MinHash similarity, and vendors are only asked for news
+the store can't already cover.
+"""
+import json
+import os
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import pytest
+
+from tradingagents.dataflows import alpha_vantage_news, yfinance_news as ynews
+from tradingagents.dataflows.config import get_config, set_config
+from tradingagents.dataflows.news_store import NewsStore, canonical_url, minhash, similarity
+from tradingagents.dataflows.records import NewsArticle
+
+_WIRE = (
+    "Acme Corp reported third quarter revenue of 4.2 billion dollars, beating analyst "
+    "estimates, as demand for its cloud software grew faster than expected"
+)
+
+
+def _art(title, summary="", link="", day=5, publisher="P"):
+    return NewsArticle(title, summary, publisher, link, datetime(2025, 5, day, 12))
+
+
+@pytest.mark.unit
+class NewsStoreDedupTests(unittest.TestCase):
+    def setUp(self):
+        self.now = datetime(2025, 5, 10).timestamp()
+        path = os.path.join(get_config()["data_cache_dir"], "news.sqlite")
+        self.store = NewsStore(path, clock=lambda: self.now)
+
+    def test_canonical_url_ignores_tracking_and_case(self):
+        self.assertEqual(
+            canonical_url("HTTPS://News.Example.com/a/b/?utm_source=x&id=7#top"),
+            canonical_url("https://news.example.com/a/b?id=7"),
+        )
+
+    def test_same_url_and_same_content_collapse(self):
+        self.store.add("ACME", [
+            _art("Acme beats", link="https://x.com/a?utm_medium=rss"),
+            _art("Acme beats (updated)", link="https://x.com/a"),
+            _art("Acme  BEATS", link="https://y.com/other"),
+        ])
+        self.assertEqual(len(self.store.articles("ACME")), 1)
+
+    def test_syndicated_rewrite_is_a_near_duplicate(self):
+        a = _art("Acme beats estimates", _WIRE, "https://reuters.com/1", publisher="Reuters")
+        b = _art("Acme beats estimates", _WIRE + ", the company said.",
+                 "https://yahoo.com/2", publisher="Yahoo")
+        self.assertGreaterEqual(similarity(minhash(a), minhash(b)), 0.8)
+        self.assertEqual(self.store.add("ACME", [a, b]), 1)
+        self.assertEqual([x.publisher for x in self.store.articles("ACME")], ["Reuters"])
+
+    def test_distinct_stories_are_kept(self):
+        self.store.add("ACME", [_art("Acme beats", _WIRE), _art("Acme CEO resigns", "Board names successor")])
+        self.assertEqual(len(self.store.articles("ACME")), 2)
+
+    def test_articles_are_indexed_by_ticker_and_date(self):
+        self.store.add("ACME", [_art("old", day=1), _art("new", day=8)])
+        self.store.add("OTHER", [_art("elsewhere", day=8)])
+        titles = [a.title for a in self.store.articles("ACME", since=datetime(2025, 5, 3))]
+        self.assertEqual(titles, ["new"])
+
+    def test_dedup_happens_after_the_window_filter(self):
+        # The newest copy of the story is outside the window; the older one counts.
+        self.store.add("ACME", [_art("Acme beats", _WIRE, "https://a.com/1", day=3),
+                                _art("Acme beats!", _WIRE + " today", "https://b.com/2", day=9)])
+        kept = self.store.articles("ACME", keep=lambda a: a.pub_date.day <= 5)
+        self.assertEqual([a.pub_date.day for a in kept], [3])
+
+    def test_sync_skips_windows_the_last_fetch_covers(self):
+        fetch = mock.Mock(return_value=[_art("x")])
+        self.store.sync("v", "ACME", datetime(2025, 5, 1), datetime(2025, 5, 9), fetch)
+        self.store.sync("v", "ACME", datetime(2025, 5, 1), datetime(2025, 5, 9), fetch)
+        self.store.sync("v", "ACME", datetime(2025, 5, 3), datetime(2025, 5, 8), fetch)
+        self.assertEqual(fetch.call_count, 1)
+        # Only the uncovered day is requested.
+        self.store.sync("v", "ACME", datetime(2025, 5, 1), datetime(2025, 5, 10), fetch)
+        self.assertEqual(fetch.call_args.args, (datetime(2025, 5, 9), datetime(2025, 5, 10)))
+        # News published since the last fetch waits for the refresh interval.
+        self.store.sync("v", "ACME", datetime(2025, 5, 1), datetime(2025, 5, 12), fetch)
+        self.assertEqual(fetch.call_count, 2)
+        self.now += 7200
+        self.store.sync("v", "ACME", datetime(2025, 5, 1), datetime(2025, 5, 12), fetch)
+        self.assertEqual(fetch.call_count, 3)
+        self.assertEqual(fetch.call_args.args[0], datetime(2025, 5, 10))
+
+    def test_sync_fetches_every_gap_of_a_widened_window(self):
+        fetch = mock.Mock(return_value=[])
+        self.store.sync("v", "ACME", datetime(2025, 5, 5), datetime(2025, 5, 8), fetch)
+        self.store.sync("v", "ACME", datetime(2025, 5, 1), datetime(2025, 5, 9), fetch)
+        self.assertEqual([c.args for c in fetch.call_args_list], [
+            (datetime(2025, 5, 5), datetime(2025, 5, 8)),
+            (datetime(2025, 5, 1), datetime(2025, 5, 5)),
+            (datetime(2025, 5, 8), datetime(2025, 5, 9)),
+        ])
+
+    def test_coverage_is_kept_per_vendor(self):
+        fetch = mock.Mock(return_value=[_art("x")])
+        self.store.sync("a", "ACME", datetime(2025, 5, 1), datetime(2025, 5, 9), fetch)
+        self.store.sync("b", "ACME", datetime(2025, 5, 1), datetime(2025, 5, 9), fetch)
+        self.assertEqual(fetch.call_count, 2)
+        self.assertEqual(fetch.call_args.args, (datetime(2025, 5, 1), datetime(2025, 5, 9)))
+
+    def test_feed_vendor_covers_everything_up_to_the_fetch(self):
+        fetch = mock.Mock(return_value=[_art("x")])
+        self.store.sync("feed", "ACME", datetime(2025, 5, 1), datetime(2025, 5, 9), fetch, ranged=False)
+        self.store.sync("feed", "ACME", datetime(2025, 4, 1), datetime(2025, 4, 5), fetch, ranged=False)
+        self.store.sync("feed", "ACME", datetime(2025, 5, 1), datetime(2025, 5, 11), fetch, ranged=False)
+        self.assertEqual(fetch.call_args_list, [mock.call(None, None)])
+        self.now += 7200
+        self.store.sync("feed", "ACME", datetime(2025, 5, 1), datetime(2025, 5, 11), fetch, ranged=False)
+        self.assertEqual(fetch.call_count, 2)
+
+
+@pytest.mark.unit
+class NewsToolStoreTests(unittest.TestCase):
+    def _yahoo_item(self, title, link, day):
+        return {"title": title, "publisher": "P", "link": link,
+                "providerPublishTime": int(datetime(2025, 5, day, 12).timestamp())}
+
+    def test_repeated_runs_reuse_stored_news(self):
+        items = [self._yahoo_item("Acme beats", "https://a.com/1?utm_source=yf", 5),
+                 self._yahoo_item("Acme beats", "https://a.com/1", 5)]
+        calls = []
+
+        class FakeTicker:
+            def __init__(self, symbol):
+                pass
+
+            def get_news(self, count):
+                calls.append(count)
+                return items
+
+        with mock.patch.object(ynews.yf, "Ticker", FakeTicker):
+            first = ynews.get_news_yfinance("ACME", "2025-05-01", "2025-05-09")
+            second = ynews.get_news_yfinance("ACME", "2025-05-01", "2025-05-08")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(first.count("### "), 1)
+        self.assertEqual(first, second.replace("2025-05-08", "2025-05-09"))
+
+    def test_alpha_vantage_news_is_rendered_from_the_store(self):
+        feed = {"feed": [
+            {"title": "Acme beats", "url": "https://a.com/1", "time_published": "20250505T120000",
+             "summary": _WIRE, "source": "Reuters", "overall_sentiment_label": "Bullish",
+             "overall_sentiment_score": 0.41},
+            {"title": "Acme beats", "url": "https://b.com/9", "time_published": "20250505T130000",
+             "summary": _WIRE, "source": "Benzinga"},
+        ]}
+        request = mock.Mock(return_value=json.dumps(feed))
+        with mock.patch.object(alpha_vantage_news, "_make_api_request", request):
+            out = alpha_vantage_news.get_news("ACME", "2025-05-01", "2025-05-09")
+            alpha_vantage_news.get_news("ACME", "2025-05-01", "2025-05-09")
+        self.assertEqual(request.call_count, 1)
+        self.assertEqual(out.count("### "), 1)
+        self.assertIn("Sentiment: Bullish (0.41)", out)
+
+    def test_widened_alpha_vantage_window_fetches_the_earlier_days(self):
+        request = mock.Mock(return_value=json.dumps({"feed": []}))
+        with mock.patch.object(alpha_vantage_news, "_make_api_request", request):
+            alpha_vantage_news.get_news("ACME", "2024-01-15", "2024-01-20")
+            alpha_vantage_news.get_news("ACME", "2024-01-01", "2024-01-30")
+        windows = [(c.args[1]["time_from"], c.args[1]["time_to"]) for c in request.call_args_list]
+        self.assertEqual(windows, [
+            ("20240115T0000", "20240120T0000"),
+            ("20240101T0000", "20240115T0000"),
+            ("20240120T0000", "20240130T0000"),
+        ])
+
+    def test_error_payload_leaves_the_window_uncovered(self):
+        request = mock.Mock(side_effect=[
+            json.dumps({"Information": "Thank you for using Alpha Vantage! Rate limit reached."}),
+            json.dumps({"feed": [{"title": "Acme beats", "url": "https://a.com/1",
+                                  "time_published": "20250505T120000"}]}),
+        ])
+        with mock.patch.object(alpha_vantage_news, "_make_api_request", request):
+            first = alpha_vantage_news.get_news("ACME", "2025-05-01", "2025-05-09")
+            second = alpha_vantage_news.get_news("ACME", "2025-05-01", "2025-05-09")
+        self.assertIn("Rate limit reached", first)
+        self.assertIn("Acme beats", second)
+        self.assertEqual(request.call_count, 2)
+
+    def test_feed_cut_at_the_limit_covers_only_its_newest_span(self):
+        limit = alpha_vantage_news._FEED_LIMIT
+        newest = [{"title": f"Story {n}", "url": f"https://a.com/{n}",
+                   "time_published": f"202401{20 + n % 10:02d}T120000"} for n in range(limit)]
+        older = [{"title": "Early story", "url": "https://a.com/early",
+                  "time_published": "20240105T120000"}]
+        request = mock.Mock(side_effect=[json.dumps({"feed": newest}), json.dumps({"feed": older})])
+        with mock.patch.object(alpha_vantage_news, "_make_api_request", request):
+            alpha_vantage_news.get_news("ACME", "2024-01-01", "2024-01-30")
+            out = alpha_vantage_news.get_news("ACME", "2024-01-02", "2024-01-10")
+        self.assertIn("Early story", out)
+        first, second = (c.args[1] for c in request.call_args_list)
+        self.assertEqual(first["limit"], str(limit))
+        # Only the part older than the truncated feed is asked for again.
+        self.assertEqual((second["time_from"], second["time_to"]), ("20240102T0000", "20240110T0000"))
+
+    def test_store_can_be_disabled(self):
+        set_config({"news_store": False})
+        request = mock.Mock(return_value=json.dumps({"feed": []}))
+        with mock.patch.object(alpha_vantage_news, "_make_api_request", request):
+            alpha_vantage_news.get_news("ACME", "2025-05-01", "2025-05-09")
+            alpha_vantage_news.get_news("ACME", "2025-05-01", "2025-05-09")
+        self.assertEqual(request.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""Parallel analyst fan-out: analysts run concurrently as isolated branches
+and the Bull Researcher only starts once every report is in.
+"""
+import threading
+from unittest import mock
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.tools import tool
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.prebuilt import ToolNode
+
+from tradingagents.graph import setup as graph_setup
+from tradingagents.graph.conditional_logic import ConditionalLogic
+from tradingagents.graph.setup import GraphSetup
+
+
+@tool
+def lookup(query: str) -> str:
+    """Look something up."""
+    return f"data for {query}"
+
+
+def _analyst(name, report_key, barrier, seen):
+    """Fake analyst: one tool round, then a report; waits on ``barrier`` first."""
+
+    def node(state):
+        messages = state["messages"]
+        if not any(isinstance(m, ToolMessage) for m in messages):
+            barrier.wait()  # only passes if the other analyst runs concurrently
+            call = {"name": "lookup", "args": {"query": name}, "id": f"call-{name}"}
+            return {"messages": [AIMessage(content="", tool_calls=[call])]}
+        seen[name] = [m.content for m in messages]
+        return {"messages": [AIMessage(content="done")], report_key: f"{name} report"}
+
+    return node
+
+
+def _compile(parallel, barrier, seen):
+    tool_nodes = {key: ToolNode([lookup]) for key in ("market", "news")}
+    setup = GraphSetup(None, None, tool_nodes, ConditionalLogic())
+    with (
+        mock.patch.object(
+            graph_setup, "create_market_analyst",
+            lambda llm: _analyst("market", "market_report", barrier, seen),
+        ),
+        mock.patch.object(
+            graph_setup, "create_news_analyst",
+            lambda llm: _analyst("news", "news_report", barrier, seen),
+        ),
+    ):
+        workflow = setup.setup_graph(["market", "news"], parallel_analysts=parallel)
+    return workflow.compile(checkpointer=MemorySaver(), interrupt_before=["Bull Researcher"])
+
+
+def _initial_state():
+    return {
+        "messages": [HumanMessage(content="AAPL")],
+        "company_of_interest": "AAPL",
+        "trade_date": "2025-01-10",
+        "market_report": "",
+        "news_report": "",
+        "analyst_wall_times": {},
+    }
+
+
+@pytest.mark.unit
+def test_parallel_analysts_run_concurrently_and_join_before_bull():
+    barrier = threading.Barrier(2, timeout=5)
+    seen = {}
+    graph = _compile(True, barrier, seen)
+    config = {"configurable": {"thread_id": "parallel"}}
+
+    state = graph.invoke(_initial_state(), config)
+
+    assert state["market_report"] == "market report"
+    assert state["news_report"] == "news report"
+    assert set(state["analyst_wall_times"]) == {"market", "news"}
+    assert graph.get_state(config).next == ("Bull Researcher",)
+    # Each branch sees only its own tool traffic.
+    assert "data for news" not in seen["market"]
+    assert "data for market" not in seen["news"]
+    # Branch messages stay out of the shared channel.
+    assert [m.content for m in state["messages"]] == ["AAPL"]
+
+
+@pytest.mark.unit
+def test_sequential_mode_is_unchanged():
+    barrier = threading.Barrier(1)  # sequential analysts never wait on each other
+    seen = {}
+    graph = _compile(False, barrier, seen)
+    config = {"configurable": {"thread_id": "sequential"}}
+
+    state = graph.invoke(_initial_state(), config)
+
+    assert state["market_report"] == "market report"
+    assert state["news_report"] == "news report"
+    assert state["analyst_wall_times"] == {}
+    assert graph.get_state(config).next == ("Bull Researcher",)
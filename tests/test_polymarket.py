@@ -102,6 +102,86 @@ class PolymarketResilienceTests(unittest.TestCase):
         self.assertIn("Fed rate cut", out)
 
 
+def _listing(*markets):
+    """A ``_request`` stub serving ``markets`` as the catalogue listing."""
+    calls = []
+
+    def _impl(path, params):
+        calls.append((path, params))
+        if path == "markets":
+            return list(markets)[params["offset"]:params["offset"] + params["limit"]]
+        if path == "public-search":
+            return _SEARCH
+        raise AssertionError(f"unexpected Gamma path: {path}")
+
+    return calls, _impl
+
+
+_CATALOGUE = (
+    _market("Fed rate cut in December?", 0.62, volume=2_000_000, end_date="2030-12-31T00:00:00Z"),
+    _market("Will the Fed cut rates in March?", 0.41, volume=7_000_000, end_date="2030-03-31T00:00:00Z"),
+    _market("US recession in 2026?", 0.22, volume=3_000_000, end_date="2030-12-31T00:00:00Z"),
+    _market("Fed hike resolved?", 1.0, volume=9_000_000, end_date="2030-12-31T00:00:00Z", closed=True),
+)
+
+
+@pytest.mark.unit
+class PolymarketCatalogueTests(unittest.TestCase):
+    def test_related_topics_are_answered_from_one_catalogue_fetch(self):
+        calls, request = _listing(*_CATALOGUE)
+        with mock.patch.object(polymarket, "_request", side_effect=request):
+            cuts = polymarket.get_prediction_markets("Fed rate cuts")
+            recession = polymarket.get_prediction_markets("recession 2026")
+        self.assertEqual([path for path, _ in calls], ["markets"])
+        # Every topic term must match; results keep the volume ranking.
+        self.assertLess(cuts.index("cut rates in March"), cuts.index("rate cut in December"))
+        self.assertNotIn("recession", cuts)
+        self.assertIn("US recession in 2026?", recession)
+
+    def test_catalogue_excludes_closed_markets(self):
+        catalogue = polymarket.build_market_catalogue(_CATALOGUE)
+        self.assertEqual(len(catalogue.markets), 3)
+        self.assertEqual(catalogue.markets[0].question, "Will the Fed cut rates in March?")
+        self.assertEqual(polymarket.search_catalogue(catalogue, "fed hike"), ())
+
+    def test_unmatched_topic_falls_back_to_search(self):
+        calls, request = _listing(*_CATALOGUE)
+        with mock.patch.object(polymarket, "_request", side_effect=request):
+            out = polymarket.get_prediction_markets("anything", limit=10)
+        self.assertEqual([path for path, _ in calls], ["markets", "public-search"])
+        self.assertIn("Open big?", out)
+
+    def test_catalogue_is_paged_up_to_its_size(self):
+        set_config({"polymarket_catalogue_size": 3})
+        markets = [
+            _market(f"Question {i}?", 0.5, volume=1000 - i, end_date="2030-12-31T00:00:00Z")
+            for i in range(5)
+        ]
+        calls, request = _listing(*markets)
+        with mock.patch.object(polymarket, "CATALOGUE_PAGE_SIZE", 2), \
+                mock.patch.object(polymarket, "_request", side_effect=request):
+            catalogue = polymarket.fetch_market_catalogue()
+        self.assertEqual([params["offset"] for _, params in calls], [0, 2])
+        self.assertEqual(len(catalogue.markets), 3)
+
+    def test_catalogue_failure_falls_back_to_search(self):
+        def _request(path, params):
+            if path == "markets":
+                raise requests.RequestException("listing down")
+            return _SEARCH
+
+        with mock.patch.object(polymarket, "_request", side_effect=_request):
+            out = polymarket.get_prediction_markets("anything", limit=10)
+        self.assertIn("Open big?", out)
+
+    def test_disabled_catalogue_always_searches(self):
+        set_config({"polymarket_catalogue": False})
+        calls, request = _listing(*_CATALOGUE)
+        with mock.patch.object(polymarket, "_request", side_effect=request):
+            polymarket.get_prediction_markets("Fed rate cut")
+        self.assertEqual([path for path, _ in calls], ["public-search"])
+
+
 @pytest.mark.unit
 class PolymarketRoutingTests(unittest.TestCase):
     def setUp(self):
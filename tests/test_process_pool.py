@@ -0,0 +1,91 @@
+"""Process runner: warm per-worker graphs, lazy job feeding, per-job failures."""
+import os
+import time
+
+import pytest
+
+from tradingagents.graph import BatchRequest, ProcessBatchRunner
+
+
+class _CountingGraph:
+    """Stands in for ``TradingAgentsGraph`` in the worker; counts its own runs."""
+
+    def __init__(self, selected_analysts, debug, config):
+        if (config or {}).get("fail_build"):
+            raise ValueError("no API key")
+        self.runs = 0
+
+    def propagate(self, ticker, trade_date, asset_type="stock", point_in_time=False):
+        if ticker == "FAIL":
+            raise RuntimeError("vendor down")
+        if ticker.startswith("SLOW"):
+            time.sleep(0.2)
+        self.runs += 1
+        state = {"company_of_interest": ticker, "trade_date": trade_date, "run": self.runs}
+        return {**state, "point_in_time": point_in_time}, "Buy"
+
+
+@pytest.mark.unit
+def test_process_runner_reuses_worker_graphs_and_isolates_failures():
+    requests = [(f"T{n}", "2026-01-05") for n in range(6)] + [("FAIL", "2026-01-05")]
+
+    with ProcessBatchRunner(workers=2, graph_factory=_CountingGraph) as runner:
+        results = list(runner.run(requests))
+
+    assert sorted(result.index for result in results) == list(range(7))
+    failed = [result for result in results if not result.ok]
+    assert len(failed) == 1
+    assert failed[0].request == BatchRequest("FAIL", "2026-01-05")
+    assert isinstance(failed[0].error, RuntimeError)
+
+    done = [result for result in results if result.ok]
+    assert os.getpid() not in {result.worker for result in results}
+    for pid in {result.worker for result in done}:
+        # One graph per worker: its run counter keeps climbing across jobs.
+        runs = sorted(result.final_state["run"] for result in done if result.worker == pid)
+        assert runs == list(range(1, len(runs) + 1))
+    assert all(result.signal == "Buy" and result.elapsed >= 0 for result in done)
+
+
+@pytest.mark.unit
+def test_process_runner_passes_point_in_time_to_the_worker():
+    requests = [BatchRequest("PIT", "2026-01-05", point_in_time=True), ("LIVE", "2026-01-05")]
+    with ProcessBatchRunner(workers=1, graph_factory=_CountingGraph) as runner:
+        results = {r.request.ticker: r for r in runner.run(requests)}
+    assert results["PIT"].final_state["point_in_time"] is True
+    assert results["LIVE"].final_state["point_in_time"] is False
+
+
+@pytest.mark.unit
+def test_process_runner_reads_requests_only_as_workers_free_up():
+    consumed = []
+
+    def requests():
+        for n in range(10):
+            consumed.append(n)
+            yield BatchRequest(f"T{n}", "2026-01-05")
+
+    with ProcessBatchRunner(workers=1, queue_size=1, graph_factory=_CountingGraph) as runner:
+        results = runner.run(requests())
+        next(results)
+        assert len(consumed) == 2
+        assert len(list(results)) == 9
+
+
+@pytest.mark.unit
+def test_stopping_a_run_early_keeps_its_results_out_of_the_next_run():
+    with ProcessBatchRunner(workers=1, queue_size=2, graph_factory=_CountingGraph) as runner:
+        first = runner.run([(f"SLOW{n}", "2026-01-05") for n in range(5)])
+        assert next(first).request.ticker == "SLOW0"
+        first.close()
+
+        results = list(runner.run([("NEXT", "2026-01-06")]))
+
+    assert [(r.index, r.request.ticker) for r in results] == [(0, "NEXT")]
+
+
+@pytest.mark.unit
+def test_process_runner_reports_workers_that_cannot_build_a_graph():
+    runner = ProcessBatchRunner(workers=1, config={"fail_build": True}, graph_factory=_CountingGraph)
+    with pytest.raises(RuntimeError, match="no API key"):
+        runner.start()
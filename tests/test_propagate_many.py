@@ -0,0 +1,199 @@
+"""Batch API: ``propagate_many`` streams per-request results as runs finish,
+isolates failures and prepares each ticker once per batch.
+"""
+import asyncio
+import contextlib
+import functools
+import weakref
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tradingagents.agents.utils.memory import TradingMemoryLog
+from tradingagents.graph import BatchRequest, BatchResult
+from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+
+def _final_state(ticker, trade_date):
+    return {
+        "final_trade_decision": f"Rating: Buy\nBuy {ticker}.",
+        "company_of_interest": ticker,
+        "trade_date": trade_date,
+        "market_report": "", "sentiment_report": "", "news_report": "", "fundamentals_report": "",
+        "investment_debate_state": {
+            "bull_history": "", "bear_history": "", "history": "",
+            "current_response": "", "judge_decision": "",
+        },
+        "investment_plan": "",
+        "trader_investment_plan": "",
+        "risk_debate_state": {
+            "aggressive_history": "", "conservative_history": "", "neutral_history": "",
+            "history": "", "judge_decision": "",
+        },
+    }
+
+
+def _batch_graph(tmp_path, fake_ainvoke, max_concurrent_runs=8):
+    graph = MagicMock()
+    graph.memory_log = TradingMemoryLog({"memory_log_path": str(tmp_path / "mem.md")})
+    graph.log_states_dict = {}
+    graph.debug = False
+    graph.config = {"results_dir": str(tmp_path), "max_concurrent_runs": max_concurrent_runs}
+    graph._async_slots = {}
+    graph._checkpoint_locks = weakref.WeakKeyDictionary()
+    graph.graph.ainvoke = fake_ainvoke
+    graph.propagator.create_initial_state.side_effect = (
+        lambda ticker, date, *a, **k: {"company_of_interest": ticker, "trade_date": date}
+    )
+    graph.propagator.get_graph_args.return_value = {}
+    graph.process_signal.side_effect = lambda decision: decision.split()[-1]
+    graph.resolve_instrument_context.side_effect = lambda ticker, asset_type="stock": f"ctx:{ticker}"
+    for name in (
+        "propagate_many", "apropagate_many", "_apropagate", "_prepare_ticker",
+        "_arun_graph", "_start_run", "_finish_run", "_log_state", "_checkpoint_lock",
+    ):
+        setattr(graph, name, functools.partial(getattr(TradingAgentsGraph, name), graph))
+    return graph
+
+
+@pytest.mark.unit
+def test_batch_request_coerce():
+    assert BatchRequest.coerce(("AAPL", "2026-01-10")) == BatchRequest("AAPL", "2026-01-10")
+    assert BatchRequest.coerce(("BTC-USD", "2026-01-10", "crypto")).asset_type == "crypto"
+    assert BatchRequest.coerce({"ticker": "MSFT", "trade_date": "2026-01-10"}).ticker == "MSFT"
+    request = BatchRequest("NVDA", "2026-01-10")
+    assert BatchRequest.coerce(request) is request
+
+
+@pytest.mark.unit
+def test_propagate_many_streams_results_and_isolates_failures(tmp_path):
+    delays = {"SLOW": 0.05, "FAIL": 0.0, "FAST": 0.0}
+
+    async def fake_ainvoke(init_state, **kwargs):
+        ticker = init_state["company_of_interest"]
+        await asyncio.sleep(delays[ticker])
+        if ticker == "FAIL":
+            raise RuntimeError("vendor down")
+        return _final_state(ticker, init_state["trade_date"])
+
+    graph = _batch_graph(tmp_path, fake_ainvoke)
+    results = list(graph.propagate_many([
+        ("SLOW", "2026-01-10"), ("FAIL", "2026-01-10"), ("FAST", "2026-01-10"),
+    ]))
+
+    assert all(isinstance(result, BatchResult) for result in results)
+    assert results[-1].request.ticker == "SLOW"  # streamed in completion order
+    by_ticker = {result.request.ticker: result for result in results}
+    assert not by_ticker["FAIL"].ok
+    assert isinstance(by_ticker["FAIL"].error, RuntimeError)
+    assert by_ticker["FAIL"].final_state is None
+    for ticker in ("SLOW", "FAST"):
+        assert by_ticker[ticker].ok
+        assert by_ticker[ticker].signal == f"{ticker}."
+        assert by_ticker[ticker].final_state["company_of_interest"] == ticker
+    assert sorted(result.index for result in results) == [0, 1, 2]
+    assert {e["ticker"] for e in graph.memory_log.load_entries()} == {"SLOW", "FAST"}
+
+
+@pytest.mark.unit
+def test_propagate_many_prepares_each_ticker_once_and_bounds_concurrency(tmp_path):
+    in_flight = []
+    peak = []
+    seen_contexts = []
+
+    async def fake_ainvoke(init_state, **kwargs):
+        in_flight.append(1)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.pop()
+        return _final_state(init_state["company_of_interest"], init_state["trade_date"])
+
+    graph = _batch_graph(tmp_path, fake_ainvoke)
+    graph.propagator.create_initial_state.side_effect = (
+        lambda ticker, date, *a, instrument_context=None, **k: (
+            seen_contexts.append(instrument_context)
+            or {"company_of_interest": ticker, "trade_date": date}
+        )
+    )
+    graph._resolve_pending_entries = MagicMock()
+    dates = ["2026-01-05", "2026-01-06", "2026-01-07"]
+    requests = [(ticker, date) for ticker in ("AAA", "BBB") for date in dates]
+
+    results = list(graph.propagate_many(requests, max_concurrency=2))
+
+    assert max(peak) == 2
+    assert all(result.ok for result in results)
+    assert sorted(graph._resolve_pending_entries.call_args_list) == [(("AAA", None),), (("BBB", None),)]
+    assert graph.resolve_instrument_context.call_count == 2
+    assert sorted(seen_contexts) == ["ctx:AAA"] * 3 + ["ctx:BBB"] * 3
+
+
+@pytest.mark.unit
+def test_point_in_time_requests_are_prepared_per_date(tmp_path):
+    async def fake_ainvoke(init_state, **kwargs):
+        return _final_state(init_state["company_of_interest"], init_state["trade_date"])
+
+    graph = _batch_graph(tmp_path, fake_ainvoke)
+    graph._resolve_pending_entries = MagicMock()
+    requests = [
+        BatchRequest("AAA", "2026-01-05", point_in_time=True),
+        BatchRequest("AAA", "2026-01-06", point_in_time=True),
+        ("AAA", "2026-01-07"),
+    ]
+
+    assert all(result.ok for result in graph.propagate_many(requests))
+    assert sorted(graph._resolve_pending_entries.call_args_list, key=str) == sorted(
+        [(("AAA", "2026-01-05"),), (("AAA", "2026-01-06"),), (("AAA", None),)], key=str
+    )
+
+
+@pytest.mark.unit
+def test_checkpointed_runs_of_one_ticker_take_turns(tmp_path):
+    open_savers = {}
+    overlap = {}
+
+    @contextlib.asynccontextmanager
+    async def fake_checkpointer(data_dir, ticker):
+        open_savers[ticker] = open_savers.get(ticker, 0) + 1
+        overlap[ticker] = max(overlap.get(ticker, 0), open_savers[ticker])
+        try:
+            yield MagicMock()
+        finally:
+            open_savers[ticker] -= 1
+
+    async def fake_ainvoke(init_state, **kwargs):
+        await asyncio.sleep(0.01)
+        return _final_state(init_state["company_of_interest"], init_state["trade_date"])
+
+    graph = _batch_graph(tmp_path, fake_ainvoke)
+    graph.config.update(checkpoint_enabled=True, data_cache_dir=str(tmp_path))
+    graph.workflow.compile.return_value.ainvoke = fake_ainvoke
+    requests = [(ticker, f"2026-01-0{day}") for ticker in ("AAA", "BBB") for day in (5, 6, 7)]
+
+    with patch("tradingagents.graph.trading_graph.aget_checkpointer", fake_checkpointer):
+        results = list(graph.propagate_many(requests))
+
+    assert all(result.ok for result in results)
+    assert overlap == {"AAA": 1, "BBB": 1}
+
+
+@pytest.mark.unit
+def test_apropagate_many_cancels_pending_runs_when_closed(tmp_path):
+    started = []
+
+    async def fake_ainvoke(init_state, **kwargs):
+        started.append(init_state["company_of_interest"])
+        if init_state["company_of_interest"] != "FIRST":
+            await asyncio.sleep(10)
+        return _final_state(init_state["company_of_interest"], init_state["trade_date"])
+
+    graph = _batch_graph(tmp_path, fake_ainvoke)
+
+    async def first_only():
+        results = graph.apropagate_many([("FIRST", "2026-01-10"), ("HANG", "2026-01-10")])
+        first = await results.__anext__()
+        await results.aclose()
+        return first
+
+    first = asyncio.run(asyncio.wait_for(first_only(), timeout=5))
+    assert first.request.ticker == "FIRST"
@@ -0,0 +1,165 @@
+"""Proactive per-vendor throttling: callers queue for a token instead of
+spending requests on 429s, and a wait longer than the budget surfaces as a
+VendorRateLimitError the router already knows how to skip past.
+"""
+import threading
+import unittest
+from unittest import mock
+
+import pytest
+
+from tradingagents.dataflows import rate_limiter
+from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.errors import VendorRateLimitError
+from tradingagents.dataflows.rate_limiter import (
+    FileTokenBucket,
+    TokenBucket,
+    get_rate_limiter,
+    throttle,
+)
+
+
+class _FakeClock:
+    """Deterministic clock whose ``sleep`` advances time instead of blocking."""
+
+    def __init__(self, start=1000.0):
+        self.now = start
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.mark.unit
+class TokenBucketTests(unittest.TestCase):
+    def test_burst_is_granted_then_callers_wait(self):
+        clock = _FakeClock()
+        bucket = TokenBucket(3, 1.0, clock=clock, sleep=clock.sleep)
+        for _ in range(3):
+            bucket.acquire()
+        self.assertEqual(clock.sleeps, [])
+        bucket.acquire()
+        self.assertEqual(len(clock.sleeps), 1)
+        self.assertAlmostEqual(clock.sleeps[0], 1.0)
+
+    def test_tokens_refill_up_to_capacity_only(self):
+        clock = _FakeClock()
+        bucket = TokenBucket(2, 1.0, clock=clock, sleep=clock.sleep)
+        bucket.acquire()
+        bucket.acquire()
+        clock.now += 100  # long idle period must not bank more than `capacity`
+        self.assertTrue(bucket.try_acquire())
+        self.assertTrue(bucket.try_acquire())
+        self.assertFalse(bucket.try_acquire())
+
+    def test_wait_beyond_timeout_raises_rate_limit_error(self):
+        bucket = TokenBucket(1, 1 / 60)  # one token per minute
+        bucket.acquire()
+        with self.assertRaises(VendorRateLimitError):
+            bucket.acquire(timeout=0.5)
+
+    def test_timeout_runs_on_the_bucket_clock(self):
+        clock = _FakeClock()
+        bucket = TokenBucket(1, 1.0, clock=clock)
+
+        def sleep_and_lose_the_race(seconds):
+            clock.sleep(seconds)
+            bucket.try_acquire()  # a competing caller takes the refilled token
+
+        bucket._sleep = sleep_and_lose_the_race
+        bucket.acquire()
+        with self.assertRaises(VendorRateLimitError):
+            bucket.acquire(timeout=2.5)
+        self.assertEqual(len(clock.sleeps), 2)
+
+    def test_invalid_parameters_rejected(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(0, 1.0)
+        with self.assertRaises(ValueError):
+            TokenBucket(1, 1.0).acquire(tokens=2)
+
+    def test_concurrent_callers_share_one_quota(self):
+        bucket = TokenBucket(5, 1000.0)
+        granted = []
+        lock = threading.Lock()
+
+        def _worker():
+            if bucket.try_acquire():
+                with lock:
+                    granted.append(1)
+
+        threads = [threading.Thread(target=_worker) for _ in range(20)]
+        with mock.patch.object(bucket, "_clock", return_value=bucket._updated):
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        self.assertEqual(len(granted), 5)
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(rate_limiter.fcntl is None, reason="file locking is POSIX-only")
+class FileTokenBucketTests(unittest.TestCase):
+    def test_instances_on_one_file_share_the_quota(self):
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = f"{tmp}/vendor.bucket"
+            clock = _FakeClock()
+            a = FileTokenBucket(path, 2, 0.001, clock=clock)
+            b = FileTokenBucket(path, 2, 0.001, clock=clock)
+            self.assertTrue(a.try_acquire())
+            self.assertTrue(b.try_acquire())
+            # Both "processes" drew from the same two tokens.
+            self.assertFalse(a.try_acquire())
+            self.assertFalse(b.try_acquire())
+
+
+@pytest.mark.unit
+class ConfiguredLimiterTests(unittest.TestCase):
+    def test_unconfigured_vendor_is_not_throttled(self):
+        self.assertIsNone(get_rate_limiter("no_such_vendor"))
+        throttle("no_such_vendor")  # no-op, must not raise
+
+    def test_same_config_reuses_the_process_wide_bucket(self):
+        self.assertIs(get_rate_limiter("alpha_vantage"), get_rate_limiter("alpha_vantage"))
+
+    def test_changed_limits_build_a_new_bucket(self):
+        before = get_rate_limiter("alpha_vantage")
+        set_config({"vendor_rate_limits": {"alpha_vantage": {"requests": 75, "period": 60}}})
+        after = get_rate_limiter("alpha_vantage")
+        self.assertIsNot(before, after)
+        self.assertEqual(after.capacity, 75)
+
+    def test_throttle_raises_when_quota_exhausted_past_max_wait(self):
+        set_config({
+            "vendor_rate_limits": {"alpha_vantage": {"requests": 1, "period": 3600}},
+            "rate_limit_max_wait": 0,
+        })
+        throttle("alpha_vantage")
+        with self.assertRaises(VendorRateLimitError):
+            throttle("alpha_vantage")
+
+    def test_alpha_vantage_request_waits_for_a_token_before_sending(self):
+        from tradingagents.dataflows import alpha_vantage_common
+
+        set_config({
+            "vendor_rate_limits": {"alpha_vantage": {"requests": 1, "period": 3600}},
+            "rate_limit_max_wait": 0,
+        })
+        resp = mock.Mock(status_code=200, text='{"ok": 1}')
+        resp.raise_for_status = mock.Mock()
+        with mock.patch.object(alpha_vantage_common.requests, "get", return_value=resp) as get:
+            alpha_vantage_common._make_api_request("TIME_SERIES_DAILY", {"symbol": "IBM"})
+            with self.assertRaises(VendorRateLimitError):
+                alpha_vantage_common._make_api_request("TIME_SERIES_DAILY", {"symbol": "IBM"})
+        # The throttled call never reached the network.
+        get.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""Typed vendor records: fetchers return normalized records, renderers turn
+them into prompt text, and the record cache lets repeated calls reuse a fetch.
+"""
+import json
+import unittest
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from tradingagents.dataflows import (
+    alpha_vantage_fundamentals as avf,
+    y_finance,
+    yfinance_registry,
+)
+from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.errors import NoMarketDataError
+from tradingagents.dataflows.records import (
+    FinancialStatement,
+    cached_record,
+    render_statement,
+)
+
+_AV_BALANCE_SHEET = json.dumps({
+    "symbol": "IBM",
+    "quarterlyReports": [
+        {"fiscalDateEnding": "2025-06-30", "reportedCurrency": "USD",
+         "totalAssets": "130000", "totalLiabilities": "None"},
+        {"fiscalDateEnding": "2025-03-31", "reportedCurrency": "USD",
+         "totalAssets": "125000", "totalLiabilities": "100000"},
+    ],
+    "annualReports": [
+        {"fiscalDateEnding": "2024-12-31", "reportedCurrency": "USD",
+         "totalAssets": "120000", "totalLiabilities": "95000"},
+    ],
+})
+
+
+@pytest.mark.unit
+class AlphaVantageStatementTests(unittest.TestCase):
+    def test_json_payload_becomes_numeric_statement(self):
+        with mock.patch.object(avf, "_make_api_request", return_value=_AV_BALANCE_SHEET):
+            stmt = avf.fetch_statement("IBM", "balance_sheet", "quarterly")
+        self.assertIsInstance(stmt, FinancialStatement)
+        self.assertEqual(stmt.currency, "USD")
+        self.assertEqual(stmt.frame.loc["totalAssets"].tolist(), [130000, 125000])
+        self.assertTrue(pd.isna(stmt.frame.loc["totalLiabilities"].iloc[0]))  # "None"
+
+    def test_future_periods_are_dropped(self):
+        # The JSON text used to reach the dict-only filter unparsed, so fiscal
+        # periods after curr_date leaked into backtests.
+        with mock.patch.object(avf, "_make_api_request", return_value=_AV_BALANCE_SHEET):
+            out = avf.get_balance_sheet("IBM", "quarterly", curr_date="2025-05-01")
+        self.assertIn("2025-03-31", out)
+        self.assertNotIn("2025-06-30", out)
+
+    def test_annual_freq_reads_annual_reports(self):
+        with mock.patch.object(avf, "_make_api_request", return_value=_AV_BALANCE_SHEET):
+            stmt = avf.fetch_statement("IBM", "balance_sheet", "annual")
+        self.assertEqual(list(stmt.frame.columns), [pd.Timestamp("2024-12-31")])
+
+    def test_no_reports_is_no_market_data(self):
+        with mock.patch.object(avf, "_make_api_request", return_value="{}"), \
+                self.assertRaises(NoMarketDataError):
+            avf.fetch_statement("NOPE", "cashflow")
+
+
+@pytest.mark.unit
+class RecordCacheTests(unittest.TestCase):
+    def test_hit_skips_fetch_and_ttl_zero_disables(self):
+        fetch = mock.Mock(side_effect=["first", "second", "third"])
+        self.assertEqual(cached_record("k", fetch), "first")
+        self.assertEqual(cached_record("k", fetch), "first")
+        set_config({"record_cache_ttl": 0})
+        self.assertEqual(cached_record("k", fetch), "second")
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_failures_are_not_cached(self):
+        fetch = mock.Mock(side_effect=[ConnectionError("blip"), "ok"])
+        with self.assertRaises(ConnectionError):
+            cached_record("k", fetch)
+        self.assertEqual(cached_record("k", fetch), "ok")
+
+    def test_statement_fetched_once_and_sliced_per_as_of_date(self):
+        frame = pd.DataFrame(
+            {pd.Timestamp("2025-06-30"): [2.0], pd.Timestamp("2025-03-31"): [1.0]},
+            index=["Total Assets"],
+        )
+
+        class FakeTicker:
+            calls = 0
+
+            def __init__(self, symbol):
+                pass
+
+            @property
+            def quarterly_balance_sheet(self):
+                FakeTicker.calls += 1
+                return frame
+
+        with mock.patch.object(yfinance_registry.yf, "Ticker", FakeTicker):
+            early = y_finance.fetch_statement("AAPL", "balance_sheet", "quarterly", "2025-04-15")
+            late = y_finance.fetch_statement("AAPL", "balance_sheet", "quarterly", "2025-07-15")
+
+        self.assertEqual(FakeTicker.calls, 1)
+        self.assertEqual(list(early.frame.columns), [pd.Timestamp("2025-03-31")])
+        self.assertEqual(len(late.frame.columns), 2)
+        # Rendering is a pure function of the record.
+        self.assertEqual(render_statement(late), render_statement(late))
+        self.assertIn("# Balance Sheet data for AAPL (quarterly)", render_statement(late))
+
+
+if __name__ == "__main__":
+    unittest.main()
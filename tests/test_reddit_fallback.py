@@ -4,6 +4,7 @@ path's degradation (#862), and chunked-transfer error handling (#1024)."""
 from __future__ import annotations
 
 import http.client
+import threading
 from unittest.mock import patch
 from urllib.error import HTTPError
 
@@ -41,8 +42,10 @@ def _resp(read_fn):
     return _Resp()
 
 
-def _atom_resp():
-    return _resp(lambda: _SAMPLE_ATOM.encode("utf-8"))
+def _atom_resp(headers=None):
+    resp = _resp(lambda: _SAMPLE_ATOM.encode("utf-8"))
+    resp.headers = headers or {}
+    return resp
 
 
 def _raise(exc):
@@ -190,3 +193,53 @@ class TestFormatterHandlesRssPosts:
         assert "1234↑" in out
         assert "56c" in out
         assert "via RSS" not in out
+
+
+@pytest.mark.unit
+class TestConditionalGet:
+    def test_etag_is_sent_and_304_reuses_parsed_posts(self):
+        fresh = _atom_resp({"ETag": '"v1"', "Last-Modified": "Wed, 20 May 2026 14:30:00 GMT"})
+        not_modified = HTTPError("url", 304, "Not Modified", {}, None)
+        with patch.object(reddit, "urlopen", side_effect=[fresh, not_modified]) as op:
+            first = reddit._fetch_subreddit_rss("NVDA", "stocks", 5, 5.0)
+            second = reddit._fetch_subreddit_rss("NVDA", "stocks", 5, 5.0)
+        assert op.call_args_list[0].args[0].get_header("If-none-match") is None
+        revalidation = op.call_args_list[1].args[0]
+        assert revalidation.get_header("If-none-match") == '"v1"'
+        assert revalidation.get_header("If-modified-since") == "Wed, 20 May 2026 14:30:00 GMT"
+        assert second == first and len(second) == 2
+
+    def test_feeds_are_revalidated_separately_per_ticker(self):
+        with patch.object(reddit, "urlopen", return_value=_atom_resp({"ETag": '"v1"'})) as op:
+            reddit._fetch_subreddit_rss("NVDA", "stocks", 5, 5.0)
+            reddit._fetch_subreddit_rss("AMD", "stocks", 5, 5.0)
+        assert op.call_args_list[1].args[0].get_header("If-none-match") is None
+
+
+@pytest.mark.unit
+class TestConcurrentSubredditFetch:
+    def test_subreddits_are_fetched_concurrently_in_order(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def _fetch(ticker, sub, limit, timeout):
+            barrier.wait()  # deadlocks (times out) unless all three overlap
+            return [{"title": f"{ticker} on {sub}", "source": "rss", "score": None,
+                     "num_comments": None, "created_utc": None, "selftext": ""}]
+
+        with patch.object(reddit, "_fetch_subreddit_rss", side_effect=_fetch):
+            out = reddit.fetch_reddit_posts("NVDA")
+        positions = [out.index(f"r/{sub}") for sub in reddit.DEFAULT_SUBREDDITS]
+        assert positions == sorted(positions)
+
+    def test_parsed_posts_are_reused_per_subreddit_and_ticker(self):
+        with patch.object(reddit, "urlopen", side_effect=lambda *a, **k: _atom_resp()) as op:
+            reddit.fetch_reddit_posts("NVDA", subreddits=("stocks",))
+            reddit.fetch_reddit_posts("nvda", subreddits=("stocks",))
+            reddit.fetch_reddit_posts("AMD", subreddits=("stocks",))
+        assert op.call_count == 2
+
+    def test_empty_results_are_not_reused(self):
+        with patch.object(reddit, "urlopen", side_effect=lambda *a, **k: _resp(lambda: b"<<bad>>")) as op:
+            reddit.fetch_reddit_posts("NVDA", subreddits=("stocks",))
+            reddit.fetch_reddit_posts("NVDA", subreddits=("stocks",))
+        assert op.call_count == 2
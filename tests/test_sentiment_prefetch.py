@@ -0,0 +1,90 @@
+"""Sentiment analyst pre-fetch: news, StockTwits and Reddit are fetched
+concurrently, and a source that fails or misses its deadline degrades to a
+placeholder instead of holding up (or crashing) the node.
+"""
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from tradingagents.agents.analysts import sentiment_analyst
+from tradingagents.agents.utils.tool_memo import memoized_call, tool_memo_scope
+from tradingagents.dataflows.config import set_config
+
+
+def _patch_sources(news, stocktwits, reddit):
+    return (
+        mock.patch.object(sentiment_analyst, "memoized_call", side_effect=news),
+        mock.patch.object(sentiment_analyst, "_stocktwits_block", side_effect=stocktwits),
+        mock.patch.object(sentiment_analyst, "_reddit_block", side_effect=reddit),
+    )
+
+
+@pytest.mark.unit
+def test_sources_are_fetched_concurrently():
+    barrier = threading.Barrier(3, timeout=5)
+
+    def _source(label):
+        def _fetch(*args, **kwargs):
+            barrier.wait()  # times out unless all three run at once
+            return label
+        return _fetch
+
+    news, st, rd = _patch_sources(_source("NEWS"), _source("ST"), _source("RD"))
+    with news, st, rd:
+        blocks = sentiment_analyst._prefetch_sources("NVDA", "2026-01-08", "2026-01-15")
+    assert blocks == {"news": "NEWS", "stocktwits": "ST", "reddit": "RD"}
+
+
+@pytest.mark.unit
+def test_slow_source_degrades_at_its_deadline():
+    set_config({"sentiment_source_timeouts": {"reddit": 0.2}})
+    release = threading.Event()
+
+    def _slow(*args, **kwargs):
+        release.wait(5)
+        return "late"
+
+    news, st, rd = _patch_sources(lambda *a: "NEWS", lambda *a, **k: "ST", _slow)
+    started = time.monotonic()
+    try:
+        with news, st, rd:
+            blocks = sentiment_analyst._prefetch_sources("NVDA", "2026-01-08", "2026-01-15")
+    finally:
+        release.set()
+    assert time.monotonic() - started < 2
+    assert blocks["news"] == "NEWS"
+    assert blocks["reddit"].startswith("<reddit unavailable: timed out")
+
+
+@pytest.mark.unit
+def test_failing_source_degrades_to_placeholder():
+    def _boom(*args, **kwargs):
+        raise ConnectionError("vendor down")
+
+    news, st, rd = _patch_sources(_boom, lambda *a, **k: "ST", lambda *a, **k: "RD")
+    with news, st, rd:
+        blocks = sentiment_analyst._prefetch_sources("NVDA", "2026-01-08", "2026-01-15")
+    assert blocks["news"] == "<news unavailable: ConnectionError>"
+    assert blocks["stocktwits"] == "ST"
+
+
+@pytest.mark.unit
+def test_news_prefetch_runs_inside_the_run_memo():
+    calls = []
+
+    def _get_news(ticker, start_date, end_date):
+        calls.append((ticker, start_date, end_date))
+        return "NEWS"
+
+    tool = mock.Mock(func=_get_news)
+    tool.name = "get_news"
+    st = mock.patch.object(sentiment_analyst, "_stocktwits_block", return_value="ST")
+    rd = mock.patch.object(sentiment_analyst, "_reddit_block", return_value="RD")
+    with mock.patch.object(sentiment_analyst, "get_news", tool), st, rd, tool_memo_scope() as memo:
+        sentiment_analyst._prefetch_sources("NVDA", "2026-01-08", "2026-01-15")
+        # The worker thread saw the run's memo: this repeat is a hit.
+        assert memoized_call(tool, "NVDA", "2026-01-08", "2026-01-15") == "NEWS"
+    assert len(calls) == 1
+    assert memo.report()["get_news"] == {"calls": 2, "hits": 1}
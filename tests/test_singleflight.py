@@ -0,0 +1,107 @@
+"""Single-flight: identical vendor calls in flight at the same time share one
+fetch, while sequential calls and different arguments still fetch separately.
+"""
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+from tradingagents.dataflows import interface
+from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.singleflight import SingleFlight
+
+
+def _run_concurrently(fn, n, release):
+    """Call ``fn`` from ``n`` threads, then set ``release`` and gather results."""
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        futures = [pool.submit(fn) for _ in range(n)]
+        # Give every worker time to reach the in-flight call before release.
+        time.sleep(0.2)
+        release.set()
+        return [f.result() for f in futures]
+
+
+@pytest.mark.unit
+class SingleFlightTests(unittest.TestCase):
+    def test_concurrent_callers_share_one_execution(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            release.wait(5)
+            return "result"
+
+        results = _run_concurrently(lambda: flight.do("key", fetch), 5, release)
+
+        self.assertEqual(results, ["result"] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.in_flight(), 0)
+
+    def test_leader_exception_reaches_every_waiter(self):
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def fetch():
+            release.wait(5)
+            raise ConnectionError("vendor down")
+
+        def call():
+            try:
+                return flight.do("key", fetch)
+            except ConnectionError as exc:
+                return str(exc)
+
+        self.assertEqual(_run_concurrently(call, 3, release), ["vendor down"] * 3)
+
+    def test_sequential_calls_are_not_cached(self):
+        flight = SingleFlight()
+        fetch = mock.Mock(side_effect=["a", "b"])
+        self.assertEqual(flight.do("key", fetch), "a")
+        self.assertEqual(flight.do("key", fetch), "b")
+
+
+@pytest.mark.unit
+class RouterCoalescingTests(unittest.TestCase):
+    def _patched_news(self, impl):
+        return mock.patch.dict(
+            interface.VENDOR_METHODS, {"get_global_news": {"yfinance": impl}}, clear=False
+        )
+
+    def _concurrent_global_news(self, n, args=("2026-01-10",)):
+        release = threading.Event()
+        calls = []
+
+        def impl(*a, **k):
+            calls.append(a)
+            release.wait(5)
+            return f"NEWS {a[0]}"
+
+        with self._patched_news(impl):
+            results = _run_concurrently(
+                lambda: interface.route_to_vendor("get_global_news", *args), n, release
+            )
+        return calls, results
+
+    def test_identical_concurrent_calls_hit_vendor_once(self):
+        calls, results = self._concurrent_global_news(4)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["NEWS 2026-01-10"] * 4)
+
+    def test_coalescing_can_be_disabled(self):
+        set_config({"coalesce_vendor_calls": False})
+        calls, _ = self._concurrent_global_news(3)
+        self.assertEqual(len(calls), 3)
+
+    def test_unhashable_arguments_bypass_coalescing(self):
+        with self._patched_news(lambda *a, **k: "NEWS"):
+            out = interface.route_to_vendor("get_global_news", "2026-01-10", queries=["fed"])
+        self.assertEqual(out, "NEWS")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+"""Social-sentiment pre-aggregation: counts, velocity, co-mentions and
+duplicate collapsing are computed locally and deterministically, and the
+aggregate block is much smaller than the raw messages it summarizes.
+"""
+from unittest import mock
+
+import pytest
+
+from tradingagents.agents.analysts import sentiment_analyst
+from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.records import SocialPost
+from tradingagents.dataflows.social_sentiment import (
+    cashtags,
+    co_mentions,
+    collapse_duplicates,
+    render_reddit_aggregate,
+    render_stocktwits_aggregate,
+)
+from tradingagents.dataflows.stocktwits import render_stocktwits_posts
+
+_NOW = 1_780_000_000.0
+
+
+def _msg(i, sentiment=None, body=None, minutes_ago=None):
+    ts = _NOW - 60 * (i if minutes_ago is None else minutes_ago)
+    return SocialPost(
+        "stocktwits", f"user{i}", f"t{i}", ts,
+        body=body or f"message number {i} about $NVDA and guidance for quarter {i}",
+        sentiment=sentiment,
+    )
+
+
+def _stream():
+    posts = [_msg(i, "Bullish" if i % 3 == 0 else "Bearish" if i % 3 == 1 else None) for i in range(27)]
+    pump = "$NVDA to the moon, loading calls before earnings $AMD $SMCI"
+    posts += [_msg(27 + i, "Bullish", body=pump) for i in range(3)]
+    return sorted(posts, key=lambda p: p.created_ts, reverse=True)
+
+
+@pytest.mark.unit
+def test_cashtags_ignore_dollar_amounts():
+    assert cashtags("Bought $nvda at $120, trimmed $BRK.B") == ["NVDA", "BRK.B"]
+
+
+@pytest.mark.unit
+def test_duplicates_collapse_ignoring_cashtags_and_links():
+    posts = [
+        _msg(1, body="Huge breakout incoming, load up now $NVDA https://x.co/a"),
+        _msg(2, body="Huge breakout incoming, load up now $AMD https://x.co/b"),
+        _msg(3, body="Earnings call was underwhelming on margins"),
+    ]
+    collapsed = collapse_duplicates(posts)
+    assert [(p.author, n) for p, n in collapsed] == [("user1", 2), ("user3", 1)]
+
+
+@pytest.mark.unit
+def test_co_mentions_count_posts_not_repeats():
+    posts = [_msg(1, body="$AMD $AMD $NVDA"), _msg(2, body="$amd and $TSLA"), _msg(3, body="$NVDA only")]
+    assert co_mentions(posts, "nvda") == [("AMD", 2), ("TSLA", 1)]
+
+
+@pytest.mark.unit
+def test_stocktwits_aggregate_counts_every_message_and_samples_a_few():
+    posts = _stream()
+    out = render_stocktwits_aggregate("NVDA", posts, {"24h": {"bullish": 40, "bearish": 9, "unlabeled": 3}},
+                                      sample=6, now=_NOW)
+    assert "Aggregate of the 30 most-recent messages (40% Bullish, 30% Bearish, 9 unlabeled; Bull/Bear ratio 1.3)" in out
+    assert "Last 24h (all stored messages): Bullish 40" in out
+    assert "Co-mentioned cashtags: $AMD (3), $SMCI (3)" in out
+    assert "Duplicates: 30 messages collapse to 28 distinct" in out
+    sample = [ln for ln in out.splitlines() if ln.startswith("[")]
+    assert len(sample) == 6
+    # Labels alternate, so each label is represented in the sample.
+    assert {"Bullish", "Bearish", "no-label"} <= {ln.split(" · ")[2].split("]")[0].split(" ")[0] for ln in sample}
+    assert out == render_stocktwits_aggregate("NVDA", posts, {"24h": {"bullish": 40, "bearish": 9, "unlabeled": 3}},
+                                              sample=6, now=_NOW)
+    assert len(out) < len(render_stocktwits_posts("NVDA", posts)) / 2
+
+
+@pytest.mark.unit
+def test_stocktwits_aggregate_velocity():
+    posts = [_msg(i, minutes_ago=10 * i) for i in range(7)]  # 7 messages over one hour
+    out = render_stocktwits_aggregate("NVDA", posts, now=_NOW)
+    assert "Velocity: 7.0 messages/hour over the last 1.0h; 7 of them in the past 24h" in out
+
+
+@pytest.mark.unit
+def test_reddit_aggregate_keeps_top_engagement_per_subreddit():
+    def _post(sub, title, score, hours_ago):
+        return SocialPost(f"r/{sub}", "", "2026-05-20T10:00:00Z", _NOW - 3600 * hours_ago,
+                          title=title, body="", score=score, num_comments=score // 10)
+
+    posts = [
+        _post("stocks", "NVDA guidance thoughts", 10, 2),
+        _post("stocks", "Is NVDA priced for perfection vs $AMD", 900, 30),
+        _post("stocks", "NVDA datacenter capex cycle question", 50, 50),
+        _post("investing", "Is NVDA priced for perfection vs $AMD", 40, 31),
+    ]
+    out = render_reddit_aggregate("NVDA", posts, ("stocks", "investing"), per_subreddit=1, now=_NOW)
+    assert "r/stocks 3, r/investing 1" in out
+    assert "Velocity: 1 in the past 24h" in out
+    assert "Duplicates: 4 posts collapse to 3 distinct" in out
+    assert "r/stocks [2026-05-20 · 900↑ · 90c · ×2] Is NVDA priced for perfection" in out
+    assert "guidance thoughts" not in out
+
+
+@pytest.mark.unit
+def test_empty_sources_keep_the_placeholders():
+    assert render_stocktwits_aggregate("nvda", ()).startswith("<no StockTwits messages found for $NVDA>")
+    assert render_reddit_aggregate("nvda", (), ("stocks",)).startswith("<no Reddit posts found")
+
+
+@pytest.mark.unit
+def test_sentiment_analyst_uses_aggregate_unless_disabled():
+    posts = _stream()
+    with mock.patch.object(sentiment_analyst, "fetch_stocktwits_posts", return_value=(posts, {})), \
+            mock.patch.object(sentiment_analyst, "fetch_stocktwits_messages", return_value="RAW") as raw:
+        assert sentiment_analyst._stocktwits_block("NVDA").startswith("Aggregate of the 30")
+        raw.assert_not_called()
+        set_config({"sentiment_aggregate": False})
+        assert sentiment_analyst._stocktwits_block("NVDA") == "RAW"
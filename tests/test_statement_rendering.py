@@ -0,0 +1,117 @@
+"""Compact financial-statement rendering: whitelisted line items, bounded
+periods, scaled units and precomputed QoQ/YoY changes, selectable per tool.
+"""
+import unittest
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from tradingagents.dataflows import y_finance, yfinance_registry
+from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.records import FinancialStatement, render_statement
+
+_QUARTERS = pd.to_datetime(
+    ["2025-06-30", "2025-03-31", "2024-12-31", "2024-09-30", "2024-06-30", "2024-03-31",
+     "2023-12-31", "2023-09-30"]
+)
+
+
+def _income_frame():
+    items = {
+        "Total Revenue": [120e9, 100e9, 110e9, 95e9, 100e9, 90e9, 92e9, 88e9],
+        "Net Income": [30e9, 25e9, 28e9, 22e9, 24e9, 21e9, 20e9, 19e9],
+        "Diluted EPS": [1.95, 1.62, 1.80, 1.41, 1.53, 1.34, 1.29, 1.22],
+    }
+    # Filler line items the analyst rarely needs, as yfinance returns them.
+    items.update({f"Other Line Item {i}": [float(i) * 1e6 + q for q in range(8)] for i in range(60)})
+    return pd.DataFrame(items, index=_QUARTERS).T
+
+
+def _statement(frame=None, kind="income_statement", freq="quarterly"):
+    return FinancialStatement(
+        "AAPL", "AAPL", kind, freq, _income_frame() if frame is None else frame, currency="USD"
+    )
+
+
+@pytest.mark.unit
+class CompactStatementTests(unittest.TestCase):
+    def test_compact_is_a_fraction_of_the_full_report(self):
+        statement = _statement()
+        full = render_statement(statement, "full")
+        compact = render_statement(statement, "compact")
+        self.assertLess(len(compact), len(full) / 5)
+
+    def test_keeps_whitelisted_items_and_latest_periods(self):
+        lines = render_statement(_statement(), "compact").splitlines()
+        table = "\n".join(lines)
+        self.assertIn("Total Revenue,120000.0,100000.0,110000.0,95000.0,+20.0%,+20.0%", table)
+        self.assertNotIn("Other Line Item", table)
+        self.assertNotIn("2024-06-30", table)
+        self.assertIn("values in USD millions", lines[0])
+
+    def test_per_share_items_are_not_scaled(self):
+        table = render_statement(_statement(), "compact")
+        self.assertIn("Diluted EPS,1.95,1.62,1.8,1.41,+20.4%,+27.5%", table)
+
+    def test_vendor_naming_styles_match_the_same_whitelist(self):
+        frame = pd.DataFrame(
+            {"totalRevenue": [5e8, 4e8], "netIncome": [1e8, 8e7], "reportedEPS": [0.5, 0.4]},
+            index=_QUARTERS[:2],
+        ).T
+        table = render_statement(_statement(frame), "compact")
+        self.assertIn("totalRevenue,500.0,400.0,+25.0%", table)
+        self.assertIn("netIncome", table)
+        self.assertNotIn("reportedEPS", table)
+
+    def test_annual_statements_report_yoy_only(self):
+        frame = pd.DataFrame({"Total Revenue": [400e9, 380e9]}, index=_QUARTERS[:2]).T
+        table = render_statement(_statement(frame, freq="annual"), "compact")
+        self.assertNotIn("QoQ", table)
+        self.assertIn("Total Revenue,400000.0,380000.0,+5.3%", table)
+
+    def test_configured_whitelist_and_periods(self):
+        set_config({"compact_statement": {"periods": 2, "unit": 1e9,
+                                          "line_items": {"income_statement": ["Other Line Item 7"]}}})
+        table = render_statement(_statement(), "compact")
+        self.assertIn("Other Line Item 7,0.0,0.0,", table)
+        self.assertNotIn("Total Revenue", table)
+        self.assertIn("USD billions", table)
+        self.assertNotIn("2024-12-31", table)
+
+    def test_unknown_items_fall_back_to_every_row(self):
+        frame = pd.DataFrame({"Mystery": [2e6, 1e6]}, index=_QUARTERS[:2]).T
+        self.assertIn("Mystery,2.0,1.0,+100.0%", render_statement(_statement(frame), "compact"))
+
+
+@pytest.mark.unit
+class StatementFormatSelectionTests(unittest.TestCase):
+    def _render_tools(self):
+        frame = _income_frame()
+
+        class FakeTicker:
+            def __init__(self, symbol):
+                pass
+
+            quarterly_income_stmt = frame
+            quarterly_balance_sheet = frame
+
+        with mock.patch.object(yfinance_registry.yf, "Ticker", FakeTicker):
+            return (
+                y_finance.get_income_statement("AAPL", "quarterly", "2025-08-01"),
+                y_finance.get_balance_sheet("AAPL", "quarterly", "2025-08-01"),
+            )
+
+    def test_default_is_the_full_report(self):
+        income, _ = self._render_tools()
+        self.assertIn("Other Line Item 59", income)
+
+    def test_format_is_selectable_per_tool(self):
+        set_config({"tool_statement_formats": {"get_income_statement": "compact"}})
+        income, balance = self._render_tools()
+        self.assertIn("compact", income.splitlines()[0])
+        self.assertNotIn("compact", balance.splitlines()[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
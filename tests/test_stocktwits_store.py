@@ -0,0 +1,145 @@
+"""StockTwits store: messages accumulate per symbol, refreshes ask only for
+messages after the newest stored id, and rolling sentiment counts are kept
+per hour as messages arrive.
+"""
+import os
+import time
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+
+import pytest
+
+from tradingagents.dataflows import stocktwits
+from tradingagents.dataflows.config import get_config, set_config
+from tradingagents.dataflows.stocktwits_store import StocktwitsStore
+
+# Real time: the fetch-level tests go through the configured store, which
+# prunes by the wall clock.
+_NOW = time.time()
+
+
+def _message(message_id, hours_ago=0.0, sentiment=None, body=None):
+    created = datetime.fromtimestamp(_NOW - hours_ago * 3600, tz=timezone.utc)
+    return {
+        "id": message_id,
+        "created_at": created.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "user": {"username": f"user{message_id}"},
+        "entities": {"sentiment": {"basic": sentiment} if sentiment else None},
+        "body": body or f"message {message_id}",
+    }
+
+
+class _Stream:
+    """Fake stream honouring since/max cursors over ``messages``, ``page`` per call."""
+
+    def __init__(self, messages, page=30):
+        self.messages = sorted(messages, key=lambda m: m["id"], reverse=True)
+        self.page = page
+        self.calls = []
+
+    def __call__(self, since, max_id):
+        self.calls.append((since, max_id))
+        matching = [
+            m for m in self.messages
+            if (since is None or m["id"] > since) and (max_id is None or m["id"] <= max_id)
+        ]
+        return {"messages": matching[:self.page], "cursor": {"more": len(matching) > self.page}}
+
+
+@pytest.mark.unit
+class StocktwitsStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.now = _NOW
+        path = os.path.join(get_config()["data_cache_dir"], "st-test.sqlite")
+        self.store = StocktwitsStore(path, refresh_interval=300, clock=lambda: self.now)
+
+    def test_refresh_asks_only_for_newer_messages(self):
+        stream = _Stream([_message(i) for i in (1, 2, 3)])
+        self.store.sync("NVDA", stream)
+        stream.messages.insert(0, _message(4))
+        self.now += 600
+        self.store.sync("NVDA", stream)
+        self.assertEqual(stream.calls, [(None, None), (3, None)])
+        self.assertEqual([r[1] for r in self.store.latest("NVDA", 10)], ["user4", "user3", "user2", "user1"])
+
+    def test_refresh_walks_back_with_max_when_a_page_overflows(self):
+        stream = _Stream([_message(1)], page=2)
+        self.store.sync("NVDA", stream)
+        stream.messages = [_message(i) for i in range(6, 0, -1)]
+        self.now += 600
+        self.store.sync("NVDA", stream)
+        self.assertEqual(stream.calls[1:], [(1, None), (1, 4), (1, 2)])
+        self.assertEqual(len(self.store.latest("NVDA", 10)), 6)
+
+    def test_refresh_interval_limits_requests(self):
+        stream = _Stream([_message(1)])
+        self.store.sync("NVDA", stream)
+        self.now += 60
+        self.store.sync("NVDA", stream)
+        self.assertEqual(len(stream.calls), 1)
+
+    def test_rolling_counts_are_maintained_without_double_counting(self):
+        stream = _Stream([
+            _message(1, hours_ago=1, sentiment="Bullish"),
+            _message(2, hours_ago=2, sentiment="Bearish"),
+            _message(3, hours_ago=30, sentiment="Bullish"),
+            _message(4, hours_ago=100),
+        ])
+        self.store.sync("NVDA", stream)
+        # An overlapping page re-delivers stored messages; counts must not move.
+        self.store.add("NVDA", stream.messages)
+        self.assertEqual(self.store.window_counts("NVDA", 24), {"bullish": 1, "bearish": 1, "unlabeled": 0})
+        self.assertEqual(self.store.window_counts("NVDA", 168), {"bullish": 2, "bearish": 1, "unlabeled": 1})
+
+    def test_old_messages_are_pruned(self):
+        stream = _Stream([_message(1, hours_ago=24 * 40), _message(2)])
+        self.store.sync("NVDA", stream)
+        self.assertEqual(len(self.store.latest("NVDA", 10)), 1)
+
+
+def _payload_reader(stream):
+    """Patch target for ``_fetch_stream`` that serves ``stream`` pages."""
+    def _fetch(ticker, timeout, since=None, max_id=None):
+        return stream(since, max_id)
+    return _fetch
+
+
+@pytest.mark.unit
+def test_fetch_renders_stored_messages_with_rolling_counts():
+    stream = _Stream([
+        _message(1, hours_ago=1, sentiment="Bullish", body="to the moon"),
+        _message(2, hours_ago=0.5, sentiment="Bearish"),
+    ])
+    with mock.patch.object(stocktwits, "_fetch_stream", side_effect=_payload_reader(stream)):
+        out = stocktwits.fetch_stocktwits_messages("nvda")
+        again = stocktwits.fetch_stocktwits_messages("NVDA")
+    assert out == again
+    assert len(stream.calls) == 1
+    assert "Bullish: 1 (50%) · Bearish: 1 (50%)" in out
+    assert "Last 24h: Bullish 1 · Bearish 1" in out
+    assert out.index("@user2") < out.index("@user1")
+    assert "to the moon" in out
+
+
+@pytest.mark.unit
+def test_failed_refresh_serves_stored_messages():
+    set_config({"stocktwits_refresh_interval": 0})
+    stream = _Stream([_message(1, sentiment="Bullish")])
+    with mock.patch.object(stocktwits, "_fetch_stream", side_effect=_payload_reader(stream)):
+        stocktwits.fetch_stocktwits_messages("NVDA")
+    with mock.patch.object(stocktwits, "_fetch_stream", side_effect=TimeoutError("slow")):
+        out = stocktwits.fetch_stocktwits_messages("NVDA")
+        missing = stocktwits.fetch_stocktwits_messages("AMD")
+    assert "@user1" in out
+    assert missing.startswith("<stocktwits unavailable")
+
+
+@pytest.mark.unit
+def test_disabled_store_formats_the_latest_page():
+    set_config({"stocktwits_store": False})
+    stream = _Stream([_message(i, sentiment="Bullish") for i in (1, 2, 3)])
+    with mock.patch.object(stocktwits, "_fetch_stream", side_effect=_payload_reader(stream)):
+        out = stocktwits.fetch_stocktwits_messages("NVDA", limit=2)
+    assert "Total: 2 most-recent messages" in out
+    assert "Last 24h" not in out
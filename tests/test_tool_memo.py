@@ -0,0 +1,113 @@
+"""Run-scoped tool memo: identical tool calls within one run are answered once,
+whether they come from a direct ``.func`` pre-fetch or a ToolNode invocation.
+"""
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+from langgraph.graph import END, START, MessagesState, StateGraph
+from langgraph.prebuilt import ToolNode
+
+from tradingagents.agents.utils.tool_memo import (
+    memoize_tool,
+    memoized_call,
+    tool_memo_scope,
+)
+
+
+def _counting_tool():
+    calls = []
+
+    @tool
+    def lookup(ticker: str, start_date: str, end_date: str = "2025-01-31") -> str:
+        """Look up something for a ticker."""
+        calls.append((ticker, start_date, end_date))
+        if ticker == "FAIL":
+            raise RuntimeError("vendor down")
+        return f"{ticker} {start_date} {end_date} #{len(calls)}"
+
+    return lookup, calls
+
+
+@pytest.mark.unit
+def test_repeated_call_is_served_from_memo():
+    lookup, calls = _counting_tool()
+    with tool_memo_scope() as memo:
+        first = memoized_call(lookup, "AAPL", "2025-01-01")
+        second = memoized_call(lookup, "AAPL", "2025-01-01")
+    assert first == second
+    assert len(calls) == 1
+    assert memo.report() == {"lookup": {"calls": 2, "hits": 1}}
+    assert "1/2" in memo.summary()
+
+
+@pytest.mark.unit
+def test_positional_and_keyword_calls_share_a_key():
+    lookup, calls = _counting_tool()
+    wrapped = memoize_tool(lookup)
+    with tool_memo_scope():
+        direct = memoized_call(lookup, "aapl ", "2025-01-01", "2025-01-31")
+        invoked = wrapped.invoke(
+            {"ticker": "AAPL", "start_date": "2025-01-01", "end_date": "2025-01-31"}
+        )
+    assert direct == invoked
+    assert len(calls) == 1
+
+
+@pytest.mark.unit
+def test_different_arguments_are_separate_entries():
+    lookup, calls = _counting_tool()
+    with tool_memo_scope():
+        memoized_call(lookup, "AAPL", "2025-01-01")
+        memoized_call(lookup, "AAPL", "2025-01-02")
+    assert len(calls) == 2
+
+
+@pytest.mark.unit
+def test_no_memo_outside_a_scope_or_when_disabled():
+    lookup, calls = _counting_tool()
+    wrapped = memoize_tool(lookup)
+    wrapped.invoke({"ticker": "AAPL", "start_date": "2025-01-01"})
+    wrapped.invoke({"ticker": "AAPL", "start_date": "2025-01-01"})
+    with tool_memo_scope(False) as memo:
+        memoized_call(lookup, "AAPL", "2025-01-01")
+    assert memo is None
+    assert len(calls) == 3
+
+
+@pytest.mark.unit
+def test_scopes_do_not_share_results():
+    lookup, calls = _counting_tool()
+    for _ in range(2):
+        with tool_memo_scope():
+            memoized_call(lookup, "AAPL", "2025-01-01")
+    assert len(calls) == 2
+
+
+@pytest.mark.unit
+def test_exceptions_are_not_memoized():
+    lookup, calls = _counting_tool()
+    with tool_memo_scope() as memo:
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                memoized_call(lookup, "FAIL", "2025-01-01")
+    assert len(calls) == 2
+    assert memo.report()["lookup"]["hits"] == 0
+
+
+@pytest.mark.unit
+def test_toolnode_calls_hit_the_run_memo():
+    lookup, calls = _counting_tool()
+    graph = StateGraph(MessagesState)
+    graph.add_node("tools", ToolNode([memoize_tool(lookup)]))
+    graph.add_edge(START, "tools")
+    graph.add_edge("tools", END)
+    app = graph.compile()
+    call = {"name": "lookup", "args": {"ticker": "MSFT", "start_date": "2025-01-01"}}
+    message = AIMessage(content="", tool_calls=[dict(call, id="1"), dict(call, id="2")])
+    with tool_memo_scope() as memo:
+        prefetched = memoized_call(lookup, "MSFT", "2025-01-01")
+        result = app.invoke({"messages": [message]})
+    contents = [m.content for m in result["messages"][1:]]
+    assert contents == [prefetched, prefetched]
+    assert len(calls) == 1
+    assert memo.report() == {"lookup": {"calls": 3, "hits": 2}}
@@ -0,0 +1,95 @@
+"""Universe fundamentals snapshot: concurrent batch fetch into one table,
+vectorized percentile ranks, and a compact context block for analysts.
+"""
+import threading
+import unittest
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from tradingagents.dataflows import universe
+from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.records import UniverseSnapshot
+
+_INFOS = {
+    "AAA": {"longName": "A Corp", "sector": "Tech", "trailingPE": 10.0, "profitMargins": 0.30, "revenueGrowth": 0.20},
+    "BBB": {"longName": "B Corp", "sector": "Tech", "trailingPE": 20.0, "profitMargins": 0.10, "revenueGrowth": 0.05},
+    "CCC": {"longName": "C Corp", "sector": "Energy", "trailingPE": 30.0, "profitMargins": 0.20, "revenueGrowth": 0.10},
+    "DDD": {"longName": "D Corp", "sector": "Energy", "trailingPE": -5.0, "profitMargins": -0.05, "revenueGrowth": -0.10},
+}
+
+
+class _Info:
+    def __init__(self, barrier=None):
+        self.calls = []
+        self.barrier = barrier
+
+    def __call__(self, symbol):
+        self.calls.append(symbol)
+        if self.barrier is not None:
+            self.barrier.wait(5)
+        if symbol == "BAD":
+            raise RuntimeError("boom")
+        return dict(_INFOS.get(symbol, {}))
+
+
+@pytest.mark.unit
+class UniverseSnapshotTests(unittest.TestCase):
+    def _snapshot(self, symbols=tuple(_INFOS), fake=None):
+        with mock.patch.object(universe, "get_info", fake or _Info()):
+            return universe.fetch_universe_snapshot(symbols)
+
+    def test_snapshot_is_one_row_per_symbol(self):
+        snapshot = self._snapshot(["aaa", "BBB", "AAA", "CCC"])
+        self.assertIsInstance(snapshot, UniverseSnapshot)
+        self.assertEqual(list(snapshot.frame.index), ["AAA", "BBB", "CCC"])
+        self.assertEqual(snapshot.frame.at["BBB", "trailing_pe"], 20.0)
+        self.assertEqual(snapshot.frame.at["CCC", "sector"], "Energy")
+
+    def test_symbols_are_fetched_concurrently(self):
+        fake = _Info(barrier=threading.Barrier(4))
+        self._snapshot(fake=fake)
+        self.assertEqual(sorted(fake.calls), sorted(_INFOS))
+
+    def test_failed_symbol_does_not_fail_the_batch(self):
+        frame = self._snapshot(["AAA", "BAD"]).frame
+        self.assertTrue(frame.loc["BAD", list(universe.RANK_METRICS)].isna().all())
+        self.assertEqual(frame.at["AAA", "profit_margin"], 0.30)
+
+    def test_snapshot_is_cached(self):
+        fake = _Info()
+        self._snapshot(fake=fake)
+        self._snapshot(fake=fake)
+        self.assertEqual(len(fake.calls), len(_INFOS))
+
+    def test_failed_symbol_is_not_cached_for_the_full_ttl(self):
+        set_config({"cache_ttls": {"universe_incomplete": 0}})
+        fake = _Info()
+        self._snapshot(["AAA", "BAD"], fake=fake)
+        self._snapshot(["AAA", "BAD"], fake=fake)
+        self.assertEqual(fake.calls.count("BAD"), 2)
+
+    def test_percentile_ranks(self):
+        ranks = universe.rank_universe(self._snapshot())
+        self.assertEqual(ranks.at["AAA", "profit_margin"], 100.0)
+        self.assertEqual(ranks.at["DDD", "profit_margin"], 25.0)
+        # A negative P/E is not a valuation and isn't ranked.
+        self.assertTrue(pd.isna(ranks.at["DDD", "trailing_pe"]))
+        self.assertEqual(ranks.at["CCC", "trailing_pe"], 100.0)
+
+    def test_ranks_within_sector(self):
+        ranks = universe.rank_universe(self._snapshot(), by="sector")
+        self.assertEqual(ranks.at["BBB", "revenue_growth"], 50.0)
+        self.assertEqual(ranks.at["CCC", "revenue_growth"], 100.0)
+
+    def test_render_context(self):
+        text = universe.render_universe_context("aaa", self._snapshot())
+        self.assertIn("AAA percentile ranks vs the universe (n=4", text)
+        self.assertIn("Profit margin: 0.3 (pct 100, median 0.15)", text)
+        self.assertNotIn("Forward P/E", text)
+        self.assertIn("not in the screened universe", universe.render_universe_context("ZZZ", self._snapshot()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -119,5 +119,51 @@ class VendorRoutingTests(unittest.TestCase):
             interface.route_to_vendor("get_stock_data", "AAPL", "2026-01-01", "2026-01-10")
 
 
+@pytest.mark.unit
+class CompiledRouteTests(unittest.TestCase):
+    def setUp(self):
+        _reset_config()
+
+    def tearDown(self):
+        _reset_config()
+
+    def test_route_is_compiled_once_per_config_version(self):
+        with mock.patch.object(
+            interface, "_compile_route", wraps=interface._compile_route
+        ) as compile_route:
+            interface._get_route("get_stock_data")
+            interface._get_route("get_stock_data")
+            self.assertEqual(compile_route.call_count, 1)
+
+            set_config({"data_vendors": {"core_stock_apis": "alpha_vantage"}})
+            route = interface._get_route("get_stock_data")
+            self.assertEqual(compile_route.call_count, 2)
+        self.assertEqual([vendor for vendor, _ in route.chain], ["alpha_vantage"])
+
+    def test_tool_override_takes_precedence_in_compiled_chain(self):
+        set_config({
+            "data_vendors": {"core_stock_apis": "yfinance"},
+            "tool_vendors": {"get_stock_data": "alpha_vantage,yfinance"},
+        })
+        route = interface._get_route("get_stock_data")
+        self.assertEqual(route.category, "core_stock_apis")
+        self.assertEqual([vendor for vendor, _ in route.chain], ["alpha_vantage", "yfinance"])
+
+    def test_in_place_vendor_override_reaches_the_route(self):
+        set_config({"data_vendors": {"core_stock_apis": "yfinance"}})
+        interface._get_route("get_stock_data")
+        with mock.patch.dict(
+            interface.VENDOR_METHODS["get_stock_data"], {"yfinance": _returns("patched")}
+        ):
+            result = interface.route_to_vendor(
+                "get_stock_data", "AAPL", "2026-01-01", "2026-01-10"
+            )
+        self.assertEqual(result, "patched")
+
+    def test_unknown_method_raises(self):
+        with self.assertRaises(ValueError):
+            interface.route_to_vendor("get_nonexistent", "AAPL")
+
+
 if __name__ == "__main__":
     unittest.main()
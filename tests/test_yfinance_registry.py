@@ -0,0 +1,117 @@
+"""Shared yfinance Ticker/info registry: one ``.info`` fetch per symbol serves
+identity resolution and fundamentals, survives a restart via the on-disk copy,
+and concurrent first requests share a single fetch.
+"""
+import os
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+import tradingagents.dataflows.yfinance_registry as registry
+from tradingagents.agents.utils.agent_utils import resolve_instrument_identity
+from tradingagents.dataflows import y_finance
+from tradingagents.dataflows.cache_backend import reset_cache_backend
+from tradingagents.dataflows.config import get_config, set_config
+
+_INFO = {"longName": "Apple Inc.", "sector": "Technology", "trailingPE": 31.2}
+
+
+class CountingTicker:
+    """Fake ``yf.Ticker`` that counts constructions and ``.info`` fetches."""
+
+    constructed = 0
+    info_fetches = 0
+    payload = _INFO
+    delay = 0.0
+
+    def __init__(self, symbol):
+        type(self).constructed += 1
+        self.symbol = symbol
+
+    @property
+    def info(self):
+        type(self).info_fetches += 1
+        time.sleep(self.delay)
+        return dict(self.payload)
+
+
+@pytest.mark.unit
+class YFinanceRegistryTests(unittest.TestCase):
+    def setUp(self):
+        CountingTicker.constructed = 0
+        CountingTicker.info_fetches = 0
+        CountingTicker.payload = _INFO
+        CountingTicker.delay = 0.0
+        resolve_instrument_identity.cache_clear()
+        patcher = mock.patch.object(registry.yf, "Ticker", CountingTicker)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(resolve_instrument_identity.cache_clear)
+
+    def _restart(self):
+        """Simulate a new process: drop every in-memory layer, keep the disk."""
+        reset_cache_backend()
+        registry.clear_ticker_registry()
+
+    def test_identity_and_fundamentals_share_one_info_fetch(self):
+        identity = resolve_instrument_identity("AAPL")
+        report = y_finance.get_fundamentals("AAPL")
+        self.assertEqual(identity["company_name"], "Apple Inc.")
+        self.assertIn("PE Ratio (TTM): 31.2", report)
+        self.assertEqual(CountingTicker.info_fetches, 1)
+        self.assertEqual(CountingTicker.constructed, 1)
+
+    def test_ticker_objects_are_shared(self):
+        self.assertIs(registry.get_ticker("aapl"), registry.get_ticker("AAPL"))
+
+    def test_info_survives_a_restart_via_disk(self):
+        registry.get_info("AAPL")
+        self._restart()
+        self.assertEqual(registry.get_info("AAPL")["longName"], "Apple Inc.")
+        self.assertEqual(CountingTicker.info_fetches, 1)
+        cache_dir = get_config()["data_cache_dir"]
+        self.assertTrue(os.path.exists(os.path.join(cache_dir, "info", "AAPL.json")))
+
+    def test_expired_disk_copy_is_refetched(self):
+        registry.get_info("AAPL")
+        self._restart()
+        set_config({"cache_ttls": {"info": 0}})
+        registry.get_info("AAPL")
+        self.assertEqual(CountingTicker.info_fetches, 2)
+
+    def test_foreign_json_on_disk_is_refetched(self):
+        registry.get_info("AAPL")
+        self._restart()
+        for content in ("[]", "null", '"info"'):
+            with open(registry._disk_path("AAPL"), "w", encoding="utf-8") as fh:
+                fh.write(content)
+            self._restart()
+            self.assertEqual(registry.get_info("AAPL")["longName"], "Apple Inc.")
+        self.assertEqual(CountingTicker.info_fetches, 4)
+
+    def test_empty_info_is_not_cached(self):
+        CountingTicker.payload = {}
+        self.assertEqual(registry.get_info("ZZZZ"), {})
+        self.assertEqual(registry.get_info("ZZZZ"), {})
+        self.assertEqual(CountingTicker.info_fetches, 2)
+
+    def test_concurrent_first_requests_share_one_fetch(self):
+        CountingTicker.delay = 0.2
+        start = threading.Barrier(4)
+
+        def fetch():
+            start.wait()
+            return registry.get_info("MSFT")
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: fetch(), range(4)))
+        self.assertEqual(CountingTicker.info_fetches, 1)
+        self.assertTrue(all(r == _INFO for r in results))
+
+
+if __name__ == "__main__":
+    unittest.main()
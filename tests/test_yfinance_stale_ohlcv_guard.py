@@ -14,6 +14,7 @@ import pytest
 
 import tradingagents.dataflows.config as config_module
 import tradingagents.dataflows.y_finance as y_finance
+import tradingagents.dataflows.yfinance_registry as yfinance_registry
 import tradingagents.default_config as default_config
 from tradingagents.dataflows import interface
 from tradingagents.dataflows.config import set_config
@@ -76,7 +77,7 @@ class StaleGuardPropagationTests(unittest.TestCase):
             def history(self, start, end):
                 return stale
 
-        with mock.patch.object(y_finance.yf, "Ticker", DummyTicker), \
+        with mock.patch.object(yfinance_registry.yf, "Ticker", DummyTicker), \
                 self.assertRaises(NoMarketDataError):
             y_finance.get_YFin_data_online("CB", "2026-06-01", "2026-06-11")
 
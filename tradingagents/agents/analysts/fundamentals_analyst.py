@@ -7,7 +7,27 @@ from tradingagents.agents.utils.agent_utils import (
     get_income_statement,
     get_instrument_context_from_state,
     get_language_instruction,
+    prefetch_fundamentals,
 )
+from tradingagents.agents.utils.fundamental_data_tools import FUNDAMENTALS_BUNDLE
+from tradingagents.agents.utils.llm_node import llm_node
+from tradingagents.dataflows.config import get_config_snapshot
+from tradingagents.dataflows.universe import fetch_universe_snapshot, render_universe_context
+
+
+def _render_bundle(bundle: dict[str, str], current_date: str) -> str:
+    """Format reports prefetched as of ``current_date`` as a prompt section, in tool order."""
+    sections = [
+        f"## {heading} (`{method}`)\n{bundle[method]}"
+        for method, heading in FUNDAMENTALS_BUNDLE.items()
+        if method in bundle
+    ]
+    return (
+        "\n\nThe following data has already been retrieved for you (quarterly statements"
+        f" as of {current_date}). Do not call tools again for it; write the report directly unless"
+        " you need something not shown here, such as annual statements.\n\n"
+        + "\n\n".join(sections)
+    )
 
 
 def create_fundamentals_analyst(llm):
@@ -26,9 +46,28 @@ def create_fundamentals_analyst(llm):
             "You are a researcher tasked with analyzing fundamental information over the past week about a company. Please write a comprehensive report of the company's fundamental information such as financial documents, company profile, basic company financials, and company financial history to gain a full view of the company's fundamental information to inform traders. Make sure to include as much detail as possible. Provide specific, actionable insights with supporting evidence to help traders make informed decisions."
             + " Make sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read."
             + " Use the available tools: `get_fundamentals` for comprehensive company analysis, `get_balance_sheet`, `get_cashflow`, and `get_income_statement` for specific financial statements."
-            + get_language_instruction(),
+            + get_language_instruction()
         )
 
+        # Pull the overview and all three statements concurrently up front, so
+        # the usual four sequential tool rounds collapse into one LLM turn. The
+        # fetch also warms the tools; on re-entry after a tool round it is a
+        # cache hit.
+        if get_config_snapshot().get("prefetch_fundamentals", True):
+            bundle = prefetch_fundamentals(str(state["company_of_interest"]), current_date)
+            if bundle:
+                system_message += _render_bundle(bundle, current_date)
+
+        universe = get_config_snapshot().get("fundamentals_universe") or []
+        if universe:
+            ticker = str(state["company_of_interest"])
+            snapshot = fetch_universe_snapshot([*universe, ticker])
+            system_message += (
+                "\n\nCross-sectional context (use it to judge whether valuation,"
+                " margins and growth are high or low relative to peers):\n"
+                + render_universe_context(ticker, snapshot)
+            )
+
         prompt = ChatPromptTemplate.from_messages(
             [
                 (
@@ -54,7 +93,7 @@ def create_fundamentals_analyst(llm):
 
         chain = prompt | llm.bind_tools(tools)
 
-        result = chain.invoke(state["messages"])
+        result = yield chain, state["messages"]
 
         report = ""
 
@@ -66,4 +105,4 @@ def create_fundamentals_analyst(llm):
             "fundamentals_report": report,
         }
 
-    return fundamentals_analyst_node
+    return llm_node(fundamentals_analyst_node)
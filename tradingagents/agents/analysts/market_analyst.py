@@ -7,6 +7,7 @@ from tradingagents.agents.utils.agent_utils import (
     get_stock_data,
     get_verified_market_snapshot,
 )
+from tradingagents.agents.utils.llm_node import llm_node
 
 
 def create_market_analyst(llm):
@@ -80,7 +81,7 @@ Write a very detailed and nuanced report of the trends you observe. Provide spec
 
         chain = prompt | llm.bind_tools(tools)
 
-        result = chain.invoke(state["messages"])
+        result = yield chain, state["messages"]
 
         report = ""
 
@@ -92,4 +93,4 @@ Write a very detailed and nuanced report of the trends you observe. Provide spec
             "market_report": report,
         }
 
-    return market_analyst_node
+    return llm_node(market_analyst_node)
@@ -8,6 +8,7 @@ from tradingagents.agents.utils.agent_utils import (
     get_news,
     get_prediction_markets,
 )
+from tradingagents.agents.utils.llm_node import llm_node
 
 
 def create_news_analyst(llm):
@@ -54,7 +55,7 @@ def create_news_analyst(llm):
         prompt = prompt.partial(instrument_context=instrument_context)
 
         chain = prompt | llm.bind_tools(tools)
-        result = chain.invoke(state["messages"])
+        result = yield chain, state["messages"]
 
         report = ""
 
@@ -66,4 +67,4 @@ def create_news_analyst(llm):
             "news_report": report,
         }
 
-    return news_analyst_node
+    return llm_node(news_analyst_node)
@@ -5,8 +5,9 @@ the old version had a prompt that demanded social-media analysis but the
 only tool available was Yahoo Finance news — which led LLMs to fabricate
 Reddit/X/StockTwits content under prompt pressure (verified live).
 
-The redesigned agent pre-fetches three complementary data sources before
-the LLM is invoked and injects them into the prompt as structured blocks:
+The redesigned agent pre-fetches three complementary data sources
+(concurrently, each under a deadline) before the LLM is invoked and injects
+them into the prompt as structured blocks:
 
   1. News headlines     — Yahoo Finance (institutional framing)
   2. StockTwits messages — retail-trader posts indexed by cashtag, with
@@ -24,6 +25,10 @@ See: https://github.com/TauricResearch/TradingAgents/issues/557
 See: https://github.com/TauricResearch/TradingAgents/issues/796
 """
 
+import contextvars
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 from langchain_core.messages import AIMessage
@@ -35,18 +40,103 @@ from tradingagents.agents.utils.agent_utils import (
     get_language_instruction,
     get_news,
 )
+from tradingagents.agents.utils.llm_node import llm_node
 from tradingagents.agents.utils.structured import (
     bind_structured,
-    invoke_structured_or_freetext,
+    structured_or_freetext_steps,
 )
-from tradingagents.dataflows.reddit import fetch_reddit_posts
-from tradingagents.dataflows.stocktwits import fetch_stocktwits_messages
+from tradingagents.agents.utils.tool_memo import memoized_call
+from tradingagents.dataflows.config import get_config_snapshot
+from tradingagents.dataflows.reddit import (
+    DEFAULT_SUBREDDITS,
+    fetch_reddit_posts,
+    fetch_reddit_social_posts,
+)
+from tradingagents.dataflows.social_sentiment import (
+    render_reddit_aggregate,
+    render_stocktwits_aggregate,
+)
+from tradingagents.dataflows.stocktwits import fetch_stocktwits_messages, fetch_stocktwits_posts
+
+logger = logging.getLogger(__name__)
+
+# Seconds each pre-fetch may take before its block degrades to a placeholder;
+# overridden per source by ``sentiment_source_timeouts``.
+DEFAULT_SOURCE_TIMEOUTS = {"news": 45.0, "stocktwits": 20.0, "reddit": 45.0}
 
 
 def _seven_days_back(trade_date: str) -> str:
     return (datetime.strptime(trade_date, "%Y-%m-%d") - timedelta(days=7)).strftime("%Y-%m-%d")
 
 
+def _stocktwits_block(ticker: str) -> str:
+    """StockTwits prompt block: a local aggregate plus sample, or the raw messages."""
+    config = get_config_snapshot()
+    if not config.get("sentiment_aggregate", True):
+        return fetch_stocktwits_messages(ticker, limit=30)
+    posts, window_counts = fetch_stocktwits_posts(ticker, limit=30)
+    return render_stocktwits_aggregate(
+        ticker, posts, window_counts, sample=config.get("sentiment_sample_messages", 8)
+    )
+
+
+def _reddit_block(ticker: str) -> str:
+    """Reddit prompt block: a local aggregate plus sample, or the raw posts."""
+    config = get_config_snapshot()
+    if not config.get("sentiment_aggregate", True):
+        return fetch_reddit_posts(ticker)
+    return render_reddit_aggregate(
+        ticker,
+        fetch_reddit_social_posts(ticker),
+        DEFAULT_SUBREDDITS,
+        per_subreddit=config.get("sentiment_sample_posts_per_subreddit", 2),
+    )
+
+
+def _prefetch_sources(ticker: str, start_date: str, end_date: str) -> dict[str, str]:
+    """Fetch the three sentiment sources concurrently, each under its deadline.
+
+    Returns ``{"news", "stocktwits", "reddit"}`` blocks. A source that raises
+    or misses its deadline becomes a ``<{source} unavailable: ...>``
+    placeholder; its worker is abandoned rather than awaited, so the node
+    waits for the slowest source within its deadline, not for the sum.
+    """
+    timeouts = {**DEFAULT_SOURCE_TIMEOUTS, **(get_config_snapshot().get("sentiment_source_timeouts") or {})}
+    fetchers = {
+        # Through the run memo: the news analyst usually asks for the same window.
+        "news": lambda: memoized_call(get_news, ticker, start_date, end_date),
+        "stocktwits": lambda: _stocktwits_block(ticker),
+        "reddit": lambda: _reddit_block(ticker),
+    }
+    pool = ThreadPoolExecutor(max_workers=len(fetchers), thread_name_prefix="sentiment")
+    started = time.monotonic()
+    try:
+        # Each worker runs in a copy of this context, so the run's tool memo
+        # and other context variables reach it.
+        futures = {
+            name: pool.submit(contextvars.copy_context().run, fetch)
+            for name, fetch in fetchers.items()
+        }
+        blocks = {}
+        for name, future in futures.items():
+            remaining = max(0.0, timeouts[name] - (time.monotonic() - started))
+            try:
+                blocks[name] = future.result(timeout=remaining)
+            except Exception as exc:
+                if future.done():  # the fetcher itself raised
+                    logger.warning("Sentiment source %s for %s failed: %s", name, ticker, exc)
+                    blocks[name] = f"<{name} unavailable: {type(exc).__name__}>"
+                else:
+                    logger.warning(
+                        "Sentiment source %s for %s missed its %.0fs deadline",
+                        name, ticker, timeouts[name],
+                    )
+                    blocks[name] = f"<{name} unavailable: timed out after {timeouts[name]:.0f}s>"
+        return blocks
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
 def create_sentiment_analyst(llm):
     """Create a sentiment analyst node for the trading graph.
 
@@ -63,20 +153,18 @@ def create_sentiment_analyst(llm):
         start_date = _seven_days_back(end_date)
         instrument_context = get_instrument_context_from_state(state)
 
-        # Pre-fetch all three sources. Each fetcher degrades gracefully and
-        # returns a string (no exceptions surface from here), so the LLM
+        # Pre-fetch all three sources concurrently. Each degrades to a
+        # placeholder string (no exceptions surface from here), so the LLM
         # always sees something — either real data or a clear placeholder.
-        news_block = get_news.func(ticker, start_date, end_date)
-        stocktwits_block = fetch_stocktwits_messages(ticker, limit=30)
-        reddit_block = fetch_reddit_posts(ticker)
+        blocks = _prefetch_sources(ticker, start_date, end_date)
 
         system_message = _build_system_message(
             ticker=ticker,
             start_date=start_date,
             end_date=end_date,
-            news_block=news_block,
-            stocktwits_block=stocktwits_block,
-            reddit_block=reddit_block,
+            news_block=blocks["news"],
+            stocktwits_block=blocks["stocktwits"],
+            reddit_block=blocks["reddit"],
         )
 
         prompt = ChatPromptTemplate.from_messages(
@@ -102,7 +190,7 @@ def create_sentiment_analyst(llm):
         # data is already in the prompt.
         formatted_messages = prompt.format_messages(messages=state["messages"])
 
-        report_text = invoke_structured_or_freetext(
+        report_text = yield from structured_or_freetext_steps(
             structured_llm,
             llm,
             formatted_messages,
@@ -115,7 +203,7 @@ def create_sentiment_analyst(llm):
             "sentiment_report": report_text,
         }
 
-    return sentiment_analyst_node
+    return llm_node(sentiment_analyst_node)
 
 
 def _build_system_message(
@@ -140,7 +228,7 @@ Institutional framing. Fact-driven, slower-moving signal.
 <end_of_news>
 
 ### StockTwits messages — retail-trader social platform indexed by cashtag
-Fast-moving signal. Each message carries a user-labeled sentiment tag (Bullish / Bearish / no-label) plus the message body.
+Fast-moving signal. Each message carries a user-labeled sentiment tag (Bullish / Bearish / no-label) plus the message body. The header gives counts computed over every fetched message (label ratios, velocity, co-mentioned cashtags) and, when available, rolling 24h / 7d Bullish/Bearish counts over every message collected for the symbol. When only a representative sample of messages is listed (duplicates collapsed, ×N = copies), base ratios on the header counts, not on the sample.
 
 <start_of_stocktwits>
 {stocktwits_block}
@@ -15,16 +15,17 @@ from tradingagents.agents.utils.agent_utils import (
     get_instrument_context_from_state,
     get_language_instruction,
 )
+from tradingagents.agents.utils.llm_node import llm_node
 from tradingagents.agents.utils.structured import (
     bind_structured,
-    invoke_structured_or_freetext,
+    structured_or_freetext_steps,
 )
 
 
 def create_portfolio_manager(llm):
     structured_llm = bind_structured(llm, PortfolioDecision, "Portfolio Manager")
 
-    def portfolio_manager_node(state) -> dict:
+    def portfolio_manager_node(state):
         instrument_context = get_instrument_context_from_state(state)
 
         history = state["risk_debate_state"]["history"]
@@ -63,7 +64,7 @@ def create_portfolio_manager(llm):
 
 Be decisive and ground every conclusion in specific evidence from the analysts.{get_language_instruction()}"""
 
-        final_trade_decision = invoke_structured_or_freetext(
+        final_trade_decision = yield from structured_or_freetext_steps(
             structured_llm,
             llm,
             prompt,
@@ -89,4 +90,4 @@ Be decisive and ground every conclusion in specific evidence from the analysts.{
             "final_trade_decision": final_trade_decision,
         }
 
-    return portfolio_manager_node
+    return llm_node(portfolio_manager_node)
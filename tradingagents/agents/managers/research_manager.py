@@ -7,16 +7,17 @@ from tradingagents.agents.utils.agent_utils import (
     get_instrument_context_from_state,
     get_language_instruction,
 )
+from tradingagents.agents.utils.llm_node import llm_node
 from tradingagents.agents.utils.structured import (
     bind_structured,
-    invoke_structured_or_freetext,
+    structured_or_freetext_steps,
 )
 
 
 def create_research_manager(llm):
     structured_llm = bind_structured(llm, ResearchPlan, "Research Manager")
 
-    def research_manager_node(state) -> dict:
+    def research_manager_node(state):
         instrument_context = get_instrument_context_from_state(state)
         history = state["investment_debate_state"].get("history", "")
 
@@ -42,7 +43,7 @@ Commit to a clear stance whenever the debate's strongest arguments warrant one;
 **Debate History:**
 {history}""" + get_language_instruction()
 
-        investment_plan = invoke_structured_or_freetext(
+        investment_plan = yield from structured_or_freetext_steps(
             structured_llm,
             llm,
             prompt,
@@ -64,4 +65,4 @@ Commit to a clear stance whenever the debate's strongest arguments warrant one;
             "investment_plan": investment_plan,
         }
 
-    return research_manager_node
+    return llm_node(research_manager_node)
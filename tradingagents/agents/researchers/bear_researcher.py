@@ -2,10 +2,11 @@ from tradingagents.agents.utils.agent_utils import (
     get_instrument_context_from_state,
     get_language_instruction,
 )
+from tradingagents.agents.utils.llm_node import llm_node
 
 
 def create_bear_researcher(llm):
-    def bear_node(state) -> dict:
+    def bear_node(state):
         investment_debate_state = state["investment_debate_state"]
         history = investment_debate_state.get("history", "")
         bear_history = investment_debate_state.get("bear_history", "")
@@ -46,7 +47,7 @@ Last bull argument: {current_response}
 Use this information to deliver a compelling bear argument, refute the bull's claims, and engage in a dynamic debate that demonstrates the risks and weaknesses of investing in the {target_label}.
 """ + get_language_instruction()
 
-        response = llm.invoke(prompt)
+        response = yield llm, prompt
 
         argument = f"Bear Analyst: {response.content}"
 
@@ -60,4 +61,4 @@ Use this information to deliver a compelling bear argument, refute the bull's cl
 
         return {"investment_debate_state": new_investment_debate_state}
 
-    return bear_node
+    return llm_node(bear_node)
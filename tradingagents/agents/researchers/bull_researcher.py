@@ -2,10 +2,11 @@ from tradingagents.agents.utils.agent_utils import (
     get_instrument_context_from_state,
     get_language_instruction,
 )
+from tradingagents.agents.utils.llm_node import llm_node
 
 
 def create_bull_researcher(llm):
-    def bull_node(state) -> dict:
+    def bull_node(state):
         investment_debate_state = state["investment_debate_state"]
         history = investment_debate_state.get("history", "")
         bull_history = investment_debate_state.get("bull_history", "")
@@ -44,7 +45,7 @@ Last bear argument: {current_response}
 Use this information to deliver a compelling bull argument, refute the bear's concerns, and engage in a dynamic debate that demonstrates the strengths of the bull position.
 """ + get_language_instruction()
 
-        response = llm.invoke(prompt)
+        response = yield llm, prompt
 
         argument = f"Bull Analyst: {response.content}"
 
@@ -58,4 +59,4 @@ Use this information to deliver a compelling bull argument, refute the bear's co
 
         return {"investment_debate_state": new_investment_debate_state}
 
-    return bull_node
+    return llm_node(bull_node)
@@ -2,10 +2,11 @@ from tradingagents.agents.utils.agent_utils import (
     get_instrument_context_from_state,
     get_language_instruction,
 )
+from tradingagents.agents.utils.llm_node import llm_node
 
 
 def create_aggressive_debator(llm):
-    def aggressive_node(state) -> dict:
+    def aggressive_node(state):
         risk_debate_state = state["risk_debate_state"]
         history = risk_debate_state.get("history", "")
         aggressive_history = risk_debate_state.get("aggressive_history", "")
@@ -36,7 +37,7 @@ Here is the current conversation history: {history} Here are the last arguments
 
 Engage actively by addressing any specific concerns raised, refuting the weaknesses in their logic, and asserting the benefits of risk-taking to outpace market norms. Maintain a focus on debating and persuading, not just presenting data. Challenge each counterpoint to underscore why a high-risk approach is optimal. Output conversationally as if you are speaking without any special formatting.""" + get_language_instruction()
 
-        response = llm.invoke(prompt)
+        response = yield llm, prompt
 
         argument = f"Aggressive Analyst: {response.content}"
 
@@ -56,4 +57,4 @@ Engage actively by addressing any specific concerns raised, refuting the weaknes
 
         return {"risk_debate_state": new_risk_debate_state}
 
-    return aggressive_node
+    return llm_node(aggressive_node)
@@ -2,10 +2,11 @@ from tradingagents.agents.utils.agent_utils import (
     get_instrument_context_from_state,
     get_language_instruction,
 )
+from tradingagents.agents.utils.llm_node import llm_node
 
 
 def create_neutral_debator(llm):
-    def neutral_node(state) -> dict:
+    def neutral_node(state):
         risk_debate_state = state["risk_debate_state"]
         history = risk_debate_state.get("history", "")
         neutral_history = risk_debate_state.get("neutral_history", "")
@@ -36,7 +37,7 @@ Here is the current conversation history: {history} Here is the last response fr
 
 Engage actively by analyzing both sides critically, addressing weaknesses in the aggressive and conservative arguments to advocate for a more balanced approach. Challenge each of their points to illustrate why a moderate risk strategy might offer the best of both worlds, providing growth potential while safeguarding against extreme volatility. Focus on debating rather than simply presenting data, aiming to show that a balanced view can lead to the most reliable outcomes. Output conversationally as if you are speaking without any special formatting.""" + get_language_instruction()
 
-        response = llm.invoke(prompt)
+        response = yield llm, prompt
 
         argument = f"Neutral Analyst: {response.content}"
 
@@ -56,4 +57,4 @@ Engage actively by analyzing both sides critically, addressing weaknesses in the
 
         return {"risk_debate_state": new_risk_debate_state}
 
-    return neutral_node
+    return llm_node(neutral_node)
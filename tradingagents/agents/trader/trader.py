@@ -11,9 +11,10 @@ from tradingagents.agents.utils.agent_utils import (
     get_instrument_context_from_state,
     get_language_instruction,
 )
+from tradingagents.agents.utils.llm_node import llm_node
 from tradingagents.agents.utils.structured import (
     bind_structured,
-    invoke_structured_or_freetext,
+    structured_or_freetext_steps,
 )
 
 
@@ -48,7 +49,7 @@ def create_trader(llm):
             },
         ]
 
-        trader_plan = invoke_structured_or_freetext(
+        trader_plan = yield from structured_or_freetext_steps(
             structured_llm,
             llm,
             messages,
@@ -62,4 +63,4 @@ def create_trader(llm):
             "sender": name,
         }
 
-    return functools.partial(trader_node, name="Trader")
+    return llm_node(functools.partial(trader_node, name="Trader"), name="trader_node")
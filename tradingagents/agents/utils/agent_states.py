@@ -1,3 +1,4 @@
+import operator
 from typing import Annotated
 
 from langgraph.graph import MessagesState
@@ -14,6 +15,9 @@ class InvestDebateState(TypedDict):
     ]  # Bullish Conversation history
     history: Annotated[str, "Conversation history"]  # Conversation history
     current_response: Annotated[str, "Latest response"]  # Last response
+    # Per-side latest responses, kept by the round-based (parallel) schedule
+    current_bull_response: Annotated[str, "Latest response by the bull researcher"]
+    current_bear_response: Annotated[str, "Latest response by the bear researcher"]
     judge_decision: Annotated[str, "Final judge decision"]  # Last response
     count: Annotated[int, "Length of the current conversation"]  # Conversation length
 
@@ -59,6 +63,9 @@ class AgentState(MessagesState):
         str, "Report from the News Researcher of current world affairs"
     ]
     fundamentals_report: Annotated[str, "Report from the Fundamentals Researcher"]
+    # Seconds each analyst branch took in parallel mode; branches write
+    # concurrently, so updates are merged rather than overwritten.
+    analyst_wall_times: Annotated[dict[str, float], operator.or_]
 
     # researcher team discussion step
     investment_debate_state: Annotated[
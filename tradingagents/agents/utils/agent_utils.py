@@ -3,7 +3,6 @@ import logging
 from collections.abc import Mapping
 from typing import Any
 
-import yfinance as yf
 from langchain_core.messages import HumanMessage, RemoveMessage
 
 # Import tools from separate utility files
@@ -13,6 +12,7 @@ from tradingagents.agents.utils.fundamental_data_tools import (
     get_cashflow,
     get_fundamentals,
     get_income_statement,
+    prefetch_fundamentals,
 )
 from tradingagents.agents.utils.macro_data_tools import get_macro_indicators
 from tradingagents.agents.utils.market_data_validation_tools import get_verified_market_snapshot
@@ -33,6 +33,7 @@ __all__ = [
     "get_balance_sheet",
     "get_cashflow",
     "get_income_statement",
+    "prefetch_fundamentals",
     "get_news",
     "get_global_news",
     "get_insider_transactions",
@@ -58,8 +59,8 @@ def get_language_instruction() -> str:
     portfolio manager — so a non-English run produces a fully localized
     report rather than a mix of languages.
     """
-    from tradingagents.dataflows.config import get_config
-    lang = get_config().get("output_language", "English")
+    from tradingagents.dataflows.config import get_config_snapshot
+    lang = get_config_snapshot().get("output_language", "English")
     if lang.strip().lower() == "english":
         return ""
     return f" Write your entire response in {lang}."
@@ -88,15 +89,27 @@ def resolve_instrument_identity(ticker: str) -> dict:
     Best-effort by design: if yfinance is unavailable, rate-limited, or doesn't
     recognise the ticker, we return ``{}`` and the caller falls back to
     ticker-only context rather than failing before analysis starts. Cached so
-    the lookup happens at most once per ticker per process.
+    the lookup happens at most once per ticker per process, and stored in the
+    shared cache backend so other processes/nodes reuse it.
 
     The symbol is normalized first (e.g. ``XAUUSD`` -> ``GC=F``) so identity
     resolves for the same instrument the price path actually fetches (#983).
     """
+    from tradingagents.dataflows.cache_backend import MISS, cache_ttl, get_cache_backend
     from tradingagents.dataflows.symbol_utils import normalize_symbol
+    from tradingagents.dataflows.yfinance_registry import get_info
+
+    canonical = normalize_symbol(ticker)
+    # Identity rarely changes, so a shared backend lets one node's lookup serve
+    # the fleet; the lru_cache above still avoids even that round trip.
+    backend = get_cache_backend()
+    cached = backend.get("identity", canonical)
+    if cached is not MISS:
+        return dict(cached)
 
     try:
-        info = yf.Ticker(normalize_symbol(ticker)).info or {}
+        # Shared with get_fundamentals and any other consumer of this symbol.
+        info = get_info(canonical)
     except Exception as exc:  # noqa: BLE001 — fail open, never block the run
         logger.debug("Could not resolve instrument identity for %s: %s", ticker, exc)
         return {}
@@ -116,6 +129,8 @@ def resolve_instrument_identity(ticker: str) -> dict:
         value = _clean_identity_value(info.get(source_key))
         if value:
             identity[target_key] = value
+    if identity:
+        backend.set("identity", canonical, identity, cache_ttl("identity"))
     return identity
 
 
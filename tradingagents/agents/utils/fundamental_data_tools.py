@@ -2,7 +2,15 @@ from typing import Annotated
 
 from langchain_core.tools import tool
 
-from tradingagents.dataflows.interface import route_to_vendor
+from tradingagents.dataflows.interface import prefetch_routes, route_to_vendor
+
+# Tool name -> heading used when the prefetched bundle is shown to the analyst.
+FUNDAMENTALS_BUNDLE = {
+    "get_fundamentals": "Company overview",
+    "get_balance_sheet": "Balance sheet",
+    "get_cashflow": "Cash flow statement",
+    "get_income_statement": "Income statement",
+}
 
 
 @tool
@@ -77,3 +85,21 @@ def get_income_statement(
         str: A formatted report containing income statement data
     """
     return route_to_vendor("get_income_statement", ticker, freq, curr_date)
+
+
+def prefetch_fundamentals(ticker: str, curr_date: str, freq: str = "quarterly") -> dict[str, str]:
+    """Fetch the overview and all three statements concurrently.
+
+    The calls use the same arguments the tools above pass to the router, so
+    they also warm the tool calls: an analyst that still calls e.g.
+    ``get_balance_sheet(ticker, "quarterly", curr_date)`` gets the prefetched
+    report back without a vendor request. Returns ``{tool name: report}`` for
+    the reports that could be fetched.
+    """
+    calls = [("get_fundamentals", (ticker, curr_date))] + [
+        (method, (ticker, freq, curr_date))
+        for method in FUNDAMENTALS_BUNDLE
+        if method != "get_fundamentals"
+    ]
+    results = prefetch_routes(calls)
+    return {method: results[(method, args)] for method, args in calls if (method, args) in results}
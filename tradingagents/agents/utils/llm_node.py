@@ -0,0 +1,112 @@
+"""Agent nodes that run on either the sync or the async graph path.
+
+``propagate`` drives the graph with ``invoke`` and every node calls
+``llm.invoke``; ``apropagate`` drives it with ``ainvoke``, where a node should
+await ``llm.ainvoke`` instead of holding a worker thread for the whole model
+call. To keep one copy of each agent's prompt logic, an agent's body is
+written as a *step generator*: it yields ``(runnable, input)`` for every model
+call, is sent the result back (or has the call's exception thrown into it, so
+``try``/``except`` fallbacks keep working), and returns the state update::
+
+    def step(state):
+        response = yield llm, prompt
+        return {"report": response.content}
+
+``llm_node(step)`` turns that into an ``AsyncNode``: calling it (or the graph's
+``invoke``) makes the calls with ``invoke``; ``acall`` (or the graph's
+``ainvoke``) awaits ``ainvoke``. On the async path the code between calls —
+prompt building, data pre-fetches — runs in a worker thread, so it never
+blocks the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Generator
+from typing import Any
+
+from langchain_core.runnables import Runnable, RunnableLambda
+
+# What a step generator yields: the runnable to call and its input.
+LLMCall = tuple[Runnable, Any]
+Steps = Generator[LLMCall, Any, Any]
+
+
+class AsyncNode(RunnableLambda):
+    """Graph node with separate sync and async implementations.
+
+    LangGraph runs ``func`` under ``invoke``/``stream`` and ``afunc`` under
+    ``ainvoke``/``astream``. The node stays callable like a plain node
+    function, so composite nodes and tests can call it directly.
+    """
+
+    def __init__(
+        self,
+        func: Callable[[dict], dict],
+        afunc: Callable[[dict], Awaitable[dict]],
+        name: str | None = None,
+    ):
+        super().__init__(func, afunc=afunc, name=name)
+
+    def __call__(self, state):
+        return self.func(state)
+
+    async def acall(self, state):
+        return await self.afunc(state)
+
+
+async def acall_node(node, state):
+    """Await ``node(state)``: its async implementation if it has one, else in a worker thread."""
+    if isinstance(node, AsyncNode):
+        return await node.acall(state)
+    return await asyncio.to_thread(node, state)
+
+
+def _advance(steps: Steps, value: Any = None, error: BaseException | None = None):
+    """Resume ``steps``: ``(True, update)`` once it returns, else ``(False, next_call)``."""
+    try:
+        if error is not None:
+            return False, steps.throw(error)
+        return False, steps.send(value)
+    except StopIteration as stop:
+        return True, stop.value
+
+
+def drive(steps: Steps) -> Any:
+    """Run a step generator to completion with blocking ``invoke`` calls."""
+    done, item = _advance(steps)
+    while not done:
+        runnable, payload = item
+        try:
+            value = runnable.invoke(payload)
+        except Exception as exc:
+            done, item = _advance(steps, error=exc)
+        else:
+            done, item = _advance(steps, value)
+    return item
+
+
+async def adrive(steps: Steps) -> Any:
+    """Run a step generator to completion, awaiting ``ainvoke`` for each call."""
+    done, item = await asyncio.to_thread(_advance, steps)
+    while not done:
+        runnable, payload = item
+        try:
+            value = await runnable.ainvoke(payload)
+        except Exception as exc:
+            done, item = await asyncio.to_thread(_advance, steps, None, exc)
+        else:
+            done, item = await asyncio.to_thread(_advance, steps, value)
+    return item
+
+
+def llm_node(step: Callable[[dict], Steps], name: str | None = None) -> AsyncNode:
+    """Build an ``AsyncNode`` from a step generator function."""
+
+    def run(state):
+        return drive(step(state))
+
+    async def arun(state):
+        return await adrive(step(state))
+
+    return AsyncNode(run, arun, name=name or getattr(step, "__name__", None))
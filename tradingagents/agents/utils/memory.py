@@ -1,11 +1,26 @@
 """Append-only markdown decision log for TradingAgents."""
 
+import functools
 import re
+import threading
 from pathlib import Path
 
+import numpy as np
+
 from tradingagents.agents.utils.rating import parse_rating
 
 
+def _serialized(method):
+    """Run a log-writing method under the instance's write lock."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._write_lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class TradingMemoryLog:
     """Append-only markdown log of trading decisions and reflections."""
 
@@ -24,9 +39,20 @@ class TradingMemoryLog:
             self._log_path.parent.mkdir(parents=True, exist_ok=True)
         # Optional cap on resolved entries. None disables rotation.
         self._max_entries = cfg.get("memory_log_max_entries")
+        # Concurrent runs (apropagate, propagate_many) append decisions while
+        # another run may be rewriting the file with outcomes.
+        self._write_lock = threading.Lock()
+
+    def share_write_lock(self, lock) -> None:
+        """Serialize writes with ``lock`` instead of the instance's own lock.
+
+        Worker processes writing one log file pass a shared multiprocessing lock.
+        """
+        self._write_lock = lock
 
     # --- Write path (Phase A) ---
 
+    @_serialized
     def store_decision(
         self,
         ticker: str,
@@ -67,9 +93,19 @@ class TradingMemoryLog:
         """Return entries with outcome:pending (for Phase B)."""
         return [e for e in self.load_entries() if e.get("pending")]
 
-    def get_past_context(self, ticker: str, n_same: int = 5, n_cross: int = 3) -> str:
-        """Return formatted past context string for agent prompt injection."""
-        entries = [e for e in self.load_entries() if not e.get("pending")]
+    def get_past_context(
+        self, ticker: str, n_same: int = 5, n_cross: int = 3, before: str | None = None
+    ) -> str:
+        """Return formatted past context string for agent prompt injection.
+
+        With ``before`` (the run's trade date) only decisions made before it
+        whose outcome was realized by then are used, so a run on a past date
+        never learns from what happened after it.
+        """
+        entries = [
+            e for e in self.load_entries()
+            if not e.get("pending") and (before is None or self._known_by(e, str(before)))
+        ]
         if not entries:
             return ""
 
@@ -96,6 +132,7 @@ class TradingMemoryLog:
 
     # --- Update path (Phase B) ---
 
+    @_serialized
     def update_with_outcome(
         self,
         ticker: str,
@@ -104,6 +141,7 @@ class TradingMemoryLog:
         alpha_return: float,
         holding_days: int,
         reflection: str,
+        exit_date: str | None = None,
     ) -> None:
         """Replace pending tag and append REFLECTION section using atomic write.
 
@@ -142,7 +180,8 @@ class TradingMemoryLog:
                 rating = fields[2]
                 new_tag = (
                     f"[{trade_date} | {ticker} | {rating}"
-                    f" | {raw_pct} | {alpha_pct} | {holding_days}d]"
+                    f" | {raw_pct} | {alpha_pct} | {holding_days}d"
+                    f"{f' | {exit_date}' if exit_date else ''}]"
                 )
                 rest = "\n".join(lines[1:])
                 new_blocks.append(
@@ -161,11 +200,13 @@ class TradingMemoryLog:
         tmp_path.write_text(new_text, encoding="utf-8")
         tmp_path.replace(self._log_path)
 
+    @_serialized
     def batch_update_with_outcomes(self, updates: list[dict]) -> None:
         """Apply multiple outcome updates in a single read + atomic write.
 
         Each element of updates must have keys: ticker, trade_date,
-        raw_return, alpha_return, holding_days, reflection.
+        raw_return, alpha_return, holding_days, reflection; and may have
+        exit_date, the session the outcome was realized on.
         """
         if not self._log_path or not self._log_path.exists() or not updates:
             return
@@ -194,9 +235,11 @@ class TradingMemoryLog:
                     rating = fields[2]
                     raw_pct = f"{upd['raw_return']:+.1%}"
                     alpha_pct = f"{upd['alpha_return']:+.1%}"
+                    exit_date = upd.get("exit_date")
                     new_tag = (
                         f"[{trade_date} | {ticker} | {rating}"
-                        f" | {raw_pct} | {alpha_pct} | {upd['holding_days']}d]"
+                        f" | {raw_pct} | {alpha_pct} | {upd['holding_days']}d"
+                        f"{f' | {exit_date}' if exit_date else ''}]"
                     )
                     rest = "\n".join(lines[1:])
                     new_blocks.append(
@@ -272,6 +315,7 @@ class TradingMemoryLog:
             "raw": fields[3] if fields[3] != "pending" else None,
             "alpha": fields[4] if len(fields) > 4 else None,
             "holding": fields[5] if len(fields) > 5 else None,
+            "exit": fields[6] if len(fields) > 6 else None,
         }
         body = "\n".join(lines[1:]).strip()
         decision_match = self._DECISION_RE.search(body)
@@ -280,6 +324,24 @@ class TradingMemoryLog:
         entry["reflection"] = reflection_match.group(1).strip() if reflection_match else ""
         return entry
 
+    @staticmethod
+    def _known_by(e: dict, before: str) -> bool:
+        """Whether ``e`` was decided before ``before`` and its outcome realized by then.
+
+        Entries resolved without an exit date (older logs, live runs) are taken
+        as realized ``holding`` business days after the decision.
+        """
+        if e["date"] >= before:
+            return False
+        realized = e.get("exit")
+        if not realized:
+            try:
+                sessions = int((e["holding"] or "0d").rstrip("d"))
+                realized = str(np.busday_offset(e["date"], sessions, roll="forward"))
+            except ValueError:
+                return False
+        return realized <= before
+
     def _format_full(self, e: dict) -> str:
         raw = e["raw"] or "n/a"
         alpha = e["alpha"] or "n/a"
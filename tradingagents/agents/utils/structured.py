@@ -19,11 +19,13 @@ all three agents log the same warnings when fallback fires.
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Generator
 from typing import Any, TypeVar
 
 from pydantic import BaseModel
 
+from .llm_node import drive
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
@@ -46,23 +48,21 @@ def bind_structured(llm: Any, schema: type[T], agent_name: str) -> Any | None:
         return None
 
 
-def invoke_structured_or_freetext(
+def structured_or_freetext_steps(
     structured_llm: Any | None,
     plain_llm: Any,
     prompt: Any,
     render: Callable[[T], str],
     agent_name: str,
-) -> str:
-    """Run the structured call and render to markdown; fall back to free-text on any failure.
+) -> Generator[tuple[Any, Any], Any, str]:
+    """Step-generator form of ``invoke_structured_or_freetext`` (see llm_node.py).
 
-    ``prompt`` is whatever the underlying LLM accepts (a string for chat
-    invocations, a list of message dicts for chat models that take that
-    shape). The same value is forwarded to the free-text path so the
-    fallback sees the same input the structured call did.
+    Agent nodes ``yield from`` it so the same fallback logic runs on both the
+    sync and the async graph path.
     """
     if structured_llm is not None:
         try:
-            result = structured_llm.invoke(prompt)
+            result = yield structured_llm, prompt
             if result is None:
                 # A thinking model can answer in plain text instead of calling
                 # the tool, leaving the parser with nothing to return. Treat it
@@ -75,5 +75,22 @@ def invoke_structured_or_freetext(
                 agent_name, exc,
             )
 
-    response = plain_llm.invoke(prompt)
+    response = yield plain_llm, prompt
     return response.content
+
+
+def invoke_structured_or_freetext(
+    structured_llm: Any | None,
+    plain_llm: Any,
+    prompt: Any,
+    render: Callable[[T], str],
+    agent_name: str,
+) -> str:
+    """Run the structured call and render to markdown; fall back to free-text on any failure.
+
+    ``prompt`` is whatever the underlying LLM accepts (a string for chat
+    invocations, a list of message dicts for chat models that take that
+    shape). The same value is forwarded to the free-text path so the
+    fallback sees the same input the structured call did.
+    """
+    return drive(structured_or_freetext_steps(structured_llm, plain_llm, prompt, render, agent_name))
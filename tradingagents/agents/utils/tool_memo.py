@@ -0,0 +1,127 @@
+"""Run-scoped memoization of agent tool calls.
+
+Within one ``propagate()`` the same tool call is often made more than once:
+the sentiment analyst pre-fetches ``get_news(ticker, start, end)`` and the
+news analyst then asks for exactly that, and analysts repeat identical
+``get_stock_data``/``get_indicators`` calls inside their own tool loops. A
+``ToolMemo`` active for the run returns the first call's string for every
+repeat.
+
+The memo is keyed by tool name and the call's arguments bound to the tool's
+signature (defaults filled, strings stripped, ticker/symbol upper-cased), so
+``get_news.func("aapl", s, e)`` and an LLM's ``get_news(ticker="AAPL",
+start_date=s, end_date=e)`` share an entry. It lives in a context variable:
+``tool_memo_scope`` opens one per run, and LangGraph/ToolNode worker threads
+inherit it. Outside a scope, memoized tools behave exactly like the originals.
+Exceptions are never memoized.
+"""
+
+from __future__ import annotations
+
+import inspect
+import logging
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from langchain_core.tools import BaseTool
+
+logger = logging.getLogger(__name__)
+
+_UPPERCASE_ARGS = frozenset({"ticker", "symbol"})
+
+_current: ContextVar[ToolMemo | None] = ContextVar("tool_memo", default=None)
+
+
+def _normalize(name: str, value: Any) -> Any:
+    if isinstance(value, str):
+        value = value.strip()
+        return value.upper() if name in _UPPERCASE_ARGS else value
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+class ToolMemo:
+    """Per-run cache of tool results with hit/miss counts per tool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._results: dict[tuple, Any] = {}
+        self._calls: dict[str, int] = {}
+        self._hits: dict[str, int] = {}
+
+    def call(self, name: str, func: Callable, *args, **kwargs) -> Any:
+        """Return ``func(*args, **kwargs)``, reusing an earlier identical call."""
+        try:
+            bound = inspect.signature(func).bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (name, tuple((k, _normalize(k, v)) for k, v in sorted(bound.arguments.items())))
+            hash(key)
+        except TypeError:
+            key = None  # unbindable or unhashable arguments: don't memoize
+        with self._lock:
+            self._calls[name] = self._calls.get(name, 0) + 1
+            if key is not None and key in self._results:
+                self._hits[name] = self._hits.get(name, 0) + 1
+                return self._results[key]
+        result = func(*args, **kwargs)
+        if key is not None:
+            with self._lock:
+                self._results.setdefault(key, result)
+        return result
+
+    def report(self) -> dict[str, dict[str, int]]:
+        """``{tool: {"calls": n, "hits": h}}`` for every tool called this run."""
+        with self._lock:
+            return {
+                name: {"calls": calls, "hits": self._hits.get(name, 0)}
+                for name, calls in sorted(self._calls.items())
+            }
+
+    def summary(self) -> str:
+        """One-line hit report, e.g. ``get_news 1/2 hits, get_stock_data 0/1``."""
+        report = self.report()
+        hits = sum(r["hits"] for r in report.values())
+        calls = sum(r["calls"] for r in report.values())
+        detail = ", ".join(f"{name} {r['hits']}/{r['calls']}" for name, r in report.items())
+        return f"tool memo: {hits}/{calls} calls served from memo" + (f" ({detail})" if detail else "")
+
+
+@contextmanager
+def tool_memo_scope(enabled: bool = True) -> Iterator[ToolMemo | None]:
+    """Activate a fresh ``ToolMemo`` for the enclosed run (None if disabled)."""
+    memo = ToolMemo() if enabled else None
+    token = _current.set(memo)
+    try:
+        yield memo
+    finally:
+        _current.reset(token)
+
+
+def memoized_call(tool: BaseTool, *args, **kwargs) -> Any:
+    """Call ``tool.func`` directly, through the active run's memo if any."""
+    memo = _current.get()
+    if memo is None:
+        return tool.func(*args, **kwargs)
+    return memo.call(tool.name, tool.func, *args, **kwargs)
+
+
+def memoize_tool(tool: BaseTool) -> BaseTool:
+    """Return a copy of ``tool`` whose calls go through the active run's memo.
+
+    The copy keeps the name, description and argument schema, so it is a
+    drop-in replacement inside a ``ToolNode``.
+    """
+    func = tool.func
+
+    def memoized(*args, **kwargs):
+        memo = _current.get()
+        if memo is None:
+            return func(*args, **kwargs)
+        return memo.call(tool.name, func, *args, **kwargs)
+
+    memoized.__signature__ = inspect.signature(func)
+    return tool.model_copy(update={"func": memoized})
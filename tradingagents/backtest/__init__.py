@@ -0,0 +1,24 @@
+# TradingAgents/backtest/__init__.py
+
+from .engine import (
+    RATING_POSITIONS,
+    TRADE_COLUMNS,
+    WalkForwardBacktest,
+    summarize,
+    trades_frame,
+    write_trades,
+)
+from .prices import forward_return, load_closes, period_return, trade_calendar
+
+__all__ = [
+    "WalkForwardBacktest",
+    "RATING_POSITIONS",
+    "TRADE_COLUMNS",
+    "summarize",
+    "trades_frame",
+    "write_trades",
+    "load_closes",
+    "trade_calendar",
+    "forward_return",
+    "period_return",
+]
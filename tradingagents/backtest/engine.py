@@ -0,0 +1,221 @@
+"""Walk-forward backtest: ``propagate`` over a calendar of trade dates, ratings to P&L.
+
+For each ticker the engine takes every ``every``-th trading session between
+``start_date`` and ``end_date`` and analyses the dates in order, with
+``point_in_time`` set: each run resolves the memory log's pending outcomes
+from the local OHLCV store cut off at its trade date, and its past context
+only holds outcomes realized by then. A decision therefore informs the
+ticker's later dates once its holding period has closed, and no run sees
+prices or outcomes from after its own date. Tickers run concurrently on
+one graph through ``apropagate`` (at most ``max_concurrent_runs`` at once).
+They share its LLM clients and the process-wide data caches, so the OHLCV
+frame, indicators and stores warmed by one date serve every later one.
+
+Each rating becomes a position (``RATING_POSITIONS``: Buy +1 … Sell -1) held
+from the trade date's close for ``holding_days`` sessions, by default until
+the next trade date and never past it, so one ticker's positions do not
+overlap and its per-trade P&L compounds into ``summarize``'s total. Its P&L is the position times the ticker's return over
+that period, with the benchmark's return over the same dates alongside.
+Prices come from the local OHLCV store (see ``prices.py``).
+
+Give the graph its own ``memory_log_path`` for a backtest, or its simulated
+decisions land in the live decision log.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from .prices import forward_return, load_closes, period_return, trade_calendar
+
+logger = logging.getLogger(__name__)
+
+RATING_POSITIONS = {
+    "Buy": 1.0,
+    "Overweight": 0.5,
+    "Hold": 0.0,
+    "Underweight": -0.5,
+    "Sell": -1.0,
+}
+
+# Columns of the trades table, in order, with their compact dtypes.
+TRADE_COLUMNS = {
+    "ticker": "category",
+    "trade_date": "datetime64[ns]",
+    "rating": "category",
+    "position": "float32",
+    "exit_date": "datetime64[ns]",
+    "sessions_held": "Int16",
+    "return": "float32",
+    "benchmark_return": "float32",
+    "pnl": "float32",
+    "elapsed": "float32",
+    "error": "string",
+}
+
+
+def trades_frame(rows: list[dict]) -> pd.DataFrame:
+    """Build the trades table from per-run rows; missing fields become nulls."""
+    frame = pd.DataFrame(rows, columns=list(TRADE_COLUMNS))
+    for column in ("trade_date", "exit_date"):
+        frame[column] = pd.to_datetime(frame[column])
+    frame = frame.astype(TRADE_COLUMNS)
+    return frame.sort_values(["ticker", "trade_date"], ignore_index=True)
+
+
+def write_trades(frame: pd.DataFrame, path) -> Path:
+    """Write the trades table: Parquet for a ``.parquet`` path, CSV otherwise."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".parquet":
+        try:
+            frame.to_parquet(path, index=False)
+        except ImportError as exc:
+            raise ImportError(
+                "Writing Parquet requires the optional 'pyarrow' dependency. "
+                'Install it with: pip install "tradingagents[backtest]"'
+            ) from exc
+    else:
+        frame.to_csv(path, index=False)
+    return path
+
+
+def summarize(frame: pd.DataFrame) -> pd.DataFrame:
+    """Per-ticker totals: trades, compounded strategy and benchmark return, hit rate, errors.
+
+    Returns compound trade by trade, which holds because a ticker's trades
+    never overlap (``holding_days <= every``).
+    """
+
+    def totals(trades: pd.DataFrame) -> pd.Series:
+        done = trades[trades["error"].isna()]
+        active = done[done["position"] != 0]
+        return pd.Series({
+            "trades": len(done),
+            "total_return": float((1 + done["pnl"].fillna(0)).prod() - 1),
+            "benchmark_return": float((1 + done["benchmark_return"].fillna(0)).prod() - 1),
+            "hit_rate": float((active["pnl"] > 0).mean()) if len(active) else float("nan"),
+            "errors": len(trades) - len(done),
+        })
+
+    return frame.groupby("ticker", observed=True).apply(totals, include_groups=False)
+
+
+class WalkForwardBacktest:
+    """Run ``graph`` over a walk-forward calendar for ``tickers`` and score the ratings.
+
+    Usage::
+
+        backtest = WalkForwardBacktest(graph, ["NVDA", "AAPL"], "2025-01-01", "2025-06-30")
+        trades = backtest.run()
+        print(summarize(trades))
+
+    ``every`` spaces the trade dates in trading sessions; ``holding_days``
+    (default ``every``, at most ``every``) is how long each position is held,
+    so a ticker's positions never overlap. The trades table
+    is written to ``output_path``, by default
+    ``results_dir/backtests/walk_forward_<start>_<end>`` as Parquet when
+    pyarrow is installed and as CSV otherwise.
+    """
+
+    def __init__(
+        self,
+        graph,
+        tickers,
+        start_date: str,
+        end_date: str,
+        every: int = 5,
+        holding_days: int | None = None,
+        asset_type: str = "stock",
+        positions: dict[str, float] | None = None,
+    ):
+        self.graph = graph
+        self.tickers = list(dict.fromkeys(tickers))
+        self.start_date = start_date
+        self.end_date = end_date
+        self.every = every
+        self.holding_days = holding_days or every
+        if not 0 < self.holding_days <= every:
+            raise ValueError(
+                f"holding_days must be between 1 and every ({every}), got {self.holding_days}: "
+                "longer holds overlap the next trade and cannot be compounded"
+            )
+        self.asset_type = asset_type
+        self.positions = positions or RATING_POSITIONS
+        self._benchmarks: dict[str, asyncio.Future] = {}
+
+    def default_output_path(self) -> Path:
+        suffix = ".parquet" if importlib.util.find_spec("pyarrow") else ".csv"
+        name = f"walk_forward_{self.start_date}_{self.end_date}{suffix}"
+        return Path(self.graph.config["results_dir"]) / "backtests" / name
+
+    def run(self, output_path=None) -> pd.DataFrame:
+        """Run the backtest, write the trades table and return it."""
+        return asyncio.run(self.arun(output_path))
+
+    async def arun(self, output_path=None) -> pd.DataFrame:
+        """Async ``run``, for callers already inside an event loop."""
+        self._benchmarks = {}
+        walks = await asyncio.gather(*(self._walk(ticker) for ticker in self.tickers))
+        frame = trades_frame([row for rows in walks for row in rows])
+        path = write_trades(frame, output_path or self.default_output_path())
+        logger.info("Backtest wrote %d trades to %s", len(frame), path)
+        return frame
+
+    async def _walk(self, ticker: str) -> list[dict]:
+        """Analyse ``ticker`` on each of its trade dates, in date order."""
+        try:
+            closes = await asyncio.to_thread(load_closes, ticker)
+        except Exception as exc:
+            logger.warning("Skipping %s: no price history (%s)", ticker, exc)
+            return []
+        benchmark = await self._benchmark_closes(self.graph._resolve_benchmark(ticker))
+
+        rows = []
+        for trade_date in trade_calendar(closes, self.start_date, self.end_date, self.every):
+            started = time.monotonic()
+            row = {"ticker": ticker, "trade_date": trade_date}
+            try:
+                _, rating = await self.graph.apropagate(
+                    ticker, trade_date, self.asset_type, point_in_time=True
+                )
+            except Exception as exc:
+                logger.warning("Run for %s on %s failed: %s", ticker, trade_date, exc)
+                row["error"] = f"{type(exc).__name__}: {exc}"
+            else:
+                row.update(self._score(rating, closes, benchmark, trade_date))
+            row["elapsed"] = time.monotonic() - started
+            rows.append(row)
+        return rows
+
+    async def _benchmark_closes(self, symbol: str) -> pd.Series | None:
+        """Closes for ``symbol``, loaded once per run however many tickers share it."""
+        if symbol not in self._benchmarks:
+            self._benchmarks[symbol] = asyncio.ensure_future(asyncio.to_thread(load_closes, symbol))
+        try:
+            return await asyncio.shield(self._benchmarks[symbol])
+        except Exception as exc:
+            logger.warning("No benchmark returns: %s has no price history (%s)", symbol, exc)
+            return None
+
+    def _score(self, rating: str, closes: pd.Series, benchmark, trade_date: str) -> dict:
+        position = self.positions.get(rating, 0.0)
+        realized, exit_date, held = forward_return(closes, trade_date, self.holding_days)
+        bench = None
+        if exit_date is not None and benchmark is not None:
+            bench = period_return(benchmark, trade_date, exit_date)
+        return {
+            "rating": rating,
+            "position": position,
+            "exit_date": exit_date,
+            "sessions_held": held,
+            "return": realized,
+            "benchmark_return": bench,
+            "pnl": None if realized is None else position * realized,
+        }
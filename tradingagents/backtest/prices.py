@@ -0,0 +1,62 @@
+"""Sessions and realized returns for the backtest, read from the local OHLCV store.
+
+``load_ohlcv`` keeps one five-year daily frame per symbol (node-local CSV behind
+the shared cache backend): the frame the market analyst's indicators are
+computed from. The backtest takes its calendar and closes from that frame
+instead of calling ``yf.Ticker().history`` per trade date, so a sweep costs
+at most one download per symbol, and none once the store is warm.
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from tradingagents.dataflows.stockstats_utils import load_ohlcv
+
+
+def load_closes(symbol: str, as_of: str | None = None) -> pd.Series:
+    """Daily closes for ``symbol`` up to ``as_of`` (default today), indexed by session date."""
+    as_of = as_of or pd.Timestamp.today().strftime("%Y-%m-%d")
+    data = load_ohlcv(symbol, as_of)
+    closes = pd.Series(
+        data["Close"].to_numpy(dtype=float),
+        index=pd.DatetimeIndex(data["Date"]).normalize(),
+        name=symbol,
+    )
+    return closes[~closes.index.duplicated(keep="last")].sort_index()
+
+
+def trade_calendar(closes: pd.Series, start_date: str, end_date: str, every: int = 1) -> list[str]:
+    """Every ``every``-th session of ``closes`` from ``start_date`` to ``end_date``, inclusive."""
+    sessions = closes.index[
+        (closes.index >= pd.Timestamp(start_date)) & (closes.index <= pd.Timestamp(end_date))
+    ]
+    return [session.strftime("%Y-%m-%d") for session in sessions[::every]]
+
+
+def forward_return(
+    closes: pd.Series, trade_date: str, holding_days: int
+) -> tuple[float | None, str | None, int | None]:
+    """Close-to-close return from ``trade_date`` over ``holding_days`` sessions.
+
+    The position is entered at the close of the last session on or before
+    ``trade_date``: the latest price the analysis could have seen. Returns
+    ``(return, exit_date, sessions_held)``; the holding period is cut short
+    at the end of the data, and all three are ``None`` when no later session
+    exists yet.
+    """
+    entry = closes.index.searchsorted(pd.Timestamp(trade_date), side="right") - 1
+    if entry < 0 or entry + 1 >= len(closes):
+        return None, None, None
+    exit_ = min(entry + holding_days, len(closes) - 1)
+    realized = float(closes.iloc[exit_] / closes.iloc[entry] - 1.0)
+    return realized, closes.index[exit_].strftime("%Y-%m-%d"), exit_ - entry
+
+
+def period_return(closes: pd.Series, start_date: str, end_date: str) -> float | None:
+    """Close-to-close return between the last sessions on or before each date."""
+    start = closes.index.searchsorted(pd.Timestamp(start_date), side="right") - 1
+    end = closes.index.searchsorted(pd.Timestamp(end_date), side="right") - 1
+    if start < 0 or end <= start:
+        return None
+    return float(closes.iloc[end] / closes.iloc[start] - 1.0)
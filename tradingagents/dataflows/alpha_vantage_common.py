@@ -7,6 +7,7 @@ import pandas as pd
 import requests
 
 from .errors import VendorNotConfiguredError, VendorRateLimitError
+from .rate_limiter import throttle
 
 API_BASE_URL = "https://www.alphavantage.co/query"
 
@@ -83,6 +84,9 @@ def _make_api_request(function_name: str, params: dict) -> dict | str:
         # Remove entitlement if it's None or empty
         api_params.pop("entitlement", None)
 
+    # Queue for a token first: on the free tier a burst of calls would
+    # otherwise spend the per-minute quota on "Note" rate-limit responses.
+    throttle("alpha_vantage")
     response = requests.get(API_BASE_URL, params=api_params, timeout=REQUEST_TIMEOUT)
     response.raise_for_status()
 
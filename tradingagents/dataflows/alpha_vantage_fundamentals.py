@@ -1,21 +1,70 @@
+import json
+
+import pandas as pd
+
 from .alpha_vantage_common import _make_api_request
+from .errors import NoMarketDataError
+from .fundamentals_store import statement_as_of
+from .records import FinancialStatement, render_statement
+
+# Alpha Vantage endpoint per statement kind.
+_STATEMENT_FUNCTIONS = {
+    "balance_sheet": "BALANCE_SHEET",
+    "cashflow": "CASH_FLOW",
+    "income_statement": "INCOME_STATEMENT",
+}
+
+
+def _reports_to_frame(reports: list[dict]) -> tuple[pd.DataFrame, str | None]:
+    """Pivot Alpha Vantage report dicts into line items x fiscal period end.
+
+    Values arrive as strings with "None" for missing, so they are coerced to
+    numbers; the reporting currency is returned separately.
+    """
+    if not reports:
+        return pd.DataFrame(), None
+    frame = pd.DataFrame(reports).set_index("fiscalDateEnding")
+    currency = None
+    if "reportedCurrency" in frame.columns:
+        currencies = frame.pop("reportedCurrency").dropna()
+        currency = currencies.iloc[0] if not currencies.empty else None
+    frame = frame.apply(pd.to_numeric, errors="coerce").T
+    frame.columns = pd.to_datetime(frame.columns)
+    return frame.sort_index(axis=1, ascending=False), currency
 
 
-def _filter_reports_by_date(result, curr_date: str):
-    """Filter annualReports/quarterlyReports to exclude entries after curr_date.
+def fetch_statement(
+    ticker: str,
+    kind: str,
+    freq: str = "quarterly",
+    curr_date: str | None = None,
+) -> FinancialStatement:
+    """Fetch one financial statement from Alpha Vantage as a ``FinancialStatement``.
 
-    Prevents look-ahead bias by removing fiscal periods that end after
-    the simulation's current date.
+    ``_make_api_request`` hands back the JSON body as text, so it is parsed
+    here; the previous dict-based date filter never ran on that string and
+    let future fiscal periods through. Periods after ``curr_date`` are dropped,
+    and repeat as-of queries are served by the point-in-time store.
     """
-    if not curr_date or not isinstance(result, dict):
-        return result
-    for key in ("annualReports", "quarterlyReports"):
-        if key in result:
-            result[key] = [
-                r for r in result[key]
-                if r.get("fiscalDateEnding", "") <= curr_date
-            ]
-    return result
+    quarterly = freq.lower() == "quarterly"
+
+    def _fetch() -> FinancialStatement:
+        payload = _make_api_request(_STATEMENT_FUNCTIONS[kind], {"symbol": ticker})
+        if isinstance(payload, str):
+            try:
+                payload = json.loads(payload)
+            except json.JSONDecodeError:
+                payload = {}
+        reports = payload.get("quarterlyReports" if quarterly else "annualReports") or []
+        frame, currency = _reports_to_frame(reports)
+        return FinancialStatement(
+            ticker, ticker, kind, freq, frame, currency=currency, vendor="alpha_vantage"
+        )
+
+    statement = statement_as_of("alpha_vantage", ticker, kind, freq, curr_date, _fetch)
+    if statement.frame.empty:
+        raise NoMarketDataError(ticker, ticker, f"no {statement.title.lower()} data")
+    return statement
 
 
 def get_fundamentals(ticker: str, curr_date: str = None) -> str:
@@ -38,18 +87,14 @@ def get_fundamentals(ticker: str, curr_date: str = None) -> str:
 
 def get_balance_sheet(ticker: str, freq: str = "quarterly", curr_date: str = None):
     """Retrieve balance sheet data for a given ticker symbol using Alpha Vantage."""
-    result = _make_api_request("BALANCE_SHEET", {"symbol": ticker})
-    return _filter_reports_by_date(result, curr_date)
+    return render_statement(fetch_statement(ticker, "balance_sheet", freq, curr_date))
 
 
 def get_cashflow(ticker: str, freq: str = "quarterly", curr_date: str = None):
     """Retrieve cash flow statement data for a given ticker symbol using Alpha Vantage."""
-    result = _make_api_request("CASH_FLOW", {"symbol": ticker})
-    return _filter_reports_by_date(result, curr_date)
+    return render_statement(fetch_statement(ticker, "cashflow", freq, curr_date))
 
 
 def get_income_statement(ticker: str, freq: str = "quarterly", curr_date: str = None):
     """Retrieve income statement data for a given ticker symbol using Alpha Vantage."""
-    result = _make_api_request("INCOME_STATEMENT", {"symbol": ticker})
-    return _filter_reports_by_date(result, curr_date)
-
+    return render_statement(fetch_statement(ticker, "income_statement", freq, curr_date))
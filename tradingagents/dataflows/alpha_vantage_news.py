@@ -1,10 +1,44 @@
+import contextlib
+import json
+from datetime import datetime, timedelta
+
 from .alpha_vantage_common import _make_api_request, format_datetime_for_api
+from .config import get_config_snapshot
+from .news_store import PartialNews, stored_news
+from .records import NewsArticle
+from .yfinance_news import render_articles
+
+# NEWS_SENTIMENT returns the newest ``limit`` articles of a window (default 50).
+_FEED_LIMIT = 1000
+
+
+def _feed_to_articles(feed: list[dict]) -> list[NewsArticle]:
+    """Convert NEWS_SENTIMENT feed items to ``NewsArticle`` records."""
+    articles = []
+    for item in feed:
+        pub_date = None
+        with contextlib.suppress(ValueError, TypeError):
+            pub_date = datetime.strptime(item.get("time_published", ""), "%Y%m%dT%H%M%S")
+        score = item.get("overall_sentiment_score")
+        label = item.get("overall_sentiment_label") or ""
+        articles.append(NewsArticle(
+            title=item.get("title") or "",
+            summary=item.get("summary") or "",
+            publisher=item.get("source") or "Unknown",
+            link=item.get("url") or "",
+            pub_date=pub_date,
+            sentiment=f"{label} ({score})" if label and score is not None else label,
+        ))
+    return articles
 
 
 def get_news(ticker, start_date, end_date) -> dict[str, str] | str:
     """Returns live and historical market news & sentiment data from premier news outlets worldwide.
 
     Covers stocks, cryptocurrencies, forex, and topics like fiscal policy, mergers & acquisitions, IPOs.
+    Articles go through the news store: the parts of the window an earlier
+    fetch covered are served locally, deduplicated across publishers, and
+    only the rest is requested.
 
     Args:
         ticker: Stock symbol for news articles.
@@ -12,16 +46,48 @@ def get_news(ticker, start_date, end_date) -> dict[str, str] | str:
         end_date: End date for news search.
 
     Returns:
-        Dictionary containing news sentiment data or JSON string.
+        Markdown news report, or the raw API response if it carries no feed.
     """
-
-    params = {
-        "tickers": ticker,
-        "time_from": format_datetime_for_api(start_date),
-        "time_to": format_datetime_for_api(end_date),
-    }
-
-    return _make_api_request("NEWS_SENTIMENT", params)
+    start_dt = datetime.strptime(start_date, "%Y-%m-%d")
+    end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+    raw_responses = []
+
+    def fetch_range(time_from, time_to):
+        params = {
+            "tickers": ticker,
+            "time_from": format_datetime_for_api(time_from),
+            "time_to": format_datetime_for_api(time_to),
+            "limit": str(_FEED_LIMIT),
+        }
+        response = _make_api_request("NEWS_SENTIMENT", params)
+        payload = response
+        if isinstance(payload, str):
+            with contextlib.suppress(json.JSONDecodeError):
+                payload = json.loads(payload)
+        feed = payload.get("feed") if isinstance(payload, dict) else None
+        if feed is None:
+            raw_responses.append(response)
+            return None  # an error body: the window stays uncovered
+        articles = _feed_to_articles(feed)
+        if len(feed) >= _FEED_LIMIT:
+            # Cut at the limit: only the span after the oldest article is complete.
+            dated = [a.pub_date for a in articles if a.pub_date is not None]
+            return PartialNews(articles, min(dated) + timedelta(seconds=1) if dated else time_to)
+        return articles
+
+    articles = stored_news(
+        "alpha_vantage",
+        ticker,
+        start_dt,
+        end_dt,
+        fetch_range,
+        keep=lambda a: a.pub_date is None or start_dt <= a.pub_date <= end_dt + timedelta(days=1),
+    )[:get_config_snapshot()["news_article_limit"]]
+    if not articles and raw_responses:
+        return raw_responses[0]  # an unexpected payload: hand it through as before
+    if not articles:
+        return f"No news found for {ticker} between {start_date} and {end_date}"
+    return f"## {ticker} News, from {start_date} to {end_date}:\n\n{render_articles(articles)}"
 
 def get_global_news(curr_date, look_back_days: int = 7, limit: int = 50) -> dict[str, str] | str:
     """Returns global market news & sentiment data without ticker-specific filtering.
@@ -36,8 +102,6 @@ def get_global_news(curr_date, look_back_days: int = 7, limit: int = 50) -> dict
     Returns:
         Dictionary containing global news sentiment data or JSON string.
     """
-    from datetime import datetime, timedelta
-
     # Calculate start date
     curr_dt = datetime.strptime(curr_date, "%Y-%m-%d")
     start_dt = curr_dt - timedelta(days=look_back_days)
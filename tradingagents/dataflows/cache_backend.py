@@ -0,0 +1,226 @@
+"""Pluggable cache backends for vendor data.
+
+Every analysis node used to keep its own ``data_cache_dir`` and in-process
+caches, so a fleet of nodes re-fetched the same OHLCV history, vendor records
+and instrument identity from rate-limited vendors. The data layer now reads
+and writes through a ``CacheBackend``:
+
+* ``MemoryCacheBackend`` (default) — per process, the previous behavior;
+* ``RedisCacheBackend`` — shared by every node pointing at the same Redis.
+  Values are pickled and zlib-compressed, expire via Redis TTLs, and live
+  under ``{cache_namespace}:{namespace}:{key}`` so one Redis can serve
+  several deployments (or environments) without collisions.
+
+Select with ``cache_backend`` ("memory" or "redis") and ``cache_redis_url``;
+per-namespace lifetimes come from ``cache_ttls``. Cache failures never break
+a run: a Redis outage is logged and treated as a miss.
+
+Values are unpickled on read, so only point ``cache_redis_url`` at a Redis
+instance you trust.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import pickle
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections.abc import Hashable
+from typing import Any
+
+from .config import get_config_snapshot
+
+logger = logging.getLogger(__name__)
+
+# Returned by ``get`` on a miss, so ``None`` itself stays cacheable.
+MISS = object()
+
+
+def _key_str(key: Hashable) -> str:
+    """Flatten a tuple key into a readable ``a:b:c`` string."""
+    if isinstance(key, tuple):
+        return ":".join(_key_str(k) for k in key)
+    return str(key)
+
+
+class CacheBackend(ABC):
+    """Namespaced key/value cache with optional per-entry TTLs."""
+
+    @abstractmethod
+    def get(self, namespace: str, key: Hashable) -> Any:
+        """Return the cached value, or ``MISS``."""
+
+    @abstractmethod
+    def set(self, namespace: str, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """Store ``value``; ``ttl`` seconds (None = no expiry)."""
+
+    @abstractmethod
+    def delete(self, namespace: str, key: Hashable) -> None:
+        """Remove one entry if present."""
+
+    @abstractmethod
+    def clear(self, namespace: str | None = None) -> None:
+        """Remove every entry in ``namespace`` (or all namespaces)."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Thread-safe in-process cache; the oldest entries are evicted past ``max_entries``."""
+
+    def __init__(self, max_entries: int = 4096, clock=time.monotonic):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._data: dict[tuple[str, Hashable], tuple[float | None, Any]] = {}
+
+    def get(self, namespace, key):
+        with self._lock:
+            entry = self._data.get((namespace, key))
+            if entry is None:
+                return MISS
+            expires, value = entry
+            if expires is not None and expires <= self._clock():
+                del self._data[(namespace, key)]
+                return MISS
+            return value
+
+    def set(self, namespace, key, value, ttl=None):
+        expires = None if ttl is None else self._clock() + ttl
+        with self._lock:
+            self._data.pop((namespace, key), None)
+            self._data[(namespace, key)] = (expires, value)
+            while len(self._data) > self.max_entries:
+                del self._data[next(iter(self._data))]
+
+    def delete(self, namespace, key):
+        with self._lock:
+            self._data.pop((namespace, key), None)
+
+    def clear(self, namespace=None):
+        with self._lock:
+            if namespace is None:
+                self._data.clear()
+            else:
+                for k in [k for k in self._data if k[0] == namespace]:
+                    del self._data[k]
+
+
+class RedisCacheBackend(CacheBackend):
+    """Redis-backed cache shared across processes and hosts.
+
+    Pass an existing ``client`` (anything with the ``get``/``set``/``delete``/
+    ``scan_iter`` subset of ``redis.Redis``) or a ``url``.
+    """
+
+    def __init__(
+        self,
+        client=None,
+        *,
+        url: str | None = None,
+        prefix: str = "tradingagents",
+        compress_level: int = 6,
+    ):
+        if client is None:
+            import redis
+
+            client = redis.Redis.from_url(url or "redis://localhost:6379/0")
+        self.client = client
+        self.prefix = prefix
+        self.compress_level = compress_level
+
+    def _name(self, namespace: str, key: Hashable) -> str:
+        return f"{self.prefix}:{namespace}:{_key_str(key)}"
+
+    def get(self, namespace, key):
+        try:
+            raw = self.client.get(self._name(namespace, key))
+        except Exception as exc:  # noqa: BLE001 — a cache outage is a miss
+            logger.warning("Redis cache read failed (%s); treating as a miss.", exc)
+            return MISS
+        if raw is None:
+            return MISS
+        try:
+            return pickle.loads(zlib.decompress(raw))
+        except Exception as exc:  # noqa: BLE001 — corrupt/foreign entry
+            logger.warning("Discarding unreadable cache entry %s: %s", self._name(namespace, key), exc)
+            return MISS
+
+    def set(self, namespace, key, value, ttl=None):
+        payload = zlib.compress(pickle.dumps(value, pickle.HIGHEST_PROTOCOL), self.compress_level)
+        # Redis expiries are whole seconds; round up so a short TTL isn't 0.
+        ex = None if ttl is None else max(1, math.ceil(ttl))
+        try:
+            self.client.set(self._name(namespace, key), payload, ex=ex)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Redis cache write failed: %s", exc)
+
+    def delete(self, namespace, key):
+        try:
+            self.client.delete(self._name(namespace, key))
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Redis cache delete failed: %s", exc)
+
+    def clear(self, namespace=None):
+        pattern = f"{self.prefix}:{namespace}:*" if namespace else f"{self.prefix}:*"
+        try:
+            keys = list(self.client.scan_iter(match=pattern))
+            if keys:
+                self.client.delete(*keys)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Redis cache clear failed: %s", exc)
+
+
+_backend: CacheBackend | None = None
+_backend_key: tuple | None = None
+_override: CacheBackend | None = None
+_backend_lock = threading.Lock()
+
+
+def get_cache_backend() -> CacheBackend:
+    """Return the process-wide backend selected by the config.
+
+    Rebuilt when ``cache_backend``, ``cache_redis_url`` or ``cache_namespace``
+    change. ``set_cache_backend`` overrides the config (e.g. to inject a
+    client built elsewhere).
+    """
+    global _backend, _backend_key
+    if _override is not None:
+        return _override
+    config = get_config_snapshot()
+    kind = (config.get("cache_backend") or "memory").lower()
+    key = (kind, config.get("cache_redis_url"), config.get("cache_namespace"))
+    backend = _backend
+    if backend is not None and _backend_key == key:
+        return backend
+    with _backend_lock:
+        if _backend is None or _backend_key != key:
+            if kind == "redis":
+                _backend = RedisCacheBackend(url=key[1], prefix=key[2] or "tradingagents")
+            elif kind == "memory":
+                _backend = MemoryCacheBackend()
+            else:
+                raise ValueError(f"Unknown cache_backend {kind!r}; expected 'memory' or 'redis'")
+            _backend_key = key
+        return _backend
+
+
+def set_cache_backend(backend: CacheBackend | None) -> None:
+    """Use ``backend`` for all vendor caching (``None`` reverts to the config)."""
+    global _override
+    _override = backend
+
+
+def reset_cache_backend() -> None:
+    """Forget the configured backend and any override (tests)."""
+    global _backend, _backend_key, _override
+    with _backend_lock:
+        _backend = None
+        _backend_key = None
+        _override = None
+
+
+def cache_ttl(namespace: str) -> float | None:
+    """Configured lifetime for ``namespace`` from ``cache_ttls`` (None = no expiry)."""
+    return (get_config_snapshot().get("cache_ttls") or {}).get(namespace)
@@ -1,10 +1,34 @@
+import threading
+from collections.abc import Mapping
 from copy import deepcopy
+from types import MappingProxyType
 
 import tradingagents.default_config as default_config
 
 # Use default config but allow it to be overridden
 _config: dict | None = None
 
+# Read-only view of ``_config`` for hot paths (routing, per-node prompt
+# helpers) that only read a key or two and shouldn't pay for a deepcopy of the
+# whole dict. Rebuilt lazily after ``set_config`` or when ``_config`` itself is
+# replaced; ``_version`` increments on every rebuild so derived tables (e.g.
+# the compiled vendor routes in ``interface``) know when to recompile.
+_snapshot: Mapping | None = None
+_snapshot_source: dict | None = None
+_version = 0
+_snapshot_lock = threading.Lock()
+
+
+def _freeze(value):
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
 
 def initialize_config():
     """Initialize the configuration with default values."""
@@ -20,22 +44,55 @@ def set_config(config: dict):
     partial update like ``{"data_vendors": {"core_stock_apis": "alpha_vantage"}}``
     keeps the other nested keys from the default; scalar keys are replaced.
     """
-    global _config
+    global _config, _snapshot
     initialize_config()
     incoming = deepcopy(config)
-    for key, value in incoming.items():
-        if isinstance(value, dict) and isinstance(_config.get(key), dict):
-            _config[key].update(value)
-        else:
-            _config[key] = value
+    with _snapshot_lock:
+        for key, value in incoming.items():
+            if isinstance(value, dict) and isinstance(_config.get(key), dict):
+                _config[key].update(value)
+            else:
+                _config[key] = value
+        _snapshot = None
 
 
 def get_config() -> dict:
-    """Get the current configuration."""
+    """Get the current configuration.
+
+    Returns a private deep copy the caller may mutate. Read-only callers on a
+    hot path should prefer ``get_config_snapshot``.
+    """
     if _config is None:
         initialize_config()
     return deepcopy(_config)
 
 
+def get_config_snapshot() -> Mapping:
+    """Return an immutable view of the current configuration without copying.
+
+    Nested dicts are ``MappingProxyType`` and lists are tuples, so the
+    snapshot can be shared freely across threads and agent nodes. The same
+    object is returned until the config changes.
+    """
+    global _snapshot, _snapshot_source, _version
+    snapshot = _snapshot
+    if snapshot is not None and _snapshot_source is _config:
+        return snapshot
+    with _snapshot_lock:
+        if _config is None:
+            initialize_config()
+        if _snapshot is None or _snapshot_source is not _config:
+            _snapshot = _freeze(_config)
+            _snapshot_source = _config
+            _version += 1
+        return _snapshot
+
+
+def get_config_version() -> int:
+    """Return a counter that changes whenever a new config snapshot is built."""
+    get_config_snapshot()
+    return _version
+
+
 # Initialize with default config
 initialize_config()
@@ -7,14 +7,22 @@ ground macro commentary in actual numbers rather than headlines alone.
 A free API key (https://fred.stlouisfed.org/docs/api/api_key.html) is read from
 ``FRED_API_KEY``; if it is unset the vendor raises ``FredNotConfiguredError`` so
 the routing layer treats it as "unavailable" rather than a hard crash.
+
+Series metadata and observation history are kept in a local store
+(``fred_store.py``), so repeated and overlapping windows cost at most one
+small incremental request; ``warm_macro_series`` pre-loads every alias.
 """
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import requests
 
 from .errors import VendorNotConfiguredError
+from .fred_store import get_fred_store
+from .rate_limiter import throttle
+from .records import MacroSeries, cached_record
 
 logger = logging.getLogger(__name__)
 
@@ -118,6 +126,7 @@ def _resolve_series_id(indicator: str) -> str:
 def _request(path: str, params: dict) -> dict:
     """GET a FRED endpoint, surfacing FRED's JSON error body on a bad request."""
     api_params = {**params, "api_key": get_api_key(), "file_type": "json"}
+    throttle("fred")
     response = requests.get(
         f"{FRED_API_BASE}/{path}", params=api_params, timeout=REQUEST_TIMEOUT
     )
@@ -133,75 +142,113 @@ def _request(path: str, params: dict) -> dict:
     return response.json()
 
 
-def get_macro_data(
-    indicator: str,
-    curr_date: str,
-    look_back_days: int | None = None,
-) -> str:
-    """Fetch a FRED macroeconomic series as a formatted markdown report.
-
-    Args:
-        indicator: A friendly alias (e.g. "cpi", "unemployment", "10y_treasury")
-            or a raw FRED series ID (e.g. "CPIAUCSL", "DGS10").
-        curr_date: End of the window (yyyy-mm-dd); no later observations are
-            returned, so a past date never leaks future data.
-        look_back_days: Trailing window length; ``None`` uses DEFAULT_LOOKBACK_DAYS.
-
-    Returns:
-        A markdown report with the series title, units, frequency, the latest
-        value, the change over the window, and a recent observation table.
-    """
-    if look_back_days is None:
-        look_back_days = DEFAULT_LOOKBACK_DAYS
-
-    end_dt = datetime.strptime(curr_date, "%Y-%m-%d")
-    start_date = (end_dt - timedelta(days=look_back_days)).strftime("%Y-%m-%d")
-
-    # Invalid LLM-supplied indicator: return guidance rather than raising, so a
-    # bad argument doesn't abort the run (the routing layer also degrades macro
-    # data, but a specific message is more useful to the analyst).
-    try:
-        series_id = _resolve_series_id(indicator)
-    except ValueError as e:
-        return f"FRED: {e}"
-
+def _series_info(series_id: str) -> dict | None:
+    """The FRED ``seriess`` entry for ``series_id``, or None if there is none."""
     meta = _request("series", {"series_id": series_id}).get("seriess") or []
-    if not meta:
-        return (
-            f"FRED series '{series_id}' not found. Pass a known alias "
-            f"(e.g. 'cpi', 'unemployment') or a valid FRED series ID."
-        )
-    info = meta[0]
-    title = info.get("title", series_id)
-    units = info.get("units_short") or info.get("units", "")
-    frequency = info.get("frequency", "")
-    seasonal = info.get("seasonal_adjustment_short", "")
+    return meta[0] if meta else None
+
 
+def _observations(series_id: str, start_date: str, end_date: str) -> tuple[tuple[str, str], ...]:
+    """``(date, value)`` pairs in ``[start_date, end_date]``, missing values dropped."""
     observations = _request(
         "series/observations",
         {
             "series_id": series_id,
             "observation_start": start_date,
-            "observation_end": curr_date,
+            "observation_end": end_date,
             "sort_order": "asc",
         },
     ).get("observations", [])
-
     # FRED encodes a missing observation as ".".
-    points = [
+    return tuple(
         (o["date"], o["value"])
         for o in observations
         if o.get("value") not in (".", None, "")
-    ]
+    )
+
+
+def fetch_macro_series(series_id: str, start_date: str, end_date: str) -> MacroSeries | None:
+    """Fetch a FRED series' metadata and observations within ``[start_date, end_date]``.
 
+    With the FRED store enabled (the default) metadata and observation history
+    are served locally and only missing observations are requested; see
+    ``fred_store``. Returns None when FRED has no series with that ID.
+    """
+    def _fetch():
+        store = get_fred_store()
+        if store is None:
+            info = _series_info(series_id)
+            points = _observations(series_id, start_date, end_date) if info else ()
+        else:
+            info = store.metadata(series_id, lambda: _series_info(series_id))
+            points = (
+                store.observations(series_id, start_date, end_date, _observations)
+                if info
+                else ()
+            )
+        if info is None:
+            return None
+        return MacroSeries(
+            series_id=series_id,
+            title=info.get("title", series_id),
+            units=info.get("units_short") or info.get("units", ""),
+            frequency=info.get("frequency", ""),
+            seasonal=info.get("seasonal_adjustment_short", ""),
+            start_date=start_date,
+            end_date=end_date,
+            observations=points,
+            vendor="fred",
+        )
+
+    return cached_record(("fred", series_id, start_date, end_date), _fetch)
+
+
+def warm_macro_series(
+    curr_date: str | None = None,
+    look_back_days: int | None = None,
+    series_ids=None,
+    max_workers: int = 4,
+) -> dict[str, int | str]:
+    """Load every ``MACRO_SERIES`` series (or ``series_ids``) into the FRED store.
+
+    Fetches each series' metadata and its trailing window ending at
+    ``curr_date`` (default today) concurrently, so later look-ups in that
+    range need no request. Returns ``{series_id: observation count}``, with an
+    error message in place of the count for series that failed.
+    """
+    if look_back_days is None:
+        look_back_days = DEFAULT_LOOKBACK_DAYS
+    end_dt = datetime.strptime(curr_date, "%Y-%m-%d") if curr_date else datetime.now()
+    end_date = end_dt.strftime("%Y-%m-%d")
+    start_date = (end_dt - timedelta(days=look_back_days)).strftime("%Y-%m-%d")
+    # Aliases overlap (fed_funds / fed_funds_rate -> FEDFUNDS): one fetch each.
+    ids = list(dict.fromkeys(series_ids or MACRO_SERIES.values()))
+
+    def _warm(series_id: str) -> int | str:
+        try:
+            series = fetch_macro_series(series_id, start_date, end_date)
+        except Exception as exc:
+            logger.warning("Warming FRED %s failed: %s", series_id, exc)
+            return f"error: {exc}"
+        return len(series.observations) if series else "error: series not found"
+
+    # The "fred" rate limiter still paces the requests across workers.
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="fred") as pool:
+        return dict(zip(ids, pool.map(_warm, ids), strict=True))
+
+
+def render_macro_series(series: MacroSeries) -> str:
+    """Render a ``MacroSeries`` as the markdown report the news analyst reads."""
+    series_id = series.series_id
     header = (
-        f"## FRED: {title} ({series_id})\n"
-        f"- Units: {units}\n"
-        f"- Frequency: {frequency}"
-        f"{f' ({seasonal})' if seasonal else ''}\n"
-        f"- Window: {start_date} to {curr_date}\n"
+        f"## FRED: {series.title} ({series_id})\n"
+        f"- Units: {series.units}\n"
+        f"- Frequency: {series.frequency}"
+        f"{f' ({series.seasonal})' if series.seasonal else ''}\n"
+        f"- Window: {series.start_date} to {series.end_date}\n"
     )
 
+    points = series.observations
     if not points:
         return header + (
             f"\nNo observations for {series_id} in this window. The series may "
@@ -235,3 +282,44 @@ def get_macro_data(
     )
 
     return header + summary + note + table
+
+
+def get_macro_data(
+    indicator: str,
+    curr_date: str,
+    look_back_days: int | None = None,
+) -> str:
+    """Fetch a FRED macroeconomic series as a formatted markdown report.
+
+    Args:
+        indicator: A friendly alias (e.g. "cpi", "unemployment", "10y_treasury")
+            or a raw FRED series ID (e.g. "CPIAUCSL", "DGS10").
+        curr_date: End of the window (yyyy-mm-dd); no later observations are
+            returned, so a past date never leaks future data.
+        look_back_days: Trailing window length; ``None`` uses DEFAULT_LOOKBACK_DAYS.
+
+    Returns:
+        A markdown report with the series title, units, frequency, the latest
+        value, the change over the window, and a recent observation table.
+    """
+    if look_back_days is None:
+        look_back_days = DEFAULT_LOOKBACK_DAYS
+
+    end_dt = datetime.strptime(curr_date, "%Y-%m-%d")
+    start_date = (end_dt - timedelta(days=look_back_days)).strftime("%Y-%m-%d")
+
+    # Invalid LLM-supplied indicator: return guidance rather than raising, so a
+    # bad argument doesn't abort the run (the routing layer also degrades macro
+    # data, but a specific message is more useful to the analyst).
+    try:
+        series_id = _resolve_series_id(indicator)
+    except ValueError as e:
+        return f"FRED: {e}"
+
+    series = fetch_macro_series(series_id, start_date, curr_date)
+    if series is None:
+        return (
+            f"FRED series '{series_id}' not found. Pass a known alias "
+            f"(e.g. 'cpi', 'unemployment') or a valid FRED series ID."
+        )
+    return render_macro_series(series)
@@ -0,0 +1,236 @@
+"""Local store for FRED series metadata and observation history.
+
+``get_macro_data`` made two FRED requests per call — ``series`` metadata and
+``series/observations`` for the window — although metadata almost never
+changes and observations only append. Series now go through a SQLite store
+(``data_cache_dir/fred.sqlite``):
+
+* metadata is kept for ``fred_metadata_ttl`` seconds;
+* observations are kept per series with the date range they cover, so any
+  look-back window inside that range is answered locally;
+* only what is missing is requested: a window starting before the covered
+  range fetches the gap before it, and a window ending after it fetches the
+  observations newer than the last stored date — at most every
+  ``fred_refresh_interval`` seconds once the range reaches the present.
+
+Reads are always cut at the requested end date, so history fetched beyond a
+simulation date never leaks into it.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+
+from .config import get_config_snapshot
+from .singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS series_meta (
+    series_id TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS observations (
+    series_id TEXT NOT NULL,
+    date TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (series_id, date)
+);
+CREATE TABLE IF NOT EXISTS coverage (
+    series_id TEXT PRIMARY KEY,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+"""
+
+# Observation fetcher: (series_id, start, end) -> (date, value) pairs.
+ObservationFetch = Callable[[str, str, str], Iterable[tuple[str, str]]]
+
+
+def _shift(day: str, days: int) -> str:
+    return (datetime.strptime(day, "%Y-%m-%d") + timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+class FredStore:
+    """SQLite-backed FRED metadata and observations with incremental sync."""
+
+    def __init__(
+        self,
+        path: str,
+        metadata_ttl: float = 7 * 86400,
+        refresh_interval: float = 6 * 3600,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.metadata_ttl = metadata_ttl
+        self.refresh_interval = refresh_interval
+        self._clock = clock
+        self._flight = SingleFlight()
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")  # readers overlap a writer
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                conn.executescript(
+                    "DROP TABLE IF EXISTS series_meta;"
+                    " DROP TABLE IF EXISTS observations;"
+                    " DROP TABLE IF EXISTS coverage;"
+                )
+                conn.executescript(_SCHEMA)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # One short-lived connection per operation, as in the other stores.
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # -- metadata -----------------------------------------------------------
+
+    def metadata(self, series_id: str, fetch: Callable[[], dict | None]) -> dict | None:
+        """Return the series' metadata, fetching it once per ``metadata_ttl``.
+
+        ``fetch`` returns the FRED ``seriess`` entry, or None for an unknown
+        series (which is not stored). A failed refresh serves the stored copy.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload, fetched_at FROM series_meta WHERE series_id=?", (series_id,)
+            ).fetchone()
+        if row is not None and self._clock() - row[1] < self.metadata_ttl:
+            return json.loads(row[0])
+        try:
+            info = self._flight.do(("meta", series_id), fetch)
+        except Exception as exc:
+            if row is None:
+                raise
+            logger.warning("Refreshing FRED metadata for %s failed (%s); serving stored copy.", series_id, exc)
+            return json.loads(row[0])
+        if info is None:
+            return None
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO series_meta (series_id, payload, fetched_at) VALUES (?, ?, ?)",
+                (series_id, json.dumps(info), self._clock()),
+            )
+        return info
+
+    # -- observations -------------------------------------------------------
+
+    def coverage(self, series_id: str) -> tuple[str, str, float] | None:
+        """``(start_date, end_date, fetched_at)`` of the stored range, if any."""
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT start_date, end_date, fetched_at FROM coverage WHERE series_id=?",
+                (series_id,),
+            ).fetchone()
+
+    def _store(self, series_id: str, points: Iterable[tuple[str, str]]) -> None:
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO observations (series_id, date, value) VALUES (?, ?, ?)",
+                [(series_id, day, value) for day, value in points],
+            )
+
+    def _set_coverage(self, series_id: str, start: str, end: str, fetched_at: float) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO coverage (series_id, start_date, end_date, fetched_at)"
+                " VALUES (?, ?, ?, ?)",
+                (series_id, start, end, fetched_at),
+            )
+
+    def _last_date(self, series_id: str) -> str | None:
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT MAX(date) FROM observations WHERE series_id=?", (series_id,)
+            ).fetchone()[0]
+
+    def _sync(self, series_id: str, start: str, end: str, fetch: ObservationFetch) -> None:
+        now = self._clock()
+        today = date.fromtimestamp(now).isoformat()
+        covered = self.coverage(series_id)
+        if covered is None:
+            self._store(series_id, fetch(series_id, start, end))
+            self._set_coverage(series_id, start, min(end, today), now)
+            return
+        covered_start, covered_end, fetched_at = covered
+        if start < covered_start:
+            self._store(series_id, fetch(series_id, start, _shift(covered_start, -1)))
+            covered_start = start
+            self._set_coverage(series_id, covered_start, covered_end, fetched_at)
+        if end <= covered_end:
+            return
+        # A range that ended before its download day is simply incomplete; one
+        # that reached the present only grows as FRED publishes, so poll it
+        # no more often than the refresh interval.
+        reached_present = covered_end >= date.fromtimestamp(fetched_at).isoformat()
+        if reached_present and now - fetched_at < self.refresh_interval:
+            return
+        last = self._last_date(series_id)
+        # Late releases are dated in the past (September CPI lands in
+        # October), so resume after the last observation, not the range end.
+        self._store(series_id, fetch(series_id, _shift(last, 1) if last else covered_start, today))
+        self._set_coverage(series_id, covered_start, today, now)
+
+    def observations(
+        self, series_id: str, start: str, end: str, fetch: ObservationFetch
+    ) -> tuple[tuple[str, str], ...]:
+        """Observations of ``series_id`` in ``[start, end]``, syncing only the gaps.
+
+        If a sync fails but part of the series is stored, the stored
+        observations are served and the failure logged; with nothing stored
+        the error propagates.
+        """
+        try:
+            self._flight.do(("obs", series_id, start, end), lambda: self._sync(series_id, start, end, fetch))
+        except Exception as exc:
+            if self.coverage(series_id) is None:
+                raise
+            logger.warning("Syncing FRED %s failed (%s); serving stored observations.", series_id, exc)
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT date, value FROM observations"
+                " WHERE series_id=? AND date BETWEEN ? AND ? ORDER BY date",
+                (series_id, start, end),
+            ).fetchall()
+        return tuple(rows)
+
+
+_stores: dict[str, FredStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_fred_store() -> FredStore | None:
+    """Return the store for the configured path, or None when ``fred_store`` is off."""
+    config = get_config_snapshot()
+    if not config.get("fred_store", True):
+        return None
+    path = config.get("fred_store_path") or os.path.join(config["data_cache_dir"], "fred.sqlite")
+    metadata_ttl = config.get("fred_metadata_ttl", 7 * 86400)
+    interval = config.get("fred_refresh_interval", 6 * 3600)
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None or (store.metadata_ttl, store.refresh_interval) != (metadata_ttl, interval):
+            store = _stores[path] = FredStore(
+                path, metadata_ttl=metadata_ttl, refresh_interval=interval
+            )
+        return store
@@ -0,0 +1,311 @@
+"""Persisted point-in-time store for financial statements.
+
+The statement functions downloaded a symbol's full statement history on
+every call and then dropped periods after the simulation date, so a backtest
+over 200 dates re-downloaded the same three statements 200 times. Statements
+now go through a SQLite store (``data_cache_dir/fundamentals.sqlite``) keyed
+by vendor, symbol, statement kind, frequency and fiscal period end:
+
+* as-of queries are answered from the stored periods ending on or before
+  the date, with no vendor call;
+* the vendor is asked again only when a period newer than the stored ones
+  could have been reported by the requested date — i.e. the next period has
+  ended since the last download — and at most once per
+  ``fundamentals_refresh_interval`` while that filing is pending;
+* every period row carries a ``version`` that is bumped when a refresh
+  restates its figures, and the schema itself is versioned so an
+  incompatible layout is rebuilt rather than misread.
+
+A download at time T holds every period reported by T, so any as-of date up
+to T is complete without refetching — which is what makes historical
+backtests local after the first download.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from .config import get_config_snapshot
+from .records import FinancialStatement, cached_record
+from .singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+# Longest gap between consecutive period ends, per frequency: by the latest
+# stored period end plus this, a newer period has certainly ended.
+_PERIOD_DAYS = {"quarterly": 92, "annual": 366}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS statement_periods (
+    vendor TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    freq TEXT NOT NULL,
+    period_end TEXT NOT NULL,
+    items TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 1,
+    first_seen REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (vendor, symbol, kind, freq, period_end)
+);
+CREATE TABLE IF NOT EXISTS statement_fetches (
+    vendor TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    freq TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    latest_period TEXT,
+    currency TEXT,
+    PRIMARY KEY (vendor, symbol, kind, freq)
+);
+"""
+
+
+def _encode_items(column: pd.Series) -> str:
+    """Serialize one period's line items, keeping their order; NaN becomes null."""
+    items = {}
+    for item, value in column.items():
+        if value is None or (isinstance(value, float) and math.isnan(value)):
+            items[str(item)] = None
+        else:
+            try:
+                items[str(item)] = float(value)
+            except (TypeError, ValueError):
+                items[str(item)] = str(value)
+    return json.dumps(items)
+
+
+class FundamentalsStore:
+    """SQLite-backed statement periods with as-of reads and lazy refresh."""
+
+    def __init__(
+        self,
+        path: str,
+        refresh_interval: float = 86400,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.refresh_interval = refresh_interval
+        self._clock = clock
+        self._flight = SingleFlight()
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")  # readers overlap a writer
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                conn.executescript(
+                    "DROP TABLE IF EXISTS statement_periods;"
+                    " DROP TABLE IF EXISTS statement_fetches;"
+                )
+                conn.executescript(_SCHEMA)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # One short-lived connection per operation keeps the store safe to use
+        # from parallel analysts and tickers.
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # -- reads --------------------------------------------------------------
+
+    def _fetch_meta(self, key: tuple) -> tuple[float, str | None, str | None] | None:
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT fetched_at, latest_period, currency FROM statement_fetches"
+                " WHERE vendor=? AND symbol=? AND kind=? AND freq=?",
+                key,
+            ).fetchone()
+
+    def _read_frame(self, key: tuple, as_of: str | None) -> pd.DataFrame:
+        sql = (
+            "SELECT period_end, items FROM statement_periods"
+            " WHERE vendor=? AND symbol=? AND kind=? AND freq=?"
+        )
+        params = list(key)
+        if as_of:
+            sql += " AND period_end <= ?"
+            params.append(as_of)
+        sql += " ORDER BY period_end DESC"
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        if not rows:
+            return pd.DataFrame()
+        columns = {pd.Timestamp(period): json.loads(items) for period, items in rows}
+        # Line items keep the newest period's order; older-only items follow.
+        return pd.DataFrame(columns)
+
+    def versions(self, vendor: str, symbol: str, kind: str, freq: str) -> dict[str, int]:
+        """Return ``{period_end: version}`` for one stored statement."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT period_end, version FROM statement_periods"
+                " WHERE vendor=? AND symbol=? AND kind=? AND freq=?",
+                (vendor, symbol, kind, freq.lower()),
+            ).fetchall()
+        return dict(rows)
+
+    # -- refresh ------------------------------------------------------------
+
+    def needs_refresh(self, meta, freq: str, as_of: str | None) -> bool:
+        """Whether a period newer than the stored ones could be reported by ``as_of``."""
+        if meta is None:
+            return True
+        fetched_at, latest_period, _ = meta
+        now = self._clock()
+        target = datetime.strptime(as_of, "%Y-%m-%d") if as_of else datetime.fromtimestamp(now)
+        # The last download already held everything reported up to its time.
+        if target.date() <= datetime.fromtimestamp(fetched_at).date():
+            return False
+        if latest_period:
+            next_end = datetime.strptime(latest_period, "%Y-%m-%d") + timedelta(
+                days=_PERIOD_DAYS.get(freq, 92)
+            )
+            if next_end > target:
+                return False
+        # A newer period has ended (or nothing was stored); its filing may
+        # still be pending, so don't ask again more often than the interval.
+        return now - fetched_at >= self.refresh_interval
+
+    def _write(self, key: tuple, statement: FinancialStatement) -> None:
+        now = self._clock()
+        frame = statement.frame
+        periods = []
+        for column in frame.columns:
+            period = pd.to_datetime(column, errors="coerce")
+            if pd.isna(period):
+                continue
+            periods.append((period.strftime("%Y-%m-%d"), _encode_items(frame[column])))
+        latest = max((p for p, _ in periods), default=None)
+        with self._connect() as conn:
+            for period_end, items in periods:
+                conn.execute(
+                    "INSERT INTO statement_periods"
+                    " (vendor, symbol, kind, freq, period_end, items, version, first_seen, updated_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, 1, ?, ?)"
+                    " ON CONFLICT (vendor, symbol, kind, freq, period_end) DO UPDATE SET"
+                    " version = version + (items != excluded.items),"
+                    " items = excluded.items, updated_at = excluded.updated_at",
+                    (*key, period_end, items, now, now),
+                )
+            conn.execute(
+                "INSERT OR REPLACE INTO statement_fetches"
+                " (vendor, symbol, kind, freq, fetched_at, latest_period, currency)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (*key, now, latest, statement.currency),
+            )
+
+    # -- public -------------------------------------------------------------
+
+    def statement(
+        self,
+        vendor: str,
+        symbol: str,
+        kind: str,
+        freq: str,
+        as_of: str | None,
+        fetch: Callable[[], FinancialStatement],
+        ticker: str | None = None,
+    ) -> FinancialStatement:
+        """Return ``symbol``'s statement as of ``as_of``, refreshing only if needed.
+
+        ``fetch`` downloads the full statement from the vendor. If a refresh
+        fails but older periods are stored, the stored data is served and the
+        failure logged; with nothing stored the error propagates.
+        """
+        freq = freq.lower()
+        if as_of:
+            as_of = pd.Timestamp(as_of).strftime("%Y-%m-%d")
+        key = (vendor, symbol, kind, freq)
+        meta = self._fetch_meta(key)
+        if self.needs_refresh(meta, freq, as_of):
+            try:
+                self._flight.do(key, lambda: self._write(key, fetch()))
+            except Exception as exc:
+                if meta is None:
+                    raise
+                logger.warning(
+                    "Refreshing %s %s %s failed (%s); serving stored periods.",
+                    vendor, symbol, kind, exc,
+                )
+            meta = self._fetch_meta(key)
+        return FinancialStatement(
+            ticker or symbol,
+            symbol,
+            kind,
+            freq,
+            self._read_frame(key, as_of),
+            currency=meta[2] if meta else None,
+            vendor=vendor,
+            retrieved_at=datetime.fromtimestamp(meta[0]) if meta else datetime.now(),
+        )
+
+
+_stores: dict[str, FundamentalsStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_fundamentals_store() -> FundamentalsStore | None:
+    """Return the store for the configured path, or None when disabled.
+
+    ``fundamentals_store_path`` defaults to ``data_cache_dir/fundamentals.sqlite``;
+    ``fundamentals_store`` set to False turns the store off.
+    """
+    config = get_config_snapshot()
+    if not config.get("fundamentals_store", True):
+        return None
+    path = config.get("fundamentals_store_path") or os.path.join(
+        config["data_cache_dir"], "fundamentals.sqlite"
+    )
+    interval = config.get("fundamentals_refresh_interval", 86400)
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None or store.refresh_interval != interval:
+            store = _stores[path] = FundamentalsStore(path, refresh_interval=interval)
+        return store
+
+
+def statement_as_of(
+    vendor: str,
+    symbol: str,
+    kind: str,
+    freq: str,
+    curr_date: str | None,
+    fetch: Callable[[], FinancialStatement],
+    ticker: str | None = None,
+) -> FinancialStatement:
+    """Serve a vendor statement as of ``curr_date`` through the store.
+
+    ``fetch`` downloads the full statement; downloads still go through
+    ``cached_record`` so a shared cache backend spares other nodes the same
+    request. With the store disabled this is the plain cached download with
+    later periods dropped.
+    """
+    quarterly = freq.lower() == "quarterly"
+
+    def download() -> FinancialStatement:
+        return cached_record((vendor, kind, symbol, quarterly), fetch)
+
+    store = get_fundamentals_store()
+    if store is None:
+        return download().as_of(curr_date)
+    freq = "quarterly" if quarterly else "annual"
+    return store.statement(vendor, symbol, kind, freq, curr_date, download, ticker=ticker)
@@ -1,4 +1,7 @@
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
 
 from .alpha_vantage import (
     get_balance_sheet as get_alpha_vantage_balance_sheet,
@@ -11,7 +14,8 @@ from .alpha_vantage import (
     get_news as get_alpha_vantage_news,
     get_stock as get_alpha_vantage_stock,
 )
-from .config import get_config
+from .cache_backend import MISS, MemoryCacheBackend
+from .config import get_config_snapshot
 from .errors import (
     NoMarketDataError,
     VendorNotConfiguredError,
@@ -19,6 +23,7 @@ from .errors import (
 )
 from .fred import get_macro_data as get_fred_macro_data
 from .polymarket import get_prediction_markets as get_polymarket_prediction_markets
+from .singleflight import SingleFlight
 from .y_finance import (
     get_balance_sheet as get_yfinance_balance_sheet,
     get_cashflow as get_yfinance_cashflow,
@@ -143,18 +148,26 @@ VENDOR_METHODS = {
     },
 }
 
+# Static method -> category index, so lookups don't scan every category.
+_METHOD_CATEGORIES = {
+    tool: category
+    for category, info in TOOLS_CATEGORIES.items()
+    for tool in info["tools"]
+}
+
+
 def get_category_for_method(method: str) -> str:
     """Get the category that contains the specified method."""
-    for category, info in TOOLS_CATEGORIES.items():
-        if method in info["tools"]:
-            return category
-    raise ValueError(f"Method '{method}' not found in any category")
+    try:
+        return _METHOD_CATEGORIES[method]
+    except KeyError:
+        raise ValueError(f"Method '{method}' not found in any category") from None
 
 def get_vendor(category: str, method: str = None) -> str:
     """Get the configured vendor for a data category or specific tool method.
     Tool-level configuration takes precedence over category-level.
     """
-    config = get_config()
+    config = get_config_snapshot()
 
     # Check tool-level configuration first (if method provided)
     if method:
@@ -165,8 +178,26 @@ def get_vendor(category: str, method: str = None) -> str:
     # Fall back to category-level configuration
     return config.get("data_vendors", {}).get(category, "default")
 
-def route_to_vendor(method: str, *args, **kwargs):
-    """Route method calls to appropriate vendor implementation with fallback support."""
+
+class _Route(NamedTuple):
+    """A method's resolved vendor chain for one config snapshot."""
+
+    category: str
+    vendor_map: dict  # the VENDOR_METHODS entry this chain was built from
+    vendor_items: tuple  # its (vendor, impl) items at compile time
+    chain: tuple  # ((vendor, impl_func), ...) in fallback order
+
+
+# Compiled routes for the current config snapshot. ``route_to_vendor`` runs on
+# every tool call; resolving the chain (category lookup, tool/category vendor
+# precedence, splitting the comma list, validating names) once per config
+# version keeps the per-call overhead to a couple of dict lookups.
+_routes: dict[str, _Route] = {}
+_routes_snapshot = None
+_routes_lock = threading.Lock()
+
+
+def _compile_route(method: str) -> _Route:
     category = get_category_for_method(method)
     vendor_config = get_vendor(category, method)
     primary_vendors = [v.strip() for v in vendor_config.split(',')]
@@ -174,7 +205,8 @@ def route_to_vendor(method: str, *args, **kwargs):
     if method not in VENDOR_METHODS:
         raise ValueError(f"Method '{method}' not supported")
 
-    all_available_vendors = list(VENDOR_METHODS[method].keys())
+    vendor_map = VENDOR_METHODS[method]
+    all_available_vendors = list(vendor_map.keys())
 
     # The configured vendor list IS the chain: we do NOT silently fall back to
     # vendors the user did not choose (#988/#289) — that returned data from an
@@ -183,7 +215,7 @@ def route_to_vendor(method: str, *args, **kwargs):
     # The "default" sentinel (no explicit config) uses all available vendors.
     explicit = [v for v in primary_vendors if v and v != "default"]
     if explicit:
-        vendor_chain = [v for v in explicit if v in VENDOR_METHODS[method]]
+        vendor_chain = [v for v in explicit if v in vendor_map]
         if not vendor_chain:
             raise ValueError(
                 f"Configured vendor(s) {explicit} not available for '{method}'. "
@@ -192,16 +224,147 @@ def route_to_vendor(method: str, *args, **kwargs):
     else:
         vendor_chain = all_available_vendors
 
-    last_no_data: NoMarketDataError | None = None
-    first_error: Exception | None = None
+    chain = []
     for vendor in vendor_chain:
-        vendor_impl = VENDOR_METHODS[method][vendor]
+        vendor_impl = vendor_map[vendor]
         impl_func = vendor_impl[0] if isinstance(vendor_impl, list) else vendor_impl
+        chain.append((vendor, impl_func))
+    return _Route(category, vendor_map, tuple(vendor_map.items()), tuple(chain))
+
+
+def _get_route(method: str) -> _Route:
+    """Return the compiled route for ``method``, recompiling on config change.
+
+    A route is also rebuilt when its ``VENDOR_METHODS`` entry has been
+    replaced (e.g. by ``mock.patch.dict`` in tests) or changed in place
+    (``VENDOR_METHODS[method][vendor] = impl``).
+    """
+    global _routes_snapshot
+    snapshot = get_config_snapshot()
+    route = _routes.get(method) if _routes_snapshot is snapshot else None
+    if (
+        route is not None
+        and route.vendor_map is VENDOR_METHODS.get(method)
+        and tuple(route.vendor_map.items()) == route.vendor_items
+    ):
+        return route
+    route = _compile_route(method)
+    with _routes_lock:
+        if _routes_snapshot is not snapshot:
+            _routes.clear()
+            _routes_snapshot = snapshot
+        _routes[method] = route
+    return route
+
+
+# Identical vendor calls issued concurrently (parallel tickers/analysts asking
+# for the same news date or macro series) share one fetch.
+_inflight = SingleFlight()
+
+
+def _coalesce_key(method: str, chain: tuple, args: tuple, kwargs: dict):
+    """Hashable identity of a routed call, or None if an argument isn't hashable."""
+    key = (method, tuple(vendor for vendor, _ in chain), args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+# Results fetched ahead of the tool call that will ask for them (see
+# ``prefetch_routes``), keyed like ``_inflight``. Kept in process: the agent
+# that prefetched is the one about to call the tools.
+_prefetched = MemoryCacheBackend(max_entries=512)
 
+
+def route_to_vendor(method: str, *args, **kwargs):
+    """Route method calls to appropriate vendor implementation with fallback support.
+
+    Results warmed by ``prefetch_routes`` are returned without a vendor call.
+    Concurrent calls with the same method, vendor chain and arguments are
+    coalesced into a single fetch unless ``coalesce_vendor_calls`` is off.
+    """
+    category, _, _, vendor_chain = _get_route(method)
+    key = _coalesce_key(method, vendor_chain, args, kwargs)
+    if key is not None:
+        result = _prefetched.get(method, key)
+        if result is not MISS:
+            return result
+        if get_config_snapshot().get("coalesce_vendor_calls", True):
+            return _inflight.do(
+                key, lambda: _call_vendor_chain(method, category, vendor_chain, args, kwargs)
+            )
+    return _call_vendor_chain(method, category, vendor_chain, args, kwargs)
+
+
+# Leading text of the strings that stand in for data when a call failed: the
+# router's sentinels above and vendors' "Error retrieving ..." returns.
+_UNUSABLE_PREFIXES = ("NO_DATA_AVAILABLE:", "DATA_UNAVAILABLE:", "Error")
+
+
+def _is_unusable(result) -> bool:
+    """Whether a routed result is an error or no-data string rather than data."""
+    return isinstance(result, str) and result.lstrip().startswith(_UNUSABLE_PREFIXES)
+
+
+def prefetch_routes(calls, ttl: float | None = None) -> dict:
+    """Run several routed calls concurrently and warm them for later tool calls.
+
+    ``calls`` is an iterable of ``(method, args)`` pairs, with ``args`` exactly
+    as the tool will pass them to ``route_to_vendor``. Successful results are
+    kept for ``ttl`` seconds (default ``prefetch_ttl``), so the matching tool
+    call returns immediately. Returns ``{(method, args): result}`` for the
+    calls that succeeded; failures, including error and no-data strings in
+    place of data, are logged and left for the tool call to retry and surface.
+    """
+    calls = [(method, tuple(args)) for method, args in calls]
+    if ttl is None:
+        ttl = get_config_snapshot().get("prefetch_ttl", 600)
+    if not calls:
+        return {}
+
+    def _fetch(call):
+        method, args = call
+        return route_to_vendor(method, *args)
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(calls), thread_name_prefix="prefetch") as pool:
+        futures = {call: pool.submit(_fetch, call) for call in calls}
+        for call, future in futures.items():
+            method, args = call
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.warning("Prefetch of %s%r failed: %s", method, args, e)
+                continue
+            if _is_unusable(result):
+                logger.warning("Prefetch of %s%r returned no data: %.200s", method, args, result)
+                continue
+            results[call] = result
+            if ttl:
+                key = _coalesce_key(method, _get_route(method).chain, args, {})
+                if key is not None:
+                    _prefetched.set(method, key, result, ttl)
+    return results
+
+
+def clear_prefetched() -> None:
+    """Forget every prefetched result (tests, or to force fresh tool calls)."""
+    _prefetched.clear()
+
+
+def _call_vendor_chain(method: str, category: str, vendor_chain: tuple, args: tuple, kwargs: dict):
+    """Try each vendor in ``vendor_chain`` in order and return the first result."""
+    last_no_data: NoMarketDataError | None = None
+    first_error: Exception | None = None
+    for vendor, impl_func in vendor_chain:
         try:
             return impl_func(*args, **kwargs)
-        except VendorRateLimitError:
+        except VendorRateLimitError as e:
             logger.warning("Vendor %r rate-limited for %s; trying next vendor.", vendor, method)
+            if first_error is None:
+                first_error = e  # An exhausted quota surfaces if no vendor can serve the call.
             continue
         except VendorNotConfiguredError as e:
             logger.warning("Vendor %r not configured for %s; trying next vendor.", vendor, method)
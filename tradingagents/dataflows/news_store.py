@@ -0,0 +1,481 @@
+"""Persistent ticker-news store with cross-run and cross-publisher dedup.
+
+Ticker news was re-downloaded and re-rendered on every run, and one wire
+story syndicated by several publishers reached the prompt several times.
+Articles now land in a SQLite store (``data_cache_dir/news.sqlite``):
+
+* exact duplicates collapse on the canonical URL (scheme/host case, tracking
+  parameters, fragments and trailing slashes ignored) or on a hash of the
+  normalized title and summary;
+* near-duplicates — the same story lightly rewritten — are found with
+  MinHash signatures over word shingles of title + summary, bucketed by LSH
+  bands so a new article is only compared with likely matches. An article
+  whose estimated similarity reaches ``news_dedup_threshold`` joins the
+  earlier article's cluster, and queries return one article per cluster;
+* articles are indexed by ticker and publish time, and each (vendor, ticker)
+  remembers which publish-time ranges its fetches covered, so a news tool
+  only asks the vendor for the parts of the requested window no earlier
+  fetch covered.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import struct
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from typing import NamedTuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .config import get_config_snapshot
+from .records import NewsArticle
+from .singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 2
+
+NUM_PERM = 64
+_BANDS = 16  # 16 bands x 4 rows: candidates at roughly >= 0.5 similarity
+_ROWS = NUM_PERM // _BANDS
+_MERSENNE = (1 << 61) - 1
+_MASK = (1 << 32) - 1
+
+# Fixed permutation coefficients, so signatures are comparable across runs.
+_PERMS = [
+    (
+        int.from_bytes(hashlib.blake2b(f"a{i}".encode(), digest_size=8).digest()) % _MERSENNE | 1,
+        int.from_bytes(hashlib.blake2b(f"b{i}".encode(), digest_size=8).digest()) % _MERSENNE,
+    )
+    for i in range(NUM_PERM)
+]
+
+_TRACKING_PARAMS = re.compile(r"^(utm_|guccounter|ncid|cmpid|soc_|mc_)", re.IGNORECASE)
+_WORD = re.compile(r"\w+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    url TEXT UNIQUE,
+    content_hash TEXT NOT NULL UNIQUE,
+    cluster_id INTEGER,
+    title TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    publisher TEXT NOT NULL,
+    link TEXT NOT NULL,
+    pub_date TEXT,
+    pub_ts REAL,
+    sentiment TEXT NOT NULL DEFAULT '',
+    signature BLOB NOT NULL,
+    stored_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS article_tickers (
+    ticker TEXT NOT NULL,
+    article_id INTEGER NOT NULL,
+    PRIMARY KEY (ticker, article_id)
+);
+CREATE TABLE IF NOT EXISTS minhash_bands (
+    band INTEGER NOT NULL,
+    bucket TEXT NOT NULL,
+    article_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS minhash_bands_lookup ON minhash_bands (band, bucket);
+CREATE INDEX IF NOT EXISTS articles_pub_ts ON articles (pub_ts);
+CREATE TABLE IF NOT EXISTS news_fetches (
+    vendor TEXT NOT NULL,
+    ticker TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (vendor, ticker)
+);
+CREATE TABLE IF NOT EXISTS news_coverage (
+    vendor TEXT NOT NULL,
+    ticker TEXT NOT NULL,
+    start_ts REAL NOT NULL,
+    end_ts REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS news_coverage_lookup ON news_coverage (vendor, ticker);
+"""
+
+class PartialNews(NamedTuple):
+    """A vendor answer cut short (e.g. at a page limit): only articles
+    published from ``complete_from`` on are known to all be there."""
+
+    articles: list[NewsArticle]
+    complete_from: datetime
+
+
+# What a vendor fetch is asked for: articles published in [time_from, time_to].
+# Feed vendors with no date filter are called with (None, None). It returns
+# the articles, ``PartialNews`` when the vendor truncated them, or None when
+# the call failed and nothing can be said about the window.
+NewsFetch = Callable[
+    [datetime | None, datetime | None], Iterable[NewsArticle] | PartialNews | None
+]
+
+
+def canonical_url(url: str) -> str:
+    """Normalize ``url`` so the same article linked two ways compares equal."""
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    query = urlencode(
+        sorted((k, v) for k, v in parse_qsl(parts.query) if not _TRACKING_PARAMS.match(k))
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+
+
+def _words(article: NewsArticle) -> list[str]:
+    return _WORD.findall(f"{article.title} {article.summary}".casefold())
+
+
+def content_hash(article: NewsArticle) -> str:
+    """Hash of the normalized title and summary (exact-duplicate key)."""
+    return hashlib.sha1(" ".join(_words(article)).encode()).hexdigest()
+
+
+def minhash(article: NewsArticle, shingle: int = 3) -> tuple[int, ...]:
+    """MinHash signature over word ``shingle``-grams of title + summary."""
+    words = _words(article)
+    grams = {" ".join(words[i:i + shingle]) for i in range(max(1, len(words) - shingle + 1))}
+    hashes = [
+        int.from_bytes(hashlib.blake2b(g.encode(), digest_size=8).digest()) for g in grams if g
+    ] or [0]
+    return tuple(min((a * h + b) % _MERSENNE for h in hashes) & _MASK for a, b in _PERMS)
+
+
+def similarity(sig_a, sig_b) -> float:
+    """Estimated Jaccard similarity of two MinHash signatures."""
+    return sum(x == y for x, y in zip(sig_a, sig_b, strict=True)) / len(sig_a)
+
+
+def _pack(signature) -> bytes:
+    return struct.pack(f"<{NUM_PERM}I", *signature)
+
+
+def _unpack(blob: bytes) -> tuple[int, ...]:
+    return struct.unpack(f"<{NUM_PERM}I", blob)
+
+
+def _band_buckets(signature) -> list[tuple[int, str]]:
+    packed = _pack(signature)
+    width = _ROWS * 4
+    return [
+        (band, hashlib.blake2b(packed[band * width:(band + 1) * width], digest_size=8).hexdigest())
+        for band in range(_BANDS)
+    ]
+
+
+def _uncovered(covered, start: float, end: float) -> list[tuple[float, float]]:
+    """The parts of ``[start, end]`` not inside any of the ``covered`` ranges."""
+    gaps, cursor = [], start
+    for low, high in sorted(covered):
+        if high <= cursor:
+            continue
+        if low >= end:
+            break
+        if low > cursor:
+            gaps.append((cursor, low))
+        cursor = high
+    if cursor < end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+def _merged(ranges) -> list[tuple[float, float]]:
+    """``ranges`` with overlapping and touching ranges joined, in order."""
+    merged: list[list[float]] = []
+    for low, high in sorted(ranges):
+        if merged and low <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], high)
+        else:
+            merged.append([low, high])
+    return [(low, high) for low, high in merged]
+
+
+def _timestamp(pub_date: datetime | None) -> float | None:
+    if pub_date is None:
+        return None
+    try:
+        return pub_date.timestamp()
+    except (OverflowError, OSError, ValueError):
+        return None
+
+
+class NewsStore:
+    """SQLite article store indexed by ticker and publish time."""
+
+    def __init__(self, path: str, threshold: float = 0.8, clock: Callable[[], float] = time.time):
+        self.path = path
+        self.threshold = threshold
+        self._clock = clock
+        self._write_lock = threading.Lock()
+        self._flight = SingleFlight()
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                for table in (
+                    "articles", "article_tickers", "minhash_bands", "news_fetches", "news_coverage",
+                ):
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
+                conn.executescript(_SCHEMA)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # -- writes -------------------------------------------------------------
+
+    def _near_duplicate(self, conn, signature) -> int | None:
+        candidates = set()
+        for band, bucket in _band_buckets(signature):
+            rows = conn.execute(
+                "SELECT article_id FROM minhash_bands WHERE band=? AND bucket=?", (band, bucket)
+            )
+            candidates.update(r[0] for r in rows)
+        best, best_score = None, self.threshold
+        for article_id in sorted(candidates):
+            row = conn.execute(
+                "SELECT cluster_id, signature FROM articles WHERE id=?", (article_id,)
+            ).fetchone()
+            score = similarity(signature, _unpack(row[1]))
+            if score >= best_score:
+                best, best_score = row[0], score
+        return best
+
+    def add(self, ticker: str, articles: Iterable[NewsArticle]) -> int:
+        """Store ``articles`` under ``ticker``; return how many were new stories.
+
+        An article already stored (same canonical URL or content) is only
+        linked to ``ticker``; a near-duplicate is stored but joins the
+        earlier article's cluster.
+        """
+        new_clusters = 0
+        with self._write_lock, self._connect() as conn:
+            for article in articles:
+                if not article.title:
+                    continue
+                url = canonical_url(article.link) or None
+                digest = content_hash(article)
+                row = conn.execute(
+                    "SELECT id FROM articles WHERE content_hash=? OR (url IS NOT NULL AND url=?)",
+                    (digest, url),
+                ).fetchone()
+                if row is None:
+                    signature = minhash(article)
+                    cluster = self._near_duplicate(conn, signature)
+                    cursor = conn.execute(
+                        "INSERT INTO articles (url, content_hash, cluster_id, title, summary,"
+                        " publisher, link, pub_date, pub_ts, sentiment, signature, stored_at)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            url, digest, cluster, article.title, article.summary,
+                            article.publisher, article.link,
+                            article.pub_date.isoformat() if article.pub_date else None,
+                            _timestamp(article.pub_date), article.sentiment,
+                            _pack(signature), self._clock(),
+                        ),
+                    )
+                    article_id = cursor.lastrowid
+                    if cluster is None:
+                        new_clusters += 1
+                        conn.execute(
+                            "UPDATE articles SET cluster_id=? WHERE id=?", (article_id, article_id)
+                        )
+                    conn.executemany(
+                        "INSERT INTO minhash_bands (band, bucket, article_id) VALUES (?, ?, ?)",
+                        [(band, bucket, article_id) for band, bucket in _band_buckets(signature)],
+                    )
+                else:
+                    article_id = row[0]
+                conn.execute(
+                    "INSERT OR IGNORE INTO article_tickers (ticker, article_id) VALUES (?, ?)",
+                    (ticker, article_id),
+                )
+        return new_clusters
+
+    # -- reads --------------------------------------------------------------
+
+    def articles(
+        self,
+        ticker: str,
+        since: datetime | None = None,
+        keep: Callable[[NewsArticle], bool] | None = None,
+    ) -> list[NewsArticle]:
+        """Deduplicated articles for ``ticker``, newest first (undated last).
+
+        ``since`` drops dated articles published before it; ``keep`` filters
+        further (e.g. a look-ahead-safe window). Filtering happens before
+        dedup, so an out-of-window copy never hides an in-window one. One
+        article is returned per near-duplicate cluster.
+        """
+        sql = (
+            "SELECT a.cluster_id, a.title, a.summary, a.publisher, a.link, a.pub_date,"
+            " a.sentiment"
+            " FROM articles a JOIN article_tickers t ON t.article_id = a.id"
+            " WHERE t.ticker = ?"
+        )
+        params: list = [ticker]
+        if since is not None:
+            sql += " AND (a.pub_ts IS NULL OR a.pub_ts >= ?)"
+            params.append(_timestamp(since))
+        sql += " ORDER BY a.pub_ts IS NULL, a.pub_ts DESC, a.id"
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        seen, result = set(), []
+        for cluster, title, summary, publisher, link, pub_date, sentiment in rows:
+            article = NewsArticle(
+                title, summary, publisher, link,
+                datetime.fromisoformat(pub_date) if pub_date else None, sentiment,
+            )
+            if cluster in seen or (keep is not None and not keep(article)):
+                continue
+            seen.add(cluster)
+            result.append(article)
+        return result
+
+    # -- sync ---------------------------------------------------------------
+
+    def _coverage(self, conn, vendor: str, ticker: str) -> list[tuple[float, float]]:
+        return conn.execute(
+            "SELECT start_ts, end_ts FROM news_coverage WHERE vendor=? AND ticker=?",
+            (vendor, ticker),
+        ).fetchall()
+
+    def _record_fetch(self, vendor: str, ticker: str, covered, fetched_at: float) -> None:
+        with self._write_lock, self._connect() as conn:
+            ranges = _merged([*self._coverage(conn, vendor, ticker), *covered])
+            conn.execute("DELETE FROM news_coverage WHERE vendor=? AND ticker=?", (vendor, ticker))
+            conn.executemany(
+                "INSERT INTO news_coverage (vendor, ticker, start_ts, end_ts) VALUES (?, ?, ?, ?)",
+                [(vendor, ticker, low, high) for low, high in ranges],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO news_fetches (vendor, ticker, fetched_at) VALUES (?, ?, ?)",
+                (vendor, ticker, fetched_at),
+            )
+
+    def sync(
+        self,
+        vendor: str,
+        ticker: str,
+        start_date: datetime,
+        end_date: datetime,
+        fetch: NewsFetch,
+        refresh_interval: float = 3600,
+        ranged: bool = True,
+    ) -> None:
+        """Fetch from the vendor the parts of ``[start_date, end_date]`` not covered yet.
+
+        A fetch for ``[a, b]`` made at time ``t`` covers ``[a, min(b, t)]``:
+        nothing published after ``t`` could have come back. Each uncovered gap
+        is fetched with ``fetch(gap_start, gap_end)``. A vendor without a date
+        filter (``ranged=False``, a latest-items feed) is called once with
+        ``fetch(None, None)`` and covers everything up to the fetch. A gap that
+        starts at or after the last fetch (news published since) is fetched at
+        most once per ``refresh_interval`` seconds. Coverage is only recorded
+        for what the fetch vouches for: nothing when it returns None (the next
+        call asks again), and only from ``complete_from`` on for
+        ``PartialNews``, so the older remainder is fetched next time.
+        """
+        start, end = _timestamp(start_date), _timestamp(end_date)
+
+        def _refresh():
+            now = self._clock()
+            with self._connect() as conn:
+                covered = self._coverage(conn, vendor, ticker)
+                row = conn.execute(
+                    "SELECT fetched_at FROM news_fetches WHERE vendor=? AND ticker=?",
+                    (vendor, ticker),
+                ).fetchone()
+            last = row[0] if row else None
+            gaps = [
+                (low, high) for low, high in _uncovered(covered, start, end)
+                if last is None or low < last or now - last >= refresh_interval
+            ]
+            if not gaps:
+                return
+            if not ranged:
+                gaps = [(min(start, 0.0), now)]
+            for low, high in gaps:
+                if ranged:
+                    result = fetch(datetime.fromtimestamp(low), datetime.fromtimestamp(high))
+                else:
+                    result = fetch(None, None)
+                if result is None:
+                    continue
+                if isinstance(result, PartialNews):
+                    low = max(low, _timestamp(result.complete_from))
+                    result = result.articles
+                self.add(ticker, result)
+                if low < min(high, now):
+                    self._record_fetch(vendor, ticker, [(low, min(high, now))], now)
+
+        self._flight.do((vendor, ticker, start, end), _refresh)
+
+
+_stores: dict[str, NewsStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_news_store() -> NewsStore | None:
+    """Return the store for the configured path, or None when ``news_store`` is off."""
+    config = get_config_snapshot()
+    if not config.get("news_store", True):
+        return None
+    path = config.get("news_store_path") or os.path.join(config["data_cache_dir"], "news.sqlite")
+    threshold = config.get("news_dedup_threshold", 0.8)
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None or store.threshold != threshold:
+            store = _stores[path] = NewsStore(path, threshold=threshold)
+        return store
+
+
+def stored_news(
+    source: str,
+    ticker: str,
+    start_date: datetime,
+    end_date: datetime,
+    fetch: NewsFetch,
+    keep: Callable[[NewsArticle], bool],
+    ranged: bool = True,
+) -> list[NewsArticle]:
+    """Deduplicated articles for a news window, served through the store.
+
+    ``source`` names the vendor; ``fetch`` and ``ranged`` are as for
+    ``NewsStore.sync``; ``keep`` is the caller's window filter. With the
+    store disabled this is the vendor fetch for the whole window, filtered,
+    with exact duplicates (same canonical URL or content) dropped.
+    """
+    store = get_news_store()
+    if store is None:
+        seen, result = set(), []
+        fetched = fetch(start_date, end_date) if ranged else fetch(None, None)
+        if isinstance(fetched, PartialNews):
+            fetched = fetched.articles
+        for article in fetched or ():
+            key = canonical_url(article.link) or content_hash(article)
+            if keep(article) and key not in seen:
+                seen.add(key)
+                result.append(article)
+        return result
+    interval = get_config_snapshot().get("news_refresh_interval", 3600)
+    store.sync(source, ticker, start_date, end_date, fetch, refresh_interval=interval, ranged=ranged)
+    return store.articles(ticker, since=start_date, keep=keep)
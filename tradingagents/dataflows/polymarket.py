@@ -8,13 +8,27 @@ what the crowd actually prices to happen next.
 Uses Polymarket's public Gamma API (https://gamma-api.polymarket.com) — no key,
 no auth. Each market's ``outcomePrices`` are the implied probabilities of its
 outcomes (a "Yes" at 0.76 means the market prices a 76% chance).
+
+Topic lookups are answered from a local catalogue of open markets, refreshed
+from Gamma's ``markets`` listing once per ``cache_ttls["polymarket_catalogue"]``
+and indexed by word, so the several related topics a news analyst asks about
+per run (and across tickers) cost no request of their own. A topic with no
+catalogue match falls back to Gamma's ``public-search``.
 """
 import json
 import logging
+import re
 from datetime import datetime, timezone
 
 import requests
 
+from .cache_backend import cache_ttl
+from .config import get_config_snapshot
+from .errors import VendorRateLimitError
+from .rate_limiter import throttle
+from .records import MarketCatalogue, MarketOdds, cached_record
+from .singleflight import SingleFlight
+
 logger = logging.getLogger(__name__)
 
 GAMMA_BASE = "https://gamma-api.polymarket.com"
@@ -25,8 +39,20 @@ REQUEST_TIMEOUT = 30
 # Default number of markets to return, ranked by traded volume.
 DEFAULT_LIMIT = 6
 
+# Markets per page of the Gamma ``markets`` listing.
+CATALOGUE_PAGE_SIZE = 500
+
+# Words too common in market questions to narrow a topic search.
+_STOPWORDS = frozenset({
+    "a", "an", "and", "at", "be", "before", "by", "does", "end", "for", "in", "is",
+    "of", "on", "or", "the", "to", "what", "when", "which", "who", "will", "with",
+})
+
+_catalogue_flight = SingleFlight()
+
 
 def _request(path: str, params: dict) -> dict:
+    throttle("polymarket")  # unthrottled unless vendor_rate_limits has an entry
     response = requests.get(
         f"{GAMMA_BASE}/{path}", params=params, timeout=REQUEST_TIMEOUT
     )
@@ -65,41 +91,161 @@ def _is_forward_looking(market: dict, now: datetime) -> bool:
     )
 
 
-def get_prediction_markets(topic: str, limit: int | None = None) -> str:
-    """Return live prediction-market probabilities for an event topic.
+def _to_odds(market: dict) -> MarketOdds | None:
+    """Normalize a Gamma market into ``MarketOdds`` (None if it has no usable price)."""
+    prices = _parse_json_list(market.get("outcomePrices"))
+    outcomes = _parse_json_list(market.get("outcomes"))
+    try:
+        prob = float(prices[0])
+    except (ValueError, IndexError):
+        return None
+    wk = market.get("oneWeekPriceChange")
+    return MarketOdds(
+        question=market.get("question") or "",
+        outcome=outcomes[0] if outcomes else "Yes",
+        probability=prob,
+        volume=market.get("volumeNum") or 0,
+        end_date=(market.get("endDate") or "")[:10],
+        week_change=wk if isinstance(wk, (int, float)) else None,
+    )
 
-    Args:
-        topic: Event keyword(s), e.g. "Fed rate cut", "recession 2026",
-            "US election", or a sector/company event.
-        limit: Max markets to return (ranked by traded volume); ``None`` uses
-            DEFAULT_LIMIT.
 
-    Returns:
-        A markdown report of the most-traded open markets matching the topic,
-        each with its implied probability, traded volume, resolution date, and
-        recent (1-week) move.
+def _terms(text: str) -> list[str]:
+    """Search terms of ``text``: lowercased words, stopwords dropped, plurals folded."""
+    terms = []
+    for word in re.findall(r"[a-z0-9]+", text.lower()):
+        if word in _STOPWORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        terms.append(word)
+    return terms
+
+
+def _market_text(market: dict) -> str:
+    """The text a market is indexed under: its question and event titles."""
+    parts = [market.get("question") or "", market.get("groupItemTitle") or ""]
+    parts.extend(e.get("title") or "" for e in market.get("events") or [] if isinstance(e, dict))
+    return " ".join(parts)
+
+
+def build_market_catalogue(markets, now: datetime | None = None) -> MarketCatalogue:
+    """Index raw Gamma markets: forward-looking ones only, by descending volume."""
+    now = now or datetime.now(timezone.utc)
+    candidates = sorted(
+        (m for m in markets if _is_forward_looking(m, now)),
+        key=lambda m: m.get("volumeNum") or 0,
+        reverse=True,
+    )
+    odds, index = [], {}
+    for market in candidates:
+        entry = _to_odds(market)
+        if entry is None:
+            continue
+        for term in set(_terms(_market_text(market))):
+            index.setdefault(term, []).append(len(odds))
+        odds.append(entry)
+    return MarketCatalogue(
+        markets=tuple(odds),
+        index={term: tuple(positions) for term, positions in index.items()},
+        vendor="polymarket",
+    )
+
+
+def fetch_market_catalogue() -> MarketCatalogue:
+    """Return the catalogue of open markets, refreshed once per its TTL.
+
+    Pages through Gamma's ``markets`` listing, highest volume first, up to
+    ``polymarket_catalogue_size`` markets. Raises like ``_request`` when the
+    first page cannot be fetched.
     """
-    if limit is None:
-        limit = DEFAULT_LIMIT
+    size = get_config_snapshot().get("polymarket_catalogue_size", 2000)
 
-    try:
+    def _fetch() -> MarketCatalogue:
+        markets = []
+        while len(markets) < size:
+            page = _request(
+                "markets",
+                {
+                    "closed": "false",
+                    "active": "true",
+                    "order": "volumeNum",
+                    "ascending": "false",
+                    "limit": CATALOGUE_PAGE_SIZE,
+                    "offset": len(markets),
+                },
+            )
+            if not isinstance(page, list) or not page:
+                break
+            markets.extend(page)
+            if len(page) < CATALOGUE_PAGE_SIZE:
+                break
+        return build_market_catalogue(markets[:size])
+
+    # One refresh even when parallel analysts miss at the same moment.
+    return _catalogue_flight.do(
+        "catalogue",
+        lambda: cached_record(("polymarket", "catalogue"), _fetch, ttl=cache_ttl("polymarket_catalogue")),
+    )
+
+
+def search_catalogue(catalogue: MarketCatalogue, topic: str) -> tuple[MarketOdds, ...]:
+    """Markets whose text contains every term of ``topic``, most-traded first.
+
+    Markets that have passed their end date since the catalogue was built are
+    dropped.
+    """
+    terms = set(_terms(topic))
+    if not terms:
+        return ()
+    postings = sorted((catalogue.index.get(t, ()) for t in terms), key=len)
+    hits = set(postings[0]).intersection(*postings[1:])
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    return tuple(
+        catalogue.markets[i]
+        for i in sorted(hits)
+        if not catalogue.markets[i].end_date or catalogue.markets[i].end_date >= today
+    )
+
+
+def _search_market_odds(topic: str) -> tuple[MarketOdds, ...]:
+    """Search Gamma's ``public-search`` for ``topic`` (cached per topic)."""
+    def _fetch():
         data = _request("public-search", {"q": topic, "limit_per_type": 20})
-    except requests.RequestException as e:
-        logger.warning("Polymarket search failed for %r: %s", topic, e)
-        return (
-            f"Polymarket data is currently unavailable (network error: {e}). "
-            f"Proceed without prediction-market signal for '{topic}'."
-        )
+        now = datetime.now(timezone.utc)
+        candidates = [
+            m
+            for event in data.get("events", [])
+            for m in event.get("markets", [])
+            if _is_forward_looking(m, now)
+        ]
+        candidates.sort(key=lambda m: m.get("volumeNum") or 0, reverse=True)
+        return tuple(o for o in map(_to_odds, candidates) if o is not None)
+
+    return cached_record(("polymarket", topic), _fetch)
+
+
+def fetch_market_odds(topic: str) -> tuple[MarketOdds, ...]:
+    """Return the open markets matching ``topic``, most-traded first.
+
+    Served from the local catalogue when ``polymarket_catalogue`` is on and
+    the topic matches; otherwise (or if the catalogue cannot be refreshed)
+    from Gamma's search. Raises ``requests.RequestException`` /
+    ``VendorRateLimitError`` when that search itself fails.
+    """
+    if get_config_snapshot().get("polymarket_catalogue", True):
+        try:
+            matches = search_catalogue(fetch_market_catalogue(), topic)
+        except (requests.RequestException, VendorRateLimitError) as e:
+            logger.warning("Polymarket catalogue refresh failed: %s; searching instead.", e)
+            matches = ()
+        if matches:
+            return matches
+    return _search_market_odds(topic)
 
-    now = datetime.now(timezone.utc)
-    candidates = [
-        m
-        for event in data.get("events", [])
-        for m in event.get("markets", [])
-        if _is_forward_looking(m, now)
-    ]
-    candidates.sort(key=lambda m: m.get("volumeNum") or 0, reverse=True)
 
+def render_market_odds(topic: str, odds, limit: int = DEFAULT_LIMIT) -> str:
+    """Render the top ``limit`` markets as the markdown report the news analyst reads."""
     header = (
         f'## Polymarket prediction markets: "{topic}"\n'
         f"Live, market-implied probabilities (higher traded volume = deeper, "
@@ -107,7 +253,7 @@ def get_prediction_markets(topic: str, limit: int | None = None) -> str:
         f"not a forecast you should take as certain.\n\n"
     )
 
-    if not candidates:
+    if not odds:
         return header + (
             f"No open prediction markets matched '{topic}'. Polymarket coverage "
             f"is concentrated in macro, political, geopolitical, and crypto "
@@ -115,25 +261,40 @@ def get_prediction_markets(topic: str, limit: int | None = None) -> str:
         )
 
     lines = []
-    for m in candidates[:limit]:
-        prices = _parse_json_list(m.get("outcomePrices"))
-        outcomes = _parse_json_list(m.get("outcomes"))
-        try:
-            prob = float(prices[0])
-        except (ValueError, IndexError):
-            continue
-        label = outcomes[0] if outcomes else "Yes"
-        volume = m.get("volumeNum") or 0
-        end_date = (m.get("endDate") or "")[:10]
-        wk = m.get("oneWeekPriceChange")
-        wk_str = (
-            f", 1-week {wk * 100:+.1f}pp"
-            if isinstance(wk, (int, float)) and wk
-            else ""
-        )
+    for o in odds[:limit]:
+        wk_str = f", 1-week {o.week_change * 100:+.1f}pp" if o.week_change else ""
         lines.append(
-            f"- **{m.get('question')}** — {label} {prob:.0%} "
-            f"(${volume:,.0f} volume, resolves {end_date}{wk_str})"
+            f"- **{o.question}** — {o.outcome} {o.probability:.0%} "
+            f"(${o.volume:,.0f} volume, resolves {o.end_date}{wk_str})"
         )
 
     return header + "\n".join(lines) + "\n"
+
+
+def get_prediction_markets(topic: str, limit: int | None = None) -> str:
+    """Return live prediction-market probabilities for an event topic.
+
+    Args:
+        topic: Event keyword(s), e.g. "Fed rate cut", "recession 2026",
+            "US election", or a sector/company event.
+        limit: Max markets to return (ranked by traded volume); ``None`` uses
+            DEFAULT_LIMIT.
+
+    Returns:
+        A markdown report of the most-traded open markets matching the topic,
+        each with its implied probability, traded volume, resolution date, and
+        recent (1-week) move.
+    """
+    if limit is None:
+        limit = DEFAULT_LIMIT
+
+    try:
+        odds = fetch_market_odds(topic)
+    except (requests.RequestException, VendorRateLimitError) as e:
+        logger.warning("Polymarket search failed for %r: %s", topic, e)
+        return (
+            f"Polymarket data is currently unavailable (network error: {e}). "
+            f"Proceed without prediction-market signal for '{topic}'."
+        )
+
+    return render_market_odds(topic, odds, limit)
@@ -0,0 +1,221 @@
+"""Proactive per-vendor request throttling.
+
+Vendor quotas (Alpha Vantage's 5 requests/minute on free keys, Reddit's per-IP
+limit, Yahoo's undocumented hourly cap) were previously handled only after the
+fact: a 429 became ``VendorRateLimitError`` or a ``yf_retry`` backoff, which
+still spent a request against the quota. This module lets callers *queue* for
+a token before sending anything.
+
+Each vendor gets one token bucket, shared by every thread in the process and
+configured from ``vendor_rate_limits`` in the config::
+
+    "vendor_rate_limits": {
+        "alpha_vantage": {"requests": 5, "period": 60},
+        ...
+    }
+
+``burst`` (default: ``requests``) caps how many tokens can accumulate. Vendors
+without an entry are not throttled. When ``rate_limit_shared_dir`` is set, the
+bucket state lives in a lock-guarded file in that directory, so several
+processes on one host (e.g. a worker pool) share a single quota. A caller that
+would have to wait longer than ``rate_limit_max_wait`` seconds gets a
+``VendorRateLimitError`` instead, which the router already treats as "try the
+next vendor".
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+
+from .config import get_config_snapshot
+from .errors import VendorRateLimitError
+from .utils import safe_ticker_component
+
+try:  # POSIX only; shared buckets fall back to in-process ones elsewhere.
+    import fcntl
+except ImportError:  # pragma: no cover - exercised only on Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on a single wait when the config doesn't set one. Long enough to
+# ride out a per-minute quota, short enough that a daily cap doesn't hang a run.
+DEFAULT_MAX_WAIT = 120.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    ``capacity`` tokens are available up front and refill continuously at
+    ``refill_per_second``. ``acquire`` blocks (outside the lock) until enough
+    tokens have accrued, so concurrent callers queue rather than burst.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_per_second: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] | None = None,
+    ):
+        if capacity <= 0 or refill_per_second <= 0:
+            raise ValueError("capacity and refill_per_second must be positive")
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def _refill(self, tokens: float, updated: float, now: float) -> float:
+        elapsed = max(0.0, now - updated)
+        return min(self.capacity, tokens + elapsed * self.refill_per_second)
+
+    def _take(self, tokens: float) -> float:
+        """Take ``tokens`` if available; otherwise return the seconds to wait."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = self._refill(self._tokens, self._updated, now)
+            self._updated = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.refill_per_second
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take ``tokens`` without waiting; return whether they were granted."""
+        return self._take(tokens) == 0.0
+
+    def acquire(self, tokens: float = 1.0, timeout: float | None = None) -> None:
+        """Block until ``tokens`` are granted.
+
+        Raises ``VendorRateLimitError`` when the wait would exceed ``timeout``
+        seconds (``None`` waits indefinitely).
+        """
+        if tokens > self.capacity:
+            raise ValueError(f"cannot acquire {tokens} tokens from a bucket of {self.capacity}")
+        sleep = self._sleep or time.sleep
+        deadline = None if timeout is None else self._clock() + timeout
+        while True:
+            wait = self._take(tokens)
+            if wait == 0.0:
+                return
+            if deadline is not None and self._clock() + wait > deadline:
+                raise VendorRateLimitError(
+                    f"rate limit: next token in {wait:.1f}s exceeds the {timeout:.0f}s wait budget"
+                )
+            sleep(wait)
+
+
+class FileTokenBucket(TokenBucket):
+    """Token bucket whose state lives in a file guarded by ``flock``.
+
+    Every process pointing at the same file draws from one quota. Wall-clock
+    time is used (not ``monotonic``) because it is comparable across processes.
+    """
+
+    def __init__(self, path: str, capacity: float, refill_per_second: float, **kwargs):
+        kwargs.setdefault("clock", time.time)
+        super().__init__(capacity, refill_per_second, **kwargs)
+        self.path = path
+
+    def _take(self, tokens: float) -> float:
+        with self._lock, open(self.path, "a+", encoding="utf-8") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                fh.seek(0)
+                try:
+                    state = json.loads(fh.read() or "{}")
+                except json.JSONDecodeError:
+                    state = {}
+                now = self._clock()
+                current = self._refill(
+                    float(state.get("tokens", self.capacity)),
+                    float(state.get("updated", now)),
+                    now,
+                )
+                wait = 0.0
+                if current >= tokens:
+                    current -= tokens
+                else:
+                    wait = (tokens - current) / self.refill_per_second
+                fh.seek(0)
+                fh.truncate()
+                fh.write(json.dumps({"tokens": current, "updated": now}))
+                fh.flush()
+                return wait
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+_buckets: dict[tuple, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def _bucket_key(vendor: str, spec: dict, shared_dir: str | None) -> tuple:
+    requests = float(spec["requests"])
+    period = float(spec.get("period", 1.0))
+    burst = float(spec.get("burst", requests))
+    return (vendor, requests, period, burst, shared_dir)
+
+
+def get_rate_limiter(vendor: str) -> TokenBucket | None:
+    """Return the process-wide bucket for ``vendor``, or None if unthrottled.
+
+    Buckets are keyed by their configured limits, so changing a vendor's entry
+    via ``set_config`` takes effect on the next call instead of reusing a
+    bucket built for the old quota.
+    """
+    config = get_config_snapshot()
+    spec = (config.get("vendor_rate_limits") or {}).get(vendor)
+    if not spec:
+        return None
+    shared_dir = config.get("rate_limit_shared_dir")
+    key = _bucket_key(vendor, spec, shared_dir)
+    bucket = _buckets.get(key)
+    if bucket is not None:
+        return bucket
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            _, requests, period, burst, _ = key
+            rate = requests / period
+            if shared_dir and fcntl is not None:
+                os.makedirs(shared_dir, exist_ok=True)
+                path = os.path.join(shared_dir, f"{safe_ticker_component(vendor)}.bucket")
+                bucket = FileTokenBucket(path, burst, rate)
+            else:
+                if shared_dir:
+                    logger.warning(
+                        "rate_limit_shared_dir is set but file locking is unavailable "
+                        "on this platform; %s is throttled per process only.", vendor,
+                    )
+                bucket = TokenBucket(burst, rate)
+            _buckets[key] = bucket
+    return bucket
+
+
+def throttle(vendor: str, tokens: float = 1.0) -> None:
+    """Wait for ``vendor``'s quota before sending a request.
+
+    A no-op for vendors without a configured limit. Raises
+    ``VendorRateLimitError`` when the wait would exceed ``rate_limit_max_wait``.
+    """
+    bucket = get_rate_limiter(vendor)
+    if bucket is None:
+        return
+    max_wait = get_config_snapshot().get("rate_limit_max_wait", DEFAULT_MAX_WAIT)
+    bucket.acquire(tokens, timeout=max_wait)
+
+
+def reset_rate_limiters() -> None:
+    """Drop all in-process buckets (tests, or after changing shared state)."""
+    with _buckets_lock:
+        _buckets.clear()
@@ -0,0 +1,352 @@
+"""Typed records returned by the vendor fetch layer.
+
+Vendor functions used to format results straight into prompt text (CSV,
+markdown), and the Alpha Vantage statement functions handed back raw API
+payloads, so nothing downstream could cache, merge, slice or reuse a result
+without re-parsing or re-fetching it. Each vendor now splits into two steps:
+
+* ``fetch_*`` — talk to the vendor and return one of the records below
+  (normalized frames / tuples of small frozen dataclasses);
+* ``render_*`` — a pure function from a record to prompt text.
+
+The string-returning functions the router exposes are just ``render(fetch())``.
+Because rendering is pure (the retrieval timestamp lives on the record), the
+same record always renders to the same text, and caches operate on records
+rather than on formatted strings.
+
+``cached_record`` caches that layer through the configured cache backend
+(see ``cache_backend``): records are kept for ``record_cache_ttl`` seconds,
+keyed by the vendor call that produced them.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import TypeVar
+
+import pandas as pd
+
+from .cache_backend import MISS, get_cache_backend
+from .config import get_config_snapshot
+from .stockstats_utils import filter_financials_by_date
+
+T = TypeVar("T")
+
+_NAMESPACE = "records"
+
+# Human-readable titles for the statement kinds, shared by every renderer.
+STATEMENT_TITLES = {
+    "balance_sheet": "Balance Sheet",
+    "cashflow": "Cash Flow",
+    "income_statement": "Income Statement",
+}
+
+
+@dataclass(frozen=True)
+class PriceBars:
+    """Daily OHLCV bars for one symbol over an inclusive date window.
+
+    ``frame`` is indexed by timezone-naive trading dates with Yahoo-style
+    column names (Open, High, Low, Close, Volume, ...).
+    """
+
+    symbol: str
+    canonical: str
+    start_date: str
+    end_date: str
+    frame: pd.DataFrame = field(compare=False, repr=False)
+    vendor: str = ""
+    retrieved_at: datetime = field(default_factory=datetime.now)
+
+
+@dataclass(frozen=True)
+class FinancialStatement:
+    """One financial statement: line items (rows) by fiscal period end (columns).
+
+    ``kind`` is one of ``STATEMENT_TITLES``; ``freq`` is "annual" or
+    "quarterly". Columns are newest first; ``as_of`` drops periods that
+    ended after a simulation date.
+    """
+
+    symbol: str
+    canonical: str
+    kind: str
+    freq: str
+    frame: pd.DataFrame = field(compare=False, repr=False)
+    currency: str | None = None
+    vendor: str = ""
+    retrieved_at: datetime = field(default_factory=datetime.now)
+
+    @property
+    def title(self) -> str:
+        return STATEMENT_TITLES.get(self.kind, self.kind)
+
+    def as_of(self, curr_date: str | None) -> FinancialStatement:
+        """Return a copy without periods ending after ``curr_date`` (look-ahead safe)."""
+        if not curr_date or self.frame.empty:
+            return self
+        return replace(self, frame=filter_financials_by_date(self.frame, curr_date))
+
+
+@dataclass(frozen=True)
+class NewsArticle:
+    """A single news item, normalized across vendor payload shapes."""
+
+    title: str
+    summary: str = ""
+    publisher: str = "Unknown"
+    link: str = ""
+    pub_date: datetime | None = None
+    sentiment: str = ""  # vendor sentiment label, e.g. Alpha Vantage's "Bullish"
+
+
+@dataclass(frozen=True)
+class SocialPost:
+    """One social-media post about a ticker (a StockTwits message or Reddit post).
+
+    ``source`` is "stocktwits" or "r/<subreddit>"; ``sentiment`` is the
+    author's own Bullish/Bearish label, if any; ``score`` / ``num_comments``
+    are None when the source does not carry them.
+    """
+
+    source: str
+    author: str
+    created_at: str
+    created_ts: float | None
+    title: str = ""
+    body: str = ""
+    sentiment: str | None = None
+    score: int | None = None
+    num_comments: int | None = None
+
+
+@dataclass(frozen=True)
+class MacroSeries:
+    """A macroeconomic series and its observations within a date window.
+
+    ``observations`` are ``(date, value)`` string pairs in ascending date
+    order, with missing values already dropped.
+    """
+
+    series_id: str
+    title: str
+    units: str
+    frequency: str
+    seasonal: str
+    start_date: str
+    end_date: str
+    observations: tuple[tuple[str, str], ...] = ()
+    vendor: str = ""
+    retrieved_at: datetime = field(default_factory=datetime.now)
+
+
+@dataclass(frozen=True)
+class MarketOdds:
+    """Market-implied probability of one prediction-market outcome."""
+
+    question: str
+    outcome: str
+    probability: float
+    volume: float = 0.0
+    end_date: str = ""
+    week_change: float | None = None
+
+
+@dataclass(frozen=True)
+class MarketCatalogue:
+    """Open prediction markets with a word index for local topic search.
+
+    ``markets`` are the forward-looking markets in descending traded volume,
+    so a market's position is its volume rank; ``index`` maps a search term
+    to the ascending positions of the markets whose text contains it.
+    """
+
+    markets: tuple[MarketOdds, ...] = ()
+    index: dict[str, tuple[int, ...]] = field(default_factory=dict, compare=False, repr=False)
+    vendor: str = ""
+    retrieved_at: datetime = field(default_factory=datetime.now)
+
+
+@dataclass(frozen=True)
+class UniverseSnapshot:
+    """Key fundamentals for many symbols: one row per canonical symbol.
+
+    ``frame`` columns are the ``universe.SNAPSHOT_FIELDS`` keys (numeric
+    except name/sector/industry).
+    """
+
+    frame: pd.DataFrame = field(compare=False, repr=False)
+    vendor: str = ""
+    retrieved_at: datetime = field(default_factory=datetime.now)
+
+
+# Line items kept by the compact rendering, per statement kind. Names are
+# matched ignoring case, spaces and punctuation, so "Total Revenue" (yfinance)
+# and "totalRevenue" (Alpha Vantage) both match.
+COMPACT_LINE_ITEMS = {
+    "balance_sheet": [
+        "Total Assets",
+        "Total Liabilities Net Minority Interest",
+        "Total Liabilities",
+        "Stockholders Equity",
+        "Total Shareholder Equity",
+        "Cash And Cash Equivalents",
+        "Cash And Cash Equivalents At Carrying Value",
+        "Current Assets",
+        "Total Current Assets",
+        "Current Liabilities",
+        "Total Current Liabilities",
+        "Total Debt",
+        "Short Long Term Debt Total",
+        "Net Debt",
+        "Working Capital",
+    ],
+    "cashflow": [
+        "Operating Cash Flow",
+        "Operating Cashflow",
+        "Capital Expenditure",
+        "Capital Expenditures",
+        "Free Cash Flow",
+        "Repurchase Of Capital Stock",
+        "Payments For Repurchase Of Common Stock",
+        "Cash Dividends Paid",
+        "Dividend Payout",
+        "Issuance Of Debt",
+        "Repayment Of Debt",
+    ],
+    "income_statement": [
+        "Total Revenue",
+        "Gross Profit",
+        "Operating Income",
+        "EBITDA",
+        "Net Income",
+        "Diluted EPS",
+        "Research And Development",
+        "Selling General And Administration",
+        "Interest Expense",
+        "Tax Provision",
+        "Income Tax Expense",
+    ],
+}
+
+_UNIT_NAMES = {1: "", 1e3: "thousands", 1e6: "millions", 1e9: "billions"}
+
+
+def _item_key(name) -> str:
+    return "".join(ch for ch in str(name).lower() if ch.isalnum())
+
+
+def _pct_change(new, old) -> str:
+    if pd.isna(new) or pd.isna(old) or old == 0:
+        return ""
+    return f"{(new - old) / abs(old) * 100:+.1f}%"
+
+
+def statement_format(kind: str) -> str:
+    """Configured rendering ("full" or "compact") for the ``get_<kind>`` tool.
+
+    ``tool_statement_formats`` overrides ``statement_format`` per tool, the
+    same precedence as ``tool_vendors`` over ``data_vendors``.
+    """
+    config = get_config_snapshot()
+    per_tool = config.get("tool_statement_formats") or {}
+    return per_tool.get(f"get_{kind}") or config.get("statement_format") or "full"
+
+
+def _render_full(statement: FinancialStatement) -> str:
+    currency = f", {statement.currency}" if statement.currency else ""
+    header = f"# {statement.title} data for {statement.canonical} ({statement.freq}{currency})\n"
+    header += f"# Data retrieved on: {statement.retrieved_at.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    return header + statement.frame.to_csv()
+
+
+def _render_compact(statement: FinancialStatement) -> str:
+    """Whitelisted line items, the latest periods, scaled units and deltas.
+
+    Deltas compare the latest period with the previous one (QoQ, quarterly
+    only) and with the same period a year earlier (YoY); they are computed
+    on the full history, before periods are cut.
+    """
+    options = get_config_snapshot().get("compact_statement") or {}
+    max_periods = int(options.get("periods", 4))
+    unit = float(options.get("unit", 1e6))
+    wanted = (options.get("line_items") or {}).get(statement.kind, COMPACT_LINE_ITEMS.get(statement.kind, []))
+
+    frame = statement.frame.sort_index(axis=1, ascending=False)
+    by_key = {_item_key(item): item for item in frame.index}
+    rows = list(dict.fromkeys(by_key[k] for k in map(_item_key, wanted) if k in by_key))
+    if rows:
+        frame = frame.loc[rows]
+    frame = frame.apply(pd.to_numeric, errors="coerce").dropna(how="all")
+
+    quarterly = statement.freq.lower() == "quarterly"
+    year_back = 4 if quarterly else 1
+    shown = frame.iloc[:, :max_periods]
+    per_share = [i for i in shown.index if "eps" in _item_key(i) or "pershare" in _item_key(i)]
+    table = (shown / unit).round(1)
+    table.loc[per_share] = shown.loc[per_share].round(2)
+    table.columns = [pd.Timestamp(c).strftime("%Y-%m-%d") for c in shown.columns]
+    if quarterly and frame.shape[1] > 1:
+        table["QoQ"] = [_pct_change(r.iloc[0], r.iloc[1]) for _, r in frame.iterrows()]
+    if frame.shape[1] > year_back:
+        table["YoY"] = [_pct_change(r.iloc[0], r.iloc[year_back]) for _, r in frame.iterrows()]
+
+    unit_name = _UNIT_NAMES.get(unit, f"x{unit:g}")
+    units = " ".join(part for part in (statement.currency, unit_name) if part)
+    header = f"# {statement.title} for {statement.canonical} ({statement.freq}, compact"
+    header += f"; values in {units}, per-share items unscaled)\n" if units else ")\n"
+    header += f"# Data retrieved on: {statement.retrieved_at.strftime('%Y-%m-%d %H:%M:%S')}\n"
+    if rows:
+        header += "# Key line items only.\n"
+    return header + "\n" + table.to_csv()
+
+
+def render_statement(statement: FinancialStatement, mode: str | None = None) -> str:
+    """Render a ``FinancialStatement`` as a CSV report with a short header.
+
+    ``mode`` is "full" (every line item and period) or "compact" (see
+    ``_render_compact``); None uses the configured format for the statement's
+    tool (``statement_format``).
+    """
+    mode = mode or statement_format(statement.kind)
+    if mode == "compact" and not statement.frame.empty:
+        return _render_compact(statement)
+    return _render_full(statement)
+
+
+def cached_record(
+    key: Hashable,
+    fetch: Callable[[], T],
+    ttl: float | None = None,
+    ttl_for: Callable[[T], float | None] | None = None,
+) -> T:
+    """Return the record cached under ``key``, fetching it on a miss.
+
+    Records live in the ``records`` namespace of the configured cache backend,
+    so with a shared backend one node's fetch serves the whole fleet. ``ttl``
+    defaults to ``record_cache_ttl``; 0 disables the cache. Exceptions from
+    ``fetch`` (e.g. ``NoMarketDataError``) are not cached, so a transient
+    failure is retried on the next call. ``ttl_for``, when given, picks the
+    lifetime from the fetched record instead (e.g. shorter for a partial one).
+    """
+    if ttl is None:
+        ttl = get_config_snapshot().get("record_cache_ttl", 0)
+    if not ttl:
+        return fetch()
+    backend = get_cache_backend()
+    record = backend.get(_NAMESPACE, key)
+    if record is not MISS:
+        return record
+    record = fetch()
+    if ttl_for is not None:
+        ttl = ttl_for(record)
+    if ttl:
+        backend.set(_NAMESPACE, key, record, ttl)
+    return record
+
+
+def clear_record_cache() -> None:
+    """Drop every cached record (tests, or to force fresh vendor data)."""
+    get_cache_backend().clear(_NAMESPACE)
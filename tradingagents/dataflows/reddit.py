@@ -10,6 +10,12 @@ off once (honouring ``Retry-After``). RSS lacks score / comment counts, so those
 posts are marked and the formatter omits the metrics rather than printing fake
 zeros.
 
+Subreddits are fetched concurrently; the shared ``reddit`` token bucket
+still paces the requests. Each feed's ``ETag`` / ``Last-Modified`` and parsed
+posts are kept under ``data_cache_dir/reddit``, so an unchanged feed answers a
+conditional GET with ``304`` and is not re-downloaded, and parsed posts are
+reused per (subreddit, ticker) for ``cache_ttls["reddit"]`` seconds.
+
 No API key required. Returns formatted plaintext blocks ready for prompt
 injection and degrades gracefully — returns a placeholder string rather than
 raising, so callers never special-case missing data.
@@ -17,19 +23,29 @@ raising, so callers never special-case missing data.
 
 from __future__ import annotations
 
+import hashlib
 import html
 import http.client
 import json
 import logging
+import os
 import re
+import threading
 import time
 import xml.etree.ElementTree as ET
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from urllib.error import HTTPError
 from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 
+from .cache_backend import MISS, cache_ttl, get_cache_backend
+from .config import get_config_snapshot
+from .errors import VendorRateLimitError
+from .rate_limiter import throttle
+from .records import SocialPost
+
 logger = logging.getLogger(__name__)
 
 _API = "https://www.reddit.com/r/{sub}/search.json?{qs}"
@@ -88,6 +104,38 @@ def _retry_after_seconds(exc: HTTPError) -> float | None:
         return None
 
 
+def _feed_state_path(url: str) -> str:
+    cache_dir = os.path.join(get_config_snapshot()["data_cache_dir"], "reddit")
+    return os.path.join(cache_dir, f"{hashlib.sha1(url.encode()).hexdigest()}.json")
+
+
+def _read_feed_state(url: str) -> dict:
+    """The stored validators and parsed posts for a feed URL ({} if none)."""
+    try:
+        with open(_feed_state_path(url), encoding="utf-8") as fh:
+            state = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) and isinstance(state.get("posts"), list) else {}
+
+
+def _write_feed_state(url: str, headers, posts: list[dict]) -> None:
+    """Persist a feed's ``ETag`` / ``Last-Modified`` with its parsed posts."""
+    etag = headers.get("ETag") if headers is not None else None
+    last_modified = headers.get("Last-Modified") if headers is not None else None
+    if not etag and not last_modified:
+        return  # nothing to revalidate with
+    path = _feed_state_path(url)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"etag": etag, "last_modified": last_modified, "posts": posts}, fh)
+        os.replace(tmp, path)  # atomic, so a concurrent reader never sees half a file
+    except OSError as exc:
+        logger.debug("Could not persist Reddit feed state for %s: %s", url, exc)
+
+
 def _fetch_subreddit_rss(
     ticker: str,
     sub: str,
@@ -101,13 +149,26 @@ def _fetch_subreddit_rss(
     post is tagged ``source="rss"`` for honest display. On a 429 (Reddit's
     per-IP rate limit) we back off once — honouring ``Retry-After`` when
     present — before giving up, so a transient burst doesn't blank the feed.
+    The request is conditional on the feed's stored ``ETag`` /
+    ``Last-Modified``; a ``304`` returns the posts parsed last time.
     """
     url = _RSS.format(sub=sub, qs=_search_qs(ticker, limit))
-    req = Request(url, headers={"User-Agent": _UA})
+    state = _read_feed_state(url)
+    headers = {"User-Agent": _UA}
+    if state.get("etag"):
+        headers["If-None-Match"] = state["etag"]
+    if state.get("last_modified"):
+        headers["If-Modified-Since"] = state["last_modified"]
+    req = Request(url, headers=headers)
     try:
+        throttle("reddit")
         with urlopen(req, timeout=timeout) as resp:
             root = ET.fromstring(resp.read())
+            resp_headers = getattr(resp, "headers", None)
     except HTTPError as exc:
+        if exc.code == 304 and state:
+            logger.debug("Reddit RSS for r/%s · %s unchanged (304)", sub, ticker)
+            return state["posts"]
         if exc.code == 429 and _retry:
             wait = _retry_after_seconds(exc) or 5.0
             logger.warning(
@@ -118,9 +179,10 @@ def _fetch_subreddit_rss(
             return _fetch_subreddit_rss(ticker, sub, limit, timeout, _retry=False)
         logger.warning("Reddit RSS fetch failed for r/%s · %s: %s", sub, ticker, exc)
         return []
-    except (OSError, http.client.HTTPException, ET.ParseError) as exc:
+    except (OSError, http.client.HTTPException, ET.ParseError, VendorRateLimitError) as exc:
         # OSError covers URLError/TimeoutError/connection resets; HTTPException
-        # covers chunked-transfer errors (IncompleteRead/BadStatusLine, #1024).
+        # covers chunked-transfer errors (IncompleteRead/BadStatusLine, #1024);
+        # VendorRateLimitError means the local quota wait ran out.
         logger.warning("Reddit RSS fetch failed for r/%s · %s: %s", sub, ticker, exc)
         return []
 
@@ -139,6 +201,7 @@ def _fetch_subreddit_rss(
             "selftext": _strip_html(content_el.text if content_el is not None else ""),
             "source": "rss",
         })
+    _write_feed_state(url, resp_headers, posts)
     return posts
 
 
@@ -159,11 +222,12 @@ def _fetch_subreddit_json(
     url = _API.format(sub=sub, qs=_search_qs(ticker, limit))
     req = Request(url, headers={"User-Agent": _UA, "Accept": "application/json"})
     try:
+        throttle("reddit")
         with urlopen(req, timeout=timeout) as resp:
             payload = json.loads(resp.read())
         children = (payload.get("data") or {}).get("children") or []
         return [c.get("data", {}) for c in children if isinstance(c, dict)]
-    except (OSError, http.client.HTTPException, json.JSONDecodeError) as exc:
+    except (OSError, http.client.HTTPException, json.JSONDecodeError, VendorRateLimitError) as exc:
         logger.warning(
             "Reddit JSON fetch failed for r/%s · %s: %s — falling back to RSS feed.",
             sub, ticker, exc,
@@ -182,8 +246,72 @@ def _fetch_subreddit(
     The JSON search endpoint is reliably WAF-blocked (403) for public clients,
     so we go straight to the RSS feed — which serves our identified User-Agent
     reliably — halving our request volume against Reddit's per-IP rate limit.
+    Parsed posts are reused for ``cache_ttls["reddit"]`` seconds per
+    (subreddit, ticker).
     """
-    return _fetch_subreddit_rss(ticker, sub, limit, timeout)
+    key = (sub.lower(), ticker.upper(), limit)
+    backend = get_cache_backend()
+    posts = backend.get("reddit", key)
+    if posts is not MISS:
+        return posts
+    posts = _fetch_subreddit_rss(ticker, sub, limit, timeout)
+    # An empty list may be a swallowed failure, so only real posts are kept.
+    if posts:
+        backend.set("reddit", key, posts, cache_ttl("reddit"))
+    return posts
+
+
+def _fetch_all(
+    ticker: str,
+    subreddits: tuple[str, ...],
+    limit_per_sub: int,
+    timeout: float,
+    inter_request_delay: float = 0.0,
+) -> list[list[dict]]:
+    """Posts per subreddit, in ``subreddits`` order (see ``fetch_reddit_posts``)."""
+    if inter_request_delay > 0:
+        results = []
+        for i, sub in enumerate(subreddits):
+            if i > 0:
+                time.sleep(inter_request_delay)
+            results.append(_fetch_subreddit(ticker, sub, limit_per_sub, timeout))
+        return results
+    with ThreadPoolExecutor(
+        max_workers=max(1, len(subreddits)), thread_name_prefix="reddit"
+    ) as pool:
+        return list(
+            pool.map(lambda sub: _fetch_subreddit(ticker, sub, limit_per_sub, timeout), subreddits)
+        )
+
+
+def fetch_reddit_social_posts(
+    ticker: str,
+    subreddits: Iterable[str] = DEFAULT_SUBREDDITS,
+    limit_per_sub: int = 5,
+    timeout: float = 10.0,
+) -> tuple[SocialPost, ...]:
+    """Recent posts mentioning ``ticker`` across ``subreddits`` as ``SocialPost``s.
+
+    Same fetch path as ``fetch_reddit_posts`` (concurrent, conditional GETs,
+    cached per subreddit and ticker); an unreachable subreddit contributes no
+    posts.
+    """
+    subreddits = tuple(subreddits)
+    posts = []
+    for sub, raw in zip(subreddits, _fetch_all(ticker, subreddits, limit_per_sub, timeout), strict=True):
+        for p in raw:
+            created = p.get("created_utc")
+            posts.append(SocialPost(
+                source=f"r/{sub}",
+                author=p.get("author") or "",
+                created_at=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(created)) if created else "",
+                created_ts=created,
+                title=(p.get("title") or "").strip(),
+                body=(p.get("selftext") or "").strip(),
+                score=p.get("score"),
+                num_comments=p.get("num_comments"),
+            ))
+    return tuple(posts)
 
 
 def fetch_reddit_posts(
@@ -191,21 +319,23 @@ def fetch_reddit_posts(
     subreddits: Iterable[str] = DEFAULT_SUBREDDITS,
     limit_per_sub: int = 5,
     timeout: float = 10.0,
-    inter_request_delay: float = 1.0,
+    inter_request_delay: float = 0.0,
 ) -> str:
     """Fetch recent Reddit posts mentioning ``ticker`` across finance
     subreddits and return them as a formatted plaintext block.
 
-    ``inter_request_delay`` paces the (now RSS-only) per-subreddit requests to
-    stay under Reddit's public per-IP rate limit; combined with the RSS-first
-    path it makes 429s rare even when several analyses run back-to-back.
+    Subreddits are fetched concurrently. Requests are paced by the shared
+    ``reddit`` token bucket (see ``vendor_rate_limits``), which keeps every
+    analysis in the process under Reddit's public per-IP limit rather than
+    only this call's own requests. A positive ``inter_request_delay`` fetches
+    the subreddits one at a time instead, with that fixed pause in between.
     """
+    subreddits = tuple(subreddits)
+    results = _fetch_all(ticker, subreddits, limit_per_sub, timeout, inter_request_delay)
+
     blocks = []
     total_posts = 0
-    for i, sub in enumerate(subreddits):
-        if i > 0:
-            time.sleep(inter_request_delay)
-        posts = _fetch_subreddit(ticker, sub, limit_per_sub, timeout)
+    for sub, posts in zip(subreddits, results, strict=True):
         total_posts += len(posts)
         if not posts:
             blocks.append(f"r/{sub}: <no posts found mentioning {ticker.upper()} in the past 7 days>")
@@ -0,0 +1,72 @@
+"""In-flight deduplication ("single-flight") for identical concurrent calls.
+
+When several tickers or analysts run in parallel, identical data requests
+tend to land at the same moment — ``get_global_news`` for one date,
+``get_macro_indicators("cpi", ...)``, or one ticker's ``get_news`` from both
+the sentiment and news analysts. ``SingleFlight.do`` lets the first caller
+for a key perform the fetch while concurrent callers with the same key block
+on its result, so the vendor sees one request instead of N.
+
+Only *concurrent* calls are merged: once the leader finishes, the key is
+forgotten and the next call fetches again. Caching results across time is a
+separate concern. A leader's exception is re-raised in every waiter, since
+they asked the same question and would have hit the same failure.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Collapse concurrent calls that share a key into one execution."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run ``fn`` once per in-flight ``key`` and return its result.
+
+        Callers that arrive while a call for ``key`` is running wait for it
+        and receive the same result (or exception) instead of calling ``fn``.
+        ``fn`` must not re-enter ``do`` with the same key on the same thread.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result
+
+    def in_flight(self) -> int:
+        """Number of keys currently being fetched."""
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,195 @@
+"""Deterministic pre-aggregation of StockTwits and Reddit posts for the prompt.
+
+The sentiment analyst used to receive 30 raw StockTwits messages and up to 15
+Reddit posts with body excerpts and was asked to count and score them itself.
+These functions do the counting locally — label ratios, message velocity,
+top co-mentioned cashtags — and collapse duplicate posts (copy-pasted pump
+messages, cross-posts), so the prompt carries a compact aggregate and a small
+representative sample instead of every post. The same input always renders
+to the same text.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections import Counter
+
+from .records import SocialPost
+
+# $AAPL, $BRK.B — but not dollar amounts like $100.
+_CASHTAG = re.compile(r"\$([A-Za-z]{1,6}(?:\.[A-Za-z]{1,2})?)\b")
+_URL = re.compile(r"https?://\S+")
+_WORD = re.compile(r"\w+")
+
+# Token-set overlap at which two posts count as the same post.
+DUPLICATE_THRESHOLD = 0.8
+
+_LABELS = ("Bullish", "Bearish", None)
+
+
+def cashtags(text: str) -> list[str]:
+    """Upper-cased cashtags mentioned in ``text``, in order."""
+    return [tag.upper() for tag in _CASHTAG.findall(text or "")]
+
+
+def _tokens(post: SocialPost) -> frozenset[str]:
+    text = _CASHTAG.sub(" ", _URL.sub(" ", f"{post.title} {post.body}"))
+    return frozenset(_WORD.findall(text.casefold()))
+
+
+def collapse_duplicates(posts, threshold: float = DUPLICATE_THRESHOLD) -> list[tuple[SocialPost, int]]:
+    """Group posts whose word sets overlap by ``threshold`` (Jaccard) or more.
+
+    Returns ``(representative, copies)`` pairs in input order; the first post
+    of each group represents it. Cashtags and URLs are ignored, so the same
+    message posted under different tickers or links still collapses.
+    """
+    groups: list[list] = []  # [representative, tokens, copies]
+    for post in posts:
+        tokens = _tokens(post)
+        for group in groups:
+            union = len(tokens | group[1])
+            if union and len(tokens & group[1]) / union >= threshold:
+                group[2] += 1
+                break
+        else:
+            groups.append([post, tokens, 1])
+    return [(post, copies) for post, _, copies in groups]
+
+
+def co_mentions(posts, ticker: str, top: int = 5) -> list[tuple[str, int]]:
+    """The ``top`` cashtags mentioned alongside ``ticker``, by number of posts."""
+    own = ticker.upper()
+    counts = Counter(
+        tag
+        for post in posts
+        for tag in set(cashtags(f"{post.title} {post.body}"))
+        if tag != own
+    )
+    return sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:top]
+
+
+def _excerpt(text: str, limit: int) -> str:
+    text = " ".join((text or "").split())
+    return text if len(text) <= limit else text[:limit] + "…"
+
+
+def _co_mention_line(posts, ticker: str) -> str:
+    tags = co_mentions(posts, ticker)
+    if not tags:
+        return "Co-mentioned cashtags: none"
+    return "Co-mentioned cashtags: " + ", ".join(f"${tag} ({n})" for tag, n in tags)
+
+
+def render_stocktwits_aggregate(
+    ticker: str,
+    posts,
+    window_counts: dict | None = None,
+    sample: int = 8,
+    now: float | None = None,
+) -> str:
+    """Compact StockTwits block: counts over every message plus a small sample.
+
+    ``posts`` are newest first. The sample alternates Bullish, Bearish and
+    unlabeled messages (newest first within each label) after duplicates are
+    collapsed, and is listed newest first.
+    """
+    if not posts:
+        return f"<no StockTwits messages found for ${ticker.upper()}>"
+    now = time.time() if now is None else now
+    labels = Counter(post.sentiment for post in posts)
+    bullish, bearish, unlabeled = labels["Bullish"], labels["Bearish"], labels[None]
+    total = len(posts)
+    ratio = f"{bullish / bearish:.1f}" if bearish else ("n/a" if not bullish else "all bullish")
+
+    stamps = [post.created_ts for post in posts if post.created_ts]
+    lines = [
+        f"Aggregate of the {total} most-recent messages"
+        f" ({round(100 * bullish / total)}% Bullish, {round(100 * bearish / total)}% Bearish,"
+        f" {unlabeled} unlabeled; Bull/Bear ratio {ratio})",
+    ]
+    if stamps:
+        span_hours = max((max(stamps) - min(stamps)) / 3600, 1 / 60)
+        recent = sum(1 for ts in stamps if now - ts <= 86400)
+        lines.append(
+            f"Velocity: {total / span_hours:.1f} messages/hour over the last {span_hours:.1f}h;"
+            f" {recent} of them in the past 24h"
+        )
+    for label, counts in (window_counts or {}).items():
+        lines.append(
+            f"Last {label} (all stored messages): Bullish {counts['bullish']}"
+            f" · Bearish {counts['bearish']} · Unlabeled {counts['unlabeled']}"
+        )
+    lines.append(_co_mention_line(posts, ticker))
+
+    distinct = collapse_duplicates(posts)
+    if len(distinct) < total:
+        lines.append(f"Duplicates: {total} messages collapse to {len(distinct)} distinct")
+    by_label = {label: [d for d in distinct if d[0].sentiment == label] for label in _LABELS}
+    chosen = []
+    while len(chosen) < min(sample, len(distinct)):
+        for label in _LABELS:
+            if by_label[label] and len(chosen) < sample:
+                chosen.append(by_label[label].pop(0))
+    chosen.sort(key=lambda d: d[0].created_ts or 0, reverse=True)
+
+    lines.append("")
+    lines.append(f"Representative messages ({len(chosen)} of {len(distinct)} distinct):")
+    for post, copies in chosen:
+        tag = post.sentiment or "no-label"
+        repeat = f" · ×{copies}" if copies > 1 else ""
+        lines.append(f"[{post.created_at} · @{post.author} · {tag}{repeat}] {_excerpt(post.body, 200)}")
+    return "\n".join(lines)
+
+
+def render_reddit_aggregate(
+    ticker: str,
+    posts,
+    subreddits,
+    per_subreddit: int = 2,
+    now: float | None = None,
+) -> str:
+    """Compact Reddit block: per-subreddit counts and velocity plus a few posts.
+
+    Per subreddit, the sample keeps the highest-engagement distinct posts
+    (score + comments) when the feed carries them, else the most recent.
+    """
+    subreddits = tuple(subreddits)
+    if not posts:
+        return (
+            f"<no Reddit posts found mentioning {ticker.upper()} across "
+            f"{', '.join(f'r/{s}' for s in subreddits)} in the past 7 days>"
+        )
+    now = time.time() if now is None else now
+    per_sub = Counter(post.source for post in posts)
+    recent = sum(1 for post in posts if post.created_ts and now - post.created_ts <= 86400)
+    lines = [
+        f"Aggregate of {len(posts)} posts mentioning {ticker.upper()} in the past 7 days: "
+        + ", ".join(f"r/{sub} {per_sub[f'r/{sub}']}" for sub in subreddits),
+        f"Velocity: {recent} in the past 24h; {len(posts) / 7:.1f}/day over the week",
+        _co_mention_line(posts, ticker),
+    ]
+    distinct = collapse_duplicates(posts)
+    if len(distinct) < len(posts):
+        lines.append(f"Duplicates: {len(posts)} posts collapse to {len(distinct)} distinct (cross-posts)")
+
+    lines.append("")
+    lines.append("Representative posts:")
+    for sub in subreddits:
+        candidates = [d for d in distinct if d[0].source == f"r/{sub}"]
+        candidates.sort(
+            key=lambda d: ((d[0].score or 0) + (d[0].num_comments or 0), d[0].created_ts or 0),
+            reverse=True,
+        )
+        for post, copies in candidates[:per_subreddit]:
+            meta = post.created_at[:10] or "?"
+            if post.score is not None and post.num_comments is not None:
+                meta += f" · {post.score}↑ · {post.num_comments}c"
+            if copies > 1:
+                meta += f" · ×{copies}"
+            line = f"r/{sub} [{meta}] {_excerpt(post.title, 160)}"
+            if post.body:
+                line += f"\n    body excerpt: {_excerpt(post.body, 160)}"
+            lines.append(line)
+    return "\n".join(lines)
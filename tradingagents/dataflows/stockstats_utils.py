@@ -8,7 +8,9 @@ import yfinance as yf
 from stockstats import wrap
 from yfinance.exceptions import YFRateLimitError
 
-from .config import get_config
+from .cache_backend import MISS, cache_ttl, get_cache_backend
+from .config import get_config_snapshot
+from .rate_limiter import throttle
 from .symbol_utils import NoMarketDataError, normalize_symbol
 from .utils import safe_ticker_component
 
@@ -25,9 +27,12 @@ def yf_retry(func, max_retries=3, base_delay=2.0):
 
     yfinance raises YFRateLimitError on HTTP 429 responses but does not
     retry them internally. This wrapper adds retry logic specifically
-    for rate limits. Other exceptions propagate immediately.
+    for rate limits. Other exceptions propagate immediately. Every attempt
+    first waits for a token from the shared ``yfinance`` bucket, so bursts
+    from concurrent analyses queue instead of tripping the 429 at all.
     """
     for attempt in range(max_retries + 1):
+        throttle("yfinance")
         try:
             return func()
         except YFRateLimitError:
@@ -135,7 +140,7 @@ def load_ohlcv(symbol: str, curr_date: str) -> pd.DataFrame:
     canonical = normalize_symbol(symbol)
     safe_symbol = safe_ticker_component(canonical)
 
-    config = get_config()
+    config = get_config_snapshot()
     curr_date_dt = pd.to_datetime(curr_date)
 
     # Cache uses a fixed window (5y to today) so one file per symbol.
@@ -153,13 +158,21 @@ def load_ohlcv(symbol: str, curr_date: str) -> pd.DataFrame:
         f"{safe_symbol}-YFin-data-{start_str}-{end_str}.csv",
     )
 
+    # The shared cache backend (Redis on a multi-node deployment) is checked
+    # before the node-local file, so one node's download serves every node.
+    backend = get_cache_backend()
+    cache_key = (canonical, start_str, end_str)
+    data = backend.get("ohlcv", cache_key)
+    # Copy: _clean_dataframe mutates, and the cached frame must stay pristine.
+    data = None if data is MISS else data.copy()
+
     # A cached file may be empty if a prior fetch failed (unknown symbol,
     # transient rate limit). Treat an empty/columnless cache as a miss and
     # re-fetch rather than serving the poisoned file forever.
-    data = None
-    if os.path.exists(data_file):
+    if data is None and os.path.exists(data_file):
         cached = pd.read_csv(data_file, on_bad_lines="skip", encoding="utf-8")
         if not cached.empty and "Close" in cached.columns:
+            backend.set("ohlcv", cache_key, cached.copy(), cache_ttl("ohlcv"))
             data = cached
 
     if data is None:
@@ -178,6 +191,7 @@ def load_ohlcv(symbol: str, curr_date: str) -> pd.DataFrame:
                 symbol, canonical, "Yahoo Finance returned no rows"
             )
         downloaded.to_csv(data_file, index=False, encoding="utf-8")
+        backend.set("ohlcv", cache_key, downloaded.copy(), cache_ttl("ohlcv"))
         data = downloaded
 
     data = _clean_dataframe(data)
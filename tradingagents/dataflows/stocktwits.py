@@ -10,6 +10,9 @@ The function is deliberately self-contained: short timeout, graceful
 degradation on any HTTP or parse failure, and a string return type so
 the calling agent gets a uniform interface regardless of whether the
 network call succeeded.
+
+Messages are kept in a local per-symbol store (``stocktwits_store.py``) so
+repeated calls fetch only messages newer than the stored ones.
 """
 
 from __future__ import annotations
@@ -17,59 +20,101 @@ from __future__ import annotations
 import http.client
 import json
 import logging
+from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 
+from .errors import VendorRateLimitError
+from .rate_limiter import throttle
+from .records import SocialPost
+from .stocktwits_store import ROLLING_WINDOWS, get_stocktwits_store, parse_message
+
 logger = logging.getLogger(__name__)
 
 _API = "https://api.stocktwits.com/api/2/streams/symbol/{ticker}.json"
 _UA = "tradingagents/0.2 (+https://github.com/TauricResearch/TradingAgents)"
 
+# Transport and quota failures the fetcher degrades on. OSError covers
+# URLError/TimeoutError/connection resets; HTTPException covers
+# chunked-transfer errors (IncompleteRead/BadStatusLine, #1024);
+# VendorRateLimitError means the local quota wait ran out.
+_FETCH_ERRORS = (OSError, http.client.HTTPException, json.JSONDecodeError, VendorRateLimitError)
 
-def fetch_stocktwits_messages(ticker: str, limit: int = 30, timeout: float = 10.0) -> str:
-    """Fetch recent StockTwits messages for ``ticker`` and return them as a
-    formatted plaintext block ready for prompt injection.
 
-    Returns a placeholder string when the endpoint is unreachable, the
-    symbol has no messages, or the response shape is unexpected — the
-    caller never has to special-case None or exceptions.
-    """
+def _fetch_stream(
+    ticker: str,
+    timeout: float,
+    since: int | None = None,
+    max_id: int | None = None,
+) -> dict:
+    """One page of the symbol stream, optionally bounded by message-id cursors."""
+    params = {k: v for k, v in (("since", since), ("max", max_id)) if v is not None}
     url = _API.format(ticker=ticker.upper())
+    if params:
+        url += "?" + urlencode(params)
     req = Request(url, headers={"User-Agent": _UA, "Accept": "application/json"})
-    try:
-        with urlopen(req, timeout=timeout) as resp:
-            data = json.loads(resp.read())
-    except (OSError, http.client.HTTPException, json.JSONDecodeError) as exc:
-        # OSError covers URLError/TimeoutError/connection resets; HTTPException
-        # covers chunked-transfer errors (IncompleteRead/BadStatusLine, #1024).
-        logger.warning("StockTwits fetch failed for %s: %s", ticker, exc)
-        return f"<stocktwits unavailable: {type(exc).__name__}>"
+    throttle("stocktwits")
+    with urlopen(req, timeout=timeout) as resp:
+        data = json.loads(resp.read())
+    return data if isinstance(data, dict) else {}
+
 
-    messages = data.get("messages", []) if isinstance(data, dict) else []
-    if not messages:
+def fetch_stocktwits_posts(
+    ticker: str, limit: int = 30, timeout: float = 10.0
+) -> tuple[tuple[SocialPost, ...], dict[str, dict[str, int]]]:
+    """Recent StockTwits messages for ``ticker``, newest first, as ``SocialPost``s.
+
+    Also returns the store's rolling-window sentiment counts (``{}`` with the
+    store disabled). With the store enabled only messages newer than the
+    stored ones are fetched, and stored messages are served if a refresh
+    fails. Raises the transport error when nothing could be fetched or served.
+    """
+    symbol = ticker.upper()
+    store = get_stocktwits_store()
+    if store is not None:
+        try:
+            store.sync(symbol, lambda since, max_id: _fetch_stream(symbol, timeout, since, max_id))
+        except _FETCH_ERRORS as exc:
+            if not store.has_messages(symbol):
+                raise
+            logger.warning("StockTwits fetch failed for %s: %s; serving stored messages", ticker, exc)
+        posts = tuple(
+            SocialPost("stocktwits", user, created, ts, body=body, sentiment=sentiment)
+            for created, user, sentiment, body, ts in store.latest(symbol, limit)
+        )
+        counts = {label: store.window_counts(symbol, hours) for label, hours in ROLLING_WINDOWS.items()}
+        return posts, counts
+
+    data = _fetch_stream(symbol, timeout)
+    posts = tuple(
+        SocialPost("stocktwits", row[3], row[1], row[2], body=row[5], sentiment=row[4])
+        for row in map(parse_message, (data.get("messages") or [])[:limit])
+        if row is not None
+    )
+    return posts, {}
+
+
+def render_stocktwits_posts(ticker: str, posts, window_counts: dict | None = None) -> str:
+    """Format StockTwits ``SocialPost``s (newest first) as the prompt block."""
+    if not posts:
         return f"<no StockTwits messages found for ${ticker.upper()}>"
 
     lines = []
     bullish = bearish = unlabeled = 0
-    for m in messages[:limit]:
-        created = m.get("created_at", "")
-        user = (m.get("user") or {}).get("username", "?")
-        entities = m.get("entities") or {}
-        sentiment_obj = entities.get("sentiment") or {}
-        sentiment = sentiment_obj.get("basic") if isinstance(sentiment_obj, dict) else None
-        body = (m.get("body") or "").replace("\n", " ").strip()
+    for post in posts:
+        body = post.body.replace("\n", " ").strip()
         if len(body) > 280:
             body = body[:280] + "…"
 
-        if sentiment == "Bullish":
+        if post.sentiment == "Bullish":
             bullish += 1
             tag = "Bullish"
-        elif sentiment == "Bearish":
+        elif post.sentiment == "Bearish":
             bearish += 1
             tag = "Bearish"
         else:
             unlabeled += 1
             tag = "no-label"
-        lines.append(f"[{created} · @{user} · {tag}] {body}")
+        lines.append(f"[{post.created_at} · @{post.author} · {tag}] {body}")
 
     total = bullish + bearish + unlabeled
     bull_pct = round(100 * bullish / total) if total else 0
@@ -80,4 +125,30 @@ def fetch_stocktwits_messages(ticker: str, limit: int = 30, timeout: float = 10.
         f"Unlabeled: {unlabeled} · "
         f"Total: {total} most-recent messages"
     )
+    for label, counts in (window_counts or {}).items():
+        summary += (
+            f"\nLast {label}: Bullish {counts['bullish']} · Bearish {counts['bearish']}"
+            f" · Unlabeled {counts['unlabeled']} (all stored messages)"
+        )
     return summary + "\n\n" + "\n".join(lines)
+
+
+def fetch_stocktwits_messages(ticker: str, limit: int = 30, timeout: float = 10.0) -> str:
+    """Fetch recent StockTwits messages for ``ticker`` and return them as a
+    formatted plaintext block ready for prompt injection.
+
+    With the StockTwits store enabled (the default) only messages newer than
+    the stored ones are fetched, and the block adds rolling 24h / 7d sentiment
+    counts over everything stored for the symbol; if a refresh fails, stored
+    messages are served.
+
+    Returns a placeholder string when the endpoint is unreachable, the
+    symbol has no messages, or the response shape is unexpected — the
+    caller never has to special-case None or exceptions.
+    """
+    try:
+        posts, counts = fetch_stocktwits_posts(ticker, limit, timeout)
+    except _FETCH_ERRORS as exc:
+        logger.warning("StockTwits fetch failed for %s: %s", ticker, exc)
+        return f"<stocktwits unavailable: {type(exc).__name__}>"
+    return render_stocktwits_posts(ticker, posts, counts)
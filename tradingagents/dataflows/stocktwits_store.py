@@ -0,0 +1,267 @@
+"""Local per-symbol store for the StockTwits message stream.
+
+``fetch_stocktwits_messages`` downloaded the latest 30 messages on every call
+and counted their sentiment from scratch. Messages now accumulate in a SQLite
+store (``data_cache_dir/stocktwits.sqlite``) keyed by symbol and message id:
+
+* each symbol remembers the newest message id it holds, and a refresh asks
+  the stream only for messages after it (the ``since`` cursor), walking back
+  with ``max`` when more arrived than one page holds;
+* the stream is asked again at most every ``stocktwits_refresh_interval``
+  seconds per symbol;
+* Bullish / Bearish / unlabeled counts are maintained per symbol and hour as
+  messages are inserted, so the rolling-window counts are a sum over a few
+  hourly buckets rather than a recount of messages.
+
+Messages and buckets older than ``RETENTION_DAYS`` are pruned on refresh.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import datetime
+
+from .config import get_config_snapshot
+from .singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+# Rolling windows reported with the stream, label -> hours.
+ROLLING_WINDOWS = {"24h": 24, "7d": 7 * 24}
+
+RETENTION_DAYS = 30
+
+# Most pages one refresh walks back through when many messages arrived.
+MAX_PAGES = 5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    symbol TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    created_ts REAL NOT NULL,
+    username TEXT NOT NULL,
+    sentiment TEXT,
+    body TEXT NOT NULL,
+    PRIMARY KEY (symbol, id)
+);
+CREATE TABLE IF NOT EXISTS sentiment_hours (
+    symbol TEXT NOT NULL,
+    hour INTEGER NOT NULL,
+    bullish INTEGER NOT NULL DEFAULT 0,
+    bearish INTEGER NOT NULL DEFAULT 0,
+    unlabeled INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (symbol, hour)
+);
+CREATE TABLE IF NOT EXISTS stream_cursors (
+    symbol TEXT PRIMARY KEY,
+    newest_id INTEGER,
+    fetched_at REAL NOT NULL
+);
+"""
+
+# One stream page: (since, max) -> the API payload ({"messages", "cursor"}).
+PageFetch = Callable[[int | None, int | None], dict]
+
+
+def _created_ts(created_at: str) -> float | None:
+    try:
+        return datetime.fromisoformat(created_at.replace("Z", "+00:00")).timestamp()
+    except (AttributeError, ValueError):
+        return None
+
+
+def parse_message(message: dict) -> tuple | None:
+    """``(id, created_at, created_ts, username, sentiment, body)``, or None if unusable."""
+    try:
+        message_id = int(message["id"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    created_at = message.get("created_at") or ""
+    created_ts = _created_ts(created_at)
+    if created_ts is None:
+        return None
+    sentiment_obj = (message.get("entities") or {}).get("sentiment") or {}
+    sentiment = sentiment_obj.get("basic") if isinstance(sentiment_obj, dict) else None
+    return (
+        message_id,
+        created_at,
+        created_ts,
+        (message.get("user") or {}).get("username", "?"),
+        sentiment if sentiment in ("Bullish", "Bearish") else None,
+        message.get("body") or "",
+    )
+
+
+class StocktwitsStore:
+    """SQLite-backed StockTwits messages with cursor sync and hourly counts."""
+
+    def __init__(
+        self,
+        path: str,
+        refresh_interval: float = 300,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.refresh_interval = refresh_interval
+        self._clock = clock
+        self._flight = SingleFlight()
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")  # readers overlap a writer
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                conn.executescript(
+                    "DROP TABLE IF EXISTS messages;"
+                    " DROP TABLE IF EXISTS sentiment_hours;"
+                    " DROP TABLE IF EXISTS stream_cursors;"
+                )
+                conn.executescript(_SCHEMA)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # One short-lived connection per operation, as in the other stores.
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # -- writes -------------------------------------------------------------
+
+    def add(self, symbol: str, messages) -> int:
+        """Insert raw stream messages; return how many were new.
+
+        Hourly sentiment buckets are only incremented for messages not seen
+        before, so re-fetching an overlapping page never double-counts.
+        """
+        added = 0
+        with self._connect() as conn:
+            for message in messages:
+                row = parse_message(message)
+                if row is None:
+                    continue
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO messages"
+                    " (symbol, id, created_at, created_ts, username, sentiment, body)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (symbol, *row),
+                )
+                if cursor.rowcount != 1:
+                    continue
+                added += 1
+                column = {"Bullish": "bullish", "Bearish": "bearish"}.get(row[4], "unlabeled")
+                conn.execute(
+                    f"INSERT INTO sentiment_hours (symbol, hour, {column}) VALUES (?, ?, 1)"
+                    f" ON CONFLICT (symbol, hour) DO UPDATE SET {column} = {column} + 1",
+                    (symbol, int(row[2] // 3600)),
+                )
+        return added
+
+    def _prune(self, symbol: str) -> None:
+        cutoff = self._clock() - RETENTION_DAYS * 86400
+        with self._connect() as conn:
+            conn.execute("DELETE FROM messages WHERE symbol=? AND created_ts < ?", (symbol, cutoff))
+            conn.execute(
+                "DELETE FROM sentiment_hours WHERE symbol=? AND hour < ?",
+                (symbol, int(cutoff // 3600)),
+            )
+
+    # -- sync ---------------------------------------------------------------
+
+    def _cursor(self, symbol: str) -> tuple[int | None, float] | None:
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT newest_id, fetched_at FROM stream_cursors WHERE symbol=?", (symbol,)
+            ).fetchone()
+
+    def sync(self, symbol: str, fetch_page: PageFetch) -> None:
+        """Fetch the messages newer than the stored ones, at most once per interval."""
+        cursor = self._cursor(symbol)
+        if cursor is not None and self._clock() - cursor[1] < self.refresh_interval:
+            return
+
+        def _refresh():
+            newest = cursor[0] if cursor else None
+            max_id = None
+            for _ in range(MAX_PAGES):
+                data = fetch_page(newest, max_id)
+                messages = data.get("messages") or []
+                self.add(symbol, messages)
+                ids = [r[0] for r in map(parse_message, messages) if r is not None]
+                # The first fetch takes one page; later ones walk back to the
+                # stored newest id while the stream says more are between.
+                if newest is None or not ids or not (data.get("cursor") or {}).get("more"):
+                    break
+                max_id = min(ids) - 1
+                if max_id <= newest:
+                    break
+            self._prune(symbol)
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO stream_cursors (symbol, newest_id, fetched_at)"
+                    " VALUES (?, (SELECT MAX(id) FROM messages WHERE symbol=?), ?)",
+                    (symbol, symbol, self._clock()),
+                )
+
+        self._flight.do(symbol, _refresh)
+
+    # -- reads --------------------------------------------------------------
+
+    def has_messages(self, symbol: str) -> bool:
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT 1 FROM messages WHERE symbol=? LIMIT 1", (symbol,)
+            ).fetchone() is not None
+
+    def latest(self, symbol: str, limit: int) -> list[tuple[str, str, str | None, str, float]]:
+        """The newest ``limit`` messages as ``(created_at, username, sentiment, body, created_ts)``."""
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT created_at, username, sentiment, body, created_ts FROM messages"
+                " WHERE symbol=? ORDER BY id DESC LIMIT ?",
+                (symbol, limit),
+            ).fetchall()
+
+    def window_counts(self, symbol: str, hours: int) -> dict[str, int]:
+        """Bullish / bearish / unlabeled message counts over the last ``hours`` hours."""
+        since = int(self._clock() // 3600) - hours + 1
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT COALESCE(SUM(bullish), 0), COALESCE(SUM(bearish), 0),"
+                " COALESCE(SUM(unlabeled), 0) FROM sentiment_hours"
+                " WHERE symbol=? AND hour >= ?",
+                (symbol, since),
+            ).fetchone()
+        return dict(zip(("bullish", "bearish", "unlabeled"), row, strict=True))
+
+
+_stores: dict[str, StocktwitsStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_stocktwits_store() -> StocktwitsStore | None:
+    """Return the store for the configured path, or None when ``stocktwits_store`` is off."""
+    config = get_config_snapshot()
+    if not config.get("stocktwits_store", True):
+        return None
+    path = config.get("stocktwits_store_path") or os.path.join(
+        config["data_cache_dir"], "stocktwits.sqlite"
+    )
+    interval = config.get("stocktwits_refresh_interval", 300)
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None or store.refresh_interval != interval:
+            store = _stores[path] = StocktwitsStore(path, refresh_interval=interval)
+        return store
@@ -0,0 +1,158 @@
+"""Batch fundamentals snapshot for a universe of symbols.
+
+Screening a universe used to mean one routed ``get_fundamentals`` call per
+name, each rendered to prose. ``fetch_universe_snapshot`` instead pulls the
+key ``.info`` fields for every symbol concurrently — through the shared
+``get_info`` (so the yfinance rate limiter, the cache backend and the on-disk
+info copies all apply) — into one columnar ``UniverseSnapshot`` frame, one
+row per symbol. ``rank_universe`` turns it into vectorized percentile ranks
+and ``render_universe_context`` into a few lines an analyst can read.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from .cache_backend import cache_ttl
+from .config import get_config_snapshot
+from .records import UniverseSnapshot, cached_record
+from .symbol_utils import normalize_symbol
+from .yfinance_registry import get_info
+
+logger = logging.getLogger(__name__)
+
+# Snapshot column -> yfinance ``.info`` key.
+SNAPSHOT_FIELDS = {
+    "name": "longName",
+    "sector": "sector",
+    "industry": "industry",
+    "market_cap": "marketCap",
+    "trailing_pe": "trailingPE",
+    "forward_pe": "forwardPE",
+    "price_to_book": "priceToBook",
+    "gross_margin": "grossMargins",
+    "operating_margin": "operatingMargins",
+    "profit_margin": "profitMargins",
+    "revenue_growth": "revenueGrowth",
+    "earnings_growth": "earningsGrowth",
+    "return_on_equity": "returnOnEquity",
+    "debt_to_equity": "debtToEquity",
+    "dividend_yield": "dividendYield",
+    "beta": "beta",
+}
+
+_TEXT_FIELDS = ("name", "sector", "industry")
+
+# Columns ranked by default, with the label used in the rendered context.
+RANK_METRICS = {
+    "trailing_pe": "Trailing P/E",
+    "forward_pe": "Forward P/E",
+    "price_to_book": "Price/Book",
+    "gross_margin": "Gross margin",
+    "operating_margin": "Operating margin",
+    "profit_margin": "Profit margin",
+    "revenue_growth": "Revenue growth",
+    "earnings_growth": "Earnings growth",
+    "return_on_equity": "Return on equity",
+    "market_cap": "Market cap",
+}
+
+# Valuation multiples are meaningless when earnings/book value are negative.
+_POSITIVE_ONLY = ("trailing_pe", "forward_pe", "price_to_book")
+
+
+def _snapshot_row(symbol: str) -> dict:
+    try:
+        info = get_info(symbol)
+    except Exception as exc:
+        logger.warning("Universe snapshot: no info for %s (%s)", symbol, exc)
+        info = {}
+    return {column: info.get(key) for column, key in SNAPSHOT_FIELDS.items()}
+
+
+def fetch_universe_snapshot(symbols, max_workers: int | None = None) -> UniverseSnapshot:
+    """Fetch key fundamentals for ``symbols`` concurrently as one table.
+
+    Rows are indexed by canonical symbol in input order (duplicates dropped);
+    symbols with no data get an all-NaN row rather than failing the batch.
+    ``max_workers`` defaults to ``universe_max_workers``. The snapshot is
+    cached for ``cache_ttls["universe"]`` seconds, or only for
+    ``cache_ttls["universe_incomplete"]`` while it has an all-NaN row, so a
+    failed ``.info`` fetch is retried soon instead of dropping that peer from
+    the ranks for hours (the symbols that did load come from ``get_info``'s
+    own cache).
+    """
+    canonicals = tuple(dict.fromkeys(normalize_symbol(s) for s in symbols))
+    if max_workers is None:
+        max_workers = get_config_snapshot().get("universe_max_workers", 16)
+
+    def _fetch() -> UniverseSnapshot:
+        if not canonicals:
+            return UniverseSnapshot(pd.DataFrame(columns=list(SNAPSHOT_FIELDS)))
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(canonicals))),
+            thread_name_prefix="universe",
+        ) as pool:
+            rows = list(pool.map(_snapshot_row, canonicals))
+        frame = pd.DataFrame(rows, index=pd.Index(canonicals, name="symbol"))
+        numeric = [c for c in SNAPSHOT_FIELDS if c not in _TEXT_FIELDS]
+        frame[numeric] = frame[numeric].apply(pd.to_numeric, errors="coerce")
+        return UniverseSnapshot(frame, vendor="yfinance")
+
+    # Hash the symbol list: a 1,500-name tuple would make an unwieldy cache key.
+    digest = hashlib.sha1("\n".join(canonicals).encode()).hexdigest()
+    return cached_record(("universe", digest), _fetch, ttl=cache_ttl("universe"), ttl_for=_snapshot_ttl)
+
+
+def _snapshot_ttl(snapshot: UniverseSnapshot) -> float | None:
+    if snapshot.frame.isna().all(axis=1).any():
+        return cache_ttl("universe_incomplete")
+    return cache_ttl("universe")
+
+
+def rank_universe(
+    snapshot: UniverseSnapshot,
+    metrics=None,
+    by: str | None = None,
+) -> pd.DataFrame:
+    """Percentile rank (0-100, 100 = highest value) of each symbol per metric.
+
+    Ranks are computed column-wise over the whole universe, or within each
+    group of ``by`` (e.g. "sector"). Missing values stay NaN; non-positive
+    valuation multiples are excluded before ranking.
+    """
+    metrics = list(metrics or RANK_METRICS)
+    values = snapshot.frame[metrics].copy()
+    for column in _POSITIVE_ONLY:
+        if column in values:
+            values[column] = values[column].where(values[column] > 0)
+    ranks = values.groupby(snapshot.frame[by]).rank(pct=True) if by else values.rank(pct=True)
+    return (ranks * 100).round(0)
+
+
+def render_universe_context(symbol: str, snapshot: UniverseSnapshot, by: str | None = None) -> str:
+    """Summarize where ``symbol`` sits in the universe, one metric per line."""
+    canonical = normalize_symbol(symbol)
+    frame = snapshot.frame
+    if canonical not in frame.index:
+        return f"{canonical} is not in the screened universe."
+    ranks = rank_universe(snapshot, by=by).loc[canonical]
+    peers = len(frame) if not by else int((frame[by] == frame.at[canonical, by]).sum())
+    scope = f"its {frame.at[canonical, by]} peers" if by else "the universe"
+    lines = [
+        f"# {canonical} percentile ranks vs {scope} (n={peers}; 100 = highest value)"
+    ]
+    for column, label in RANK_METRICS.items():
+        value = frame.at[canonical, column]
+        if pd.isna(value) or pd.isna(ranks[column]):
+            continue
+        population = frame[column]
+        if column in _POSITIVE_ONLY:
+            population = population[population > 0]
+        median = population.median()
+        lines.append(f"{label}: {value:.4g} (pct {ranks[column]:.0f}, median {median:.4g})")
+    return "\n".join(lines)
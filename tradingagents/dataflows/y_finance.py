@@ -2,54 +2,71 @@ from datetime import datetime
 from typing import Annotated
 
 import pandas as pd
-import yfinance as yf
 from dateutil.relativedelta import relativedelta
 
+from .fundamentals_store import statement_as_of
+from .records import (
+    STATEMENT_TITLES,
+    FinancialStatement,
+    PriceBars,
+    cached_record,
+    render_statement,
+)
 from .stockstats_utils import (
     StockstatsUtils,
     _assert_ohlcv_not_stale,
-    filter_financials_by_date,
     load_ohlcv,
     yf_retry,
 )
 from .symbol_utils import NoMarketDataError, normalize_symbol
+from .yfinance_registry import get_info, get_ticker
 
 
-def get_YFin_data_online(
+def fetch_price_bars(
     symbol: Annotated[str, "ticker symbol of the company"],
     start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
     end_date: Annotated[str, "End date in yyyy-mm-dd format"],
-):
-
+) -> PriceBars:
+    """Fetch daily OHLCV bars for ``[start_date, end_date]`` as a ``PriceBars`` record."""
     datetime.strptime(start_date, "%Y-%m-%d")
     end_dt = datetime.strptime(end_date, "%Y-%m-%d")
 
     # Resolve broker/forex symbols to Yahoo's convention (XAUUSD+ -> GC=F).
     canonical = normalize_symbol(symbol)
-    ticker = yf.Ticker(canonical)
-
-    # yfinance treats ``end`` as EXCLUSIVE, so it would drop the requested
-    # end_date row (and the current day when end_date is today). Request one day
-    # past end_date so the requested range is actually inclusive (#986/#987).
-    end_inclusive = (end_dt + relativedelta(days=1)).strftime("%Y-%m-%d")
-    data = yf_retry(lambda: ticker.history(start=start_date, end=end_inclusive))
-
-    # Empty result means the symbol is unknown/delisted. Raise a typed error
-    # instead of returning prose: the routing layer turns it into a single
-    # unambiguous "no data" signal so the agent never fabricates a price.
-    if data.empty:
-        raise NoMarketDataError(
-            symbol, canonical, f"no rows between {start_date} and {end_date}"
-        )
 
-    # Remove timezone info from index for cleaner output
-    if data.index.tz is not None:
-        data.index = data.index.tz_localize(None)
+    def _fetch() -> PriceBars:
+        ticker = get_ticker(canonical)
+
+        # yfinance treats ``end`` as EXCLUSIVE, so it would drop the requested
+        # end_date row (and the current day when end_date is today). Request one
+        # day past end_date so the requested range is actually inclusive (#986/#987).
+        end_inclusive = (end_dt + relativedelta(days=1)).strftime("%Y-%m-%d")
+        data = yf_retry(lambda: ticker.history(start=start_date, end=end_inclusive))
+
+        # Empty result means the symbol is unknown/delisted. Raise a typed error
+        # instead of returning prose: the routing layer turns it into a single
+        # unambiguous "no data" signal so the agent never fabricates a price.
+        if data.empty:
+            raise NoMarketDataError(
+                symbol, canonical, f"no rows between {start_date} and {end_date}"
+            )
+
+        # Remove timezone info from index for cleaner output
+        if data.index.tz is not None:
+            data.index = data.index.tz_localize(None)
+
+        # Reject a stale frame (e.g. a year-old partial response) before it is
+        # formatted into the report. Raises NoMarketDataError, which the router
+        # turns into one clear unavailable signal (#1021).
+        _assert_ohlcv_not_stale(data, end_date, symbol, canonical)
+        return PriceBars(symbol, canonical, start_date, end_date, data, vendor="yfinance")
 
-    # Reject a stale frame (e.g. a year-old partial response) before it is
-    # formatted into the report. Raises NoMarketDataError, which the router
-    # turns into one clear unavailable signal (#1021).
-    _assert_ohlcv_not_stale(data, end_date, symbol, canonical)
+    return cached_record(("yfinance", "price_bars", canonical, start_date, end_date), _fetch)
+
+
+def render_price_bars(bars: PriceBars) -> str:
+    """Render ``PriceBars`` as the CSV report the market analyst reads."""
+    data = bars.frame.copy()
 
     # Round numerical values to 2 decimal places for cleaner display
     numeric_columns = ["Open", "High", "Low", "Close", "Adj Close"]
@@ -62,13 +79,22 @@ def get_YFin_data_online(
 
     # Add header information; note the resolved symbol when it differs so the
     # agent (and user) can see which instrument was actually priced.
+    symbol, canonical = bars.symbol, bars.canonical
     label = canonical if canonical == symbol.upper() else f"{canonical} (from {symbol})"
-    header = f"# Stock data for {label} from {start_date} to {end_date}\n"
+    header = f"# Stock data for {label} from {bars.start_date} to {bars.end_date}\n"
     header += f"# Total records: {len(data)}\n"
-    header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    header += f"# Data retrieved on: {bars.retrieved_at.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
 
     return header + csv_string
 
+
+def get_YFin_data_online(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format"],
+):
+    return render_price_bars(fetch_price_bars(symbol, start_date, end_date))
+
 def get_stock_stats_indicators_window(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicator: Annotated[str, "technical indicator to get the analysis and report of"],
@@ -278,8 +304,8 @@ def get_fundamentals(
     """Get company fundamentals overview from yfinance."""
     canonical = normalize_symbol(ticker)
     try:
-        ticker_obj = yf.Ticker(canonical)
-        info = yf_retry(lambda: ticker_obj.info)
+        # Shared with instrument-identity resolution: one .info fetch per symbol.
+        info = get_info(canonical)
 
         if not info:
             raise NoMarketDataError(ticker, canonical, "no fundamentals returned")
@@ -338,74 +364,67 @@ def get_fundamentals(
         return f"Error retrieving fundamentals for {ticker}: {str(e)}"
 
 
-def get_balance_sheet(
-    ticker: Annotated[str, "ticker symbol of the company"],
-    freq: Annotated[str, "frequency of data: 'annual' or 'quarterly'"] = "quarterly",
-    curr_date: Annotated[str, "current date in YYYY-MM-DD format"] = None
-):
-    """Get balance sheet data from yfinance."""
-    canonical = normalize_symbol(ticker)
-    try:
-        ticker_obj = yf.Ticker(canonical)
+# yfinance attribute names per statement kind: (quarterly, annual).
+_STATEMENT_ATTRS = {
+    "balance_sheet": ("quarterly_balance_sheet", "balance_sheet"),
+    "cashflow": ("quarterly_cashflow", "cashflow"),
+    "income_statement": ("quarterly_income_stmt", "income_stmt"),
+}
 
-        if freq.lower() == "quarterly":
-            data = yf_retry(lambda: ticker_obj.quarterly_balance_sheet)
-        else:
-            data = yf_retry(lambda: ticker_obj.balance_sheet)
 
-        data = filter_financials_by_date(data, curr_date)
+def fetch_statement(
+    ticker: str,
+    kind: str,
+    freq: str = "quarterly",
+    curr_date: str | None = None,
+) -> FinancialStatement:
+    """Fetch one financial statement as a ``FinancialStatement`` record.
 
-        if data.empty:
-            raise NoMarketDataError(ticker, canonical, "no balance sheet data")
+    Served from the point-in-time fundamentals store: only periods that
+    ended on or before ``curr_date`` are returned, and Yahoo is asked again
+    only when a newer period could have been reported.
+    """
+    canonical = normalize_symbol(ticker)
+    quarterly = freq.lower() == "quarterly"
+    attr = _STATEMENT_ATTRS[kind][0 if quarterly else 1]
 
-        # Convert to CSV string for consistency with other functions
-        csv_string = data.to_csv()
+    def _fetch() -> FinancialStatement:
+        ticker_obj = get_ticker(canonical)
+        data = yf_retry(lambda: getattr(ticker_obj, attr))
+        return FinancialStatement(ticker, canonical, kind, freq, data, vendor="yfinance")
 
-        # Add header information
-        header = f"# Balance Sheet data for {canonical} ({freq})\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    statement = statement_as_of("yfinance", canonical, kind, freq, curr_date, _fetch, ticker)
+    if statement.frame.empty:
+        raise NoMarketDataError(ticker, canonical, f"no {statement.title.lower()} data")
+    return statement
 
-        return header + csv_string
 
+def _get_statement(ticker: str, kind: str, freq: str, curr_date: str | None) -> str:
+    try:
+        return render_statement(fetch_statement(ticker, kind, freq, curr_date))
     except NoMarketDataError:
         raise
     except Exception as e:
-        return f"Error retrieving balance sheet for {ticker}: {str(e)}"
+        title = STATEMENT_TITLES[kind].lower()
+        return f"Error retrieving {title} for {ticker}: {str(e)}"
 
 
-def get_cashflow(
+def get_balance_sheet(
     ticker: Annotated[str, "ticker symbol of the company"],
     freq: Annotated[str, "frequency of data: 'annual' or 'quarterly'"] = "quarterly",
     curr_date: Annotated[str, "current date in YYYY-MM-DD format"] = None
 ):
-    """Get cash flow data from yfinance."""
-    canonical = normalize_symbol(ticker)
-    try:
-        ticker_obj = yf.Ticker(canonical)
-
-        if freq.lower() == "quarterly":
-            data = yf_retry(lambda: ticker_obj.quarterly_cashflow)
-        else:
-            data = yf_retry(lambda: ticker_obj.cashflow)
-
-        data = filter_financials_by_date(data, curr_date)
-
-        if data.empty:
-            raise NoMarketDataError(ticker, canonical, "no cash flow data")
-
-        # Convert to CSV string for consistency with other functions
-        csv_string = data.to_csv()
-
-        # Add header information
-        header = f"# Cash Flow data for {canonical} ({freq})\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    """Get balance sheet data from yfinance."""
+    return _get_statement(ticker, "balance_sheet", freq, curr_date)
 
-        return header + csv_string
 
-    except NoMarketDataError:
-        raise
-    except Exception as e:
-        return f"Error retrieving cash flow for {ticker}: {str(e)}"
+def get_cashflow(
+    ticker: Annotated[str, "ticker symbol of the company"],
+    freq: Annotated[str, "frequency of data: 'annual' or 'quarterly'"] = "quarterly",
+    curr_date: Annotated[str, "current date in YYYY-MM-DD format"] = None
+):
+    """Get cash flow data from yfinance."""
+    return _get_statement(ticker, "cashflow", freq, curr_date)
 
 
 def get_income_statement(
@@ -414,33 +433,7 @@ def get_income_statement(
     curr_date: Annotated[str, "current date in YYYY-MM-DD format"] = None
 ):
     """Get income statement data from yfinance."""
-    canonical = normalize_symbol(ticker)
-    try:
-        ticker_obj = yf.Ticker(canonical)
-
-        if freq.lower() == "quarterly":
-            data = yf_retry(lambda: ticker_obj.quarterly_income_stmt)
-        else:
-            data = yf_retry(lambda: ticker_obj.income_stmt)
-
-        data = filter_financials_by_date(data, curr_date)
-
-        if data.empty:
-            raise NoMarketDataError(ticker, canonical, "no income statement data")
-
-        # Convert to CSV string for consistency with other functions
-        csv_string = data.to_csv()
-
-        # Add header information
-        header = f"# Income Statement data for {canonical} ({freq})\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-
-        return header + csv_string
-
-    except NoMarketDataError:
-        raise
-    except Exception as e:
-        return f"Error retrieving income statement for {ticker}: {str(e)}"
+    return _get_statement(ticker, "income_statement", freq, curr_date)
 
 
 def get_insider_transactions(
@@ -449,7 +442,7 @@ def get_insider_transactions(
     """Get insider transactions data from yfinance."""
     canonical = normalize_symbol(ticker)
     try:
-        ticker_obj = yf.Ticker(canonical)
+        ticker_obj = get_ticker(canonical)
         data = yf_retry(lambda: ticker_obj.insider_transactions)
 
         # Empty is normal here (many valid symbols have no insider filings),
@@ -1,14 +1,22 @@
 """yfinance-based news data fetching functions."""
 
 import contextlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import yfinance as yf
 from dateutil.relativedelta import relativedelta
 
-from .config import get_config
+from .cache_backend import cache_ttl
+from .config import get_config_snapshot
+from .news_store import stored_news
+from .records import NewsArticle, cached_record
 from .stockstats_utils import yf_retry
 from .symbol_utils import normalize_symbol
+from .yfinance_registry import get_ticker
+
+logger = logging.getLogger(__name__)
 
 
 def _extract_article_data(article: dict) -> dict:
@@ -57,6 +65,83 @@ def _extract_article_data(article: dict) -> dict:
         }
 
 
+def _to_article(article: dict) -> NewsArticle:
+    return NewsArticle(**_extract_article_data(article))
+
+
+def fetch_ticker_news(canonical: str, limit: int) -> tuple[NewsArticle, ...]:
+    """Fetch the latest ``limit`` Yahoo news items for a ticker (unfiltered)."""
+    def _fetch():
+        stock = get_ticker(canonical)
+        news = yf_retry(lambda: stock.get_news(count=limit))
+        return tuple(_to_article(a) for a in news or ())
+
+    return cached_record(("yfinance", "news", canonical, limit), _fetch)
+
+
+def search_news(query: str, limit: int, date: str | None = None) -> tuple[NewsArticle, ...]:
+    """Run one Yahoo news search and return its articles (unfiltered).
+
+    Search results don't depend on the ticker, so with ``date`` they are
+    cached per (query, date) for ``cache_ttls["global_news"]`` seconds and
+    every ticker analysed for that date reuses them.
+    """
+    def _fetch():
+        search = yf_retry(lambda: yf.Search(
+            query=query,
+            news_count=limit,
+            enable_fuzzy_query=True,
+        ))
+        return tuple(_to_article(a) for a in search.news or ())
+
+    if date is None:
+        return cached_record(("yfinance", "search", query, limit), _fetch)
+    return cached_record(
+        ("yfinance", "search", query, limit, date), _fetch, ttl=cache_ttl("global_news")
+    )
+
+
+def _search_all(queries, limit: int, date: str) -> list[tuple[NewsArticle, ...]]:
+    """Run every query concurrently; results come back in query order.
+
+    A failed query is logged and contributes nothing, so one bad search
+    doesn't cost the others; if every query fails the first error is raised.
+    """
+    if not queries:
+        return []
+    with ThreadPoolExecutor(max_workers=len(queries), thread_name_prefix="news-search") as pool:
+        futures = [pool.submit(search_news, query, limit, date) for query in queries]
+    results, errors = [], []
+    for query, future in zip(queries, futures, strict=True):
+        try:
+            results.append(future.result())
+        except Exception as e:
+            logger.warning("Global news query %r failed: %s", query, e)
+            errors.append(e)
+    if errors and len(errors) == len(queries):
+        raise errors[0]
+    return results
+
+
+def _title_key(title: str) -> str:
+    return " ".join(title.casefold().split())
+
+
+def render_articles(articles) -> str:
+    """Render articles as the markdown blocks the news analyst reads."""
+    news_str = ""
+    for article in articles:
+        news_str += f"### {article.title} (source: {article.publisher})\n"
+        if article.sentiment:
+            news_str += f"Sentiment: {article.sentiment}\n"
+        if article.summary:
+            news_str += f"{article.summary}\n"
+        if article.link:
+            news_str += f"Link: {article.link}\n"
+        news_str += "\n"
+    return news_str
+
+
 def _in_news_window(pub_date, start_dt, end_dt) -> bool:
     """Whether an article belongs in the [start_dt, end_dt] window.
 
@@ -87,44 +172,34 @@ def get_news_yfinance(
     Returns:
         Formatted string containing news articles
     """
-    article_limit = get_config()["news_article_limit"]
+    article_limit = get_config_snapshot()["news_article_limit"]
     # Query Yahoo with the canonical symbol, like every other yfinance path —
     # a raw broker/forex/crypto alias (XAUUSD, BTCUSD) otherwise silently
     # returns no news. Keep the user's ticker in the report header.
     canonical = normalize_symbol(ticker)
     resolved = "" if canonical == ticker else f" (resolved to {canonical})"
     try:
-        stock = yf.Ticker(canonical)
-        news = yf_retry(lambda: stock.get_news(count=article_limit))
-
-        if not news:
-            return f"No news found for {ticker}{resolved}"
-
-        # Parse date range for filtering
         start_dt = datetime.strptime(start_date, "%Y-%m-%d")
         end_dt = datetime.strptime(end_date, "%Y-%m-%d")
 
-        news_str = ""
-        filtered_count = 0
-
-        for article in news:
-            data = _extract_article_data(article)
-
+        # Served from the news store, deduplicated across publishers and runs.
+        # Yahoo's feed has no date filter — it always returns the latest items —
+        # so a refresh just pulls the feed again and the store keeps what's new.
+        in_window = stored_news(
+            "yfinance",
+            canonical,
+            start_dt,
+            end_dt,
+            lambda _from, _to: fetch_ticker_news(canonical, article_limit),
             # Keep only articles within the requested window (look-ahead safe).
-            if not _in_news_window(data["pub_date"], start_dt, end_dt):
-                continue
-
-            news_str += f"### {data['title']} (source: {data['publisher']})\n"
-            if data["summary"]:
-                news_str += f"{data['summary']}\n"
-            if data["link"]:
-                news_str += f"Link: {data['link']}\n"
-            news_str += "\n"
-            filtered_count += 1
-
-        if filtered_count == 0:
+            keep=lambda a: _in_news_window(a.pub_date, start_dt, end_dt),
+            ranged=False,
+        )[:article_limit]
+
+        if not in_window:
             return f"No news found for {ticker}{resolved} between {start_date} and {end_date}"
 
+        news_str = render_articles(in_window)
         return f"## {ticker}{resolved} News, from {start_date} to {end_date}:\n\n{news_str}"
 
     except Exception as e:
@@ -149,42 +224,16 @@ def get_global_news_yfinance(
     Returns:
         Formatted string containing global news articles
     """
-    config = get_config()
+    config = get_config_snapshot()
     if look_back_days is None:
         look_back_days = config["global_news_lookback_days"]
     if limit is None:
         limit = config["global_news_article_limit"]
     search_queries = config["global_news_queries"]
 
-    all_news = []
-    seen_titles = set()
-
     try:
-        for query in search_queries:
-            search = yf_retry(lambda q=query: yf.Search(
-                query=q,
-                news_count=limit,
-                enable_fuzzy_query=True,
-            ))
-
-            if search.news:
-                for article in search.news:
-                    # Handle both flat and nested structures
-                    if "content" in article:
-                        data = _extract_article_data(article)
-                        title = data["title"]
-                    else:
-                        title = article.get("title", "")
-
-                    # Deduplicate by title
-                    if title and title not in seen_titles:
-                        seen_titles.add(title)
-                        all_news.append(article)
-
-            if len(all_news) >= limit:
-                break
-
-        if not all_news:
+        results = _search_all(search_queries, limit, curr_date)
+        if not any(results):
             return f"No global news found for {curr_date}"
 
         # Calculate date range
@@ -192,27 +241,28 @@ def get_global_news_yfinance(
         start_dt = curr_dt - relativedelta(days=look_back_days)
         start_date = start_dt.strftime("%Y-%m-%d")
 
-        news_str = ""
-        kept = 0
-        for article in all_news[:limit]:
-            # Extract uniformly (flat + nested) and apply the same look-ahead-safe
-            # window filter, so flat articles can't leak future news (#1007).
-            data = _extract_article_data(article)
-            if not _in_news_window(data["pub_date"], start_dt, curr_dt):
-                continue
-            news_str += f"### {data['title']} (source: {data['publisher']})\n"
-            if data["summary"]:
-                news_str += f"{data['summary']}\n"
-            if data["link"]:
-                news_str += f"Link: {data['link']}\n"
-            news_str += "\n"
-            kept += 1
+        # Window filter first (look-ahead safe for flat, epoch-dated articles
+        # too, #1007), then dedup by title across all queries. Deduping first
+        # let an out-of-window copy shadow an in-window one and spent the
+        # limit on articles the filter then dropped.
+        in_window = []
+        seen_titles = set()
+        for articles in results:
+            for article in articles:
+                if not article.title or not _in_news_window(article.pub_date, start_dt, curr_dt):
+                    continue
+                key = _title_key(article.title)
+                if key not in seen_titles:
+                    seen_titles.add(key)
+                    in_window.append(article)
+        in_window = in_window[:limit]
 
         # All candidates fell outside the window -> say so rather than return an
         # empty-bodied report (#993).
-        if kept == 0:
+        if not in_window:
             return f"No global news found between {start_date} and {curr_date}"
 
+        news_str = render_articles(in_window)
         return f"## Global Market News, from {start_date} to {curr_date}:\n\n{news_str}"
 
     except Exception as e:
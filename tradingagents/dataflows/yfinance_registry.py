@@ -0,0 +1,123 @@
+"""Shared yfinance ``Ticker`` objects and ``.info`` payloads.
+
+One run used to build a fresh ``yf.Ticker`` for identity resolution, another
+for fundamentals and one per statement, and fetched ``.info`` (one of Yahoo's
+slowest, most rate-limited endpoints) at least twice per symbol. This module
+keeps one ``Ticker`` per canonical symbol and one ``.info`` payload that every
+consumer shares:
+
+* ``get_ticker`` — thread-safe registry of ``yf.Ticker`` objects, refreshed
+  after the ``info`` TTL so long-lived processes don't pin stale sessions;
+* ``get_info`` — the symbol's ``.info`` dict, served from the cache backend,
+  then an on-disk JSON copy under ``data_cache_dir/info`` (survives restarts),
+  then Yahoo. Concurrent first requests for a symbol share one fetch.
+
+Both honor ``cache_ttls["info"]`` (seconds).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+
+import yfinance as yf
+
+from .cache_backend import MISS, cache_ttl, get_cache_backend
+from .config import get_config_snapshot
+from .singleflight import SingleFlight
+from .stockstats_utils import yf_retry
+from .symbol_utils import normalize_symbol
+from .utils import safe_ticker_component
+
+logger = logging.getLogger(__name__)
+
+# Fallback lifetime when ``cache_ttls`` has no ``info`` entry.
+DEFAULT_INFO_TTL = 6 * 3600
+
+_tickers: dict[str, tuple[float, yf.Ticker]] = {}
+_tickers_lock = threading.Lock()
+_info_flight = SingleFlight()
+
+
+def _info_ttl() -> float:
+    ttl = cache_ttl("info")
+    return DEFAULT_INFO_TTL if ttl is None else ttl
+
+
+def get_ticker(symbol: str) -> yf.Ticker:
+    """Return the shared ``yf.Ticker`` for ``symbol`` (normalized first)."""
+    canonical = normalize_symbol(symbol)
+    now = time.monotonic()
+    with _tickers_lock:
+        entry = _tickers.get(canonical)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        ticker = yf.Ticker(canonical)
+        _tickers[canonical] = (now + _info_ttl(), ticker)
+        return ticker
+
+
+def _disk_path(canonical: str) -> str:
+    cache_dir = os.path.join(get_config_snapshot()["data_cache_dir"], "info")
+    return os.path.join(cache_dir, f"{safe_ticker_component(canonical)}.json")
+
+
+def _read_disk(canonical: str, ttl: float) -> dict | None:
+    path = _disk_path(canonical)
+    try:
+        with open(path, encoding="utf-8") as fh:
+            payload = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict):
+        return None  # valid JSON but not ours (e.g. ``null``): refetch
+    if time.time() - payload.get("fetched_at", 0) > ttl:
+        return None
+    info = payload.get("info")
+    return info if isinstance(info, dict) and info else None
+
+
+def _write_disk(canonical: str, info: dict) -> None:
+    path = _disk_path(canonical)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"fetched_at": time.time(), "info": info}, fh, default=str)
+        os.replace(tmp, path)  # atomic, so a concurrent reader never sees half a file
+    except OSError as exc:
+        logger.debug("Could not persist yfinance info for %s: %s", canonical, exc)
+
+
+def _load_info(canonical: str) -> dict:
+    ttl = _info_ttl()
+    info = _read_disk(canonical, ttl)
+    if info is None:
+        info = yf_retry(lambda: get_ticker(canonical).info) or {}
+        if info:
+            _write_disk(canonical, info)
+    if info:
+        get_cache_backend().set("info", canonical, info, ttl)
+    return info
+
+
+def get_info(symbol: str) -> dict:
+    """Return ``yf.Ticker(symbol).info``, shared across consumers and restarts.
+
+    Empty payloads (unknown symbols) are returned but never cached. The dict
+    is a copy, so callers may mutate it.
+    """
+    canonical = normalize_symbol(symbol)
+    info = get_cache_backend().get("info", canonical)
+    if info is MISS:
+        info = _info_flight.do(canonical, lambda: _load_info(canonical))
+    return dict(info)
+
+
+def clear_ticker_registry() -> None:
+    """Forget every shared ``Ticker`` (tests, or after changing yfinance sessions)."""
+    with _tickers_lock:
+        _tickers.clear()
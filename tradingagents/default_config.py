@@ -17,6 +17,7 @@ _ENV_OVERRIDES = {
     "TRADINGAGENTS_MAX_RISK_ROUNDS":      "max_risk_discuss_rounds",
     "TRADINGAGENTS_CHECKPOINT_ENABLED":   "checkpoint_enabled",
     "TRADINGAGENTS_BENCHMARK_TICKER":     "benchmark_ticker",
+    "TRADINGAGENTS_CACHE_BACKEND":        "cache_backend",
     "TRADINGAGENTS_TEMPERATURE":          "temperature",
     # Provider-specific reasoning/thinking knobs (None = each provider's own
     # default). Settable here for non-interactive runs; the CLI also offers an
@@ -137,6 +138,139 @@ DEFAULT_CONFIG = _apply_env_overrides({
     "tool_vendors": {
         # Example: "get_stock_data": "alpha_vantage",  # Override category default
     },
+    # Cache backend for vendor data (OHLCV, vendor records, instrument
+    # identity). "memory" keeps it per process; "redis" shares it across every
+    # node pointing at cache_redis_url, namespaced under cache_namespace.
+    "cache_backend": "memory",
+    "cache_redis_url": os.getenv("TRADINGAGENTS_REDIS_URL", "redis://localhost:6379/0"),
+    "cache_namespace": "tradingagents",
+    # Per-namespace lifetimes in seconds (None = no expiry). The OHLCV key
+    # already rolls over daily; identity changes only on corporate actions.
+    "cache_ttls": {
+        "info": 6 * 3600,       # yfinance .info payloads (also kept on disk)
+        "ohlcv": 24 * 3600,
+        "identity": 7 * 24 * 3600,
+        "universe": 6 * 3600,   # batch fundamentals snapshots
+        "universe_incomplete": 5 * 60,  # ...with a symbol whose info failed
+        "global_news": 6 * 3600,  # global news searches, per (query, date)
+        "polymarket_catalogue": 15 * 60,  # open-market catalogue refresh
+        "reddit": 10 * 60,      # parsed Reddit posts, per (subreddit, ticker)
+    },
+    # Seconds to keep fetched vendor records (price bars, statements, news,
+    # macro series, market odds) in process, so repeated tool calls within a
+    # run reuse them instead of re-fetching. 0 disables the cache.
+    "record_cache_ttl": 900,
+    # Point-in-time store for financial statements (SQLite, by default at
+    # data_cache_dir/fundamentals.sqlite). As-of queries are served locally;
+    # the vendor is asked again only once a newer fiscal period has ended,
+    # and at most every ``fundamentals_refresh_interval`` seconds while its
+    # filing is pending. False re-downloads statements as before.
+    "fundamentals_store": True,
+    "fundamentals_store_path": None,
+    "fundamentals_refresh_interval": 24 * 3600,
+    # How statement tools (get_balance_sheet, get_cashflow,
+    # get_income_statement) render: "full" dumps every line item and period;
+    # "compact" keeps key line items, the latest ``periods`` columns, values
+    # divided by ``unit``, and QoQ/YoY changes — a fraction of the tokens.
+    # ``tool_statement_formats`` overrides per tool, e.g.
+    # {"get_balance_sheet": "compact"}. ``line_items`` maps a statement kind
+    # to its whitelist (defaults: records.COMPACT_LINE_ITEMS).
+    "statement_format": "full",
+    "tool_statement_formats": {},
+    "compact_statement": {"periods": 4, "unit": 1e6, "line_items": {}},
+    # Universe screened by the fundamentals analyst: when non-empty, its
+    # prompt gets the ticker's percentile ranks (P/E, margins, growth, ...)
+    # against these symbols, from one concurrent batch snapshot.
+    "fundamentals_universe": [],
+    "universe_max_workers": 16,
+    # Ticker-news store (SQLite, by default at data_cache_dir/news.sqlite):
+    # articles are kept across runs, deduplicated by canonical URL, content
+    # hash and MinHash near-duplicate detection (``news_dedup_threshold`` is
+    # the estimated similarity at which two articles count as one story), and
+    # the vendor is asked for newer articles at most every
+    # ``news_refresh_interval`` seconds. False fetches on every call.
+    "news_store": True,
+    "news_store_path": None,
+    "news_refresh_interval": 3600,
+    "news_dedup_threshold": 0.8,
+    # FRED store (SQLite, by default at data_cache_dir/fred.sqlite): series
+    # metadata is kept for ``fred_metadata_ttl`` seconds and observations
+    # accumulate per series, so look-back windows are served locally and only
+    # observations newer than the last stored one are requested — at most
+    # every ``fred_refresh_interval`` seconds for the present. False fetches
+    # metadata and the whole window on every call.
+    "fred_store": True,
+    "fred_store_path": None,
+    "fred_metadata_ttl": 7 * 24 * 3600,
+    "fred_refresh_interval": 6 * 3600,
+    # Answer prediction-market topics from a local catalogue of the
+    # ``polymarket_catalogue_size`` most-traded open markets (refreshed per
+    # cache_ttls["polymarket_catalogue"]); topics it can't match fall back to
+    # Polymarket's search. False searches on every new topic.
+    "polymarket_catalogue": True,
+    "polymarket_catalogue_size": 2000,
+    # StockTwits store (SQLite, by default at data_cache_dir/stocktwits.sqlite):
+    # messages accumulate per symbol, a refresh asks only for messages newer
+    # than the stored ones (since/max cursors) at most every
+    # ``stocktwits_refresh_interval`` seconds, and rolling 24h/7d sentiment
+    # counts are kept per hour. False fetches the latest page on every call.
+    "stocktwits_store": True,
+    "stocktwits_store_path": None,
+    "stocktwits_refresh_interval": 300,
+    # Per-source deadlines (seconds) for the sentiment analyst's concurrent
+    # news / StockTwits / Reddit pre-fetch; a source that misses its deadline
+    # is replaced by an "unavailable" placeholder. Omitted sources use
+    # sentiment_analyst.DEFAULT_SOURCE_TIMEOUTS.
+    "sentiment_source_timeouts": {"news": 45, "stocktwits": 20, "reddit": 45},
+    # Hand the sentiment analyst locally computed StockTwits / Reddit
+    # aggregates (label ratios, velocity, co-mentioned cashtags, duplicates
+    # collapsed) with a small representative sample instead of every raw
+    # post. False injects the raw messages and posts as before.
+    "sentiment_aggregate": True,
+    "sentiment_sample_messages": 8,
+    "sentiment_sample_posts_per_subreddit": 2,
+    # Merge identical vendor calls that are in flight at the same time (e.g.
+    # parallel analysts fetching the same day's global news) into one request.
+    "coalesce_vendor_calls": True,
+    # Fetch the fundamentals analyst's overview and three statements
+    # concurrently at node start and hand them to the LLM directly, instead of
+    # four sequential tool rounds. Prefetched results also answer the matching
+    # tool calls for ``prefetch_ttl`` seconds.
+    "prefetch_fundamentals": True,
+    "prefetch_ttl": 600,
+    # Run the selected analysts as concurrent graph branches, each with its
+    # own message list, joining before the Bull Researcher. Wall time becomes
+    # the slowest analyst instead of the sum of all four; False keeps the
+    # sequential Market -> Sentiment -> News -> Fundamentals chain.
+    "parallel_analysts": False,
+    # Run each debate round as one node whose speakers answer the previous
+    # round concurrently (Bull and Bear; Aggressive, Conservative and Neutral),
+    # merged in that order. False keeps strictly alternating turns.
+    "parallel_debate": False,
+    # Most apropagate() runs one TradingAgentsGraph executes at once; further
+    # calls wait for a slot on the event loop. Also the default batch width of
+    # propagate_many().
+    "max_concurrent_runs": 8,
+    # Memoize tool calls within one propagate(): an identical call repeated by
+    # the same or another analyst returns the first result (see tool_memo.py).
+    "tool_memo": True,
+    # Proactive per-vendor throttling: callers wait for a token instead of
+    # spending requests on 429s. ``requests`` per ``period`` seconds, with up
+    # to ``burst`` (default: ``requests``) sent back-to-back. Vendors without
+    # an entry are not throttled. Raise alpha_vantage for premium keys.
+    "vendor_rate_limits": {
+        "alpha_vantage": {"requests": 5, "period": 60},
+        "yfinance": {"requests": 2000, "period": 3600, "burst": 30},
+        "reddit": {"requests": 30, "period": 60, "burst": 3},
+        "stocktwits": {"requests": 200, "period": 3600, "burst": 10},
+        "fred": {"requests": 120, "period": 60},
+    },
+    # Longest a caller queues for a token before giving up with a rate-limit
+    # error (the router then tries the next configured vendor).
+    "rate_limit_max_wait": 120,
+    # Directory for file-backed buckets so several processes on one host share
+    # a single quota. None keeps the buckets per process.
+    "rate_limit_shared_dir": None,
     # Benchmark for alpha calculation in the reflection layer.
     # ``benchmark_ticker`` (when set) overrides the suffix map for all
     # tickers; leave it None to use ``benchmark_map`` for auto-detection
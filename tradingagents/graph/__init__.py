@@ -1,6 +1,8 @@
 # TradingAgents/graph/__init__.py
 
+from .batch import BatchRequest, BatchResult
 from .conditional_logic import ConditionalLogic
+from .process_pool import ProcessBatchRunner
 from .propagation import Propagator
 from .reflection import Reflector
 from .setup import GraphSetup
@@ -9,6 +11,9 @@ from .trading_graph import TradingAgentsGraph
 
 __all__ = [
     "TradingAgentsGraph",
+    "BatchRequest",
+    "BatchResult",
+    "ProcessBatchRunner",
     "ConditionalLogic",
     "GraphSetup",
     "Propagator",
@@ -15,6 +15,9 @@ class AnalystNodeSpec:
 @dataclass(frozen=True)
 class AnalystExecutionPlan:
     specs: list[AnalystNodeSpec]
+    # True when the analysts run as concurrent graph branches rather than
+    # one after another; every analyst is then active from the start.
+    parallel: bool = False
 
 
 ANALYST_NODE_SPECS: dict[str, AnalystNodeSpec] = {
@@ -55,6 +58,7 @@ ANALYST_NODE_SPECS: dict[str, AnalystNodeSpec] = {
 
 def build_analyst_execution_plan(
     selected_analysts: Iterable[str],
+    parallel: bool = False,
 ) -> AnalystExecutionPlan:
     specs: list[AnalystNodeSpec] = []
     for analyst_key in selected_analysts:
@@ -66,7 +70,7 @@ def build_analyst_execution_plan(
     if not specs:
         raise ValueError("at least one analyst must be selected")
 
-    return AnalystExecutionPlan(specs=specs)
+    return AnalystExecutionPlan(specs=specs, parallel=parallel)
 
 
 def get_initial_analyst_node(plan: AnalystExecutionPlan) -> str:
@@ -99,6 +103,12 @@ class AnalystWallTimeTracker:
         finished_at = monotonic() if completed_at is None else completed_at
         self._wall_times[analyst_key] = max(0.0, finished_at - started_at)
 
+    def record(self, analyst_key: str, duration: float) -> None:
+        """Record a wall time measured elsewhere (e.g. inside a parallel branch)."""
+        if analyst_key not in ANALYST_NODE_SPECS:
+            raise ValueError(f"unknown analyst key: {analyst_key}")
+        self._wall_times.setdefault(analyst_key, max(0.0, duration))
+
     def get_wall_times(self) -> dict[str, float]:
         return dict(self._wall_times)
 
@@ -116,20 +126,27 @@ class AnalystWallTimeTracker:
 
 def sync_analyst_tracker_from_chunk(
     tracker: AnalystWallTimeTracker,
-    chunk: dict[str, str],
+    chunk: dict,
     now: float | None = None,
 ) -> None:
     current_time = monotonic() if now is None else now
     active_found = False
+    # Parallel branches time themselves: the parent graph only sees their
+    # reports when the whole fan-out joins, so chunk timing can't tell them apart.
+    measured = chunk.get("analyst_wall_times") or {}
 
     for spec in tracker.plan.specs:
         has_report = bool(chunk.get(spec.report_key))
 
+        if has_report and spec.key in measured:
+            tracker.record(spec.key, measured[spec.key])
+            continue
+
         if has_report:
             tracker.mark_started(spec.key, started_at=current_time)
             tracker.mark_completed(spec.key, completed_at=current_time)
             continue
 
-        if not active_found:
+        if not active_found or tracker.plan.parallel:
             tracker.mark_started(spec.key, started_at=current_time)
             active_found = True
@@ -0,0 +1,42 @@
+"""Request and result records for multi-ticker runs (``propagate_many``, ``ProcessBatchRunner``)."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class BatchRequest:
+    """One run; ``point_in_time`` is as for ``TradingAgentsGraph.propagate``."""
+
+    ticker: str
+    trade_date: str
+    asset_type: str = "stock"
+    point_in_time: bool = False
+
+    @classmethod
+    def coerce(cls, request: BatchRequest | tuple | dict) -> BatchRequest:
+        """Accept a ``BatchRequest``, a ``(ticker, date[, asset_type[, point_in_time]])`` tuple or a dict."""
+        if isinstance(request, cls):
+            return request
+        if isinstance(request, dict):
+            return cls(**request)
+        return cls(*request)
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Outcome of one request; exactly one of ``final_state`` and ``error`` is set."""
+
+    index: int  # position in the submitted requests
+    request: BatchRequest
+    final_state: dict[str, Any] | None = None
+    signal: str | None = None
+    error: BaseException | None = None
+    elapsed: float = 0.0
+    worker: int | None = None  # pid of the worker process (ProcessBatchRunner)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
@@ -7,11 +7,12 @@ from __future__ import annotations
 
 import hashlib
 import sqlite3
-from collections.abc import Generator
-from contextlib import contextmanager
+from collections.abc import AsyncGenerator, Generator
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
 
 from langgraph.checkpoint.sqlite import SqliteSaver
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 
 from tradingagents.dataflows.utils import safe_ticker_component
 
@@ -43,6 +44,14 @@ def get_checkpointer(data_dir: str | Path, ticker: str) -> Generator[SqliteSaver
         conn.close()
 
 
+@asynccontextmanager
+async def aget_checkpointer(data_dir: str | Path, ticker: str) -> AsyncGenerator[AsyncSqliteSaver, None]:
+    """Async ``get_checkpointer`` for ``apropagate``, on the same per-ticker DB."""
+    async with AsyncSqliteSaver.from_conn_string(str(_db_path(data_dir, ticker))) as saver:
+        await saver.setup()
+        yield saver
+
+
 def has_checkpoint(data_dir: str | Path, ticker: str, date: str) -> bool:
     """Check whether a resumable checkpoint exists for ticker+date."""
     return checkpoint_step(data_dir, ticker, date) is not None
@@ -71,3 +71,15 @@ class ConditionalLogic:
         if state["risk_debate_state"]["latest_speaker"].startswith("Conservative"):
             return "Neutral Analyst"
         return "Aggressive Analyst"
+
+    def should_continue_debate_round(self, state: AgentState) -> str:
+        """Determine if another concurrent Bull/Bear round should run."""
+        if state["investment_debate_state"]["count"] >= 2 * self.max_debate_rounds:
+            return "Research Manager"
+        return "Research Debate"
+
+    def should_continue_risk_round(self, state: AgentState) -> str:
+        """Determine if another concurrent risk round should run."""
+        if state["risk_debate_state"]["count"] >= 3 * self.max_risk_discuss_rounds:
+            return "Portfolio Manager"
+        return "Risk Debate"
@@ -0,0 +1,125 @@
+"""Round-based scheduling for the research and risk debates.
+
+In the default schedule every debate turn is its own graph node, and each
+speaker answers the one before it: Bull -> Bear -> Bull ..., Aggressive ->
+Conservative -> Neutral -> .... With ``parallel_debate`` a whole round is
+one node instead. Every speaker in the round answers the state as it stood at
+the end of the previous round, so their LLM calls run concurrently. The
+arguments are then merged in a fixed speaker order (Bull, Bear; Aggressive,
+Conservative, Neutral), so the history is the same however the calls finish.
+
+The speaker nodes are the unchanged ``create_*`` nodes. Each one gets a view
+of the state in which "the other side's last argument" is the previous
+round's argument. In round one that argument is empty, and each speaker
+opens from the analyst reports alone.
+"""
+
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+from tradingagents.agents.utils.llm_node import AsyncNode, acall_node
+
+RESEARCH_DEBATE_NODE = "Research Debate"
+RISK_DEBATE_NODE = "Risk Debate"
+
+
+def _speak_concurrently(turns) -> list[dict]:
+    """Run ``(node, state)`` turns concurrently; results in turn order.
+
+    Each turn runs in a copy of the caller's context, so the run's tool memo
+    and LangChain callbacks reach it. A failing speaker fails the round, as
+    it would fail its node in the sequential schedule.
+    """
+    with ThreadPoolExecutor(max_workers=len(turns), thread_name_prefix="debate") as pool:
+        futures = [
+            pool.submit(contextvars.copy_context().run, node, view)
+            for node, view in turns
+        ]
+        return [future.result() for future in futures]
+
+
+async def _aspeak_concurrently(turns) -> list[dict]:
+    """Async ``_speak_concurrently``: the turns share the event loop."""
+    return list(await asyncio.gather(*(acall_node(node, view) for node, view in turns)))
+
+
+def _round_node(turns, merge, name: str) -> AsyncNode:
+    """A node that runs ``turns(state)`` concurrently and returns ``merge(state, results)``."""
+
+    def run(state):
+        return merge(state, _speak_concurrently(turns(state)))
+
+    async def arun(state):
+        return merge(state, await _aspeak_concurrently(turns(state)))
+
+    return AsyncNode(run, arun, name=name)
+
+
+def create_research_round(bull_node, bear_node):
+    """One node that runs a Bull and a Bear turn concurrently."""
+
+    def turns(state):
+        debate = state["investment_debate_state"]
+
+        def view(last_opponent_argument):
+            return {
+                **state,
+                "investment_debate_state": {**debate, "current_response": last_opponent_argument},
+            }
+
+        return [
+            (bull_node, view(debate.get("current_bear_response", ""))),
+            (bear_node, view(debate.get("current_bull_response", ""))),
+        ]
+
+    def merge(state, results) -> dict:
+        debate = state["investment_debate_state"]
+        bull, bear = (result["investment_debate_state"] for result in results)
+        bull_argument, bear_argument = bull["current_response"], bear["current_response"]
+        return {
+            "investment_debate_state": {
+                "history": debate.get("history", "") + "\n" + bull_argument + "\n" + bear_argument,
+                "bull_history": bull["bull_history"],
+                "bear_history": bear["bear_history"],
+                "current_response": bear_argument,
+                "current_bull_response": bull_argument,
+                "current_bear_response": bear_argument,
+                "judge_decision": debate.get("judge_decision", ""),
+                "count": debate["count"] + 2,
+            }
+        }
+
+    return _round_node(turns, merge, "research_round")
+
+
+def create_risk_round(aggressive_node, conservative_node, neutral_node):
+    """One node that runs the Aggressive, Conservative and Neutral turns concurrently."""
+
+    def turns(state):
+        return [(aggressive_node, state), (conservative_node, state), (neutral_node, state)]
+
+    def merge(state, results) -> dict:
+        debate = state["risk_debate_state"]
+        aggressive, conservative, neutral = (result["risk_debate_state"] for result in results)
+        arguments = [
+            aggressive["current_aggressive_response"],
+            conservative["current_conservative_response"],
+            neutral["current_neutral_response"],
+        ]
+        return {
+            "risk_debate_state": {
+                "history": debate.get("history", "") + "".join("\n" + arg for arg in arguments),
+                "aggressive_history": aggressive["aggressive_history"],
+                "conservative_history": conservative["conservative_history"],
+                "neutral_history": neutral["neutral_history"],
+                "latest_speaker": "Neutral",
+                "current_aggressive_response": arguments[0],
+                "current_conservative_response": arguments[1],
+                "current_neutral_response": arguments[2],
+                "judge_decision": debate.get("judge_decision", ""),
+                "count": debate["count"] + 3,
+            }
+        }
+
+    return _round_node(turns, merge, "risk_round")
@@ -0,0 +1,242 @@
+"""Multi-ticker runs across worker processes (``ProcessBatchRunner``).
+
+``propagate_many`` overlaps the network-bound parts of many runs on one event
+loop, but indicator maths (pandas, stockstats), report parsing and prompt
+building still share one interpreter and its GIL. The process runner starts
+``workers`` processes instead. Each builds its own ``TradingAgentsGraph`` once
+and keeps it, with its LLM clients, compiled graph and in-process data
+caches, for every job it is given. Only the ``(index, BatchRequest)`` job
+goes to a worker and only its ``BatchResult`` comes back; the graph is never
+pickled.
+
+Jobs are fed lazily: at most ``workers + queue_size`` are submitted and not
+yet collected, so a long (or generated) request stream is consumed only as
+fast as the workers finish.
+
+Workers are started with the ``spawn`` method: the graph's HTTP clients and
+cache threads do not survive a ``fork``. Their memory-log writes share one
+cross-process lock, so a decision appended by one worker is never lost to
+another worker rewriting the log with outcomes.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import multiprocessing
+import os
+import pickle
+import queue
+import time
+from collections.abc import Callable, Iterable, Iterator
+
+from .batch import BatchRequest, BatchResult
+
+logger = logging.getLogger(__name__)
+
+# How often a waiting parent checks that its workers are still alive.
+_POLL_SECONDS = 1.0
+
+
+def _default_graph_factory(**kwargs):
+    from .trading_graph import TradingAgentsGraph
+
+    return TradingAgentsGraph(**kwargs)
+
+
+def _portable(result: BatchResult) -> bytes:
+    """Pickle ``result``; a final state or error that cannot cross processes is replaced."""
+    try:
+        return pickle.dumps(result)
+    except Exception as exc:
+        error = result.error
+        if error is not None:
+            error = RuntimeError(f"{type(error).__name__}: {error}")
+        else:
+            error = RuntimeError(f"final state could not be sent back: {exc}")
+        return pickle.dumps(
+            BatchResult(result.index, result.request, error=error,
+                        elapsed=result.elapsed, worker=result.worker)
+        )
+
+
+def _worker_main(graph_factory, graph_kwargs, write_lock, jobs, results) -> None:
+    """Worker process: build one graph, then run jobs until the ``None`` sentinel."""
+    pid = os.getpid()
+    try:
+        graph = graph_factory(**graph_kwargs)
+        memory_log = getattr(graph, "memory_log", None)
+        if memory_log is not None:
+            memory_log.share_write_lock(write_lock)
+    except Exception as exc:
+        results.put(("failed", pid, f"{type(exc).__name__}: {exc}"))
+        return
+    results.put(("ready", pid, None))
+
+    while (job := jobs.get()) is not None:
+        index, request = job
+        started = time.monotonic()
+        try:
+            final_state, signal = graph.propagate(
+                request.ticker, request.trade_date, request.asset_type,
+                point_in_time=request.point_in_time,
+            )
+        except Exception as exc:
+            logger.warning("Run for %s on %s failed: %s", request.ticker, request.trade_date, exc)
+            result = BatchResult(index, request, error=exc,
+                                 elapsed=time.monotonic() - started, worker=pid)
+        else:
+            result = BatchResult(index, request, final_state, signal,
+                                 elapsed=time.monotonic() - started, worker=pid)
+        results.put(("result", pid, _portable(result)))
+
+
+class ProcessBatchRunner:
+    """Run ``propagate`` for many (ticker, date) jobs on a pool of warm worker processes.
+
+    Usage::
+
+        with ProcessBatchRunner(config=config, workers=4) as runner:
+            for result in runner.run([("AAPL", "2026-01-05"), ("MSFT", "2026-01-05")]):
+                ...
+
+    ``graph_factory`` builds each worker's graph from ``selected_analysts``,
+    ``debug`` and ``config`` keywords (``TradingAgentsGraph`` by default); it
+    and ``config`` must be picklable. Results arrive in completion order as
+    ``BatchResult``s carrying the run's wall time and the worker's pid; a
+    failed run carries its ``error`` and the pool carries on. A request's
+    ``point_in_time`` flag is passed on to ``propagate``.
+    """
+
+    def __init__(
+        self,
+        selected_analysts=("market", "social", "news", "fundamentals"),
+        config: dict | None = None,
+        workers: int | None = None,
+        queue_size: int | None = None,
+        debug: bool = False,
+        graph_factory: Callable | None = None,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_size = self.workers if queue_size is None else queue_size
+        self._graph_factory = graph_factory or _default_graph_factory
+        self._graph_kwargs = {
+            "selected_analysts": selected_analysts,
+            "debug": debug,
+            "config": config,
+        }
+        self._ctx = multiprocessing.get_context("spawn")
+        self._processes: list = []
+        self._jobs = None
+        self._results = None
+
+    def __enter__(self) -> ProcessBatchRunner:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Start the workers and wait until each has built its graph."""
+        if self._processes:
+            return
+        self._jobs = self._ctx.Queue(maxsize=self.workers + self.queue_size)
+        self._results = self._ctx.Queue()
+        write_lock = self._ctx.Lock()
+        for n in range(self.workers):
+            process = self._ctx.Process(
+                target=_worker_main,
+                args=(self._graph_factory, self._graph_kwargs, write_lock,
+                      self._jobs, self._results),
+                name=f"tradingagents-worker-{n}",
+                daemon=True,
+            )
+            process.start()
+            self._processes.append(process)
+
+        for _ in range(self.workers):
+            kind, pid, detail = self._receive()
+            if kind == "failed":
+                self.close()
+                raise RuntimeError(f"worker {pid} could not build its graph: {detail}")
+
+    def run(self, requests: Iterable) -> Iterator[BatchResult]:
+        """Run every request on the pool; yield each ``BatchResult`` as it finishes.
+
+        ``requests`` are ``BatchRequest``s, ``(ticker, trade_date[, asset_type])``
+        tuples or dicts, and are read only as workers free up. Stopping early
+        drops the jobs not yet started and waits out the running ones, so
+        their results never reach a later ``run``.
+        """
+        self.start()
+        capacity = self.workers + self.queue_size
+        pending = enumerate(requests)
+        in_flight = 0
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and in_flight < capacity:
+                    try:
+                        index, request = next(pending)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    self._jobs.put((index, BatchRequest.coerce(request)))
+                    in_flight += 1
+                if not in_flight:
+                    return
+                _, _, payload = self._receive()
+                in_flight -= 1
+                yield pickle.loads(payload)
+        except GeneratorExit:
+            self._discard(in_flight)
+            raise
+
+    def _discard(self, in_flight: int) -> None:
+        """Drop queued jobs and read away the results of the ones already running."""
+        with contextlib.suppress(queue.Empty):
+            while in_flight:
+                self._jobs.get_nowait()
+                in_flight -= 1
+        for _ in range(in_flight):
+            self._receive()
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Stop the workers; jobs not yet started are dropped, hung workers terminated."""
+        if not self._processes:
+            return
+        try:
+            while True:
+                self._jobs.get_nowait()
+        except queue.Empty:
+            pass
+        for _ in self._processes:
+            self._jobs.put(None)
+        # Keep reading results meanwhile: a worker only exits once what it
+        # put on the results queue has been taken off the pipe.
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and any(p.is_alive() for p in self._processes):
+            with contextlib.suppress(queue.Empty):
+                self._results.get(timeout=0.1)
+        for process in self._processes:
+            if process.is_alive():
+                logger.warning("Terminating worker %s", process.pid)
+                process.terminate()
+            process.join()
+        self._processes = []
+        for q in (self._jobs, self._results):
+            q.close()
+            q.cancel_join_thread()
+
+    def _receive(self):
+        """Next worker message; raises if a worker died and nothing more can arrive."""
+        while True:
+            try:
+                return self._results.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                dead = [p for p in self._processes if p.exitcode not in (None, 0)]
+                if dead:
+                    raise RuntimeError(
+                        f"worker {dead[0].pid} exited unexpectedly (exit code {dead[0].exitcode})"
+                    ) from None
@@ -44,6 +44,8 @@ class Propagator:
                     "bear_history": "",
                     "history": "",
                     "current_response": "",
+                    "current_bull_response": "",
+                    "current_bear_response": "",
                     "judge_decision": "",
                     "count": 0,
                 }
@@ -66,6 +68,7 @@ class Propagator:
             "fundamentals_report": "",
             "sentiment_report": "",
             "news_report": "",
+            "analyst_wall_times": {},
         }
 
     def get_graph_args(self, callbacks: list | None = None) -> dict[str, Any]:
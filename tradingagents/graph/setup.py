@@ -1,5 +1,6 @@
 # TradingAgents/graph/setup.py
 
+from time import monotonic
 from typing import Any
 
 from langgraph.graph import END, START, StateGraph
@@ -21,9 +22,16 @@ from tradingagents.agents import (
     create_trader,
 )
 from tradingagents.agents.utils.agent_states import AgentState
+from tradingagents.agents.utils.llm_node import AsyncNode
 
-from .analyst_execution import build_analyst_execution_plan
+from .analyst_execution import AnalystNodeSpec, build_analyst_execution_plan
 from .conditional_logic import ConditionalLogic
+from .debate_rounds import (
+    RESEARCH_DEBATE_NODE,
+    RISK_DEBATE_NODE,
+    create_research_round,
+    create_risk_round,
+)
 
 
 class GraphSetup:
@@ -42,8 +50,46 @@ class GraphSetup:
         self.tool_nodes = tool_nodes
         self.conditional_logic = conditional_logic
 
+    def _analyst_branch(self, spec: AnalystNodeSpec, analyst_node):
+        """Wrap one analyst's tool loop as a self-contained graph node.
+
+        The branch runs ``analyst <-> tools`` on its own copy of the message
+        list, so concurrent analysts never see each other's tool traffic, and
+        hands back only its report and wall time to the parent graph.
+        """
+        branch = StateGraph(AgentState)
+        branch.add_node(spec.agent_node, analyst_node)
+        branch.add_node(spec.tool_node, self.tool_nodes[spec.key])
+        branch.add_edge(START, spec.agent_node)
+        branch.add_conditional_edges(
+            spec.agent_node,
+            getattr(self.conditional_logic, f"should_continue_{spec.key}"),
+            {spec.tool_node: spec.tool_node, spec.clear_node: END},
+        )
+        branch.add_edge(spec.tool_node, spec.agent_node)
+        compiled = branch.compile()
+
+        def update(result, started_at):
+            return {
+                spec.report_key: result.get(spec.report_key, ""),
+                "analyst_wall_times": {spec.key: monotonic() - started_at},
+            }
+
+        def run_branch(state):
+            started_at = monotonic()
+            return update(compiled.invoke(state), started_at)
+
+        async def arun_branch(state):
+            started_at = monotonic()
+            return update(await compiled.ainvoke(state), started_at)
+
+        return AsyncNode(run_branch, arun_branch, name=f"{spec.key}_branch")
+
     def setup_graph(
-        self, selected_analysts=("market", "social", "news", "fundamentals")
+        self,
+        selected_analysts=("market", "social", "news", "fundamentals"),
+        parallel_analysts: bool = False,
+        parallel_debate: bool = False,
     ):
         """Set up and compile the agent workflow graph.
 
@@ -53,8 +99,14 @@ class GraphSetup:
                 - "social": Social media analyst
                 - "news": News analyst
                 - "fundamentals": Fundamentals analyst
+            parallel_analysts (bool): Run the analysts as concurrent branches
+                from START, each with an isolated message list, joining before
+                the Bull Researcher. Default runs them one after another.
+            parallel_debate (bool): Run each research and risk debate round
+                as one node whose speakers answer the previous round
+                concurrently (see debate_rounds.py). Default alternates turns.
         """
-        plan = build_analyst_execution_plan(selected_analysts)
+        plan = build_analyst_execution_plan(selected_analysts, parallel=parallel_analysts)
 
         analyst_factories = {
             "market": lambda: create_market_analyst(self.quick_thinking_llm),
@@ -78,89 +130,122 @@ class GraphSetup:
         # Create workflow
         workflow = StateGraph(AgentState)
 
-        # Add analyst nodes to the graph
-        for spec in plan.specs:
-            workflow.add_node(spec.agent_node, analyst_factories[spec.key]())
-            workflow.add_node(spec.clear_node, create_msg_delete())
-            workflow.add_node(spec.tool_node, self.tool_nodes[spec.key])
-
         # Add other nodes
-        workflow.add_node("Bull Researcher", bull_researcher_node)
-        workflow.add_node("Bear Researcher", bear_researcher_node)
+        if parallel_debate:
+            workflow.add_node(
+                RESEARCH_DEBATE_NODE,
+                create_research_round(bull_researcher_node, bear_researcher_node),
+            )
+            workflow.add_node(
+                RISK_DEBATE_NODE,
+                create_risk_round(aggressive_analyst, conservative_analyst, neutral_analyst),
+            )
+            debate_entry, risk_entry = RESEARCH_DEBATE_NODE, RISK_DEBATE_NODE
+        else:
+            workflow.add_node("Bull Researcher", bull_researcher_node)
+            workflow.add_node("Bear Researcher", bear_researcher_node)
+            workflow.add_node("Aggressive Analyst", aggressive_analyst)
+            workflow.add_node("Neutral Analyst", neutral_analyst)
+            workflow.add_node("Conservative Analyst", conservative_analyst)
+            debate_entry, risk_entry = "Bull Researcher", "Aggressive Analyst"
         workflow.add_node("Research Manager", research_manager_node)
         workflow.add_node("Trader", trader_node)
-        workflow.add_node("Aggressive Analyst", aggressive_analyst)
-        workflow.add_node("Neutral Analyst", neutral_analyst)
-        workflow.add_node("Conservative Analyst", conservative_analyst)
         workflow.add_node("Portfolio Manager", portfolio_manager_node)
 
-        # Define edges
-        # Start with the first analyst
-        workflow.add_edge(START, plan.specs[0].agent_node)
-
-        # Connect analysts in sequence
-        for i, spec in enumerate(plan.specs):
-            current_analyst = spec.agent_node
-            current_tools = spec.tool_node
-            current_clear = spec.clear_node
+        if plan.parallel:
+            # Fan out from START; the debate waits for every branch.
+            for spec in plan.specs:
+                workflow.add_node(
+                    spec.agent_node,
+                    self._analyst_branch(spec, analyst_factories[spec.key]()),
+                )
+                workflow.add_edge(START, spec.agent_node)
+            workflow.add_edge([spec.agent_node for spec in plan.specs], debate_entry)
+        else:
+            # Add analyst nodes to the graph
+            for spec in plan.specs:
+                workflow.add_node(spec.agent_node, analyst_factories[spec.key]())
+                workflow.add_node(spec.clear_node, create_msg_delete())
+                workflow.add_node(spec.tool_node, self.tool_nodes[spec.key])
+
+            # Start with the first analyst
+            workflow.add_edge(START, plan.specs[0].agent_node)
+
+            # Connect analysts in sequence
+            for i, spec in enumerate(plan.specs):
+                current_analyst = spec.agent_node
+                current_tools = spec.tool_node
+                current_clear = spec.clear_node
+
+                # Add conditional edges for current analyst
+                workflow.add_conditional_edges(
+                    current_analyst,
+                    getattr(self.conditional_logic, f"should_continue_{spec.key}"),
+                    [current_tools, current_clear],
+                )
+                workflow.add_edge(current_tools, current_analyst)
+
+                # Connect to next analyst or to the debate if this is the last analyst
+                if i < len(plan.specs) - 1:
+                    workflow.add_edge(current_clear, plan.specs[i + 1].agent_node)
+                else:
+                    workflow.add_edge(current_clear, debate_entry)
 
-            # Add conditional edges for current analyst
+        # Add remaining edges
+        if parallel_debate:
             workflow.add_conditional_edges(
-                current_analyst,
-                getattr(self.conditional_logic, f"should_continue_{spec.key}"),
-                [current_tools, current_clear],
+                RESEARCH_DEBATE_NODE,
+                self.conditional_logic.should_continue_debate_round,
+                [RESEARCH_DEBATE_NODE, "Research Manager"],
+            )
+            workflow.add_conditional_edges(
+                RISK_DEBATE_NODE,
+                self.conditional_logic.should_continue_risk_round,
+                [RISK_DEBATE_NODE, "Portfolio Manager"],
+            )
+        else:
+            workflow.add_conditional_edges(
+                "Bull Researcher",
+                self.conditional_logic.should_continue_debate,
+                {
+                    "Bear Researcher": "Bear Researcher",
+                    "Research Manager": "Research Manager",
+                },
+            )
+            workflow.add_conditional_edges(
+                "Bear Researcher",
+                self.conditional_logic.should_continue_debate,
+                {
+                    "Bull Researcher": "Bull Researcher",
+                    "Research Manager": "Research Manager",
+                },
+            )
+            workflow.add_conditional_edges(
+                "Aggressive Analyst",
+                self.conditional_logic.should_continue_risk_analysis,
+                {
+                    "Conservative Analyst": "Conservative Analyst",
+                    "Portfolio Manager": "Portfolio Manager",
+                },
+            )
+            workflow.add_conditional_edges(
+                "Conservative Analyst",
+                self.conditional_logic.should_continue_risk_analysis,
+                {
+                    "Neutral Analyst": "Neutral Analyst",
+                    "Portfolio Manager": "Portfolio Manager",
+                },
+            )
+            workflow.add_conditional_edges(
+                "Neutral Analyst",
+                self.conditional_logic.should_continue_risk_analysis,
+                {
+                    "Aggressive Analyst": "Aggressive Analyst",
+                    "Portfolio Manager": "Portfolio Manager",
+                },
             )
-            workflow.add_edge(current_tools, current_analyst)
-
-            # Connect to next analyst or to Bull Researcher if this is the last analyst
-            if i < len(plan.specs) - 1:
-                workflow.add_edge(current_clear, plan.specs[i + 1].agent_node)
-            else:
-                workflow.add_edge(current_clear, "Bull Researcher")
-
-        # Add remaining edges
-        workflow.add_conditional_edges(
-            "Bull Researcher",
-            self.conditional_logic.should_continue_debate,
-            {
-                "Bear Researcher": "Bear Researcher",
-                "Research Manager": "Research Manager",
-            },
-        )
-        workflow.add_conditional_edges(
-            "Bear Researcher",
-            self.conditional_logic.should_continue_debate,
-            {
-                "Bull Researcher": "Bull Researcher",
-                "Research Manager": "Research Manager",
-            },
-        )
         workflow.add_edge("Research Manager", "Trader")
-        workflow.add_edge("Trader", "Aggressive Analyst")
-        workflow.add_conditional_edges(
-            "Aggressive Analyst",
-            self.conditional_logic.should_continue_risk_analysis,
-            {
-                "Conservative Analyst": "Conservative Analyst",
-                "Portfolio Manager": "Portfolio Manager",
-            },
-        )
-        workflow.add_conditional_edges(
-            "Conservative Analyst",
-            self.conditional_logic.should_continue_risk_analysis,
-            {
-                "Neutral Analyst": "Neutral Analyst",
-                "Portfolio Manager": "Portfolio Manager",
-            },
-        )
-        workflow.add_conditional_edges(
-            "Neutral Analyst",
-            self.conditional_logic.should_continue_risk_analysis,
-            {
-                "Aggressive Analyst": "Aggressive Analyst",
-                "Portfolio Manager": "Portfolio Manager",
-            },
-        )
+        workflow.add_edge("Trader", risk_entry)
 
         workflow.add_edge("Portfolio Manager", END)
 
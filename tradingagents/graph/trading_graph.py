@@ -1,8 +1,11 @@
 # TradingAgents/graph/trading_graph.py
 
+import asyncio
 import json
 import logging
 import os
+import time
+import weakref
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -28,13 +31,21 @@ from tradingagents.agents.utils.agent_utils import (
     resolve_instrument_identity,
 )
 from tradingagents.agents.utils.memory import TradingMemoryLog
+from tradingagents.agents.utils.tool_memo import memoize_tool, tool_memo_scope
 from tradingagents.dataflows.config import set_config
 from tradingagents.dataflows.utils import safe_ticker_component
 from tradingagents.default_config import DEFAULT_CONFIG
 from tradingagents.llm_clients import create_llm_client
 from tradingagents.reporting import write_report_tree
 
-from .checkpointer import checkpoint_step, clear_checkpoint, get_checkpointer, thread_id
+from .batch import BatchRequest, BatchResult
+from .checkpointer import (
+    aget_checkpointer,
+    checkpoint_step,
+    clear_checkpoint,
+    get_checkpointer,
+    thread_id,
+)
 from .conditional_logic import ConditionalLogic
 from .propagation import Propagator
 from .reflection import Reflector
@@ -44,6 +55,11 @@ from .signal_processing import SignalProcessor
 logger = logging.getLogger(__name__)
 
 
+def _memoized_node(tools) -> ToolNode:
+    """A ``ToolNode`` whose tools go through the active run's tool memo."""
+    return ToolNode([memoize_tool(t) for t in tools])
+
+
 class TradingAgentsGraph:
     """Main class that orchestrates the trading agents framework."""
 
@@ -123,9 +139,16 @@ class TradingAgentsGraph:
         self.curr_state = None
         self.ticker = None
         self.log_states_dict = {}  # date to full state dict
+        self.tool_memo_report = {}  # tool -> {"calls", "hits"} for the last run
+        self._async_slots = weakref.WeakKeyDictionary()  # event loop -> apropagate semaphore
+        self._checkpoint_locks = weakref.WeakKeyDictionary()  # event loop -> {ticker: lock}
 
         # Set up the graph: keep the workflow for recompilation with a checkpointer.
-        self.workflow = self.graph_setup.setup_graph(selected_analysts)
+        self.workflow = self.graph_setup.setup_graph(
+            selected_analysts,
+            parallel_analysts=self.config.get("parallel_analysts", False),
+            parallel_debate=self.config.get("parallel_debate", False),
+        )
         self.graph = self.workflow.compile()
         self._checkpointer_ctx = None
 
@@ -159,9 +182,13 @@ class TradingAgentsGraph:
         return kwargs
 
     def _create_tool_nodes(self) -> dict[str, ToolNode]:
-        """Create tool nodes for different data sources using abstract methods."""
+        """Create tool nodes for different data sources using abstract methods.
+
+        Tools are wrapped with the run-scoped memo (see ``_memoized_node``), so
+        a call repeated within one ``propagate()`` returns the earlier result.
+        """
         return {
-            "market": ToolNode(
+            "market": _memoized_node(
                 [
                     # Core stock data tools
                     get_stock_data,
@@ -173,13 +200,13 @@ class TradingAgentsGraph:
                     get_verified_market_snapshot,
                 ]
             ),
-            "social": ToolNode(
+            "social": _memoized_node(
                 [
                     # News tools for social media analysis
                     get_news,
                 ]
             ),
-            "news": ToolNode(
+            "news": _memoized_node(
                 [
                     # News and insider information
                     get_news,
@@ -189,7 +216,7 @@ class TradingAgentsGraph:
                     get_prediction_markets,
                 ]
             ),
-            "fundamentals": ToolNode(
+            "fundamentals": _memoized_node(
                 [
                     # Fundamental analysis tools
                     get_fundamentals,
@@ -266,26 +293,68 @@ class TradingAgentsGraph:
             )
             return None, None, None
 
-    def _resolve_pending_entries(self, ticker: str) -> None:
+    def _fetch_returns_as_of(
+        self, ticker: str, trade_date: str, as_of: str, holding_days: int = 5,
+        benchmark: str = "SPY",
+    ) -> tuple[float | None, float | None, int | None, str | None]:
+        """``_fetch_returns`` as it could have been computed on ``as_of``.
+
+        Prices come from the local OHLCV store, which ``load_ohlcv`` cuts off
+        at ``as_of``, and the outcome only counts once the whole holding
+        period has closed by then. Returns ``(raw_return, alpha_return,
+        holding_days, exit_date)``, all ``None`` while the outcome is not yet
+        known.
+        """
+        from tradingagents.backtest.prices import forward_return, load_closes, period_return
+        from tradingagents.dataflows.symbol_utils import normalize_symbol
+
+        try:
+            closes = load_closes(normalize_symbol(ticker), as_of)
+            raw, exit_date, days = forward_return(closes, trade_date, holding_days)
+            if raw is None or days < holding_days:
+                return None, None, None, None
+            bench = period_return(load_closes(benchmark, as_of), trade_date, exit_date)
+            if bench is None:
+                return None, None, None, None
+            return raw, raw - bench, days, exit_date
+        except Exception as e:
+            logger.warning(
+                "Could not resolve outcome for %s on %s as of %s vs %s: %s",
+                ticker, trade_date, as_of, benchmark, e,
+            )
+            return None, None, None, None
+
+    def _resolve_pending_entries(self, ticker: str, as_of: str | None = None) -> None:
         """Resolve pending log entries for ticker at the start of a new run.
 
         Fetches returns for each same-ticker pending entry, generates reflections,
         then writes all updates in a single atomic batch write to avoid redundant I/O.
         Skips entries whose price data is not yet available (too recent or delisted).
+        With ``as_of`` (a point-in-time run) only what was known on that date
+        is used: entries from ``as_of`` on stay pending, and returns come from
+        the local OHLCV store up to ``as_of`` (``_fetch_returns_as_of``).
 
         Trade-off: only same-ticker entries are resolved per run.  Entries for
         other tickers accumulate until that ticker is run again.
         """
         pending = [e for e in self.memory_log.get_pending_entries() if e["ticker"] == ticker]
+        if as_of is not None:
+            pending = [e for e in pending if e["date"] < str(as_of)]
         if not pending:
             return
 
         benchmark = self._resolve_benchmark(ticker)
         updates = []
         for entry in pending:
-            raw, alpha, days = self._fetch_returns(
-                ticker, entry["date"], benchmark=benchmark,
-            )
+            exit_date = None
+            if as_of is None:
+                raw, alpha, days = self._fetch_returns(
+                    ticker, entry["date"], benchmark=benchmark,
+                )
+            else:
+                raw, alpha, days, exit_date = self._fetch_returns_as_of(
+                    ticker, entry["date"], str(as_of), benchmark=benchmark,
+                )
             if raw is None:
                 continue  # price not available yet — try again next run
             reflection = self.reflector.reflect_on_final_decision(
@@ -301,6 +370,7 @@ class TradingAgentsGraph:
                 "alpha_return": alpha,
                 "holding_days": days,
                 "reflection": reflection,
+                "exit_date": exit_date,
             })
 
         if updates:
@@ -318,7 +388,9 @@ class TradingAgentsGraph:
         identity = resolve_instrument_identity(ticker)
         return build_instrument_context(ticker, asset_type, identity)
 
-    def propagate(self, company_name, trade_date, asset_type: str = "stock"):
+    def propagate(
+        self, company_name, trade_date, asset_type: str = "stock", *, point_in_time: bool = False
+    ):
         """Run the trading agents graph for a company on a specific date.
 
         ``asset_type`` selects between the stock pipeline (default) and the
@@ -327,11 +399,17 @@ class TradingAgentsGraph:
         ``checkpoint_enabled`` is set in config, the graph is recompiled with
         a per-ticker SqliteSaver so a crashed run can resume from the last
         successful node on a subsequent invocation with the same ticker+date.
+
+        The memory-log context only carries outcomes realized before
+        ``trade_date``. ``point_in_time`` also resolves pending outcomes from
+        the local price store as of ``trade_date`` rather than from the latest
+        prices, so a historical replay (e.g. a backtest) sees nothing from
+        after the date it analyses.
         """
         self.ticker = company_name
 
         # Resolve any pending memory-log entries for this ticker before the pipeline runs.
-        self._resolve_pending_entries(company_name)
+        self._resolve_pending_entries(company_name, str(trade_date) if point_in_time else None)
 
         # Recompile with a checkpointer if the user opted in.
         if self.config.get("checkpoint_enabled"):
@@ -352,7 +430,15 @@ class TradingAgentsGraph:
                 logger.info("Starting fresh for %s on %s", company_name, trade_date)
 
         try:
-            return self._run_graph(company_name, trade_date, asset_type=asset_type)
+            # Repeated identical tool calls within this run are served from a
+            # run-scoped memo; the per-tool hit report is kept for inspection.
+            with tool_memo_scope(self.config.get("tool_memo", True)) as memo:
+                try:
+                    return self._run_graph(company_name, trade_date, asset_type=asset_type)
+                finally:
+                    self.tool_memo_report = memo.report() if memo else {}
+                    if memo:
+                        logger.info("%s %s: %s", company_name, trade_date, memo.summary())
         finally:
             if self._checkpointer_ctx is not None:
                 self._checkpointer_ctx.__exit__(None, None, None)
@@ -374,12 +460,160 @@ class TradingAgentsGraph:
             )
         return write_report_tree(final_state, ticker, save_path)
 
-    def _run_graph(self, company_name, trade_date, asset_type: str = "stock"):
-        """Execute the graph and write the resulting state to disk and memory log."""
+    async def apropagate(
+        self, company_name, trade_date, asset_type: str = "stock", *, point_in_time: bool = False
+    ):
+        """Async ``propagate``: run the graph with ``ainvoke``/``astream``.
+
+        Agent nodes await ``ainvoke`` on their LLMs (see ``llm_node.py``), so
+        many analyses can share one event loop instead of holding one thread
+        each; tool calls and the blocking setup and bookkeeping around the run
+        go to worker threads. At most ``max_concurrent_runs`` analyses run at
+        once per graph instance, the rest wait their turn. Unlike
+        ``propagate`` this never swaps ``self.graph``, so concurrent calls on
+        one instance are safe; ``curr_state`` holds the last run to finish.
+        ``point_in_time`` is as for ``propagate``.
+        """
+        async with self._run_slots():
+            return await self._apropagate(
+                company_name, trade_date, asset_type, point_in_time=point_in_time
+            )
+
+    async def _apropagate(
+        self, company_name, trade_date, asset_type: str = "stock", instrument_context=None,
+        *, point_in_time: bool = False,
+    ):
+        """``apropagate`` without the concurrency slot.
+
+        Batch runs resolve each ticker's pending entries and instrument
+        context once (``_prepare_ticker``) and pass the context in; both
+        per-run steps are then skipped. Checkpointed runs of one ticker take
+        turns (``_checkpoint_lock``): they share its SQLite checkpoint DB.
+        """
+        self.ticker = company_name
+        if instrument_context is None:
+            as_of = str(trade_date) if point_in_time else None
+            await asyncio.to_thread(self._resolve_pending_entries, company_name, as_of)
+        with tool_memo_scope(self.config.get("tool_memo", True)) as memo:
+            try:
+                if self.config.get("checkpoint_enabled"):
+                    async with self._checkpoint_lock(company_name), aget_checkpointer(
+                        self.config["data_cache_dir"], company_name
+                    ) as saver:
+                        graph = self.workflow.compile(checkpointer=saver)
+                        return await self._arun_graph(
+                            graph, company_name, trade_date, asset_type, instrument_context
+                        )
+                return await self._arun_graph(
+                    self.graph, company_name, trade_date, asset_type, instrument_context
+                )
+            finally:
+                self.tool_memo_report = memo.report() if memo else {}
+                if memo:
+                    logger.info("%s %s: %s", company_name, trade_date, memo.summary())
+
+    def propagate_many(self, requests, max_concurrency: int | None = None):
+        """Analyse many (ticker, date) requests concurrently, yielding results as they finish.
+
+        ``requests`` are ``BatchRequest``s, ``(ticker, trade_date[, asset_type])``
+        tuples or dicts. The runs share this instance's LLM clients, compiled
+        graph and data caches, and each ticker's pending memory-log entries and
+        instrument identity are resolved once per batch instead of once per
+        run; for a ``point_in_time`` request, once per (ticker, date), as of
+        that date. Runs of one ticker on different dates may overlap, so a
+        historical replay that should learn from its own earlier dates runs
+        them in order instead (see ``WalkForwardBacktest``). Up to
+        ``max_concurrency`` (default ``max_concurrent_runs``) analyses run at
+        once through the async path on a private event loop.
+        Each request yields a ``BatchResult``; a failed run carries its
+        ``error`` and the others carry on.
+
+        Call this from synchronous code; inside an event loop use
+        ``apropagate_many``.
+        """
+        loop = asyncio.new_event_loop()
+        results = self.apropagate_many(requests, max_concurrency)
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(results.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            loop.run_until_complete(results.aclose())
+            loop.run_until_complete(loop.shutdown_default_executor())
+            loop.close()
+
+    async def apropagate_many(self, requests, max_concurrency: int | None = None):
+        """Async ``propagate_many``: yield a ``BatchResult`` per request as it finishes."""
+        jobs = [BatchRequest.coerce(request) for request in requests]
+        limit = asyncio.Semaphore(max_concurrency or self.config.get("max_concurrent_runs", 8))
+        prepared: dict[tuple[str, str, str | None], asyncio.Future] = {}
+
+        async def run(index: int, job: BatchRequest) -> BatchResult:
+            async with limit:
+                started = time.monotonic()
+                try:
+                    as_of = job.trade_date if job.point_in_time else None
+                    key = (job.ticker, job.asset_type, as_of)
+                    if key not in prepared:
+                        prepared[key] = asyncio.ensure_future(asyncio.to_thread(
+                            self._prepare_ticker, job.ticker, job.asset_type, as_of
+                        ))
+                    context = await asyncio.shield(prepared[key])
+                    final_state, signal = await self._apropagate(
+                        job.ticker, job.trade_date, job.asset_type, instrument_context=context
+                    )
+                except Exception as exc:
+                    logger.warning("Run for %s on %s failed: %s", job.ticker, job.trade_date, exc)
+                    return BatchResult(index, job, error=exc, elapsed=time.monotonic() - started)
+                return BatchResult(
+                    index, job, final_state, signal, elapsed=time.monotonic() - started
+                )
+
+        tasks = [asyncio.ensure_future(run(index, job)) for index, job in enumerate(jobs)]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, *prepared.values(), return_exceptions=True)
+
+    def _prepare_ticker(self, ticker: str, asset_type: str = "stock", as_of: str | None = None) -> str:
+        """Per-ticker setup shared by a batch: resolve pending entries, return the instrument context."""
+        self._resolve_pending_entries(ticker, as_of)
+        return self.resolve_instrument_context(ticker, asset_type)
+
+    def _checkpoint_lock(self, ticker: str) -> asyncio.Lock:
+        """The lock serializing checkpointed runs of ``ticker`` on the running loop."""
+        locks = self._checkpoint_locks.setdefault(asyncio.get_running_loop(), {})
+        key = safe_ticker_component(ticker).upper()  # one lock per checkpoint DB
+        lock = locks.get(key)
+        if lock is None:
+            lock = locks[key] = asyncio.Lock()
+        return lock
+
+    def _run_slots(self) -> asyncio.Semaphore:
+        """The semaphore bounding concurrent ``apropagate`` runs on the running loop."""
+        loop = asyncio.get_running_loop()
+        slots = self._async_slots.get(loop)
+        if slots is None:
+            slots = self._async_slots[loop] = asyncio.Semaphore(
+                self.config.get("max_concurrent_runs", 8)
+            )
+        return slots
+
+    def _start_run(
+        self, company_name, trade_date, asset_type: str = "stock", instrument_context=None
+    ):
+        """Build the initial state and graph arguments for one run."""
         # Initialize state — inject memory log context for PM and the
-        # deterministically resolved instrument identity for all agents.
-        past_context = self.memory_log.get_past_context(company_name)
-        instrument_context = self.resolve_instrument_context(company_name, asset_type)
+        # deterministically resolved instrument identity for all agents. Only
+        # outcomes known by the trade date reach the context.
+        past_context = self.memory_log.get_past_context(company_name, before=str(trade_date))
+        if instrument_context is None:
+            instrument_context = self.resolve_instrument_context(company_name, asset_type)
         init_agent_state = self.propagator.create_initial_state(
             company_name,
             trade_date,
@@ -393,20 +627,30 @@ class TradingAgentsGraph:
         if self.config.get("checkpoint_enabled"):
             tid = thread_id(company_name, str(trade_date))
             args.setdefault("config", {}).setdefault("configurable", {})["thread_id"] = tid
+        return init_agent_state, args
+
+    @staticmethod
+    def _print_new_message(chunk, last_printed):
+        """Pretty-print the chunk's trailing message if it changed; return its signature."""
+        msg = chunk["messages"][-1]
+        # Nodes after the trader don't append to messages, so the
+        # same trailing message repeats across chunks. Print it only
+        # when it changes (#1027); the trace/state merge is unchanged.
+        signature = (type(msg).__name__, getattr(msg, "content", None))
+        if signature != last_printed:
+            msg.pretty_print()
+        return signature
+
+    def _run_graph(self, company_name, trade_date, asset_type: str = "stock"):
+        """Execute the graph and write the resulting state to disk and memory log."""
+        init_agent_state, args = self._start_run(company_name, trade_date, asset_type)
 
         if self.debug:
             trace = []
             last_printed = None
             for chunk in self.graph.stream(init_agent_state, **args):
                 if chunk["messages"]:
-                    msg = chunk["messages"][-1]
-                    # Nodes after the trader don't append to messages, so the
-                    # same trailing message repeats across chunks. Print it only
-                    # when it changes (#1027); the trace/state merge is unchanged.
-                    signature = (type(msg).__name__, getattr(msg, "content", None))
-                    if signature != last_printed:
-                        msg.pretty_print()
-                        last_printed = signature
+                    last_printed = self._print_new_message(chunk, last_printed)
                     trace.append(chunk)
             # Streamed chunks are per-node deltas. Merge them so the returned
             # state matches what graph.invoke() yields in the non-debug path.
@@ -416,6 +660,33 @@ class TradingAgentsGraph:
         else:
             final_state = self.graph.invoke(init_agent_state, **args)
 
+        return self._finish_run(company_name, trade_date, final_state)
+
+    async def _arun_graph(
+        self, graph, company_name, trade_date, asset_type: str = "stock", instrument_context=None
+    ):
+        """Async ``_run_graph`` on ``graph``; blocking bookkeeping runs in worker threads."""
+        init_agent_state, args = await asyncio.to_thread(
+            self._start_run, company_name, trade_date, asset_type, instrument_context
+        )
+
+        if self.debug:
+            trace = []
+            last_printed = None
+            async for chunk in graph.astream(init_agent_state, **args):
+                if chunk["messages"]:
+                    last_printed = self._print_new_message(chunk, last_printed)
+                    trace.append(chunk)
+            final_state = {}
+            for chunk in trace:
+                final_state.update(chunk)
+        else:
+            final_state = await graph.ainvoke(init_agent_state, **args)
+
+        return await asyncio.to_thread(self._finish_run, company_name, trade_date, final_state)
+
+    def _finish_run(self, company_name, trade_date, final_state):
+        """Record a finished run; return ``(final_state, processed_signal)``."""
         # Store current state for reflection.
         self.curr_state = final_state
 
@@ -439,7 +710,7 @@ class TradingAgentsGraph:
 
     def _log_state(self, trade_date, final_state):
         """Log the final state to a JSON file."""
-        self.log_states_dict[str(trade_date)] = {
+        entry = self.log_states_dict[str(trade_date)] = {
             "company_of_interest": final_state["company_of_interest"],
             "trade_date": final_state["trade_date"],
             "market_report": final_state["market_report"],
@@ -471,13 +742,15 @@ class TradingAgentsGraph:
 
         # Save to file. Reject ticker values that would escape the
         # results directory when joined as a path component.
-        safe_ticker = safe_ticker_component(self.ticker)
+        # The state's own ticker, not ``self.ticker``: concurrent apropagate
+        # runs on one instance each log under their own ticker.
+        safe_ticker = safe_ticker_component(final_state["company_of_interest"])
         directory = Path(self.config["results_dir"]) / safe_ticker / "TradingAgentsStrategy_logs"
         directory.mkdir(parents=True, exist_ok=True)
 
         log_path = directory / f"full_states_log_{trade_date}.json"
         with open(log_path, "w", encoding="utf-8") as f:
-            json.dump(self.log_states_dict[str(trade_date)], f, indent=4)
+            json.dump(entry, f, indent=4)
 
     def process_signal(self, full_signal):
         """Process a signal to extract the core decision."""
@@ -17,6 +17,9 @@ class NormalizedAzureChatOpenAI(AzureChatOpenAI):
     def invoke(self, input, config=None, **kwargs):
         return normalize_content(super().invoke(input, config, **kwargs))
 
+    async def ainvoke(self, input, config=None, **kwargs):
+        return normalize_content(await super().ainvoke(input, config, **kwargs))
+
 
 class AzureOpenAIClient(BaseLLMClient):
     """Client for Azure OpenAI deployments.
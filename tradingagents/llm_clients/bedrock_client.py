@@ -34,6 +34,9 @@ def _bedrock_class():
         def invoke(self, input, config=None, **kwargs):
             return normalize_content(super().invoke(input, config, **kwargs))
 
+        async def ainvoke(self, input, config=None, **kwargs):
+            return normalize_content(await super().ainvoke(input, config, **kwargs))
+
     _BEDROCK_CLASS = NormalizedChatBedrockConverse
     return _BEDROCK_CLASS
 
@@ -17,7 +17,7 @@ class NormalizedChatOpenAI(ChatOpenAI):
     """ChatOpenAI with normalized content output and capability-aware binding.
 
     The Responses API returns content as a list of typed blocks
-    (reasoning, text, etc.). ``invoke`` normalizes to string for
+    (reasoning, text, etc.). ``invoke``/``ainvoke`` normalize to string for
     consistent downstream handling.
 
     ``with_structured_output`` consults the per-model capability table
@@ -35,6 +35,9 @@ class NormalizedChatOpenAI(ChatOpenAI):
     def invoke(self, input, config=None, **kwargs):
         return normalize_content(super().invoke(input, config, **kwargs))
 
+    async def ainvoke(self, input, config=None, **kwargs):
+        return normalize_content(await super().ainvoke(input, config, **kwargs))
+
     def with_structured_output(self, schema, *, method=None, **kwargs):
         caps = get_capabilities(self.model_name)
         if caps.preferred_structured_method == "none":